@@ -0,0 +1,93 @@
+"""
+Time the catalog access pattern of the column insights on a synthetic catalog, before and
+after the memoized CatalogIndex. Before it, every call to get_schema rebuilt the columns of
+the whole catalog and the insights called it once or twice per model, so the "before" column
+is measured on a sample of the models and extrapolated to all of them.
+
+Usage:
+    python benchmarks/bench_catalog_index.py [TABLES] [COLUMNS]
+"""
+import sys
+import time
+
+from dbt_artifacts_parser.parser import parse_catalog
+from tabulate import tabulate
+
+from datapilot.core.platforms.dbt.factory import DBTFactory
+
+SAMPLE = 20
+
+
+def synthetic_catalog(tables: int, columns: int) -> dict:
+    nodes = {}
+    for i in range(tables):
+        unique_id = f"model.bench.model_{i}"
+        nodes[unique_id] = {
+            "metadata": {
+                "type": "BASE TABLE",
+                "schema": "BENCH",
+                "name": f"MODEL_{i}",
+                "database": "ANALYTICS",
+                "comment": None,
+                "owner": None,
+            },
+            "columns": {
+                f"COLUMN_{j}": {"type": "TEXT" if j % 2 else "NUMBER", "index": j + 1, "name": f"COLUMN_{j}", "comment": None}
+                for j in range(columns)
+            },
+            "stats": {},
+            "unique_id": unique_id,
+        }
+    return {
+        "metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/catalog/v1.json", "dbt_version": "1.7.4", "env": {}},
+        "nodes": nodes,
+        "sources": {},
+        "errors": None,
+    }
+
+
+def rebuilt_schema(wrapper):
+    """get_schema as it was implemented before the index."""
+    nodes_with_schemas = {}
+    for node_id, catalog_table_node in wrapper.catalog.nodes.items():
+        nodes_with_schemas[node_id] = {column_name: column_node.type for column_name, column_node in catalog_table_node.columns.items()}
+    for source_id, catalog_source_node in wrapper.catalog.sources.items():
+        nodes_with_schemas[source_id] = {column_name: column_node.type for column_name, column_node in catalog_source_node.columns.items()}
+    return nodes_with_schemas
+
+
+def before(wrapper, node_ids):
+    for node_id in node_ids:
+        # DBTDocumentationStaleColumns._get_columns_in_model
+        if node_id in rebuilt_schema(wrapper):
+            [k.lower() for k in rebuilt_schema(wrapper)[node_id].keys()]
+
+
+def after(wrapper, node_ids):
+    for node_id in node_ids:
+        wrapper.get_column_names(node_id)
+
+
+def main(tables, columns):
+    catalog = parse_catalog(synthetic_catalog(tables, columns))
+    node_ids = list(catalog.nodes)
+
+    start = time.perf_counter()
+    before(DBTFactory.get_catalog_wrapper(catalog), node_ids[:SAMPLE])
+    before_time = (time.perf_counter() - start) * len(node_ids) / SAMPLE
+
+    wrapper = DBTFactory.get_catalog_wrapper(catalog)
+    start = time.perf_counter()
+    wrapper.get_index()
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    after(wrapper, node_ids)
+    lookup_time = time.perf_counter() - start
+
+    rows = [[f"{tables} x {columns}", f"{before_time:.1f}", f"{build_time * 1000:.1f}", f"{lookup_time * 1000:.1f}"]]
+    print(tabulate(rows, headers=["tables x columns", "before (s, extrapolated)", "index build (ms)", "lookups (ms)"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [20000, 10][len(args) :]))
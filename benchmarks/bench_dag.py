@@ -0,0 +1,240 @@
+"""
+Time the graph insights on a synthetic DAG, as they were implemented before on the children
+map and the depends_on of the nodes, and on the shared ManifestGraph. The memory used by the
+children map and by the graph is printed first.
+
+The DAG has SOURCES sources and MODELS models. Every model depends on one to three sources or
+models defined before it, most of them close to it, so that fanouts and rejoins both occur.
+
+Usage:
+    python benchmarks/bench_dag.py [MODELS] [SOURCES]
+"""
+import logging
+import random
+import sys
+import time
+
+from tabulate import tabulate
+
+from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.insights.checks.check_model_parents_and_childs import CheckModelParentsAndChilds
+from datapilot.core.platforms.dbt.insights.modelling.joining_of_upstream_concepts import DBTRejoiningOfUpstreamConcepts
+from datapilot.core.platforms.dbt.insights.modelling.model_fanout import DBTModelFanout
+from datapilot.core.platforms.dbt.insights.modelling.root_model import DBTRootModel
+from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDependsOn
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.wrappers.manifest.graph import ManifestGraph
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+
+CONFIG = {"insights": {CheckModelParentsAndChilds.ALIAS: {"max_parents": 2, "max_children": 3}}}
+
+
+def synthetic_index(models: int, sources: int, seed: int = 0) -> ManifestIndex:
+    rng = random.Random(seed)
+    index = ManifestIndex("bench")
+    for i in range(sources):
+        unique_id = f"source.bench.raw.s_{i}"
+        index.add_source(
+            AltimateManifestSourceNode.construct(
+                unique_id=unique_id,
+                name=f"s_{i}",
+                resource_type=AltimateResourceType.source,
+                package_name="bench",
+                path="models/sources.yml",
+                original_file_path="models/sources.yml",
+            )
+        )
+    upstream = list(index.sources)
+    for i in range(models):
+        # Mostly recent parents, which makes diamonds and rejoins common
+        parents = {upstream[max(0, len(upstream) - 1 - int(rng.expovariate(0.01)))] for _ in range(rng.randint(1, 3))}
+        unique_id = f"model.bench.m_{i}"
+        index.add_node(
+            AltimateManifestNode.construct(
+                unique_id=unique_id,
+                name=f"m_{i}",
+                resource_type=AltimateResourceType.model,
+                package_name="bench",
+                path=f"m_{i}.sql",
+                original_file_path=f"models/m_{i}.sql",
+                depends_on=AltimateDependsOn.construct(nodes=sorted(parents)),
+            )
+        )
+        upstream.append(unique_id)
+    return index
+
+
+class ModelFanoutBefore(DBTModelFanout):
+    """DBTModelFanout as it was implemented before, on the children map."""
+
+    def generate(self, *args, **kwargs):
+        fanout_threshold = self.get_check_config(self.FANOUT_THRESHOLD_STR) or self.FANOUT_THRESHOLD
+        insights = []
+        for parent, children_set in self.children_map.items():
+            if self.should_skip_model(parent):
+                continue
+
+            node = self.get_node(parent)
+            if node.resource_type != AltimateResourceType.model:
+                continue
+
+            leaf_children = [
+                child
+                for child in children_set
+                if len(self.children_map[child]) == 0
+                and self.get_node(child).resource_type
+                not in [
+                    AltimateResourceType.test,
+                    AltimateResourceType.analysis,
+                    AltimateResourceType.metric,
+                ]
+            ]
+
+            if len(leaf_children) > fanout_threshold:
+                insight_result = self._build_failure_result(parent, leaf_children, fanout_threshold)
+                insights.append(
+                    DBTModelInsightResponse(
+                        unique_id=parent,
+                        package_name=node.package_name,
+                        path=node.path,
+                        original_file_path=node.original_file_path,
+                        insight=insight_result,
+                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                    )
+                )
+        return insights
+
+
+class RejoiningOfUpstreamConceptsBefore(DBTRejoiningOfUpstreamConcepts):
+    """DBTRejoiningOfUpstreamConcepts as it was implemented before, on the children map."""
+
+    def generate(self, *args, **kwargs):
+        insights = []
+        for parent_model, children in self.children_map.items():
+            for child in children:
+                child_child_is_also_parent_child = any(
+                    dwn_stream_child in self.children_map[child] for dwn_stream_child in self.children_map[parent_model]
+                )
+                if child_child_is_also_parent_child and len(self.children_map[child]) == 1:
+                    insight_result = self._build_failure_result(
+                        child=child,
+                        parent_model=parent_model,
+                        children_list=list(self.children_map[child]),
+                        rejoin_targets=list(self.children_map[child])[:1],
+                    )
+                    child_node = self.get_node(child)
+                    if self.should_skip_model(child_node.unique_id):
+                        continue
+                    insights.append(
+                        DBTModelInsightResponse(
+                            unique_id=child_node.unique_id,
+                            package_name=child_node.package_name,
+                            path=child_node.path,
+                            original_file_path=child_node.original_file_path,
+                            insight=insight_result,
+                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                        )
+                    )
+        return insights
+
+
+class RootModelBefore(DBTRootModel):
+    """DBTRootModel as it was implemented before, on the depends_on of the nodes."""
+
+    def generate(self, *args, **kwargs):
+        insights = []
+        for node_id, node in self.nodes.items():
+            if self.should_skip_model(node_id):
+                continue
+            if node.resource_type == AltimateResourceType.model and not node.depends_on.nodes:
+                insight_result = self._build_failure_result(node.unique_id)
+                insights.append(
+                    DBTModelInsightResponse(
+                        unique_id=node_id,
+                        package_name=node.package_name,
+                        path=node.path,
+                        original_file_path=node.original_file_path,
+                        insight=insight_result,
+                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                    )
+                )
+        return insights
+
+
+class ModelParentsAndChildsBefore(CheckModelParentsAndChilds):
+    """CheckModelParentsAndChilds as it was implemented before, on the children map."""
+
+    def _check_model_parents_and_childs(self, model_unique_id: str):
+        children = self.children_map.get(model_unique_id, [])
+        node = self.get_node(model_unique_id)
+        parents = node.depends_on.nodes
+        message = ""
+        if len(parents) < self.min_parents or len(parents) > self.max_parents:
+            message += f"The model:{model_unique_id} doesn't have the required number of parents.\n Min parents: {self.min_parents}, Max parents: {self.max_parents}. It has f{len(parents)} parents\n"
+
+        if len(children) < self.min_childs or len(children) > self.max_childs:
+            message += f"The model:{model_unique_id} doesn't have the required number of childs.\n Min childs: {self.min_childs}, Max childs: {self.max_childs}. It has f{len(children)} childs\n"
+
+        return message
+
+
+BEFORE = {
+    DBTModelFanout: ModelFanoutBefore,
+    DBTRejoiningOfUpstreamConcepts: RejoiningOfUpstreamConceptsBefore,
+    DBTRootModel: RootModelBefore,
+    CheckModelParentsAndChilds: ModelParentsAndChildsBefore,
+}
+
+
+def children_map_size(children_map) -> int:
+    return sys.getsizeof(children_map) + sum(sys.getsizeof(children) for children in children_map.values())
+
+
+def graph_size(graph: ManifestGraph) -> int:
+    arrays = [graph.parent_offsets, graph.parent_targets, graph.child_offsets, graph.child_targets, graph.in_degree, graph.out_degree]
+    arrays += [graph.topological_order, graph.depth]
+    return sys.getsizeof(graph.positions) + sys.getsizeof(graph.unique_ids) + sum(map(sys.getsizeof, arrays))
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(models, sources):
+    logging.disable(logging.CRITICAL)
+    index = synthetic_index(models, sources)
+    graph, build_time = timed(ManifestGraph.from_index, index)
+    print(f"ManifestGraph of {len(graph)} vertices and {len(graph.child_targets)} edges built in {build_time:.2f}s")
+    print(f"Children map: {children_map_size(index.children_map) / 2**20:.1f} MB, ManifestGraph: {graph_size(graph) / 2**20:.1f} MB\n")
+
+    rows = []
+    for insight_class, before_class in BEFORE.items():
+        kwargs = {
+            "manifest_wrapper": None,
+            "nodes": index.nodes,
+            "sources": index.sources,
+            "exposures": {},
+            "tests": {},
+            "seeds": {},
+            "macros": {},
+            "children_map": index.children_map,
+            "project_name": "bench",
+            "config": CONFIG,
+        }
+        before, before_time = timed(before_class(**kwargs).generate)
+        after, after_time = timed(insight_class(graph=graph, **kwargs).generate)
+        assert [(insight.unique_id, insight.insight.message) for insight in before] == [
+            (insight.unique_id, insight.insight.message) for insight in after
+        ]
+        rows.append([insight_class.NAME, len(after), f"{before_time:.3f}", f"{after_time:.3f}", f"{before_time / after_time:.1f}x"])
+    print(tabulate(rows, headers=["insight", "results", "before (s)", "ManifestGraph (s)", "speedup"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [100_000, 1_000][len(args) :]))
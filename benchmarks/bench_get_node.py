@@ -0,0 +1,141 @@
+"""
+Time every insight on the bundled manifests with the entity lookups as they were implemented
+before, where get_node probed the nodes, sources, exposures, tests, macros and seeds one after
+the other, and with the unified entity index.
+
+The average duration of a lookup of every entity type is printed first. The insights are then
+run REPEAT times on each manifest, with the catalog and configuration of the tests when there
+is one, and the durations are summed.
+
+Usage:
+    python benchmarks/bench_get_node.py [REPEAT]
+"""
+import logging
+import sys
+import timeit
+from pathlib import Path
+from unittest import mock
+
+from tabulate import tabulate
+
+from datapilot.config.config import load_config
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.insights.base import DBTInsight
+from datapilot.core.platforms.dbt.insights.modelling.root_model import DBTRootModel
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_manifest
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "tests" / "data"
+CASES = [
+    ("manifest_v10.json", None),
+    ("manifest_v11.json", "catalog_v1.json"),
+    ("manifest_v12.json", "catalog_v12.json"),
+    ("manifests/manifest_tuva3.json", None),
+]
+
+
+def chained_get_node(self, node_id):
+    """DBTInsight.get_node as it was implemented before."""
+    if node_id in self.nodes:
+        return self.nodes[node_id]
+    elif node_id in self.sources:
+        return self.sources[node_id]
+    elif node_id in self.exposures:
+        return self.exposures[node_id]
+    elif node_id in self.tests:
+        return self.tests[node_id]
+    elif node_id in self.macros:
+        return self.macros[node_id]
+    elif node_id in self.seeds:
+        return self.seeds[node_id]
+    else:
+        self.logger.debug(f"Model {node_id} not found in manifest")
+        return None
+
+
+def run_insights(cases, config, timings):
+    for manifest, catalog in cases:
+        generator = DBTInsightGenerator(manifest=manifest, catalog=catalog, config=config)
+        generator.run()
+        for name, duration in generator.timings.items():
+            timings[name] = timings.get(name, 0.0) + duration
+
+
+def lookup_rows(manifest):
+    """Average duration of a lookup of the entities of every type, and of unknown ids."""
+    index = DBTFactory.get_manifest_wrapper(manifest).get_index()
+    insight = DBTRootModel(
+        manifest_wrapper=None,
+        nodes=index.nodes,
+        sources=index.sources,
+        exposures=index.exposures,
+        tests=index.tests,
+        seeds=index.seeds,
+        macros=index.macros,
+        children_map=index.children_map,
+        project_name=index.project_name,
+        entities=index.get_entities(),
+    )
+    ids_by_type = {
+        "nodes": list(index.nodes),
+        "sources": list(index.sources),
+        "tests": list(index.tests),
+        "seeds": list(index.seeds),
+        "unknown": [f"model.unknown.m_{i}" for i in range(1000)],
+    }
+    rows = []
+    for entity_type, unique_ids in ids_by_type.items():
+        if not unique_ids:
+            continue
+        number = max(1, 200_000 // len(unique_ids))
+        chained = timeit.timeit(lambda ids=unique_ids: [chained_get_node(insight, unique_id) for unique_id in ids], number=number)
+        indexed = timeit.timeit(lambda ids=unique_ids: [insight.get_node(unique_id) for unique_id in ids], number=number)
+        lookups = number * len(unique_ids)
+        rows.append([entity_type, len(unique_ids), f"{chained / lookups * 1e9:.0f}", f"{indexed / lookups * 1e9:.0f}"])
+    return rows
+
+
+def main(repeat):
+    logging.disable(logging.CRITICAL)
+    config = load_config(str(DATA_DIR / "config.yml"))
+    cases = [
+        (load_manifest(str(DATA_DIR / manifest_file)), load_catalog(str(DATA_DIR / catalog_file)) if catalog_file else None)
+        for manifest_file, catalog_file in CASES
+    ]
+    # Warm up the imports and caches first
+    run_insights(cases, config, {})
+
+    before, after = {}, {}
+    # Both variants run in turn, so that they are equally affected by the state of the machine
+    for _ in range(repeat):
+        # Every lookup went through the chain before, the typed accessors included
+        with mock.patch.multiple(
+            DBTInsight,
+            get_node=chained_get_node,
+            get_manifest_node=chained_get_node,
+            get_source=chained_get_node,
+            get_macro=chained_get_node,
+        ):
+            run_insights(cases, config, before)
+        run_insights(cases, config, after)
+
+    print(tabulate(lookup_rows(cases[1][0]), headers=["entity type", "lookups", "chained (ns)", "entity index (ns)"], tablefmt="github"))
+    print()
+    rows = [
+        [name, f"{before[name] * 1000:.1f}", f"{after[name] * 1000:.1f}", f"{before[name] / after[name]:.2f}x" if after[name] else "-"]
+        for name in sorted(before, key=before.get, reverse=True)
+    ]
+    rows.append(
+        [
+            "total",
+            f"{sum(before.values()) * 1000:.1f}",
+            f"{sum(after.values()) * 1000:.1f}",
+            f"{sum(before.values()) / sum(after.values()):.2f}x",
+        ]
+    )
+    print(tabulate(rows, headers=["insight", "chained lookups (ms)", "entity index (ms)", "speedup"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]] or [20])
@@ -0,0 +1,46 @@
+"""
+Throughput of get_hard_coded_references, in MB of SQL per second, on the raw code of the
+models of the test manifests.
+
+Usage:
+    python benchmarks/bench_hard_coded_references.py [REPEAT] [FILE ...]
+"""
+import json
+import sys
+import time
+from pathlib import Path
+
+from tabulate import tabulate
+
+from datapilot.core.platforms.dbt.utils import get_hard_coded_references
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "tests" / "data"
+
+
+def raw_codes(path):
+    with Path(path).open() as f:
+        manifest = json.load(f)
+    return [node.get("raw_code") or node.get("raw_sql") or "" for node in manifest["nodes"].values() if node["resource_type"] == "model"]
+
+
+def main(repeat, paths):
+    rows = []
+    for path in paths:
+        codes = raw_codes(path)
+        size = sum(len(code.encode()) for code in codes)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for code in codes:
+                get_hard_coded_references(code)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        rows.append([Path(path).name, len(codes), f"{size / 1024:.0f}", f"{best * 1000:.1f}", f"{size / best / 1024 / 1024:.1f}"])
+    print(tabulate(rows, headers=["file", "models", "SQL (KB)", "time (ms)", "MB/s"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    repeat = int(args.pop(0)) if args and args[0].isdigit() else 5
+    files = args or sorted(DATA_DIR.glob("manifests/manifest_*.json"))
+    main(repeat, files)
@@ -0,0 +1,72 @@
+"""
+Resident memory of project-health on a synthetic project, with the heavy fields of the
+entities (raw and compiled code, columns, macro SQL) kept in a FieldStore until an insight reads
+them, against the index that holds all of them. Every mode runs in a fresh interpreter, which
+loads the manifest as the CLI does, drops it once indexed, and runs every insight.
+
+RSS is read from /proc/self/status, so it runs on Linux only. Pages of the store that an insight
+read are counted as long as the kernel keeps them, they are file-backed and dropped first.
+
+Usage:
+    python benchmarks/bench_lazy_fields.py [MODELS] [COLUMNS]
+"""
+import gc
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic import write_artifacts
+from tabulate import tabulate
+
+MODES = ["eager (before)", "lazy"]
+
+
+def rss_mb(field="VmRSS"):
+    with Path("/proc/self/status").open() as status:
+        for line in status:
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError(f"{field} not found in /proc/self/status")
+
+
+def measure(mode, manifest_path):
+    """
+    Print the RSS of the process once the index is built and once the insights ran, and the
+    time it took, as a tab-separated row.
+    """
+    from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+    from datapilot.core.platforms.dbt.utils import load_cached_manifest
+    from datapilot.core.platforms.dbt.wrappers.manifest import wrapper
+
+    # The index without a store keeps every field in the models
+    wrapper.OFFLOAD_MIN_NODES = float("inf") if mode == MODES[0] else 0
+    start = time.perf_counter()
+    index = load_cached_manifest(manifest_path)
+    gc.collect()
+    indexed = rss_mb()
+    DBTInsightGenerator(manifest=index).run()
+    gc.collect()
+    print(f"{indexed}\t{rss_mb()}\t{rss_mb('VmHWM')}\t{time.perf_counter() - start}")
+
+
+def main(models, columns):
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path, _ = write_artifacts(directory, models=models, columns=columns)
+        rows = []
+        for mode in MODES:
+            command = [sys.executable, __file__, "--measure", mode, str(manifest_path)]
+            output = subprocess.run(command, capture_output=True, text=True, check=True).stdout  # noqa: S603
+            indexed, ran, peak, seconds = (float(value) for value in output.split())
+            rows.append([mode, f"{indexed:.0f}", f"{ran:.0f}", f"{peak:.0f}", f"{seconds:.1f}"])
+    print(f"Synthetic project of {models} models of {columns} columns\n")
+    headers = ["index", "RSS indexed (MB)", "RSS after the insights (MB)", "peak RSS (MB)", "seconds"]
+    print(tabulate(rows, headers=headers, tablefmt="github"))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--measure"]:
+        measure(*sys.argv[2:4])
+    else:
+        main(*[int(arg) for arg in sys.argv[1:3]], *[50_000, 10][len(sys.argv[1:3]) :])
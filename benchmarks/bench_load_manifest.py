@@ -0,0 +1,69 @@
+"""
+Wall time and peak RSS of load_manifest / load_catalog for every JSON loader backend.
+
+Every configuration runs in a fresh interpreter so that the peak RSS of one run does not
+leak into the next one. Unix only, as it relies on the resource module.
+
+Usage:
+    python benchmarks/bench_load_manifest.py [FILE ...]
+"""
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+
+from tabulate import tabulate
+
+from datapilot.core.platforms.dbt.constants import MANIFEST_SECTIONS
+from datapilot.utils.json_loader import available_json_backends
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "tests" / "data"
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run(path: str, backend: str, use_mmap: bool, stream: bool, queue) -> None:
+    from datapilot.core.platforms.dbt.utils import load_catalog
+    from datapilot.core.platforms.dbt.utils import load_manifest
+
+    baseline = _peak_rss_mb()
+    start = time.perf_counter()
+    if Path(path).name.startswith("catalog"):
+        load_catalog(path, backend=backend, use_mmap=use_mmap)
+    else:
+        load_manifest(path, backend=backend, use_mmap=use_mmap, sections=MANIFEST_SECTIONS if stream else None)
+    queue.put((time.perf_counter() - start, _peak_rss_mb() - baseline))
+
+
+def configurations():
+    for backend in available_json_backends():
+        yield backend, False, False
+        yield backend, True, False
+    yield "auto", False, True
+
+
+def main(paths):
+    ctx = multiprocessing.get_context("spawn")
+    rows = []
+    for path in paths:
+        for backend, use_mmap, stream in configurations():
+            if stream and Path(path).name.startswith("catalog"):
+                continue
+            queue = ctx.Queue()
+            process = ctx.Process(target=_run, args=(str(path), backend, use_mmap, stream, queue))
+            process.start()
+            wall_time, peak_rss = queue.get()
+            process.join()
+            mode = "stream" if stream else ("mmap" if use_mmap else "read")
+            rows.append([Path(path).name, backend, mode, f"{wall_time * 1000:.1f}", f"{peak_rss:.1f}"])
+    print(tabulate(rows, headers=["file", "backend", "mode", "wall time (ms)", "peak RSS delta (MB)"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    files = sys.argv[1:] or sorted(DATA_DIR.glob("manifest_v1*.json")) + sorted(DATA_DIR.glob("catalog_*.json"))
+    main(files)
@@ -0,0 +1,85 @@
+"""
+Time the single-pass ManifestIndex against the previous access pattern, where the
+executor called every getter of the manifest wrapper and each of them walked the manifest.
+
+Usage:
+    python benchmarks/bench_manifest_index.py [REPEAT] [FILE ...]
+"""
+import sys
+import time
+from pathlib import Path
+
+from tabulate import tabulate
+
+from datapilot.core.platforms.dbt.constants import GENERIC
+from datapilot.core.platforms.dbt.constants import MACRO
+from datapilot.core.platforms.dbt.constants import SEED
+from datapilot.core.platforms.dbt.constants import SINGULAR
+from datapilot.core.platforms.dbt.constants import TEST
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.utils import load_manifest
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "tests" / "data"
+
+
+def per_getter_scans(wrapper):
+    """The getters as they were implemented before the index: one scan per entity type."""
+    project_name = wrapper.get_package()
+    nodes = {}
+    for node in wrapper._get_section("nodes"):
+        if wrapper._get_resource_type(node) in (SEED, TEST) or wrapper._get_package_name(node) != project_name:
+            continue
+        nodes[node.unique_id] = wrapper._get_node(node)
+    macros = {
+        macro.unique_id: wrapper._get_macro(macro)
+        for macro in wrapper._get_section("macros")
+        if wrapper._get_resource_type(macro) == MACRO and wrapper._get_package_name(macro) == project_name
+    }
+    sources = {source.unique_id: wrapper._get_source(source) for source in wrapper._get_section("sources")}
+    exposures = {exposure.unique_id: wrapper._get_exposure(exposure) for exposure in wrapper._get_section("exposures")}
+    seeds = {node.unique_id: wrapper._get_seed(node) for node in wrapper._get_section("nodes") if wrapper._get_resource_type(node) == SEED}
+    children_map = wrapper.parent_to_child_map(nodes)
+    tests = {
+        node.unique_id: wrapper._get_tests(node)
+        for node in wrapper._get_section("nodes")
+        if wrapper._get_resource_type(node) == TEST and wrapper._get_test_type(node) in (GENERIC, SINGULAR)
+    }
+    # MissingPrimaryKeyTests asks for the generic tests once more
+    generic_tests = {
+        node.unique_id: wrapper._get_tests(node)
+        for node in wrapper._get_section("nodes")
+        if wrapper._get_resource_type(node) == TEST and wrapper._get_test_type(node) == GENERIC
+    }
+    return nodes, macros, sources, exposures, seeds, children_map, tests, generic_tests
+
+
+def single_pass(wrapper):
+    index = wrapper.get_index()
+    return index, wrapper.get_tests(GENERIC)
+
+
+def best_of(func, manifest, repeat):
+    timings = []
+    for _ in range(repeat):
+        wrapper = DBTFactory.get_manifest_wrapper(manifest)
+        start = time.perf_counter()
+        func(wrapper)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(repeat, paths):
+    rows = []
+    for path in paths:
+        manifest = load_manifest(str(path))
+        before = best_of(per_getter_scans, manifest, repeat)
+        after = best_of(single_pass, manifest, repeat)
+        rows.append([Path(path).name, f"{before * 1000:.1f}", f"{after * 1000:.1f}", f"{before / after:.2f}x"])
+    print(tabulate(rows, headers=["file", "per-getter scans (ms)", "single pass (ms)", "speedup"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    repeat = int(args.pop(0)) if args and args[0].isdigit() else 5
+    files = args or sorted(DATA_DIR.glob("manifest_v1?.json"))
+    main(repeat, files)
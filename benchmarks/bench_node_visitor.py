@@ -0,0 +1,118 @@
+"""
+Time the checks of every model and source of a synthetic project, each running its own loop
+over the entities as before, against a single NodeVisitor pass that dispatches every entity to
+all of them. The whole run of the insights is timed both ways as well.
+
+The checks run with a configuration that enables all of them, so that none skips the loop.
+
+Usage:
+    python benchmarks/bench_node_visitor.py [MODELS] [REPEAT]
+"""
+import logging
+import sys
+import tempfile
+import time
+
+from synthetic import write_artifacts
+from tabulate import tabulate
+
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.insights import INSIGHT_REGISTRY
+from datapilot.core.platforms.dbt.insights import load_insight
+from datapilot.core.platforms.dbt.insights.visitor import NodeVisitor
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.utils import load_cached_manifest
+from datapilot.core.platforms.dbt.utils import load_catalog
+
+CONFIG = {
+    "insights": {
+        "column_name_contract": {"patterns": [{"pattern": "^[a-z_]+$", "dtype": "string"}], "default_pattern": "^[a-z_]+$"},
+        "check_model_has_labels_keys": {"labels_keys": ["owner"]},
+        "check_model_has_valid_meta_keys": {"meta_keys": ["owner"]},
+        "check_model_has_tests_by_group": {"tests": [{"test_group": ["unique", "not_null"], "min_count": 1}]},
+        "check_model_has_tests_by_name": {"tests": [{"test": "unique", "min_count": 1}]},
+        "check_model_has_tests_by_type": {"tests": [{"test": "data", "min_count": 1}]},
+        "check_model_materialization_by_childs": {"threshold_childs": 2},
+        "model_name_by_folder": {"patterns": [{"folder": "staging", "pattern": "^stg_"}], "default_pattern": "^[a-z]"},
+        "check_model_parents_database": {"whitelist": ["analytics"]},
+        "check_model_parents_schema": {"blacklist": ["raw"]},
+        "check_model_tags": {"tag_list": ["core"]},
+        "check_source_childs": {"min_childs": 1, "max_childs": 10},
+        "check_source_has_freshness": {"freshness": ["warn_after", "error_after"]},
+        "check_source_has_labels_keys": {"labels_keys": ["owner"]},
+        "check_source_has_meta_keys": {"meta_keys": ["owner"]},
+        "check_source_has_tests_by_group": {"tests": [{"test_group": ["unique", "not_null"], "min_count": 1}]},
+        "check_source_has_tests_by_name": {"tests": [{"test": "unique", "min_count": 1}]},
+        "check_source_has_tests_by_type": {"tests": [{"test": "data", "min_count": 1}]},
+        "check_source_tags": {"tags": ["core"]},
+    }
+}
+
+
+def get_checks(generator: DBTInsightGenerator):
+    checks = []
+    for alias in INSIGHT_REGISTRY:
+        insight_class = load_insight(alias)
+        if not issubclass(insight_class, PerNodeCheck):
+            continue
+        checks.append(
+            insight_class(
+                manifest_wrapper=generator.manifest_wrapper,
+                catalog_wrapper=generator.catalog_wrapper,
+                nodes=generator.nodes,
+                macros=generator.macros,
+                sources=generator.sources,
+                seeds=generator.seeds,
+                exposures=generator.exposures,
+                children_map=generator.children_map,
+                tests=generator.tests,
+                project_name=generator.project_name,
+                config=generator.config,
+                graph=generator.graph,
+                entities=generator.entities,
+            )
+        )
+    return checks
+
+
+def best_of(repeat, function):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main(models, repeat):
+    # The insights log every finding
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path, catalog_path = write_artifacts(directory, models=models)
+        manifest = load_cached_manifest(manifest_path)
+        catalog = load_catalog(str(catalog_path))
+
+    generator = DBTInsightGenerator(manifest=manifest, catalog=catalog, config=CONFIG)
+    checks = get_checks(generator)
+    # The results of every check are kept, as the runs keep them
+    per_insight, expected = best_of(repeat, lambda: [NodeVisitor([check]).generate()[0] for check in checks])
+    fused, outcomes = best_of(repeat, lambda: NodeVisitor(checks).generate())
+    # Checks that raise have no results either way
+    if [len(results or []) for results, _, _ in outcomes] != [len(results or []) for results, _, _ in expected]:
+        raise AssertionError("The fused pass found different results")
+
+    runs = {}
+    for fuse_checks in (False, True):
+        generator = DBTInsightGenerator(manifest=manifest, catalog=catalog, config=CONFIG, fuse_checks=fuse_checks)
+        runs[fuse_checks], _ = best_of(repeat, generator.run)
+
+    print(f"Synthetic project of {models} models and {len(generator.sources)} sources, {len(checks)} checks, best of {repeat}\n")
+    rows = [
+        [f"{len(checks)} checks", f"{per_insight:.3f}", f"{fused:.3f}", f"{per_insight / fused:.1f}x"],
+        ["all the insights", f"{runs[False]:.3f}", f"{runs[True]:.3f}", f"{runs[False] / runs[True]:.1f}x"],
+    ]
+    print(tabulate(rows, headers=["", "per insight (s)", "single pass (s)", "speedup"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]], *[20_000, 3][len(sys.argv[1:3]) :])
@@ -0,0 +1,99 @@
+"""
+Time the detection of rejoining upstream concepts on a synthetic DAG of hub models, as it was
+implemented before, scanning the children of the parent for every child, and with the current
+set intersections.
+
+The DAG has HUBS hub models with CHILDREN children each. A third of the children have a single
+child, which is another child of the same hub half of the time, i.e. a rejoin. The others have
+two children in the next hub.
+
+Usage:
+    python benchmarks/bench_rejoin.py [HUBS] [CHILDREN]
+"""
+import logging
+import random
+import sys
+import time
+
+from bench_dag import RejoiningOfUpstreamConceptsBefore
+from tabulate import tabulate
+
+from datapilot.core.platforms.dbt.insights.modelling.joining_of_upstream_concepts import DBTRejoiningOfUpstreamConcepts
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDependsOn
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.wrappers.manifest.graph import ManifestGraph
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+
+
+def synthetic_hub_index(hubs: int, children: int, seed: int = 0) -> ManifestIndex:
+    rng = random.Random(seed)
+    parents = {}
+    for hub in range(hubs):
+        hub_id = f"model.bench.hub_{hub}"
+        parents.setdefault(hub_id, [])
+        child_ids = [f"model.bench.hub_{hub}_child_{i}" for i in range(children)]
+        for child_id in child_ids:
+            parents.setdefault(child_id, []).append(hub_id)
+        for i, child_id in enumerate(child_ids):
+            if i % 3 == 0:
+                # A later child of the same hub, or a model of its own
+                target = rng.choice(child_ids[i + 1 :]) if i + 1 < children and rng.random() < 0.5 else f"{child_id}_leaf"
+                parents.setdefault(target, []).append(child_id)
+            elif hub + 1 < hubs:
+                for _ in range(2):
+                    parents.setdefault(f"model.bench.hub_{hub + 1}_child_{rng.randrange(children)}", []).append(child_id)
+
+    index = ManifestIndex("bench")
+    for unique_id, node_parents in parents.items():
+        index.add_node(
+            AltimateManifestNode.construct(
+                unique_id=unique_id,
+                name=unique_id.split(".")[-1],
+                resource_type=AltimateResourceType.model,
+                package_name="bench",
+                path=f"{unique_id}.sql",
+                original_file_path=f"models/{unique_id}.sql",
+                depends_on=AltimateDependsOn.construct(nodes=list(dict.fromkeys(node_parents))),
+            )
+        )
+    return index
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(hubs, children):
+    logging.disable(logging.CRITICAL)
+    rows = []
+    for hub_children in (children // 8, children // 2, children):
+        index = synthetic_hub_index(hubs, hub_children)
+        kwargs = {
+            "manifest_wrapper": None,
+            "nodes": index.nodes,
+            "sources": {},
+            "exposures": {},
+            "tests": {},
+            "seeds": {},
+            "macros": {},
+            "children_map": index.children_map,
+            "project_name": "bench",
+        }
+        before, before_time = timed(RejoiningOfUpstreamConceptsBefore(**kwargs).generate)
+        graph = ManifestGraph.from_index(index)
+        after, after_time = timed(DBTRejoiningOfUpstreamConcepts(graph=graph, **kwargs).generate)
+        assert [(insight.unique_id, insight.insight.message) for insight in before] == [
+            (insight.unique_id, insight.insight.message) for insight in after
+        ]
+        rows.append(
+            [len(index.nodes), hub_children, len(after), f"{before_time:.3f}", f"{after_time:.3f}", f"{before_time / after_time:.1f}x"]
+        )
+    print(tabulate(rows, headers=["models", "children per hub", "rejoins", "before (s)", "current (s)", "speedup"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [20, 1600][len(args) :]))
@@ -0,0 +1,137 @@
+"""
+Time --select on a synthetic project, with the scan of every entity that get_models did before
+and with ModelSelector, and the should_skip_model checks of an insight against the selection.
+
+The project has MODELS models spread over nested directories, each with two tests, and every
+model depends on up to three earlier models.
+
+Usage:
+    python benchmarks/bench_selector.py [MODELS]
+"""
+import gc
+import random
+import sys
+import time
+
+from tabulate import tabulate
+
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDependsOn
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateNodeConfig
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.selector import ModelSelector
+from datapilot.core.platforms.dbt.utils import SelectOption
+from datapilot.core.platforms.dbt.utils import parse_argument
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+from datapilot.utils.utils import is_superset_path
+
+SELECTORS = [
+    ["m_100"],
+    ["models/d_3/d_3_1/m_100.sql"],
+    ["path:models/d_3/d_3_1"],
+    ["path:models/d_3", "m_1", "m_2"],
+    ["tag:daily"],
+    ["+m_100"],
+    ["m_100+"],
+    ["2+m_100+2"],
+    ["@m_100"],
+]
+
+
+def synthetic_index(models: int, seed: int = 0) -> ManifestIndex:
+    rng = random.Random(seed)
+    index = ManifestIndex("bench")
+    for i in range(models):
+        directory = f"models/d_{i % 10}/d_{i % 10}_{i % 7}"
+        unique_id = f"model.bench.m_{i}"
+        parents = sorted({f"model.bench.m_{rng.randrange(i)}" for _ in range(rng.randint(0, 3))}) if i else []
+        index.add_node(
+            AltimateManifestNode.construct(
+                unique_id=unique_id,
+                name=f"m_{i}",
+                resource_type=AltimateResourceType.model,
+                package_name="bench",
+                path=f"m_{i}.sql",
+                original_file_path=f"{directory}/m_{i}.sql",
+                config=AltimateNodeConfig.construct(tags=["daily"] if i % 100 == 0 else []),
+                depends_on=AltimateDependsOn.construct(nodes=parents),
+            )
+        )
+        for test in ("unique", "not_null"):
+            test_id = f"test.bench.{test}_m_{i}"
+            index.add_test(
+                AltimateManifestTestNode.construct(
+                    unique_id=test_id,
+                    name=f"{test}_m_{i}",
+                    resource_type=AltimateResourceType.test,
+                    package_name="bench",
+                    original_file_path=f"{directory}/schema.yml",
+                    test_type="generic",
+                    depends_on=AltimateDependsOn.construct(nodes=[unique_id]),
+                )
+            )
+    return index
+
+
+def scanning_get_models(selected_model_list, entities):
+    """get_models as it was implemented before, on the name and path selectors it supported."""
+    final_models = []
+    for selected_model in selected_model_list:
+        selected_category = parse_argument(selected_model)
+        for entities_of_type in entities.values():
+            for entity in entities_of_type.values():
+                if selected_category["type"] in (SelectOption.MODEL_NAME, SelectOption.MODEL_PATH):
+                    if entity.name == selected_category.get("name") or entity.original_file_path == selected_category.get("name"):
+                        final_models.append(entity.unique_id)
+                elif selected_category["type"] == SelectOption.DIRECTORY:
+                    if is_superset_path(selected_category["name"], entity.original_file_path):
+                        final_models.append(entity.unique_id)
+    return list(set(final_models))
+
+
+def timed(func, *args):
+    # Without the collections of the whole index that allocations trigger, like timeit
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = func(*args)
+        return result, time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def main(models):
+    index = synthetic_index(models)
+    entities = {"nodes": index.nodes, "sources": index.sources, "exposures": index.exposures, "tests": index.tests}
+    rows = []
+    for selectors in SELECTORS:
+        # The scan only supported names, paths and directories
+        supported = not any(operator in selector for selector in selectors for operator in ("+", "@", "tag:"))
+        before, before_time = timed(scanning_get_models, selectors, entities) if supported else (None, None)
+        # The selector is built for every selection, as the executor does
+        after, after_time = timed(lambda selectors=selectors: ModelSelector.from_index(index).select(selectors))
+        if before is not None:
+            assert set(before) == after
+
+        # should_skip_model for every node, against the list before and the frozenset now
+        skip_before_time = timed(lambda selected=before: [unique_id not in selected for unique_id in index.nodes])[1] if before else None
+        skip_after_time = timed(lambda selected=after: [unique_id not in selected for unique_id in index.nodes])[1]
+        rows.append(
+            [
+                " ".join(selectors),
+                len(after),
+                "-" if before_time is None else f"{before_time * 1000:.1f}",
+                f"{after_time * 1000:.1f}",
+                "-" if skip_before_time is None else f"{skip_before_time * 1000:.1f}",
+                f"{skip_after_time * 1000:.1f}",
+            ]
+        )
+    headers = ["--select", "selected", "scan (ms)", "ModelSelector (ms)", "skip checks, list (ms)", "skip checks, frozenset (ms)"]
+    print(f"{len(index.nodes)} models and {len(index.tests)} tests\n")
+    print(tabulate(rows, headers=headers, tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]] or [20_000])
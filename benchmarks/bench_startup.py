@@ -0,0 +1,58 @@
+"""
+Time the startup of the CLI with python -X importtime: the import of datapilot.cli.main as the
+datapilot command does it, against the imports it did before the insight registry and the
+manifest models were loaded lazily, i.e. every insight module and every manifest version of
+dbt_artifacts_parser. Every import runs RUNS times in a fresh interpreter, the median is kept.
+
+Usage:
+    python benchmarks/bench_startup.py [RUNS]
+"""
+import statistics
+import subprocess
+import sys
+
+from tabulate import tabulate
+
+IMPORTS = {
+    "eager (before)": (
+        "import datapilot.cli.main; import dbt_artifacts_parser.parser; from datapilot.core.platforms.dbt.insights import INSIGHTS"
+    ),
+    "lazy": "import datapilot.cli.main",
+}
+
+
+def import_times(statement):
+    """
+    Total import time of the statement in seconds, and the cumulative import time of every
+    module it imported.
+    """
+    command = [sys.executable, "-X", "importtime", "-c", statement]
+    stderr = subprocess.run(command, capture_output=True, text=True, check=True).stderr  # noqa: S603
+    total, times = 0.0, {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        seconds = int(cumulative) / 1e6
+        # Nested imports are indented, the top-level ones add up to the total
+        if not name[1:].startswith(" "):
+            total += seconds
+        times[name.strip()] = seconds
+    return total, times
+
+
+def main(runs):
+    rows = []
+    slowest = {}
+    for label, statement in IMPORTS.items():
+        samples = [import_times(statement) for _ in range(runs)]
+        rows.append([label, f"{statistics.median(total for total, _ in samples) * 1000:.0f}", len(samples[0][1])])
+        slowest[label] = sorted(samples[0][1].items(), key=lambda item: -item[1])[:10]
+    print(tabulate(rows, headers=["imports", "median import time (ms)", "modules"], tablefmt="github"))
+    for label, modules in slowest.items():
+        print(f"\nSlowest imports, {label}\n")
+        print(tabulate([[name, f"{seconds * 1000:.0f}"] for name, seconds in modules], headers=["module", "ms"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]] or [5])
@@ -0,0 +1,120 @@
+"""
+Time the insights on the tests of a synthetic project with 200k tests: each building the tests
+of every model and source for itself, against a single TestAttachmentIndex built once per run
+and shared by all of them. The tested models of the coverage are also timed as they were found
+before, with a scan of all the tests, against the set kept by the index.
+
+Usage:
+    python benchmarks/bench_test_index.py [MODELS] [TESTS_PER_MODEL]
+"""
+import logging
+import sys
+import tempfile
+import time
+
+from synthetic import write_artifacts
+from tabulate import tabulate
+
+from datapilot.core.platforms.dbt.constants import SINGULAR
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.insights import load_insight
+from datapilot.core.platforms.dbt.utils import load_cached_manifest
+from datapilot.core.platforms.dbt.wrappers.manifest.attachments import TestAttachmentIndex
+
+INSIGHTS = [
+    "check_model_has_tests_by_name",
+    "check_model_has_tests_by_type",
+    "check_model_has_tests_by_group",
+    "check_source_has_tests",
+    "check_source_has_tests_by_name",
+    "check_source_has_tests_by_type",
+    "check_source_has_tests_by_group",
+    "missing_primary_key_tests",
+    "dbt_low_test_coverage",
+]
+
+CONFIG = {
+    "insights": {
+        "check_model_has_tests_by_name": {"tests": [{"test": "unique", "min_count": 1}]},
+        "check_model_has_tests_by_type": {"tests": [{"test": "generic", "min_count": 2}]},
+        "check_model_has_tests_by_group": {"tests": [{"test_group": ["unique", "not_null"], "min_count": 1}]},
+        "check_source_has_tests": {"tests": 1},
+        "check_source_has_tests_by_name": {"tests": [{"test": "unique", "min_count": 1}]},
+        "check_source_has_tests_by_type": {"tests": [{"test": "schema", "min_count": 1}]},
+        "check_source_has_tests_by_group": {"tests": [{"test_group": ["unique", "not_null"], "min_count": 1}]},
+    }
+}
+
+
+def scan_coverage(generator: DBTInsightGenerator) -> float:
+    """
+    DBTTestCoverage._calculate_coverage as it was, with a scan of all the tests.
+    """
+    num_models = sum(1 for node in generator.nodes.values() if node.resource_type == "model")
+    models_with_tests = set()
+    for test in generator.tests.values():
+        if test.test_type == SINGULAR:
+            return 100
+        if test.package_name == generator.project_name:
+            models_with_tests.update(test.depends_on.nodes if test.depends_on else ())
+    return round((len(models_with_tests) / num_models) * 100) if num_models > 0 else 100
+
+
+def run_insights(generator: DBTInsightGenerator, test_index=None):
+    """
+    Run the insights on the tests, sharing test_index, or each building its own when it is None.
+    """
+    results = {}
+    for alias in INSIGHTS:
+        insight = load_insight(alias)(
+            manifest_wrapper=generator.manifest_wrapper,
+            nodes=generator.nodes,
+            macros=generator.macros,
+            sources=generator.sources,
+            seeds=generator.seeds,
+            exposures=generator.exposures,
+            children_map=generator.children_map,
+            tests=generator.tests,
+            project_name=generator.project_name,
+            config=generator.config,
+            graph=generator.graph,
+            entities=generator.entities,
+            test_index=test_index,
+        )
+        results[alias] = len(insight.generate())
+    return results
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main(models, tests):
+    # The insights log every finding
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path, _ = write_artifacts(directory, models=models, tests=tests)
+        manifest = load_cached_manifest(manifest_path)
+    generator = DBTInsightGenerator(manifest=manifest, config=CONFIG)
+
+    scan_seconds, _ = timed(scan_coverage, generator)
+    build_seconds, test_index = timed(TestAttachmentIndex.from_index, generator.index)
+    lookup_seconds, _ = timed(lambda: len(test_index.project_tested_ids))
+    per_insight_seconds, per_insight = timed(run_insights, generator)
+    shared_seconds, shared = timed(run_insights, generator, test_index)
+    if per_insight != shared:
+        raise AssertionError("The shared index found different results")
+
+    print(f"Synthetic project of {models} models, {len(generator.sources)} sources and {len(generator.tests)} tests\n")
+    rows = [
+        ["build the index", "", f"{build_seconds:.3f}"],
+        ["tested models of the coverage", f"{scan_seconds:.3f}", f"{lookup_seconds:.6f}"],
+        [f"{len(INSIGHTS)} insights on tests", f"{per_insight_seconds:.3f}", f"{shared_seconds:.3f}"],
+    ]
+    print(tabulate(rows, headers=["", "per insight (s)", "shared index (s)"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]], *[50_000, 4][len(sys.argv[1:3]) :])
@@ -0,0 +1,107 @@
+"""
+Time the detection of long chains of views on a synthetic layered DAG, with the recursive
+search that find_long_chains used before and with the current one.
+
+The DAG has LAYERS layers of WIDTH models. Every model depends on two models of the layer
+above it and is a view with the given probability, a table otherwise.
+
+Usage:
+    python benchmarks/bench_view_chains.py [WIDTH] [LAYERS]
+"""
+import random
+import sys
+import time
+
+from tabulate import tabulate
+
+from datapilot.core.platforms.dbt.constants import NON_MATERIALIZED
+from datapilot.core.platforms.dbt.insights.performance.chain_view_linking import DBTChainViewLinking
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDependsOn
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateNodeConfig
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+
+# (probability of a view, minimum chain length)
+CASES = [(1.0, 4), (0.5, 4), (0.5, 8), (0.6, 12)]
+
+
+def synthetic_insight(width: int, layers: int, view_probability: float, seed: int = 0) -> DBTChainViewLinking:
+    rng = random.Random(seed)
+    nodes = {}
+    for layer in range(layers):
+        for i in range(width):
+            parents = [f"model.bench.m_{layer - 1}_{rng.randrange(width)}" for _ in range(2)] if layer else []
+            materialized = "view" if rng.random() < view_probability else "table"
+            unique_id = f"model.bench.m_{layer}_{i}"
+            nodes[unique_id] = AltimateManifestNode.construct(
+                unique_id=unique_id,
+                resource_type=AltimateResourceType.model,
+                config=AltimateNodeConfig.construct(materialized=materialized),
+                depends_on=AltimateDependsOn.construct(nodes=parents),
+            )
+    return DBTChainViewLinking(
+        manifest_wrapper=None,
+        nodes=nodes,
+        sources={},
+        exposures={},
+        tests={},
+        seeds={},
+        macros={},
+        children_map={},
+        project_name="bench",
+    )
+
+
+def recursive_find_long_chains(insight, min_chain_length):
+    """find_long_chains as it was implemented before."""
+
+    def is_not_materialized(node) -> bool:
+        if node.resource_type == AltimateResourceType.source:
+            return False
+        return node.config.materialized in NON_MATERIALIZED
+
+    def build_chain(node_id, current_chain):
+        if len(current_chain) >= min_chain_length:
+            long_chains.append(current_chain)
+            return
+        for parent_id in insight.get_node(node_id).depends_on.nodes:
+            if is_not_materialized(insight.get_node(parent_id)):
+                build_chain(parent_id, [*current_chain, parent_id])
+
+    long_chains = []
+    for node_id, node in insight.nodes.items():
+        if is_not_materialized(node):
+            build_chain(node_id, [node_id])
+    return long_chains
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(width, layers):
+    rows = []
+    for view_probability, min_chain_length in CASES:
+        insight = synthetic_insight(width, layers, view_probability)
+        before, before_time = timed(recursive_find_long_chains, insight, min_chain_length)
+        after, after_time = timed(insight.find_long_chains, min_chain_length)
+        assert before == after
+        rows.append(
+            [
+                f"{width * layers}",
+                f"{view_probability:.0%}",
+                min_chain_length,
+                len(after),
+                f"{before_time:.2f}",
+                f"{after_time:.2f}",
+                f"{before_time / after_time:.1f}x",
+            ]
+        )
+    print(tabulate(rows, headers=["models", "views", "min length", "chains", "recursive (s)", "current (s)", "speedup"], tablefmt="github"))
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [250, 200][len(args) :]))
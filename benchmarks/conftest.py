@@ -0,0 +1,53 @@
+"""
+Fixtures of the benchmark suite, see test_suite.py. The synthetic artifacts are written once
+per size to the pytest cache and reused by the next runs.
+"""
+import logging
+from pathlib import Path
+
+import pytest
+from synthetic import write_artifacts
+
+DEFAULT_SIZES = "1000,10000,50000"
+# Default storage of the saved runs, compared against with --benchmark-compare
+BASELINES = Path(__file__).parent / "baselines"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--synthetic-models",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated numbers of models of the synthetic projects to benchmark on. Defaults to {DEFAULT_SIZES}.",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    if config.getoption("benchmark_storage", None) == "file://./.benchmarks":
+        config.option.benchmark_storage = BASELINES.as_uri()
+
+
+def pytest_generate_tests(metafunc):
+    if "models" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("synthetic_models").split(",")]
+        metafunc.parametrize("models", sizes, ids=[f"{size}_models" for size in sizes], scope="session")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quiet_insights():
+    # The insights log every finding, which would be timed as well
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="session")
+def artifacts(request, models):
+    """
+    Paths of the manifest and catalog of the synthetic project of the given size.
+    """
+    directory = Path(request.config.cache.mkdir(f"synthetic_v12_{models}"))
+    manifest_path, catalog_path = directory / "manifest.json", directory / "catalog.json"
+    if not (manifest_path.exists() and catalog_path.exists()):
+        write_artifacts(directory, models=models, version="v12")
+    return manifest_path, catalog_path
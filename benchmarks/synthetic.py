@@ -0,0 +1,378 @@
+"""
+Synthetic dbt projects for the benchmarks: a manifest of the v10, v11 or v12 schema, the
+catalog that goes with it and the run_results.json of a run of its models.
+
+The models are spread over DEPTH layers. Layer 0 holds the staging models, which read from
+the sources, and every model of a later layer reads from a model of the layer just above it
+and from up to MAX_PARENTS - 1 models of any earlier layer, so the longest path of the DAG
+has DEPTH models. The fanout distribution picks the parents within a layer: uniformly, or
+with a power law that turns a few models into hubs with hundreds of children.
+
+Every model has COLUMNS columns in the catalog, half of them documented in the manifest, and
+TESTS generic tests on its first column.
+
+Usage:
+    python benchmarks/synthetic.py OUTPUT_DIR [--models N] [--sources N] [--tests N] [--columns N]
+        [--depth N] [--max-parents N] [--fanout uniform|power] [--views FRACTION] [--version v10|v11|v12]
+"""
+import argparse
+import hashlib
+import json
+import random
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+PROJECT = "bench"
+VERSIONS = ["v10", "v11", "v12"]
+UNIFORM = "uniform"
+POWER = "power"
+FANOUTS = [UNIFORM, POWER]
+# Top-level sections that every version has, the others are added per version
+TOP_LEVEL = ["docs", "exposures", "metrics", "groups", "selectors", "disabled", "group_map", "semantic_models"]
+VERSION_TOP_LEVEL = {"v10": [], "v11": ["saved_queries"], "v12": ["saved_queries", "unit_tests"]}
+SOURCE_GROUPS = 10
+DIRECTORIES = 20
+TEST_NAMES = ["unique", "not_null", "accepted_values", "relationships"]
+
+
+def _pick(rng: random.Random, candidates: List[Dict], fanout: str) -> Dict:
+    if fanout == POWER:
+        # Pareto ranks, the first candidates of a layer get most of the children
+        return candidates[min(len(candidates), int(rng.paretovariate(1.0))) - 1]
+    return candidates[rng.randrange(len(candidates))]
+
+
+def _layer_name(layer: int, depth: int) -> Tuple[str, str]:
+    if layer == 0:
+        return "staging", "stg"
+    if layer == depth - 1:
+        return "marts", "fct"
+    return "intermediate", "int"
+
+
+def _source(i: int) -> Dict:
+    source_name = f"src_{i % SOURCE_GROUPS}"
+    name = f"table_{i}"
+    return {
+        "database": "analytics",
+        "schema": "raw",
+        "name": name,
+        "resource_type": "source",
+        "package_name": PROJECT,
+        "path": "models/staging/sources.yml",
+        "original_file_path": "models/staging/sources.yml",
+        "unique_id": f"source.{PROJECT}.{source_name}.{name}",
+        "fqn": [PROJECT, "staging", source_name, name],
+        "source_name": source_name,
+        "source_description": "",
+        "loader": "",
+        "identifier": name,
+        "description": f"Raw table {i}" if i % 2 else "",
+        "columns": {},
+        "meta": {},
+        "source_meta": {},
+        "tags": [],
+        "config": {"enabled": True},
+        "unrendered_config": {},
+        "relation_name": f"analytics.raw.{name}",
+        "created_at": 0.0,
+    }
+
+
+def _model(name: str, directory: str, parents: List[Dict], columns: int, materialized: str, documented: bool) -> Dict:
+    unique_id = f"model.{PROJECT}.{name}"
+    refs = [parent for parent in parents if parent["resource_type"] == "model"]
+    sources = [parent for parent in parents if parent["resource_type"] == "source"]
+    from_clauses = [f"{{{{ ref('{parent['name']}') }}}}" for parent in refs]
+    from_clauses += [f"{{{{ source('{parent['source_name']}', '{parent['name']}') }}}}" for parent in sources]
+    column_names = [f"column_{j}" for j in range(columns)]
+    raw_code = "select\n    " + ",\n    ".join(column_names) + "\nfrom " + "\njoin ".join(from_clauses)
+    return {
+        "database": "analytics",
+        "schema": "bench",
+        "name": name,
+        "resource_type": "model",
+        "package_name": PROJECT,
+        "path": f"{directory}/{name}.sql",
+        "original_file_path": f"models/{directory}/{name}.sql",
+        "unique_id": unique_id,
+        "fqn": [PROJECT, *directory.split("/"), name],
+        "alias": name,
+        "checksum": {"name": "sha256", "checksum": hashlib.sha256(raw_code.encode()).hexdigest()},
+        "config": {"enabled": True, "materialized": materialized, "tags": [], "meta": {}},
+        "tags": [],
+        "description": f"The {name} model" if documented else "",
+        # Half of the columns are documented, the catalog has all of them
+        "columns": {
+            column: {"name": column, "description": f"The {column} column", "meta": {}, "data_type": None, "tags": []}
+            for column in column_names[: columns // 2]
+        },
+        "meta": {},
+        "patch_path": f"{PROJECT}://models/{directory}/schema.yml" if documented else None,
+        "unrendered_config": {"materialized": materialized},
+        "created_at": 0.0,
+        "relation_name": f"analytics.bench.{name}",
+        "raw_code": raw_code,
+        "language": "sql",
+        "refs": [{"name": parent["name"], "package": None, "version": None} for parent in refs],
+        "sources": [[parent["source_name"], parent["name"]] for parent in sources],
+        "metrics": [],
+        "depends_on": {"macros": [], "nodes": [parent["unique_id"] for parent in parents]},
+        "access": "protected",
+        "constraints": [],
+        "version": None,
+        "latest_version": None,
+        "deprecation_date": None,
+    }
+
+
+def _test(test_name: str, model: Dict) -> Dict:
+    column = "column_0"
+    name = f"{test_name}_{model['name']}_{column}"
+    directory = model["original_file_path"].rsplit("/", 1)[0]
+    return {
+        "database": "analytics",
+        "schema": "bench_dbt_test__audit",
+        "name": name,
+        "resource_type": "test",
+        "package_name": PROJECT,
+        "path": f"{name}.sql",
+        "original_file_path": f"{directory}/schema.yml",
+        "unique_id": f"test.{PROJECT}.{name}",
+        "fqn": [PROJECT, *directory.split("/")[1:], name],
+        "alias": name,
+        "checksum": {"name": "none", "checksum": ""},
+        "config": {"enabled": True, "materialized": "test", "severity": "ERROR", "tags": [], "meta": {}},
+        "tags": [],
+        "description": "",
+        "columns": {},
+        "meta": {},
+        "unrendered_config": {},
+        "created_at": 0.0,
+        "raw_code": f"{{{{ test_{test_name}(**_dbt_generic_test_kwargs) }}}}",
+        "language": "sql",
+        "refs": [{"name": model["name"], "package": None, "version": None}],
+        "sources": [],
+        "metrics": [],
+        "depends_on": {"macros": [f"macro.dbt.test_{test_name}"], "nodes": [model["unique_id"]]},
+        "column_name": column,
+        "file_key_name": f"models.{model['name']}",
+        "attached_node": model["unique_id"],
+        "test_metadata": {"name": test_name, "kwargs": {"column_name": column}, "namespace": None},
+    }
+
+
+def synthetic_manifest(
+    models: int = 1000,
+    sources: Optional[int] = None,
+    tests: int = 2,
+    columns: int = 10,
+    depth: int = 10,
+    max_parents: int = 3,
+    fanout: str = UNIFORM,
+    views: float = 0.3,
+    version: str = "v12",
+    seed: int = 0,
+) -> Dict:
+    """
+    Manifest of a synthetic project, as decoded from manifest.json. See the module docstring
+    for its shape. sources defaults to a tenth of the models.
+    """
+    if version not in VERSIONS:
+        raise ValueError(f"Unknown manifest version: {version}. Expected one of {', '.join(VERSIONS)}")
+    if fanout not in FANOUTS:
+        raise ValueError(f"Unknown fanout distribution: {fanout}. Expected one of {', '.join(FANOUTS)}")
+    rng = random.Random(seed)
+    depth = max(1, min(depth, models))
+    source_nodes = [_source(i) for i in range(max(1, models // 10 if sources is None else sources))]
+
+    nodes: Dict[str, Dict] = {}
+    layers: List[List[Dict]] = []
+    for layer in range(depth):
+        directory, prefix = _layer_name(layer, depth)
+        # The models are spread evenly over the layers
+        size = models // depth + (layer < models % depth)
+        current = []
+        for i in range(size):
+            if layer == 0:
+                parents = [_pick(rng, source_nodes, fanout)]
+            else:
+                parents = [_pick(rng, layers[-1], fanout)]
+                for _ in range(rng.randrange(max_parents)):
+                    parents.append(_pick(rng, layers[rng.randrange(layer)], fanout))
+            # Staging models are views, as dbt recommends
+            materialized = "view" if layer == 0 or rng.random() < views else "table"
+            model = _model(
+                f"{prefix}_{layer}_{i}",
+                f"{directory}/group_{i % DIRECTORIES}",
+                list({parent["unique_id"]: parent for parent in parents}.values()),
+                columns,
+                materialized,
+                documented=rng.random() < 0.7,
+            )
+            nodes[model["unique_id"]] = model
+            current.append(model)
+        layers.append(current)
+
+    for model in [model for layer in layers for model in layer]:
+        for test_name in TEST_NAMES[:tests]:
+            test = _test(test_name, model)
+            nodes[test["unique_id"]] = test
+
+    parent_map = {unique_id: node["depends_on"]["nodes"] for unique_id, node in nodes.items()}
+    parent_map.update({source["unique_id"]: [] for source in source_nodes})
+    child_map: Dict[str, List[str]] = {unique_id: [] for unique_id in parent_map}
+    for unique_id, parents in parent_map.items():
+        for parent in parents:
+            child_map[parent].append(unique_id)
+
+    manifest = {
+        "metadata": {
+            "dbt_schema_version": f"https://schemas.getdbt.com/dbt/manifest/{version}.json",
+            "dbt_version": {"v10": "1.6.0", "v11": "1.7.0", "v12": "1.8.0"}[version],
+            "generated_at": "2024-01-01T00:00:00.000000Z",
+            "invocation_id": "00000000-0000-0000-0000-000000000000",
+            "env": {},
+            "project_name": PROJECT,
+            "adapter_type": "snowflake",
+        },
+        "nodes": nodes,
+        "sources": {source["unique_id"]: source for source in source_nodes},
+        "macros": {},
+        "parent_map": parent_map,
+        "child_map": child_map,
+    }
+    for section in TOP_LEVEL + VERSION_TOP_LEVEL[version]:
+        manifest[section] = {}
+    return manifest
+
+
+def synthetic_catalog(manifest: Dict, seed: int = 0) -> Dict:
+    """
+    Catalog of the models and sources of a synthetic manifest. Every model has the columns of
+    its SQL, sources have five columns.
+    """
+    rng = random.Random(seed)
+
+    def table(node: Dict, column_names: List[str]) -> Dict:
+        return {
+            "metadata": {
+                "type": "VIEW" if node.get("config", {}).get("materialized") == "view" else "BASE TABLE",
+                "schema": node["schema"].upper(),
+                "name": node.get("alias", node["name"]).upper(),
+                "database": node["database"].upper(),
+                "comment": None,
+                "owner": None,
+            },
+            "columns": {
+                column.upper(): {
+                    "type": rng.choice(["TEXT", "NUMBER", "TIMESTAMP_NTZ"]),
+                    "index": i + 1,
+                    "name": column.upper(),
+                    "comment": None,
+                }
+                for i, column in enumerate(column_names)
+            },
+            "stats": {},
+            "unique_id": node["unique_id"],
+        }
+
+    nodes = {}
+    for unique_id, node in manifest["nodes"].items():
+        if node["resource_type"] == "model":
+            column_names = node["raw_code"].split("from", 1)[0].replace("select", "").replace(",", " ").split()
+            nodes[unique_id] = table(node, column_names)
+    return {
+        "metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/catalog/v1.json", "dbt_version": "1.7.4", "env": {}},
+        "nodes": nodes,
+        "sources": {unique_id: table(source, [f"field_{j}" for j in range(5)]) for unique_id, source in manifest["sources"].items()},
+        "errors": None,
+    }
+
+
+def synthetic_run_results(manifest: Dict, seed: int = 0) -> Dict:
+    """
+    run_results.json (v5) of a run of all the models of a synthetic manifest. Run times follow
+    a log-normal distribution, so that a few models run for minutes. Runs with different seeds
+    serve as a run and its baseline.
+    """
+    rng = random.Random(seed)
+    started_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    results = []
+    for unique_id, node in manifest["nodes"].items():
+        if node["resource_type"] != "model":
+            continue
+        execution_time = round(rng.lognormvariate(1, 1.5), 3)
+        completed_at = started_at + timedelta(seconds=execution_time)
+        results.append(
+            {
+                "status": "success",
+                "timing": [
+                    {"name": "compile", "started_at": started_at.isoformat(), "completed_at": started_at.isoformat()},
+                    {"name": "execute", "started_at": started_at.isoformat(), "completed_at": completed_at.isoformat()},
+                ],
+                "thread_id": f"Thread-{len(results) % 8 + 1}",
+                "execution_time": execution_time,
+                "adapter_response": {},
+                "message": "SUCCESS 1",
+                "failures": None,
+                "unique_id": unique_id,
+                "compiled": True,
+                "compiled_code": node["raw_code"],
+                "relation_name": f'"{node["database"]}"."{node["schema"]}"."{node.get("alias", node["name"])}"',
+            }
+        )
+    return {
+        "metadata": {
+            "dbt_schema_version": "https://schemas.getdbt.com/dbt/run-results/v5.json",
+            "dbt_version": "1.7.4",
+            "generated_at": started_at.isoformat(),
+            "invocation_id": f"00000000-0000-0000-0000-{seed:012d}",
+            "env": {},
+        },
+        "results": results,
+        "elapsed_time": sum(result["execution_time"] for result in results),
+        "args": {"which": "run"},
+    }
+
+
+def write_artifacts(output_dir, **kwargs) -> Tuple[Path, Path]:
+    """
+    Write manifest.json and catalog.json of a synthetic project to output_dir. The keyword
+    arguments are those of synthetic_manifest.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = synthetic_manifest(**kwargs)
+    manifest_path, catalog_path = output_dir / "manifest.json", output_dir / "catalog.json"
+    manifest_path.write_text(json.dumps(manifest))
+    catalog_path.write_text(json.dumps(synthetic_catalog(manifest, seed=kwargs.get("seed", 0))))
+    return manifest_path, catalog_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the manifest and catalog of a synthetic dbt project.")
+    parser.add_argument("output_dir")
+    parser.add_argument("--models", type=int, default=1000)
+    parser.add_argument("--sources", type=int, default=None)
+    parser.add_argument("--tests", type=int, default=2, help="Generic tests per model")
+    parser.add_argument("--columns", type=int, default=10, help="Columns per model")
+    parser.add_argument("--depth", type=int, default=10, help="Number of layers of models")
+    parser.add_argument("--max-parents", type=int, default=3)
+    parser.add_argument("--fanout", choices=FANOUTS, default=UNIFORM)
+    parser.add_argument("--views", type=float, default=0.3, help="Fraction of the non-staging models that are views")
+    parser.add_argument("--version", choices=VERSIONS, default="v12")
+    parser.add_argument("--seed", type=int, default=0)
+    args = vars(parser.parse_args())
+    manifest_path, catalog_path = write_artifacts(args.pop("output_dir"), **args)
+    print(f"Wrote {manifest_path} and {catalog_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark suite of the loading of the artifacts, the construction of the insight generator,
+every insight and the formatting of the report, on synthetic projects of 1k, 10k and 50k
+models. It needs pytest-benchmark, see benchmarks/requirements.txt.
+
+Usage:
+    pytest benchmarks                                   # all the sizes
+    pytest benchmarks --synthetic-models 1000           # a single size
+    pytest benchmarks --benchmark-save=<name>           # store a run in benchmarks/baselines
+    pytest benchmarks --benchmark-compare=0001 --benchmark-compare-fail=mean:25%
+    pytest benchmarks --benchmark-disable               # run everything once, as a smoke test
+"""
+import contextlib
+import io
+from pathlib import Path
+
+import pytest
+from synthetic import VERSIONS
+from synthetic import synthetic_run_results
+from synthetic import write_artifacts
+
+from datapilot.config.config import load_config
+from datapilot.core.platforms.dbt.cli.cli import echo_reports
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.insights import INSIGHTS
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.core.platforms.dbt.utils import load_raw_manifest
+from datapilot.core.platforms.dbt.utils import parse_run_results
+
+# Config of the repository tests, which enables the insights that need one
+CONFIG_PATH = Path(__file__).parent.parent / "tests" / "data" / "config.yml"
+
+
+def rounds(models: int) -> int:
+    # The largest projects take seconds per round
+    return max(1, min(5, 20_000 // models))
+
+
+def run(benchmark, models, func, *args, **kwargs):
+    return benchmark.pedantic(func, args=args, kwargs=kwargs, rounds=rounds(models), iterations=1)
+
+
+@pytest.fixture(scope="session")
+def manifest(artifacts):
+    return load_manifest(str(artifacts[0]))
+
+
+@pytest.fixture(scope="session")
+def catalog(artifacts):
+    return load_catalog(str(artifacts[1]))
+
+
+@pytest.fixture(scope="session")
+def generator(artifacts, manifest, catalog):
+    # A run and its baseline, so that the insights on the run time have data
+    raw_manifest = load_raw_manifest(str(artifacts[0]))
+    return DBTInsightGenerator(
+        manifest=manifest,
+        catalog=catalog,
+        config=load_config(CONFIG_PATH),
+        run_results=parse_run_results(synthetic_run_results(raw_manifest, seed=0)),
+        baseline_run_results=parse_run_results(synthetic_run_results(raw_manifest, seed=1)),
+    )
+
+
+@pytest.mark.parametrize("version", VERSIONS)
+def test_load_manifest(benchmark, request, models, version):
+    directory = Path(request.config.cache.mkdir(f"synthetic_{version}_{models}"))
+    if not (directory / "manifest.json").exists():
+        write_artifacts(directory, models=models, version=version)
+    run(benchmark, models, load_manifest, str(directory / "manifest.json"))
+
+
+def test_load_raw_manifest(benchmark, models, artifacts):
+    run(benchmark, models, load_raw_manifest, str(artifacts[0]))
+
+
+def test_load_catalog(benchmark, models, artifacts):
+    run(benchmark, models, load_catalog, str(artifacts[1]))
+
+
+def test_get_manifest_wrapper(benchmark, models, manifest):
+    # The index is built by the wrapper on first use, and cached on it
+    run(benchmark, models, lambda: DBTFactory.get_manifest_wrapper(manifest).get_index())
+
+
+def test_insight_generator_init(benchmark, models, manifest, catalog):
+    run(benchmark, models, DBTInsightGenerator, manifest=manifest, catalog=catalog)
+
+
+@pytest.mark.parametrize("insight_class", INSIGHTS, ids=[insight_class.ALIAS for insight_class in INSIGHTS])
+def test_insight(benchmark, models, generator, insight_class):
+    def setup():
+        # Insights may change their state from the config in __init__, every round gets its own
+        insight = insight_class(
+            manifest_wrapper=generator.manifest_wrapper,
+            catalog_wrapper=generator.catalog_wrapper,
+            nodes=generator.nodes,
+            macros=generator.macros,
+            sources=generator.sources,
+            seeds=generator.seeds,
+            exposures=generator.exposures,
+            children_map=generator.children_map,
+            tests=generator.tests,
+            project_name=generator.project_name,
+            config=generator.config,
+            graph=generator.graph,
+            entities=generator.entities,
+            test_index=generator.test_index,
+            run_results=generator.run_results,
+            baseline_run_results=generator.baseline_run_results,
+        )
+        return (insight,), {}
+
+    benchmark.pedantic(lambda insight: insight.generate(), setup=setup, rounds=rounds(models), iterations=1)
+
+
+def test_format_report(benchmark, models, generator):
+    reports = generator.run()
+
+    def format_reports():
+        with contextlib.redirect_stdout(io.StringIO()):
+            echo_reports(reports)
+
+    run(benchmark, models, format_reports)
@@ -10,11 +10,21 @@ from datapilot.config.config import load_config
 from datapilot.core.platforms.dbt.constants import MODEL
 from datapilot.core.platforms.dbt.constants import PROJECT
 from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.executor import get_projection
 from datapilot.core.platforms.dbt.formatting import generate_model_insights_table
 from datapilot.core.platforms.dbt.formatting import generate_project_insights_table
-from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_cached_catalog
+from datapilot.core.platforms.dbt.utils import load_cached_manifest
 from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.core.platforms.dbt.utils import load_run_results
+from datapilot.core.platforms.dbt.writers import REPORT_FORMATS
+from datapilot.core.platforms.dbt.writers import TEXT
+from datapilot.core.platforms.dbt.writers import get_report_writer
+from datapilot.utils.cache import DiskCache
 from datapilot.utils.formatting.utils import tabulate_data
+from datapilot.utils.profiling import PROFILE_FORMATS
+from datapilot.utils.profiling import TABLE
+from datapilot.utils.profiling import Profiler
 from datapilot.utils.utils import map_url_to_instance
 
 logging.basicConfig(level=logging.INFO)
@@ -37,6 +47,16 @@ def dbt():
     required=False,
     help="Path to the DBT catalog file",
 )
+@click.option(
+    "--run-results-path",
+    required=False,
+    help="Path to the run_results.json of a dbt run or build, enables the insights on the run time of the models",
+)
+@click.option(
+    "--baseline-run-results-path",
+    required=False,
+    help="Path to the run_results.json of a baseline run, e.g. the previous production run, to find the models that got slower",
+)
 @click.option(
     "--config-path",
     required=False,
@@ -48,41 +68,159 @@ def dbt():
     default=None,
     help="Selective model testing. Specify one or more models to run tests on.",
 )
-def project_health(manifest_path, catalog_path, config_path=None, select=None):
+@click.option(
+    "--skip-validation",
+    is_flag=True,
+    default=False,
+    help="Build the manifest nodes straight from the manifest JSON without validating it. Faster on large projects.",
+)
+@click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="Number of insights to run in parallel. Uses forked worker processes where available, threads otherwise.",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Do not read or write the on-disk cache of parsed manifests and catalogs.",
+)
+@click.option(
+    "--cache-dir",
+    required=False,
+    default=None,
+    help="Directory of the on-disk cache. Defaults to ~/.cache/datapilot.",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    default=False,
+    help="Only re-evaluate the nodes that changed since the previous incremental run, and reuse its results for the others.",
+)
+@click.option(
+    "--format",
+    "report_format",
+    type=click.Choice(REPORT_FORMATS),
+    default=TEXT,
+    help="Format of the report. json, jsonl and sarif stream the findings as every insight finishes, sarif for code scanning tools.",
+)
+@click.option(
+    "--output",
+    required=False,
+    default=None,
+    help="File to write the report to. Defaults to stdout.",
+)
+@click.option(
+    "--profile",
+    type=click.Choice(PROFILE_FORMATS),
+    default=None,
+    help="Report the time taken by every phase and insight, as a table, as JSON or as a Chrome trace that speedscope also opens.",
+)
+@click.option(
+    "--profile-output",
+    required=False,
+    default=None,
+    help="File to write the profile to. Defaults to stderr.",
+)
+@click.option(
+    "--profile-memory",
+    is_flag=True,
+    default=False,
+    help="Also report the peak memory allocated by every phase and insight, with tracemalloc. Slows the run down.",
+)
+def project_health(
+    manifest_path,
+    catalog_path,
+    run_results_path=None,
+    baseline_run_results_path=None,
+    config_path=None,
+    select=None,
+    skip_validation=False,
+    jobs=1,
+    no_cache=False,
+    cache_dir=None,
+    incremental=False,
+    report_format=TEXT,
+    output=None,
+    profile=None,
+    profile_output=None,
+    profile_memory=False,
+):
     """
     Validate the DBT project's configuration and structure.
     :param manifest_path: Path to the DBT manifest file.
     """
+    if profile_memory and not profile:
+        profile = TABLE
+    profiler = Profiler(enabled=profile is not None, trace_memory=profile_memory).start()
     config = None
     if config_path:
         config = load_config(config_path)
     selected_models = []
     if select:
         selected_models = select.split(" ")
-    manifest = load_manifest(manifest_path)
-    catalog = load_catalog(catalog_path) if catalog_path else None
-    insight_generator = DBTInsightGenerator(manifest=manifest, catalog=catalog, config=config, selected_models=selected_models)
-    reports = insight_generator.run()
+    if baseline_run_results_path and not run_results_path:
+        raise click.UsageError("--baseline-run-results-path is compared to the run results of --run-results-path, which is missing")
+    if incremental and no_cache:
+        raise click.UsageError("--incremental keeps the results of the previous run in the cache, it cannot be used with --no-cache")
+    cache = None if no_cache else DiskCache(cache_dir)
+    manifest = load_cached_manifest(
+        manifest_path, cache=cache, skip_validation=skip_validation, profiler=profiler, projection=get_projection(config)
+    )
+    catalog = load_cached_catalog(catalog_path, cache=cache, profiler=profiler) if catalog_path else None
+    run_results = load_run_results(run_results_path, profiler=profiler) if run_results_path else None
+    baseline_run_results = load_run_results(baseline_run_results_path, profiler=profiler) if baseline_run_results_path else None
+    insight_generator = DBTInsightGenerator(
+        manifest=manifest,
+        catalog=catalog,
+        run_results=run_results,
+        baseline_run_results=baseline_run_results,
+        config=config,
+        selected_models=selected_models,
+        jobs=jobs,
+        incremental_cache=cache if incremental else None,
+        profiler=profiler,
+    )
+    if report_format == TEXT:
+        reports = insight_generator.run()
+        with profiler.phase("format report"), click.open_file(output or "-", "w") as file:
+            echo_reports(reports, file=file)
+    else:
+        with click.open_file(output or "-", "wb") as stream:
+            writer = get_report_writer(report_format, stream)
+            writer.open()
+            insight_generator.run(on_results=writer.write)
+            with profiler.phase("format report"):
+                writer.close()
+
+    profiler.stop()
+    if profile and profile_output:
+        profiler.write(profile, profile_output)
+    elif profile:
+        click.echo(profiler.format(profile), err=True)
+
 
+def echo_reports(reports, file=None):
     package_insights = reports[PROJECT]
     model_insights = reports[MODEL]
     model_report = generate_model_insights_table(model_insights)
     if len(model_report) > 0:
-        click.echo("--" * 50)
-        click.echo("Model Insights")
-        click.echo("--" * 50)
+        click.echo("--" * 50, file=file)
+        click.echo("Model Insights", file=file)
+        click.echo("--" * 50, file=file)
     for model_id, report in model_report.items():
-        click.echo(f"Model: {model_id}")
-        click.echo(f"File path: {report['path']}")
-        click.echo(tabulate_data(report["table"], headers="keys"))
-        click.echo("\n")
+        click.echo(f"Model: {model_id}", file=file)
+        click.echo(f"File path: {report['path']}", file=file)
+        click.echo(tabulate_data(report["table"], headers="keys"), file=file)
+        click.echo("\n", file=file)
 
     if len(package_insights) > 0:
         project_report = generate_project_insights_table(package_insights)
-        click.echo("--" * 50)
-        click.echo("Project Insights")
-        click.echo("--" * 50)
-        click.echo(tabulate_data(project_report, headers="keys"))
+        click.echo("--" * 50, file=file)
+        click.echo("Project Insights", file=file)
+        click.echo("--" * 50, file=file)
+        click.echo(tabulate_data(project_report, headers="keys"), file=file)
 
 
 @dbt.command("onboard")
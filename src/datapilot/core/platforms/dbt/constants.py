@@ -32,3 +32,18 @@ OTHER_TEST_NODE = "other_test_node"
 
 
 FOLDER = "folder"
+
+
+# Top-level manifest sections read by the insights
+MANIFEST_SECTIONS = ("metadata", "nodes", "sources", "macros", "exposures")
+
+# Entity types of a ManifestIndex, by the name of their dict on the index
+NODES = "nodes"
+SOURCES = "sources"
+SEEDS = "seeds"
+TESTS = "tests"
+MACROS = "macros"
+EXPOSURES = "exposures"
+ENTITY_TYPES = (NODES, SOURCES, SEEDS, TESTS, MACROS, EXPOSURES)
+# The DAG of the nodes, the selector and the incremental runs rely on them, they are always built
+DAG_ENTITY_TYPES = (NODES, SOURCES, SEEDS)
@@ -1,21 +1,79 @@
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 
 # from src.utils.formatting.utils import generate_model_insights_table
+from typing import Callable
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Tuple
+from typing import Type
 
 from datapilot.core.platforms.dbt.constants import MODEL
 from datapilot.core.platforms.dbt.constants import PROJECT
 from datapilot.core.platforms.dbt.exceptions import AltimateCLIArgumentError
 from datapilot.core.platforms.dbt.factory import DBTFactory
-from datapilot.core.platforms.dbt.insights import INSIGHTS
+from datapilot.core.platforms.dbt.incremental import IncrementalRun
+from datapilot.core.platforms.dbt.incremental import get_positions
+from datapilot.core.platforms.dbt.incremental import get_signature
+from datapilot.core.platforms.dbt.incremental import sort_results
+from datapilot.core.platforms.dbt.insights import INSIGHT_REGISTRY
+from datapilot.core.platforms.dbt.insights import get_insights
+from datapilot.core.platforms.dbt.insights import load_insight
+from datapilot.core.platforms.dbt.insights.visitor import NodeVisitor
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
 from datapilot.core.platforms.dbt.schemas.manifest import Catalog
 from datapilot.core.platforms.dbt.schemas.manifest import Manifest
-from datapilot.core.platforms.dbt.utils import get_models
+from datapilot.core.platforms.dbt.schemas.manifest import RunResults
+from datapilot.core.platforms.dbt.selector import ModelSelector
+from datapilot.core.platforms.dbt.utils import load_run_results
+from datapilot.core.platforms.dbt.wrappers.manifest.attachments import TestAttachmentIndex
+from datapilot.core.platforms.dbt.wrappers.manifest.graph import ManifestGraph
+from datapilot.core.platforms.dbt.wrappers.manifest.projection import ManifestProjection
+from datapilot.utils.cache import DiskCache
 from datapilot.utils.formatting.utils import RED
 from datapilot.utils.formatting.utils import YELLOW
 from datapilot.utils.formatting.utils import color_text
+from datapilot.utils.profiling import INSIGHT
+from datapilot.utils.profiling import NO_PROFILER
+from datapilot.utils.profiling import PHASE
+from datapilot.utils.profiling import Profiler
+from datapilot.utils.profiling import measure
+
+# Insights to run in forked worker processes. Workers inherit it, together with the
+# manifest state the insights point to, so nothing but the results is pickled.
+_FORKED_INSIGHTS: List = []
+
+
+def get_projection(config: Optional[Dict] = None) -> ManifestProjection:
+    """
+    The entity types and the heavy fields of the manifest read by the insights that the
+    configuration does not disable. load_cached_manifest only builds those.
+    """
+    disabled_insights = (config or {}).get("disabled_insights", None) or []
+    return ManifestProjection.of_insights(get_insights(disabled_insights))
+
+
+def _generate(insight) -> Tuple[Optional[List], Dict, Optional[str]]:
+    results, error = None, None
+    # Measured where the insight runs, the span is returned with the results
+    with measure(insight.NAME, INSIGHT) as span:
+        try:
+            results = insight.generate()
+            if isinstance(insight, NodeVisitor):
+                # The results of every check of the pass, with the errors as text like the ones of the insights
+                results = [(checks, check_span, None if e is None else str(e)) for checks, check_span, e in results]
+        except Exception as e:
+            error = str(e)
+    return results, span, error
+
+
+def _generate_forked(position: int) -> Tuple[Optional[List], Dict, Optional[str]]:
+    return _generate(_FORKED_INSIGHTS[position])
 
 
 class DBTInsightGenerator:
@@ -29,13 +87,30 @@ class DBTInsightGenerator:
         target: str = "dev",
         selected_models: Optional[str] = None,
         selected_model_ids: Optional[List[str]] = None,
+        jobs: int = 1,
+        incremental_cache: Optional[DiskCache] = None,
+        profiler: Optional[Profiler] = None,
+        fuse_checks: bool = True,
+        run_results: Optional[RunResults] = None,
+        baseline_run_results: Optional[RunResults] = None,
     ):
         self.run_results_path = run_results_path
         self.target = target
         self.env = env
         self.config = config or {}
+        self.jobs = jobs
+        # Run the checks of every model and source in a single pass, see NodeVisitor
+        self.fuse_checks = fuse_checks
+        self.timings: Dict[str, float] = {}
+        self.profiler = profiler or NO_PROFILER
 
-        self.manifest_wrapper = DBTFactory.get_manifest_wrapper(manifest)
+        with self.profiler.phase("wrap manifest"):
+            # All the entities are built in a single pass over the manifest
+            self.manifest_wrapper = DBTFactory.get_manifest_wrapper(manifest)
+            # Only the entities and fields the enabled insights read, unless the index was built already
+            index = self.manifest_wrapper.get_index(get_projection(self.config))
+            self.index = index
+            self.entities = index.get_entities()
         self.manifest_present = True
         self.catalog_present = False
         self.catalog_wrapper = None
@@ -43,35 +118,49 @@ class DBTInsightGenerator:
         if catalog:
             self.catalog_wrapper = DBTFactory.get_catalog_wrapper(catalog)
             self.catalog_present = True
+            # Built once here, so that the insights and forked workers share it
+            with self.profiler.phase("index catalog"):
+                self.catalog_wrapper.get_index()
 
+        if run_results is None and run_results_path:
+            run_results = load_run_results(run_results_path, profiler=self.profiler)
+        self.run_results = None
         self.run_results_present = False
+        self.baseline_run_results = None
+        self.baseline_run_results_present = False
+        if run_results is not None:
+            # The timings of the models by unique id, shared by the insights on the run time
+            with self.profiler.phase("index run results"):
+                self.run_results = DBTFactory.get_run_results_wrapper(run_results).get_run_results()
+                if baseline_run_results is not None:
+                    self.baseline_run_results = DBTFactory.get_run_results_wrapper(baseline_run_results).get_run_results()
+            self.run_results_present = True
+            self.baseline_run_results_present = baseline_run_results is not None
         self.logger = logging.getLogger("dbt-insight-generator")
 
-        self.nodes = self.manifest_wrapper.get_nodes()
-        self.macros = self.manifest_wrapper.get_macros()
-        self.sources = self.manifest_wrapper.get_sources()
-        self.exposures = self.manifest_wrapper.get_exposures()
-        self.seeds = self.manifest_wrapper.get_seeds()
-        self.children_map = self.manifest_wrapper.parent_to_child_map(self.nodes)
-        self.tests = self.manifest_wrapper.get_tests()
-        self.project_name = self.manifest_wrapper.get_package()
+        self.nodes = index.nodes
+        self.macros = index.macros
+        self.sources = index.sources
+        self.exposures = index.exposures
+        self.seeds = index.seeds
+        self.children_map = index.children_map
+        self.tests = index.tests
+        self.project_name = index.project_name
+        # Graph insights share a single compact DAG, built before the insights are forked
+        with self.profiler.phase("build graph"):
+            self.graph = ManifestGraph.from_index(index)
+        # The insights on tests share the tests of every model and source
+        with self.profiler.phase("index tests"):
+            self.test_index = TestAttachmentIndex.from_index(index)
         self.selected_models = None
         self.selected_models_flag = False
-        entities = {
-            "nodes": self.nodes,
-            "sources": self.sources,
-            "exposures": self.exposures,
-            "tests": self.tests,
-        }
         if selected_model_ids:
             self.selected_models_flag = True
-            self.selected_models = selected_model_ids
+            self.selected_models = frozenset(selected_model_ids)
         elif selected_models:
             self.selected_models_flag = True
-            self.selected_models = get_models(
-                selected_models,
-                entities=entities,
-            )
+            with self.profiler.phase("select models"):
+                self.selected_models = ModelSelector.from_index(index).select(selected_models)
             if not self.selected_models:
                 raise AltimateCLIArgumentError(
                     f"Invalid values provided in the --select argument. Could not find models associated with pattern: --select {' '.join(selected_models)}"
@@ -79,27 +168,117 @@ class DBTInsightGenerator:
         self.excluded_models = None
         self.excluded_models_flag = False
 
-    def _check_if_skipped(self, insight):
-        if self.config.get("disabled_insights", False):
-            if insight.ALIAS in self.config.get("disabled_insights", []):
-                return True
-        return False
+        # Results of a previous run only cover the whole project, not a selection of it
+        self.incremental_run = None
+        if incremental_cache is not None and not self.selected_models_flag:
+            catalog_id = f"{catalog.metadata.invocation_id}:{catalog.metadata.generated_at}" if catalog else None
+            signature = get_signature(self.config, catalog_id, list(INSIGHT_REGISTRY))
+            with self.profiler.phase("incremental state"):
+                self.incremental_run = IncrementalRun(incremental_cache, index, signature)
+
+    def _execute(self, insights: List) -> Iterator[Tuple[Optional[List], Dict, Optional[str]]]:
+        """
+        Run the insights and yield their results, spans and errors in the order of the given
+        insights, each as soon as it and the ones before it are done. With more than one job
+        the insights run in forked worker processes, or in threads where fork is not available.
+
+        All the insights go to the process pool, not only the regex and graph ones. Every insight
+        is a pure Python pass over the in-memory manifest with no I/O to overlap, so threads
+        would hold the GIL in turn and run no faster than one after another. The workers share
+        the manifest with the parent through fork, so a process costs about as much as a
+        thread would.
+        """
+        if self.jobs <= 1 or len(insights) <= 1:
+            for insight in insights:
+                yield _generate(insight)
+                # The heavy fields an insight read are not kept for the next one
+                self.index.release()
+            return
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                yield from pool.map(_generate, insights)
+            return
+
+        _FORKED_INSIGHTS[:] = insights
+        try:
+            with ProcessPoolExecutor(max_workers=self.jobs, mp_context=multiprocessing.get_context("fork")) as pool:
+                yield from pool.map(_generate_forked, range(len(insights)))
+        finally:
+            _FORKED_INSIGHTS.clear()
+
+    def _is_fused(self, insight) -> bool:
+        return self.fuse_checks and isinstance(insight, PerNodeCheck)
 
-    def run(self):
+    def _get_tasks(self, insights: List) -> List:
+        """
+        The insights to execute, the checks of every model and source replaced by a single
+        NodeVisitor at the position of the first of them.
+        """
+        checks = [insight for insight in insights if self._is_fused(insight)]
+        if not checks:
+            return insights
+        tasks = []
+        for insight in insights:
+            if not self._is_fused(insight):
+                tasks.append(insight)
+            elif insight is checks[0]:
+                tasks.append(NodeVisitor(checks))
+        return tasks
+
+    def _get_fused_outcomes(self, outcome: Tuple) -> Iterator[Tuple[Optional[List], Dict, Optional[str]]]:
+        """
+        The results, spans and errors of every check of the NodeVisitor pass. The span of the
+        pass is recorded as a phase, the spans of the checks are their share of it and share
+        its peak memory.
+        """
+        results, span, error = outcome
+        span["category"] = PHASE
+        self.profiler.add(span)
+        if error is not None:
+            # The pass failed as a whole, every check fails with it
+            return repeat((None, None, error))
+        for _, check_span, _ in results:
+            check_span["peak_memory"] = span["peak_memory"]
+        return iter(results)
+
+    def run(self, on_results: Optional[Callable[[Type, List], None]] = None):
+        """
+        Run the insights and return their results by level, the model results by unique id.
+
+        :param on_results: Called with every insight class and its results as soon as the
+            insight is done, in the order of INSIGHT_REGISTRY. The results are then not kept in the
+            returned reports, so that the memory of the run does not grow with them.
+        """
         reports = {
             MODEL: {},
             PROJECT: [],
         }
-        for insight_class in INSIGHTS:
-            # TODO: Skip insight based on config
+        pending = []
+        disabled_insights = set(self.config.get("disabled_insights", None) or [])
+        for alias in INSIGHT_REGISTRY:
+            # Disabled insights are not even imported
+            if alias in disabled_insights:
+                self.logger.info(color_text(f"Skipping insight {alias} as it is not enabled in config", YELLOW))
+                continue
+            insight_class = load_insight(alias)
 
             run_insight, message = insight_class.has_all_required_data(
                 has_manifest=self.manifest_present,
                 has_catalog=self.catalog_present,
                 has_run_results=self.run_results_present,
+                has_baseline_run_results=self.baseline_run_results_present,
             )
 
             if run_insight:
+                selected_models = self.selected_models
+                if self.incremental_run and self.incremental_run.reuses(insight_class):
+                    if not self.incremental_run.dirty:
+                        self.logger.info(f"Reusing the results of the previous run for insight {insight_class.NAME}")
+                        pending.append((insight_class, None, message))
+                        continue
+                    selected_models = self.incremental_run.dirty
+
                 self.logger.info(f"Running insight {insight_class.NAME}")
                 insight = insight_class(
                     manifest_wrapper=self.manifest_wrapper,
@@ -113,45 +292,78 @@ class DBTInsightGenerator:
                     tests=self.tests,
                     project_name=self.project_name,
                     config=self.config,
-                    selected_models=self.selected_models,
+                    selected_models=selected_models,
                     excluded_models=self.excluded_models,
+                    graph=self.graph,
+                    entities=self.entities,
+                    test_index=self.test_index,
+                    run_results=self.run_results,
+                    baseline_run_results=self.baseline_run_results,
                 )
+                pending.append((insight_class, insight, message))
+            else:
+                self.logger.info(color_text(f"Skipping insight {insight_class.NAME} as {message}", YELLOW))
 
-                if self._check_if_skipped(insight):
-                    self.logger.info(
-                        color_text(
-                            f"Skipping insight {insight_class.NAME} as it is not enabled in config",
-                            YELLOW,
-                        )
-                    )
-                    continue
-                try:
-                    insights = insight.generate()
-                    num_insights = len(insights)
-                    text = f"Found {num_insights} insights for {insight_class.NAME}"
-                    if num_insights > 0:
-                        self.logger.info(color_text(text, RED))
-                    else:
-                        self.logger.info(f"No insights found for {insight_class.NAME}")
-
-                    for insight in insights:
-                        # Handle MODEL level insights
-                        if insight.insight_level == MODEL:
-                            # Add the insight if the model is selected or if all models are selected
-                            # if self.selected_models_flag and insight.unique_id in self.selected_models or not self.selected_models_flag:
-                            reports[MODEL].setdefault(insight.unique_id, []).append(insight)
-                        # Handle PROJECT level insights, only if all models are selected
-                        elif insight.insight_level == PROJECT:
-                            reports[PROJECT].append(insight)
-
-                except Exception as e:
-                    self.logger.info(
-                        color_text(
-                            f"Error running insight {insight_class.NAME}: {e}. Skipping insight. {message}",
-                            RED,
-                        )
+        outcomes = self._execute(self._get_tasks([insight for _, insight, _ in pending if insight is not None]))
+
+        # Results are merged in the order of INSIGHT_REGISTRY, whatever the order they finished in
+        fused_outcomes = None
+        positions = None
+        for insight_class, insight, message in pending:
+            if insight is None:
+                insights, span, error = [], None, None
+            elif self._is_fused(insight):
+                if fused_outcomes is None:
+                    fused_outcomes = self._get_fused_outcomes(next(outcomes))
+                insights, span, error = next(fused_outcomes)
+            else:
+                insights, span, error = next(outcomes)
+            duration = span["duration"] if span else 0.0
+            self.timings[insight_class.NAME] = duration
+            self.logger.info(f"Insight {insight_class.NAME} took {duration:.3f}s")
+            if span:
+                self.profiler.add(span)
+            if error is not None:
+                self.logger.info(
+                    color_text(
+                        f"Error running insight {insight_class.NAME}: {error}. Skipping insight. {message}",
+                        RED,
                     )
+                )
+                continue
+
+            if self.incremental_run:
+                insights = self.incremental_run.merge(insight_class, insights)
+            elif insight_class.INCREMENTAL:
+                # Ordered as in incremental runs, so that the reports of both can be diffed
+                if positions is None:
+                    positions = get_positions(self.index)
+                insights = sort_results(insights, positions)
+            num_insights = len(insights)
+            if span:
+                span["args"]["findings"] = num_insights
+            text = f"Found {num_insights} insights for {insight_class.NAME}"
+            if num_insights > 0:
+                self.logger.info(color_text(text, RED))
             else:
-                self.logger.info(color_text(f"Skipping insight {insight_class.NAME} as {message}", YELLOW))
+                self.logger.info(f"No insights found for {insight_class.NAME}")
+
+            if on_results is not None:
+                on_results(insight_class, insights)
+                continue
+            for insight in insights:
+                # Handle MODEL level insights
+                if insight.insight_level == MODEL:
+                    # Add the insight if the model is selected or if all models are selected
+                    # if self.selected_models_flag and insight.unique_id in self.selected_models or not self.selected_models_flag:
+                    reports[MODEL].setdefault(insight.unique_id, []).append(insight)
+                # Handle PROJECT level insights, only if all models are selected
+                elif insight.insight_level == PROJECT:
+                    reports[PROJECT].append(insight)
+
+        # Shuts the worker pool down
+        outcomes.close()
 
+        if self.incremental_run:
+            self.incremental_run.save()
         return reports
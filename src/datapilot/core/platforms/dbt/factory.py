@@ -1,26 +1,66 @@
+from importlib import import_module
+from typing import Dict
+from typing import Union
+
 from dbt_artifacts_parser.parsers.catalog.catalog_v1 import CatalogV1
-from dbt_artifacts_parser.parsers.manifest.manifest_v10 import ManifestV10
-from dbt_artifacts_parser.parsers.manifest.manifest_v11 import ManifestV11
-from dbt_artifacts_parser.parsers.manifest.manifest_v12 import ManifestV12
 
 from datapilot.core.platforms.dbt.schemas.manifest import Catalog
 from datapilot.core.platforms.dbt.schemas.manifest import Manifest
+from datapilot.core.platforms.dbt.schemas.manifest import RunResults
 from datapilot.core.platforms.dbt.wrappers.catalog.v1.wrapper import CatalogV1Wrapper
-from datapilot.core.platforms.dbt.wrappers.manifest.v10.wrapper import ManifestV10Wrapper
-from datapilot.core.platforms.dbt.wrappers.manifest.v11.wrapper import ManifestV11Wrapper
-from datapilot.core.platforms.dbt.wrappers.manifest.v12.wrapper import ManifestV12Wrapper
+from datapilot.core.platforms.dbt.wrappers.manifest.cached.wrapper import CachedManifestWrapper
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+from datapilot.core.platforms.dbt.wrappers.manifest.raw.wrapper import RawManifestWrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV1Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV2Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV3Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV4Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV5Wrapper
+from datapilot.core.platforms.dbt.wrappers.run_results.run_results import RunResultsV6Wrapper
 from datapilot.exceptions.exceptions import AltimateNotSupportedError
 
+# Module and class of the wrapper of the parsed manifests of every supported schema version.
+# The wrapper modules import the models of their manifest version, only the one used is imported.
+MANIFEST_WRAPPERS = {
+    "https://schemas.getdbt.com/dbt/manifest/v10.json": (
+        "datapilot.core.platforms.dbt.wrappers.manifest.v10.wrapper",
+        "ManifestV10Wrapper",
+    ),
+    "https://schemas.getdbt.com/dbt/manifest/v11.json": (
+        "datapilot.core.platforms.dbt.wrappers.manifest.v11.wrapper",
+        "ManifestV11Wrapper",
+    ),
+    "https://schemas.getdbt.com/dbt/manifest/v12.json": (
+        "datapilot.core.platforms.dbt.wrappers.manifest.v12.wrapper",
+        "ManifestV12Wrapper",
+    ),
+}
+SUPPORTED_MANIFEST_SCHEMA_VERSIONS = list(MANIFEST_WRAPPERS)
+
+RUN_RESULTS_WRAPPERS = {
+    "https://schemas.getdbt.com/dbt/run-results/v1.json": RunResultsV1Wrapper,
+    "https://schemas.getdbt.com/dbt/run-results/v2.json": RunResultsV2Wrapper,
+    "https://schemas.getdbt.com/dbt/run-results/v3.json": RunResultsV3Wrapper,
+    "https://schemas.getdbt.com/dbt/run-results/v4.json": RunResultsV4Wrapper,
+    "https://schemas.getdbt.com/dbt/run-results/v5.json": RunResultsV5Wrapper,
+    "https://schemas.getdbt.com/dbt/run-results/v6.json": RunResultsV6Wrapper,
+}
+
 
 class DBTFactory:
     @classmethod
-    def get_manifest_wrapper(cls, manifest: Manifest):
-        if isinstance(manifest, ManifestV12):
-            return ManifestV12Wrapper(manifest)
-        if isinstance(manifest, ManifestV11):
-            return ManifestV11Wrapper(manifest)
-        if isinstance(manifest, ManifestV10):
-            return ManifestV10Wrapper(manifest)
+    def get_manifest_wrapper(cls, manifest: Union[Manifest, Dict, ManifestIndex]):
+        if isinstance(manifest, ManifestIndex):
+            return CachedManifestWrapper(manifest)
+        if isinstance(manifest, dict):
+            metadata = manifest.get("metadata", {})
+            if metadata.get("dbt_schema_version") not in SUPPORTED_MANIFEST_SCHEMA_VERSIONS:
+                raise AltimateNotSupportedError(f"dbt version {metadata.get('dbt_version')} not supported")
+            return RawManifestWrapper(manifest)
+        dbt_schema_version = manifest.metadata.dbt_schema_version
+        if dbt_schema_version in MANIFEST_WRAPPERS:
+            module, name = MANIFEST_WRAPPERS[dbt_schema_version]
+            return getattr(import_module(module), name)(manifest)
         raise AltimateNotSupportedError(f"dbt version {manifest.metadata.dbt_version} not supported")
 
     @classmethod
@@ -28,3 +68,10 @@ class DBTFactory:
         if isinstance(catalog, CatalogV1):
             return CatalogV1Wrapper(catalog)
         raise AltimateNotSupportedError(f"dbt version {catalog.metadata.dbt_version} not supported")
+
+    @classmethod
+    def get_run_results_wrapper(cls, run_results: RunResults):
+        dbt_schema_version = run_results.metadata.dbt_schema_version
+        if dbt_schema_version in RUN_RESULTS_WRAPPERS:
+            return RUN_RESULTS_WRAPPERS[dbt_schema_version](run_results)
+        raise AltimateNotSupportedError(f"dbt version {run_results.metadata.dbt_version} not supported")
@@ -1,4 +1,5 @@
 import argparse
+import sys
 import time
 from typing import Optional
 from typing import Sequence
@@ -7,9 +8,14 @@ from datapilot.config.config import load_config
 from datapilot.core.platforms.dbt.constants import MODEL
 from datapilot.core.platforms.dbt.constants import PROJECT
 from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.executor import get_projection
 from datapilot.core.platforms.dbt.formatting import generate_model_insights_table
 from datapilot.core.platforms.dbt.formatting import generate_project_insights_table
+from datapilot.utils.cache import DiskCache
 from datapilot.utils.formatting.utils import tabulate_data
+from datapilot.utils.profiling import PROFILE_FORMATS
+from datapilot.utils.profiling import TABLE
+from datapilot.utils.profiling import Profiler
 from datapilot.utils.utils import generate_partial_manifest_catalog
 
 
@@ -28,6 +34,47 @@ def main(argv: Optional[Sequence[str]] = None):
         help="Base path of the dbt project",
     )
 
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of insights to run in parallel",
+    )
+
+    parser.add_argument(
+        "--force-parse",
+        action="store_true",
+        help="Always run dbt parse, even when target/manifest.json is newer than the project files",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk cache of parsed manifests and column metadata",
+    )
+
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory of the on-disk cache. Defaults to ~/.cache/datapilot",
+    )
+
+    parser.add_argument(
+        "--profile",
+        choices=PROFILE_FORMATS,
+        help="Report the time taken by every phase and insight, as a table, as JSON or as a Chrome trace that speedscope also opens",
+    )
+
+    parser.add_argument(
+        "--profile-output",
+        help="File to write the profile to. Defaults to stderr.",
+    )
+
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Also report the peak memory allocated by every phase and insight, with tracemalloc",
+    )
+
     args = parser.parse_known_args(argv)
     # print(f"args: {args}", file=sys.__stdout__)
     config = {}
@@ -47,36 +94,62 @@ def main(argv: Optional[Sequence[str]] = None):
         return
 
     # print(f"Changed files: {changed_files}", file=sys.__stdout__)
-    selected_models, manifest, catalog = generate_partial_manifest_catalog(changed_files, base_path=base_path)
-    # print("se1ected models", selected_models, file=sys.__stdout__)
-    insight_generator = DBTInsightGenerator(
-        manifest=manifest,
-        catalog=catalog,
-        config=config,
-        selected_model_ids=selected_models,
+    profile = args[0].profile
+    if args[0].profile_memory and not profile:
+        profile = TABLE
+    profiler = Profiler(enabled=profile is not None, trace_memory=args[0].profile_memory).start()
+    cache = None if args[0].no_cache else DiskCache(args[0].cache_dir)
+    selected_models, manifest, catalog = generate_partial_manifest_catalog(
+        changed_files,
+        base_path=base_path,
+        cache=cache,
+        reuse_manifest=not args[0].force_parse,
+        profiler=profiler,
+        projection=get_projection(config),
     )
-    reports = insight_generator.run()
-    if reports:
-        model_report = generate_model_insights_table(reports[MODEL])
-        if len(model_report) > 0:
-            print("--" * 50)
-            print("Model Insights")
-            print("--" * 50)
-        for model_id, report in model_report.items():
-            print(f"Model: {model_id}")
-            print(f"File path: {report['path']}")
-            print(tabulate_data(report["table"], headers="keys"))
-            print("\n")
-
-        project_report = generate_project_insights_table(reports[PROJECT])
-        if len(project_report) > 0:
-            print("--" * 50)
-            print("Project Insights")
-            print("--" * 50)
-            print(tabulate_data(project_report, headers="keys"))
+    # print("se1ected models", selected_models, file=sys.__stdout__)
+    with profiler.phase("insights"):
+        insight_generator = DBTInsightGenerator(
+            manifest=manifest,
+            catalog=catalog,
+            config=config,
+            selected_model_ids=selected_models,
+            jobs=args[0].jobs,
+            profiler=profiler,
+        )
+        reports = insight_generator.run()
+    with profiler.phase("format report"):
+        if reports:
+            model_report = generate_model_insights_table(reports[MODEL])
+            if len(model_report) > 0:
+                print("--" * 50)
+                print("Model Insights")
+                print("--" * 50)
+            for model_id, report in model_report.items():
+                print(f"Model: {model_id}")
+                print(f"File path: {report['path']}")
+                print(tabulate_data(report["table"], headers="keys"))
+                print("\n")
 
+            project_report = generate_project_insights_table(reports[PROJECT])
+            if len(project_report) > 0:
+                print("--" * 50)
+                print("Project Insights")
+                print("--" * 50)
+                print(tabulate_data(project_report, headers="keys"))
+    profiler.stop()
+
+    print_timings(profiler, start_time, profile, args[0].profile_output)
+    if reports:
         exit(1)
 
+
+def print_timings(profiler: Profiler, start_time: float, profile_format: Optional[str] = None, profile_output: Optional[str] = None):
+    if profile_format and profile_output:
+        profiler.write(profile_format, profile_output)
+    elif profile_format:
+        # Kept out of the insight tables on stdout
+        print(profiler.format(profile_format), file=sys.stderr)
     end_time = time.time()
     total_time = end_time - start_time
     print(f"Total time taken: {round(total_time, 2)} seconds")
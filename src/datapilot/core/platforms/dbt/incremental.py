@@ -0,0 +1,150 @@
+import hashlib
+import json
+import logging
+from itertools import chain
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+
+from datapilot import __version__
+from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestEntity
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+from datapilot.utils.cache import DiskCache
+
+logger = logging.getLogger("datapilot.incremental")
+
+
+class IncrementalState:
+    """
+    What an incremental run keeps for the next one: the fingerprint of every entity and the
+    results of the incremental insights, by insight name.
+    """
+
+    def __init__(self, signature: str, fingerprints: Dict[str, str], results: Dict[str, List[DBTModelInsightResponse]]):
+        self.signature = signature
+        self.fingerprints = fingerprints
+        self.results = results
+
+
+def _entities(index: ManifestIndex) -> Iterable[ManifestEntity]:
+    return chain(
+        index.nodes.values(),
+        index.sources.values(),
+        index.exposures.values(),
+        index.seeds.values(),
+        index.tests.values(),
+        index.macros.values(),
+    )
+
+
+def get_neighbours(index: ManifestIndex) -> Dict[str, Set[str]]:
+    """
+    Parents and children of every entity, tests and exposures included.
+    """
+    neighbours = {entity.unique_id: set() for entity in _entities(index)}
+    for entity in _entities(index):
+        depends_on = getattr(entity, "depends_on", None)
+        for parent in (depends_on.nodes if depends_on else None) or []:
+            neighbours[entity.unique_id].add(parent)
+            neighbours.setdefault(parent, set()).add(entity.unique_id)
+    return neighbours
+
+
+def get_positions(index: ManifestIndex) -> Dict[str, int]:
+    """
+    Position of every entity in the manifest, the order of the results of the incremental
+    insights in full and incremental runs alike.
+    """
+    return {entity.unique_id: position for position, entity in enumerate(_entities(index))}
+
+
+def sort_results(insights: List, positions: Dict[str, int]) -> List:
+    return sorted(insights, key=lambda insight: positions.get(getattr(insight, "unique_id", None), len(positions)))
+
+
+def get_fingerprints(index: ManifestIndex, neighbours: Dict[str, Set[str]]) -> Dict[str, str]:
+    """
+    Fingerprint of every entity. It covers the entity itself (checksum, config, columns, ...)
+    and the unique ids of its parents and children.
+    """
+    fingerprints = {}
+    for entity in _entities(index):
+        digest = hashlib.sha1(repr(entity).encode())  # noqa: S324
+        digest.update("\0".join(sorted(neighbours.get(entity.unique_id, ()))).encode())
+        fingerprints[entity.unique_id] = digest.hexdigest()
+    return fingerprints
+
+
+def get_signature(config: Optional[Dict], catalog_id: Optional[str], insight_names: Iterable[str]) -> str:
+    """
+    Everything besides the manifest that the results depend on. Results of a previous run are
+    only reused when the signature did not change.
+    """
+    parts = [__version__, json.dumps(config or {}, sort_keys=True, default=str), str(catalog_id), *insight_names]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+class IncrementalRun:
+    """
+    Incremental project health check. Insights flagged as INCREMENTAL only run on the entities
+    whose fingerprint changed since the previous run, and on their direct neighbours. Their
+    results for the other entities are taken from the previous run.
+    """
+
+    def __init__(self, cache: DiskCache, index: ManifestIndex, signature: str):
+        self.cache = cache
+        self.key = "incremental-" + hashlib.sha256(str(index.project_name).encode()).hexdigest()
+        self.signature = signature
+
+        neighbours = get_neighbours(index)
+        self.fingerprints = get_fingerprints(index, neighbours)
+        self.positions = get_positions(index)
+
+        previous = cache.get(self.key)
+        if not isinstance(previous, IncrementalState) or previous.signature != signature:
+            self.previous_results = {}
+            self.dirty = set(self.fingerprints)
+            logger.info("No reusable results of a previous run, running all the insights")
+        else:
+            self.previous_results = previous.results
+            changed = {
+                unique_id for unique_id, fingerprint in self.fingerprints.items() if previous.fingerprints.get(unique_id) != fingerprint
+            }
+            changed.update(unique_id for unique_id in previous.fingerprints if unique_id not in self.fingerprints)
+            self.dirty = set(changed)
+            for unique_id in changed:
+                self.dirty.update(neighbours.get(unique_id, ()))
+            logger.info(f"{len(changed)} of {len(self.fingerprints)} entities changed since the previous run")
+
+        self.results: Dict[str, List[DBTModelInsightResponse]] = {}
+        # Nothing to write back when every result was reused as is
+        self.modified = bool(self.dirty)
+
+    def reuses(self, insight_class) -> bool:
+        return insight_class.INCREMENTAL and insight_class.NAME in self.previous_results
+
+    def merge(self, insight_class, insights: List) -> List:
+        """
+        Combine the results of an insight run on the dirty entities with the results of the
+        previous run for the other entities. Results are ordered by entity, see get_positions.
+        """
+        if not insight_class.INCREMENTAL:
+            return insights
+        if self.reuses(insight_class):
+            # Results outside of the selection would duplicate the ones of the previous run
+            insights = [insight for insight in insights if insight.unique_id in self.dirty]
+            previous = [insight for insight in self.previous_results[insight_class.NAME] if insight.unique_id not in self.dirty]
+            insights = previous + insights
+        else:
+            self.modified = True
+        insights = sort_results(insights, self.positions)
+        self.results[insight_class.NAME] = insights
+        return insights
+
+    def save(self) -> None:
+        if not self.modified:
+            return
+        self.cache.set(self.key, IncrementalState(self.signature, self.fingerprints, self.results))
@@ -1,115 +1,90 @@
-from datapilot.core.platforms.dbt.insights.checks.check_column_desc_are_same import CheckColumnDescAreSame
-from datapilot.core.platforms.dbt.insights.checks.check_column_name_contract import CheckColumnNameContract
-from datapilot.core.platforms.dbt.insights.checks.check_macro_args_have_desc import CheckMacroArgsHaveDesc
-from datapilot.core.platforms.dbt.insights.checks.check_macro_has_desc import CheckMacroHasDesc
-from datapilot.core.platforms.dbt.insights.checks.check_model_has_all_columns import CheckModelHasAllColumns
-from datapilot.core.platforms.dbt.insights.checks.check_model_has_meta_keys import CheckModelHasMetaKeys
-from datapilot.core.platforms.dbt.insights.checks.check_model_has_properties_file import CheckModelHasPropertiesFile
-from datapilot.core.platforms.dbt.insights.checks.check_model_has_tests_by_group import CheckModelHasTestsByGroup
-from datapilot.core.platforms.dbt.insights.checks.check_model_has_tests_by_name import CheckModelHasTestsByName
-from datapilot.core.platforms.dbt.insights.checks.check_model_has_tests_by_type import CheckModelHasTestsByType
-from datapilot.core.platforms.dbt.insights.checks.check_model_materialization_by_childs import CheckModelMaterializationByChilds
-from datapilot.core.platforms.dbt.insights.checks.check_model_name_contract import CheckModelNameContract
-from datapilot.core.platforms.dbt.insights.checks.check_model_parents_and_childs import CheckModelParentsAndChilds
-from datapilot.core.platforms.dbt.insights.checks.check_model_parents_database import CheckModelParentsDatabase
-from datapilot.core.platforms.dbt.insights.checks.check_model_parents_schema import CheckModelParentsSchema
-from datapilot.core.platforms.dbt.insights.checks.check_model_tags import CheckModelTags
-from datapilot.core.platforms.dbt.insights.checks.check_source_childs import CheckSourceChilds
-from datapilot.core.platforms.dbt.insights.checks.check_source_columns_have_desc import CheckSourceColumnsHaveDescriptions
-from datapilot.core.platforms.dbt.insights.checks.check_source_has_all_columns import CheckSourceHasAllColumns
-from datapilot.core.platforms.dbt.insights.checks.check_source_has_freshness import CheckSourceHasFreshness
-from datapilot.core.platforms.dbt.insights.checks.check_source_has_loader import CheckSourceHasLoader
-from datapilot.core.platforms.dbt.insights.checks.check_source_has_meta_keys import CheckSourceHasMetaKeys
-from datapilot.core.platforms.dbt.insights.checks.check_source_has_tests import CheckSourceHasTests
-from datapilot.core.platforms.dbt.insights.checks.check_source_has_tests_by_group import CheckSourceHasTestsByGroup
-from datapilot.core.platforms.dbt.insights.checks.check_source_has_tests_by_name import CheckSourceHasTestsByName
-from datapilot.core.platforms.dbt.insights.checks.check_source_has_tests_by_type import CheckSourceHasTestsByType
-from datapilot.core.platforms.dbt.insights.checks.check_source_table_has_description import CheckSourceTableHasDescription
-from datapilot.core.platforms.dbt.insights.checks.check_source_tags import CheckSourceTags
-from datapilot.core.platforms.dbt.insights.dbt_test.missing_primary_key_tests import MissingPrimaryKeyTests
-from datapilot.core.platforms.dbt.insights.dbt_test.test_coverage import DBTTestCoverage
-from datapilot.core.platforms.dbt.insights.governance.documentation_on_stale_columns import DBTDocumentationStaleColumns
-from datapilot.core.platforms.dbt.insights.governance.exposures_dependent_on_private_models import DBTExposureDependentOnPrivateModels
-from datapilot.core.platforms.dbt.insights.governance.public_models_without_contracts import DBTPublicModelWithoutContracts
-from datapilot.core.platforms.dbt.insights.governance.undocumented_columns import DBTMissingDocumentation
-from datapilot.core.platforms.dbt.insights.governance.undocumented_public_models import DBTUndocumentedPublicModels
-from datapilot.core.platforms.dbt.insights.modelling.direct_join_to_source import DBTDirectJoinSource
-from datapilot.core.platforms.dbt.insights.modelling.downstream_models_dependent_on_source import DBTDownstreamModelsDependentOnSource
-from datapilot.core.platforms.dbt.insights.modelling.duplicate_sources import DBTDuplicateSources
-from datapilot.core.platforms.dbt.insights.modelling.hard_coded_references import DBTHardCodedReferences
-from datapilot.core.platforms.dbt.insights.modelling.joining_of_upstream_concepts import DBTRejoiningOfUpstreamConcepts
-from datapilot.core.platforms.dbt.insights.modelling.model_fanout import DBTModelFanout
-from datapilot.core.platforms.dbt.insights.modelling.multiple_sources_joined import DBTModelsMultipleSourcesJoined
-from datapilot.core.platforms.dbt.insights.modelling.root_model import DBTRootModel
-from datapilot.core.platforms.dbt.insights.modelling.source_fanout import DBTSourceFanout
-from datapilot.core.platforms.dbt.insights.modelling.staging_model_dependent_on_downstream_models import (
-    DBTStagingModelsDependentOnDownstreamModels,
-)
-from datapilot.core.platforms.dbt.insights.modelling.staging_model_dependent_on_staging_models import (
-    DBTStagingModelsDependentOnStagingModels,
-)
-from datapilot.core.platforms.dbt.insights.modelling.unused_sources import DBTUnusedSources
-from datapilot.core.platforms.dbt.insights.performance.chain_view_linking import DBTChainViewLinking
-from datapilot.core.platforms.dbt.insights.performance.exposure_parent_materializations import DBTExposureParentMaterialization
-from datapilot.core.platforms.dbt.insights.structure.model_directories_structure import DBTModelDirectoryStructure
-from datapilot.core.platforms.dbt.insights.structure.model_naming_conventions import DBTModelNamingConvention
-from datapilot.core.platforms.dbt.insights.structure.source_directories_structure import DBTSourceDirectoryStructure
-from datapilot.core.platforms.dbt.insights.structure.test_directory_structure import DBTTestDirectoryStructure
+from importlib import import_module
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Tuple
+from typing import Type
 
-INSIGHTS = [
-    DBTDirectJoinSource,
-    DBTDownstreamModelsDependentOnSource,
-    DBTDuplicateSources,
-    DBTModelFanout,
-    DBTRootModel,
-    DBTSourceFanout,
-    DBTStagingModelsDependentOnDownstreamModels,
-    DBTStagingModelsDependentOnStagingModels,
-    DBTUnusedSources,
-    DBTModelsMultipleSourcesJoined,
-    DBTHardCodedReferences,
-    DBTRejoiningOfUpstreamConcepts,
-    DBTExposureDependentOnPrivateModels,
-    DBTUndocumentedPublicModels,
-    DBTPublicModelWithoutContracts,
-    DBTChainViewLinking,
-    DBTExposureParentMaterialization,
-    DBTMissingDocumentation,
-    DBTDocumentationStaleColumns,
-    MissingPrimaryKeyTests,
-    DBTTestCoverage,
-    DBTModelDirectoryStructure,
-    DBTModelNamingConvention,
-    DBTSourceDirectoryStructure,
-    DBTTestDirectoryStructure,
-    CheckColumnDescAreSame,
-    CheckColumnNameContract,
-    CheckMacroArgsHaveDesc,
-    CheckMacroHasDesc,
-    CheckModelHasAllColumns,
-    # CheckModelHasLabelsKeys,
-    CheckModelHasMetaKeys,
-    CheckModelHasPropertiesFile,
-    CheckModelHasTestsByName,
-    CheckModelHasTestsByType,
-    CheckModelHasTestsByGroup,
-    CheckModelMaterializationByChilds,
-    CheckModelNameContract,
-    CheckModelParentsAndChilds,
-    CheckModelParentsDatabase,
-    CheckModelParentsSchema,
-    CheckModelTags,
-    CheckSourceChilds,
-    CheckSourceColumnsHaveDescriptions,
-    CheckSourceHasAllColumns,
-    CheckSourceHasFreshness,
-    # CheckSourceHasLabelsKeys,
-    CheckSourceHasLoader,
-    CheckSourceHasMetaKeys,
-    CheckSourceHasTestsByName,
-    CheckSourceHasTestsByType,
-    CheckSourceHasTestsByGroup,
-    CheckSourceHasTests,
-    CheckSourceTableHasDescription,
-    CheckSourceTags,
-]
+# Module, relative to this package, and class of every insight by alias, in the order the
+# insights run. An insight module is only imported when its insight is loaded, so that the
+# CLI starts without importing them all and disabled insights are never imported.
+INSIGHT_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "source_staging_model_integrity": ("modelling.direct_join_to_source", "DBTDirectJoinSource"),
+    "downstream_source_dependence": ("modelling.downstream_models_dependent_on_source", "DBTDownstreamModelsDependentOnSource"),
+    "Duplicate_Sources": ("modelling.duplicate_sources", "DBTDuplicateSources"),
+    "model_fanout": ("modelling.model_fanout", "DBTModelFanout"),
+    "root_model": ("modelling.root_model", "DBTRootModel"),
+    "source_fanout": ("modelling.source_fanout", "DBTSourceFanout"),
+    "staging_models_dependency": ("modelling.staging_model_dependent_on_downstream_models", "DBTStagingModelsDependentOnDownstreamModels"),
+    "staging_models_on_staging": ("modelling.staging_model_dependent_on_staging_models", "DBTStagingModelsDependentOnStagingModels"),
+    "unused_sources": ("modelling.unused_sources", "DBTUnusedSources"),
+    "multiple_sources_joined": ("modelling.multiple_sources_joined", "DBTModelsMultipleSourcesJoined"),
+    "hard_coded_references": ("modelling.hard_coded_references", "DBTHardCodedReferences"),
+    "rejoining_upstream_concepts": ("modelling.joining_of_upstream_concepts", "DBTRejoiningOfUpstreamConcepts"),
+    "exposures_dependent_on_private_models": ("governance.exposures_dependent_on_private_models", "DBTExposureDependentOnPrivateModels"),
+    "undocumented_public_models": ("governance.undocumented_public_models", "DBTUndocumentedPublicModels"),
+    "public_models_without_contracts": ("governance.public_models_without_contracts", "DBTPublicModelWithoutContracts"),
+    "chain_view_linking": ("performance.chain_view_linking", "DBTChainViewLinking"),
+    "exposure_parent_bad_materialization": ("performance.exposure_parent_materializations", "DBTExposureParentMaterialization"),
+    "slowest_models": ("performance.slowest_models", "DBTSlowestModels"),
+    "model_run_time_regression": ("performance.run_time_regression", "DBTRunTimeRegression"),
+    "model_run_time_dwarfs_children": ("performance.run_time_dwarfs_children", "DBTRunTimeDwarfsChildren"),
+    "missing_documentation": ("governance.undocumented_columns", "DBTMissingDocumentation"),
+    "documentation_on_stale_columns": ("governance.documentation_on_stale_columns", "DBTDocumentationStaleColumns"),
+    "missing_primary_key_tests": ("dbt_test.missing_primary_key_tests", "MissingPrimaryKeyTests"),
+    "dbt_low_test_coverage": ("dbt_test.test_coverage", "DBTTestCoverage"),
+    "model_directory_structure": ("structure.model_directories_structure", "DBTModelDirectoryStructure"),
+    "model_naming_convention_check": ("structure.model_naming_conventions", "DBTModelNamingConvention"),
+    "source_directory_structure": ("structure.source_directories_structure", "DBTSourceDirectoryStructure"),
+    "test_directory_structure": ("structure.test_directory_structure", "DBTTestDirectoryStructure"),
+    "column_descriptions_are_same": ("checks.check_column_desc_are_same", "CheckColumnDescAreSame"),
+    "column_name_contract": ("checks.check_column_name_contract", "CheckColumnNameContract"),
+    "check_macro_args_have_desc": ("checks.check_macro_args_have_desc", "CheckMacroArgsHaveDesc"),
+    "check_macro_has_desc": ("checks.check_macro_has_desc", "CheckMacroHasDesc"),
+    "check_model_has_all_columns": ("checks.check_model_has_all_columns", "CheckModelHasAllColumns"),
+    # "check_model_has_labels_keys": ("checks.check_model_has_labels_keys", "CheckModelHasLabelsKeys"),
+    "check_model_has_valid_meta_keys": ("checks.check_model_has_meta_keys", "CheckModelHasMetaKeys"),
+    "check_model_has_properties_file": ("checks.check_model_has_properties_file", "CheckModelHasPropertiesFile"),
+    "check_model_has_tests_by_name": ("checks.check_model_has_tests_by_name", "CheckModelHasTestsByName"),
+    "check_model_has_tests_by_type": ("checks.check_model_has_tests_by_type", "CheckModelHasTestsByType"),
+    "check_model_has_tests_by_group": ("checks.check_model_has_tests_by_group", "CheckModelHasTestsByGroup"),
+    "check_model_materialization_by_childs": ("checks.check_model_materialization_by_childs", "CheckModelMaterializationByChilds"),
+    "model_name_by_folder": ("checks.check_model_name_contract", "CheckModelNameContract"),
+    "check_model_parents_and_childs": ("checks.check_model_parents_and_childs", "CheckModelParentsAndChilds"),
+    "check_model_parents_database": ("checks.check_model_parents_database", "CheckModelParentsDatabase"),
+    "check_model_parents_schema": ("checks.check_model_parents_schema", "CheckModelParentsSchema"),
+    "check_model_tags": ("checks.check_model_tags", "CheckModelTags"),
+    "check_source_childs": ("checks.check_source_childs", "CheckSourceChilds"),
+    "check_source_columns_have_desc": ("checks.check_source_columns_have_desc", "CheckSourceColumnsHaveDescriptions"),
+    "check_source_has_all_columns": ("checks.check_source_has_all_columns", "CheckSourceHasAllColumns"),
+    "check_source_has_freshness": ("checks.check_source_has_freshness", "CheckSourceHasFreshness"),
+    "check_source_has_loader": ("checks.check_source_has_loader", "CheckSourceHasLoader"),
+    # "check_source_has_labels_keys": ("checks.check_source_has_labels_keys", "CheckSourceHasLabelsKeys"),
+    "check_source_has_meta_keys": ("checks.check_source_has_meta_keys", "CheckSourceHasMetaKeys"),
+    "check_source_has_tests_by_name": ("checks.check_source_has_tests_by_name", "CheckSourceHasTestsByName"),
+    "check_source_has_tests_by_type": ("checks.check_source_has_tests_by_type", "CheckSourceHasTestsByType"),
+    "check_source_has_tests_by_group": ("checks.check_source_has_tests_by_group", "CheckSourceHasTestsByGroup"),
+    "check_source_has_tests": ("checks.check_source_has_tests", "CheckSourceHasTests"),
+    "check_source_table_has_desc": ("checks.check_source_table_has_description", "CheckSourceTableHasDescription"),
+    "check_source_tags": ("checks.check_source_tags", "CheckSourceTags"),
+}
+
+
+def load_insight(alias: str) -> Type:
+    module, name = INSIGHT_REGISTRY[alias]
+    return getattr(import_module(f"{__name__}.{module}"), name)
+
+
+def get_insights(disabled: Iterable[str] = ()) -> List[Type]:
+    """
+    Classes of the insights in the order they run, but the disabled aliases, which are not imported.
+    """
+    disabled = set(disabled)
+    return [load_insight(alias) for alias in INSIGHT_REGISTRY if alias not in disabled]
+
+
+def __getattr__(name: str):
+    # INSIGHTS, all the insight classes, imports every insight module on access
+    if name == "INSIGHTS":
+        return get_insights()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
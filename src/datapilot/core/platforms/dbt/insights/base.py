@@ -2,6 +2,8 @@ from abc import abstractmethod
 from typing import ClassVar
 from typing import Dict
 from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from datapilot.config.utils import get_insight_config
@@ -15,16 +17,29 @@ from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSource
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateSeedNode
-from datapilot.core.platforms.dbt.wrappers.manifest.wrapper import BaseManifestWrapper
+from datapilot.core.platforms.dbt.utils import get_longest_path_lengths
+from datapilot.core.platforms.dbt.wrappers.manifest.attachments import TestAttachmentIndex
+from datapilot.core.platforms.dbt.wrappers.manifest.graph import ManifestGraph
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestEntity
+from datapilot.core.platforms.dbt.wrappers.manifest.index import merge_entities
+from datapilot.core.platforms.dbt.wrappers.manifest.wrapper import BaseManifestIndexWrapper
 
 
 class DBTInsight(Insight):
     DEFAULT_SEVERITY = Severity.ERROR
     FILES_REQUIRED: ClassVar = ["Manifest"]
+    # Results for an entity only depend on the entity and its direct parents and children.
+    # Incremental runs only re-run such insights on the part of the DAG that changed.
+    INCREMENTAL: ClassVar[bool] = True
+    # Entity types the insight reads besides nodes, sources and seeds, which are always built,
+    # and heavy fields of the entities it reads. The manifest is only loaded with the ones the
+    # enabled insights read, see ManifestProjection.
+    ENTITIES_REQUIRED: ClassVar[Tuple[str, ...]] = ()
+    HEAVY_FIELDS_REQUIRED: ClassVar[Tuple[str, ...]] = ()
 
     def __init__(
         self,
-        manifest_wrapper: BaseManifestWrapper,
+        manifest_wrapper: BaseManifestIndexWrapper,
         nodes: Dict[str, AltimateManifestNode],
         sources: Dict[str, AltimateManifestSourceNode],
         exposures: Dict[str, AltimateManifestExposureNode],
@@ -35,6 +50,9 @@ class DBTInsight(Insight):
         project_name: str,
         selected_models: Union[List[str], None] = None,
         excluded_models: Union[List[str], None] = None,
+        graph: Optional[ManifestGraph] = None,
+        entities: Optional[Dict[str, ManifestEntity]] = None,
+        test_index: Optional[TestAttachmentIndex] = None,
         *args,
         **kwargs,
     ):
@@ -49,8 +67,33 @@ class DBTInsight(Insight):
         self.project_name = project_name
         self.selected_models = selected_models
         self.excluded_models = excluded_models
+        self._graph = graph
+        self._test_index = test_index
+        # Some insights replace self.tests with their configuration, so the entities are indexed first
+        self.entities = entities if entities is not None else merge_entities(nodes, sources, exposures, tests, macros, seeds)
         super().__init__(*args, **kwargs)
 
+    @property
+    def graph(self) -> ManifestGraph:
+        """
+        The DAG of the nodes, shared by all the insights of a run. It is only built here when
+        the insight was created without one.
+        """
+        if self._graph is None:
+            self._graph = ManifestGraph(self.nodes, self.children_map, extra_ids=[*self.sources, *(self.seeds or {})])
+        return self._graph
+
+    @property
+    def test_index(self) -> TestAttachmentIndex:
+        """
+        The tests attached to every model and source, shared by all the insights of a run. It
+        is only built here when the insight was created without one.
+        """
+        if self._test_index is None:
+            tests = [entity for entity in self.entities.values() if isinstance(entity, AltimateManifestTestNode)]
+            self._test_index = TestAttachmentIndex(tests, self.project_name)
+        return self._test_index
+
     @abstractmethod
     def generate(self, *args, **kwargs) -> Dict:
         pass
@@ -63,48 +106,80 @@ class DBTInsight(Insight):
     ) -> Union[
         AltimateManifestNode, AltimateManifestSourceNode, AltimateManifestExposureNode, AltimateManifestTestNode, AltimateManifestMacroNode
     ]:
-        if node_id in self.nodes:
-            return self.nodes[node_id]
-        elif node_id in self.sources:
-            return self.sources[node_id]
-        elif node_id in self.exposures:
-            return self.exposures[node_id]
-        elif node_id in self.tests:
-            return self.tests[node_id]
-        elif node_id in self.macros:
-            return self.macros[node_id]
-        elif node_id in self.seeds:
-            return self.seeds[node_id]
-        else:
+        node = self.entities.get(node_id)
+        if node is None:
             self.logger.debug(f"Model {node_id} not found in manifest")
-            return None
+        return node
+
+    def get_manifest_node(self, node_id: str) -> Optional[AltimateManifestNode]:
+        return self.nodes.get(node_id)
+
+    def get_source(self, source_id: str) -> Optional[AltimateManifestSourceNode]:
+        return self.sources.get(source_id)
+
+    def get_exposure(self, exposure_id: str) -> Optional[AltimateManifestExposureNode]:
+        return self.exposures.get(exposure_id)
+
+    def get_test(self, test_id: str) -> Optional[AltimateManifestTestNode]:
+        # self.tests holds the configuration of some insights, the tests are looked up in the entities
+        test = self.entities.get(test_id)
+        return test if isinstance(test, AltimateManifestTestNode) else None
+
+    def get_macro(self, macro_id: str) -> Optional[AltimateManifestMacroNode]:
+        return self.macros.get(macro_id)
+
+    def get_seed(self, seed_id: str) -> Optional[AltimateSeedNode]:
+        return self.seeds.get(seed_id)
 
     def find_long_chains(self, min_chain_length=4):
         """
         Find chains of nodes with 'materialized' set to 'view' or 'ephemeral' of a given minimum length.
 
-        :param nodes: Dictionary of nodes where key is node_id and value is a node with 'depends_on' and 'materialized'.
+        Every chain starts at a non-materialized node and goes up through its non-materialized
+        parents. The length of the longest chain above every node is computed first, so that
+        only the parents that can still complete a chain are visited.
+
         :param min_chain_length: Minimum length of the chain to be found.
         :return: A list of chains, where each chain is a list of node IDs.
         """
-
-        def is_not_materialized(node: Union[AltimateManifestNode, AltimateManifestSourceNode]) -> bool:
-            if node.resource_type == AltimateResourceType.source:
-                return False
-            return node.config.materialized in NON_MATERIALIZED
-
-        def build_chain(node_id, current_chain):
-            if len(current_chain) >= min_chain_length:
-                long_chains.append(current_chain)
-                return
-            for parent_id in self.get_node(node_id).depends_on.nodes:
-                if is_not_materialized(self.get_node(parent_id)):
-                    build_chain(parent_id, [*current_chain, parent_id])
+        parents = {
+            node_id: node.depends_on.nodes if node.depends_on else []
+            for node_id, node in self.nodes.items()
+            if node.resource_type != AltimateResourceType.source and node.config and node.config.materialized in NON_MATERIALIZED
+        }
+        lengths, cyclic = get_longest_path_lengths(parents)
+        if cyclic:
+            self.logger.warning(f"Found a cycle between non-materialized models: {', '.join(sorted(cyclic))}")
+        # Nodes on a cycle can complete any chain, they are only cut when the chain comes back to them
+        reach = dict(lengths)
+        reach.update(dict.fromkeys(cyclic, min_chain_length))
 
         long_chains = []
-        for node_id, node in self.nodes.items():
-            if is_not_materialized(node):
-                build_chain(node_id, [node_id])
+        for node_id in parents:
+            if reach[node_id] < min_chain_length:
+                continue
+            chain = [node_id]
+            remaining_parents = [iter(parents[node_id])]
+            while remaining_parents:
+                if len(chain) >= min_chain_length:
+                    long_chains.append(list(chain))
+                elif len(chain) == min_chain_length - 1:
+                    # Every non-materialized parent completes a chain
+                    for parent_id in remaining_parents[-1]:
+                        if parent_id in reach and not (parent_id in cyclic and parent_id in chain):
+                            long_chains.append([*chain, parent_id])
+                else:
+                    for parent_id in remaining_parents[-1]:
+                        if reach.get(parent_id, 0) + len(chain) >= min_chain_length and not (parent_id in cyclic and parent_id in chain):
+                            chain.append(parent_id)
+                            remaining_parents.append(iter(parents[parent_id]))
+                            break
+                    else:
+                        chain.pop()
+                        remaining_parents.pop()
+                    continue
+                chain.pop()
+                remaining_parents.pop()
 
         return long_chains
 
@@ -11,12 +11,14 @@ from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 class CheckColumnDescAreSame(ChecksInsight):
     NAME = "Column descriptions consistent for same column names"
     ALIAS = "column_descriptions_are_same"
+    HEAVY_FIELDS_REQUIRED = ("columns",)
     DESCRIPTION = "Column description for the same column name should be same "
     REASON_TO_FLAG = (
         "Different descriptions for the same column names can lead to confusion and hinder effective data "
         "modeling and analysis. It's important to have consistent column descriptions."
     )
     FILES_REQUIRED: ClassVar = ["Manifest", "Catalog"]
+    INCREMENTAL = False
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
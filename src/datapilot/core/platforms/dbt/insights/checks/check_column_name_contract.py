@@ -1,19 +1,19 @@
 import re
 from typing import ClassVar
 from typing import List
+from typing import Optional
 from typing import Sequence
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
 from datapilot.utils.formatting.utils import numbered_list
 
 
-class CheckColumnNameContract(ChecksInsight):
+class CheckColumnNameContract(PerNodeCheck, ChecksInsight):
     NAME = "Column name follows contract pattern"
     ALIAS = "column_name_contract"
     DESCRIPTION = "Column names should adhere to the contract pattern defined for the data type. "
@@ -39,13 +39,13 @@ class CheckColumnNameContract(ChecksInsight):
         self.catalog = catalog_wrapper
         super().__init__(*args, **kwargs)
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         self.default_pattern = self.get_check_config(self.DEFAULT_PATTERN_STR)
         datatype_configs = self.get_check_config(self.PATTERNS_LIST_STR)
         # Patterns : [{"pattern": "^[a-z_]+$", "dtype": "string"}, {"pattern": "^[a-z_]+$", "dtype": "string"}]
         if not datatype_configs:
             self.logger.debug(f"Column name contract not found in insight config for {self.ALIAS}. Skipping insight.")
-            return []
+            return False
         self.patterns = {
             pattern.get(self.DATATYPE_STR).lower(): pattern.get(self.PATTERN_STR)
             for pattern in datatype_configs
@@ -53,27 +53,14 @@ class CheckColumnNameContract(ChecksInsight):
         }
         if not self.patterns:
             self.logger.debug(f"Column name contract not found in insight config for {self.ALIAS}")
-            return []
+            return False
+        return True
 
-        insights = []
-        for node_id, node in self.nodes.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.model:
-                columns = self._get_columns_with_contract_violation(node_id)
-                if columns:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, columns),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        columns = self._get_columns_with_contract_violation(node_id)
+        if columns:
+            return self._build_failure_result(node_id, columns)
+        return None
 
     def _build_failure_result(self, model_unique_id: str, columns: Sequence[str]) -> DBTInsightResult:
         failure_message = self.FAILURE_MESSAGE.format(
@@ -92,16 +79,12 @@ class CheckColumnNameContract(ChecksInsight):
         )
 
     def _get_columns_in_model(self, node_id) -> List[str]:
-        if node_id not in self.catalog.get_schema():
-            return []
-        return self.catalog.get_schema()[node_id].keys()
+        return self.catalog.get_node_columns(node_id).keys()
 
     def _get_columns_with_contract_violation(self, node_id) -> Sequence[str]:
         columns = []
-        for col in self._get_columns_in_model(node_id):
-            schema = self.catalog.get_schema()[node_id]
+        for col, col_type in self.catalog.get_node_columns(node_id).items():
             col_name = col.lower()
-            col_type = schema[col]
             if col_type.lower() in self.patterns:
                 if re.match(self.patterns[col_type.lower()], col_name, re.IGNORECASE) is None:
                     columns.append(col)
@@ -1,15 +1,19 @@
-from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import MACROS
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestMacroNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
-class CheckMacroHasDesc(ChecksInsight):
+class CheckMacroHasDesc(PerNodeCheck, ChecksInsight):
     NAME = "Macro has documentation"
     ALIAS = "check_macro_has_desc"
+    VISITED_ENTITIES = MACROS
+    VISITED_RESOURCE_TYPE = AltimateResourceType.macro
+    ENTITIES_REQUIRED = (MACROS,)
     DESCRIPTION = "Macros should be documented."
     REASON_TO_FLAG = "Undocumented macros can cause misunderstandings and inefficiencies in data modeling and analysis, as they make it difficult to understand their purpose and usage. Clear descriptions are vital for accuracy and streamlined workflow."
 
@@ -35,29 +39,10 @@ class CheckMacroHasDesc(ChecksInsight):
             metadata={"macro_unique_id": node_id},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def check_node(self, node_id: str, node: AltimateManifestMacroNode) -> Optional[DBTInsightResult]:
         """
-        Generate a list of InsightResponse objects for each model in the DBT project,
-        identifying macros that don't have descriptions.
-        :return: A list of InsightResponse objects.
+        Identifies the macros that don't have descriptions.
         """
-
-        insights = []
-        for macro_id, macro in self.macros.items():
-            if self.should_skip_model(macro_id):
-                self.logger.debug(f"Skipping model {macro_id} as it is not enabled for selected models")
-                continue
-            if macro.resource_type == AltimateResourceType.macro:
-                if not macro.description:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=macro_id,
-                            package_name=macro.package_name,
-                            original_file_path=macro.original_file_path,
-                            path=macro.original_file_path,
-                            insight=self._build_failure_result(macro_id),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-
-        return insights
+        if not node.description:
+            return self._build_failure_result(node_id)
+        return None
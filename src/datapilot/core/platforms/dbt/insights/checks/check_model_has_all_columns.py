@@ -1,21 +1,21 @@
 from typing import ClassVar
-from typing import List
+from typing import Optional
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
 from datapilot.utils.formatting.utils import numbered_list
 
 
-class CheckModelHasAllColumns(ChecksInsight):
+class CheckModelHasAllColumns(PerNodeCheck, ChecksInsight):
     NAME = "Model has all columns as per catalog"
     ALIAS = "check_model_has_all_columns"
+    HEAVY_FIELDS_REQUIRED = ("columns",)
     DESCRIPTION = "Models should have all the columns as per the catalog."
     REASON_TO_FLAG = (
         "Missing columns in the model can lead to data integrity issues and inconsistency in analysis. "
@@ -27,26 +27,11 @@ class CheckModelHasAllColumns(ChecksInsight):
         self.catalog = catalog_wrapper
         super().__init__(*args, **kwargs)
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
-        insights = []
-        for node_id, node in self.nodes.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.model:
-                missing_columns = self._check_model_columns(node_id)
-                if missing_columns:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, missing_columns),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        missing_columns = self._check_model_columns(node_id)
+        if missing_columns:
+            return self._build_failure_result(node_id, missing_columns)
+        return None
 
     def _build_failure_result(self, model_unique_id: str, columns: Sequence[str]) -> DBTInsightResult:
         failure_message = (
@@ -72,11 +57,10 @@ class CheckModelHasAllColumns(ChecksInsight):
 
     def _check_model_columns(self, node_id) -> Tuple[int, Set[str]]:
         missing_columns = set()
-        schema = self.catalog.get_schema()
-        if node_id not in schema:
+        if not self.catalog.has_node(node_id):
             return missing_columns
-        catalog_columns = schema[node_id].keys()
-        for col_name in self.get_node(node_id).columns.keys():
+        catalog_columns = self.catalog.get_node_columns(node_id)
+        for col_name in self.get_manifest_node(node_id).columns.keys():
             if col_name not in catalog_columns:
                 missing_columns.add(col_name)
         return missing_columns
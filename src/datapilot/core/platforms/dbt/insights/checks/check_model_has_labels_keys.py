@@ -1,17 +1,16 @@
-from typing import List
+from typing import Optional
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 from datapilot.utils.formatting.utils import numbered_list
 
 
-class CheckModelHasLabelsKeys(ChecksInsight):
+class CheckModelHasLabelsKeys(PerNodeCheck, ChecksInsight):
     NAME = "Model Has labels"
     ALIAS = "check_model_has_labels_keys"
     DESCRIPTION = "Models should have all the labels keys as per the configuration."
@@ -22,29 +21,16 @@ class CheckModelHasLabelsKeys(ChecksInsight):
     LABEL_KEYS_STR = "labels_keys"
     ALLOW_EXTRA_KEYS_STR = "allow_extra_keys"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         self.labels_keys = self.get_check_config(self.LABEL_KEYS_STR)
         self.allow_extra_keys = self.get_check_config(self.ALLOW_EXTRA_KEYS_STR)
+        return True
 
-        insights = []
-        for node_id, node in self.nodes.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.model:
-                status_code, missibg_labels, extra_labels = self._check_labels_keys(node_id)
-                if status_code == 1:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, missibg_labels, extra_labels),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        status_code, missing_labels, extra_labels = self._check_labels_keys(node_id)
+        if status_code == 1:
+            return self._build_failure_result(node_id, missing_labels, extra_labels)
+        return None
 
     def _build_failure_result(self, model_unique_id: str, missing_keys: Sequence[str], extra_labels: Sequence[str]) -> DBTInsightResult:
         failure_message = (
@@ -75,8 +61,8 @@ class CheckModelHasLabelsKeys(ChecksInsight):
 
     def _check_labels_keys(self, node_id) -> Tuple[int, Set[str]]:
         status_code = 0
-        missing_keys = set(self.labels_keys) - set(self.get_node(node_id).label)
-        config = self.get_node(node_id).config.dict() if self.get_node(node_id).config else {}
+        missing_keys = set(self.labels_keys) - set(self.get_manifest_node(node_id).label)
+        config = self.get_manifest_node(node_id).config.dict() if self.get_manifest_node(node_id).config else {}
         labels = config.get("labels", {})
         label_keys = set(labels.keys())
         extra_keys = set()
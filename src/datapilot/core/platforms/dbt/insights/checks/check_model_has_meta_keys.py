@@ -1,17 +1,16 @@
-from typing import List
+from typing import Optional
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 from datapilot.utils.formatting.utils import numbered_list
 
 
-class CheckModelHasMetaKeys(ChecksInsight):
+class CheckModelHasMetaKeys(PerNodeCheck, ChecksInsight):
     NAME = "Model has all valid keys in metadata"
     ALIAS = "check_model_has_valid_meta_keys"
     DESCRIPTION = "Model always has a list of valid metadata keys."
@@ -22,28 +21,16 @@ class CheckModelHasMetaKeys(ChecksInsight):
     META_KEYS_STR = "meta_keys"
     ALLOW_EXTRA_KEYS_STR = "allow_extra_keys"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         self.meta_keys = self.get_check_config(self.META_KEYS_STR)
         self.allow_extra_keys = self.get_check_config(self.ALLOW_EXTRA_KEYS_STR)
-        insights = []
-        for node_id, node in self.nodes.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.model:
-                status_code, missing_keys, extra_keys = self._check_meta_keys(node_id)
-                if status_code == 1:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, missing_keys, extra_keys),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+        return True
+
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        status_code, missing_keys, extra_keys = self._check_meta_keys(node_id)
+        if status_code == 1:
+            return self._build_failure_result(node_id, missing_keys, extra_keys)
+        return None
 
     def _build_failure_result(self, model_unique_id: str, missing_keys: Sequence[str], extra_keys: Set[str]) -> DBTInsightResult:
         failure_message = (
@@ -71,7 +58,7 @@ class CheckModelHasMetaKeys(ChecksInsight):
 
     def _check_meta_keys(self, node_id) -> Tuple[int, Set[str], Set[str]]:
         status_code = 0
-        model = self.get_node(node_id)
+        model = self.get_manifest_node(node_id)
         meta = model.meta.dict() if model.meta else {}
         model_meta_keys = set(meta.keys())
         missing_keys = None
@@ -1,23 +1,25 @@
 from typing import Dict
 from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import TESTS
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 
 
-class CheckModelHasTestsByGroup(ChecksInsight):
+class CheckModelHasTestsByGroup(PerNodeCheck, ChecksInsight):
     NAME = "Model has tests by group"
     ALIAS = "check_model_has_tests_by_group"
+    ENTITIES_REQUIRED = (TESTS,)
     DESCRIPTION = "Check if models have a number of tests for specific test groups."
     REASON_TO_FLAG = "Models should have tests with specific groups for proper validation."
     TESTS_LIST_STR = "tests"
     TEST_GROUP_STR = "test_group"
     TEST_COUNT_STR = "min_count"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         self.test_list = self.get_check_config(self.TESTS_LIST_STR) or []
         self.test_groups = {
             tuple(test.get(self.TEST_GROUP_STR, [])): test.get(self.TEST_COUNT_STR, 0)
@@ -26,26 +28,14 @@ class CheckModelHasTestsByGroup(ChecksInsight):
         }
         if not self.test_groups:
             self.logger.warning(f"No test groups found in the configuration for {self.ALIAS}. Skipping the insight.")
-            return []
-        insights = []
-        for node_id, node in self.nodes.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.model:
-                missing_test_groups = self._model_has_tests_by_group(node_id)
-                if missing_test_groups:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, missing_test_groups),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+            return False
+        return True
+
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        missing_test_groups = self._model_has_tests_by_group(node_id)
+        if missing_test_groups:
+            return self._build_failure_result(node_id, missing_test_groups)
+        return None
 
     def _build_failure_result(self, model_unique_id: str, missing_test_groups: List[Dict]) -> DBTInsightResult:
         missing_test_group_str = ""
@@ -69,16 +59,10 @@ class CheckModelHasTestsByGroup(ChecksInsight):
 
     def _model_has_tests_by_group(self, node_id) -> List[Dict]:
         """
-        For model, check all dependencies and if node type is test, check if it has the required groups.
-        Only return true if all child.group in test_groups
+        For model, check the tests attached to it and if it has the required groups.
+        Only return true if all the test groups have their minimum count
         """
-        test_group_count = {}
-        for child_id in self.children_map.get(node_id, []):
-            child = self.get_node(child_id)
-            if child.resource_type == AltimateResourceType.test:
-                for group in self.test_groups:
-                    if child.name in group:
-                        test_group_count[group] = test_group_count.get(group, 0) + 1
+        test_group_count = {group: self.test_index.get_count_by_group(node_id, group) for group in self.test_groups}
         missing_test_groups = []
         for group, count in self.test_groups.items():
             if test_group_count.get(group, 0) < count:
@@ -1,15 +1,16 @@
-from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.constants import VIEW
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 
 
-class CheckModelMaterializationByChilds(ChecksInsight):
+class CheckModelMaterializationByChilds(PerNodeCheck, ChecksInsight):
     NAME = "Model materialization by children"
     ALIAS = "check_model_materialization_by_childs"
+    VISITED_RESOURCE_TYPE = None
     DESCRIPTION = "Fewer children than threshold ideally should be view or ephemeral, more or equal should be table or incremental."
     REASON_TO_FLAG = "The model is flagged due to inappropriate materialization: models with child counts above the threshold require robust and efficient data processing, hence they should be materialized as tables or incrementals for optimized query performance and data management."
     THRESHOLD_CHILDS_STR = "threshold_childs"
@@ -62,55 +63,29 @@ class CheckModelMaterializationByChilds(ChecksInsight):
             metadata={"threshold_childs": threshold_childs, "nr_childs": nr_childs, "model_materialization": model_materialization},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         """
-        Generate a list of InsightResponse objects for each model in the DBT project,
         Checks the model materialization by a given threshold of child models.
         All models with less child models then the treshold should be materialized as views (or ephemerals),
         all the rest as tables or incrementals.
         threshold_childs: Threshold from which onwards the materialization should be changed.
         threshold_childs will be taken from the config file.
         """
-        insights = []
-        threshold_childs = self.get_check_config(self.THRESHOLD_CHILDS_STR)
-        if not threshold_childs:
+        self.threshold_childs = self.get_check_config(self.THRESHOLD_CHILDS_STR)
+        if not self.threshold_childs:
             self.logger.info(f"Threshold childs are not provided in the configuration file for the insight {self.ALIAS}")
-            return insights
+            return False
+        return True
 
-        for node_id, node in self.nodes.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            nr_childs = len(self.children_map.get(node_id, []))
-            model_materialization = node.config.materialized
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        nr_childs = len(self.children_map.get(node_id, []))
+        model_materialization = node.config.materialized
 
-            if nr_childs > threshold_childs and model_materialization == VIEW:
-                insights.append(
-                    DBTModelInsightResponse(
-                        unique_id=node_id,
-                        package_name=node.package_name,
-                        path=node.original_file_path,
-                        original_file_path=node.original_file_path,
-                        insight=self._build_failure_result_view_materialization(
-                            node_id, nr_childs, threshold_childs, model_materialization
-                        ),
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                    )
-                )
-            elif nr_childs <= threshold_childs and model_materialization != VIEW:
-                insights.append(
-                    DBTModelInsightResponse(
-                        unique_id=node_id,
-                        package_name=node.package_name,
-                        path=node.original_file_path,
-                        original_file_path=node.original_file_path,
-                        insight=self._build_failure_result_not_view_materialization(
-                            node_id, nr_childs, threshold_childs, model_materialization
-                        ),
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                    )
-                )
-        return insights
+        if nr_childs > self.threshold_childs and model_materialization == VIEW:
+            return self._build_failure_result_view_materialization(node_id, nr_childs, self.threshold_childs, model_materialization)
+        if nr_childs <= self.threshold_childs and model_materialization != VIEW:
+            return self._build_failure_result_not_view_materialization(node_id, nr_childs, self.threshold_childs, model_materialization)
+        return None
 
     @classmethod
     def get_config_schema(cls):
@@ -1,16 +1,15 @@
 import re
 from typing import Dict
-from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 from datapilot.utils.utils import is_superset_path
 
 
-class CheckModelNameContract(ChecksInsight):
+class CheckModelNameContract(PerNodeCheck, ChecksInsight):
     NAME = "Valid Mmdel name by folder"
     ALIAS = "model_name_by_folder"
     DESCRIPTION = (
@@ -53,47 +52,34 @@ class CheckModelNameContract(ChecksInsight):
             metadata={"model_unique_id": node_id, **failure},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         """
-        Generate a list of InsightResponse objects for each model in the DBT project,
-        identifying models with model name that matches a certain regex pattern.
+        Identifies models with model name that matches a certain regex pattern.
         """
-        insights = []
         self.default_pattern = self.get_check_config(self.DEFAULT_PATTERN_STR)
         pattern_configs = self.get_check_config(self.PATTERNS_LIST_STR)
         if not pattern_configs:
             self.logger.debug(f"Model name contract not found in insight config for {self.ALIAS}. Skipping insight.")
-            return []
+            return False
         self.patterns = {
             pattern.get(self.FOLDER_STR): pattern.get(self.PATTERN_STR)
             for pattern in pattern_configs
             if pattern.get(self.PATTERN_STR) and pattern.get(self.FOLDER_STR)
         }
-        for node_id, node in self.nodes.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.model:
-                failure = self._check_model_name_contract(node_id)
-                if failure:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, failure),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+        return True
+
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        failure = self._check_model_name_contract(node_id)
+        if failure:
+            return self._build_failure_result(node_id, failure)
+        return None
 
     def _check_model_name_contract(self, model_unique_id: str) -> bool:
         """
         Check if the model name abides to the contract.
         """
-        model_name = self.get_node(model_unique_id).name
-        model_path = self.get_node(model_unique_id).original_file_path
+        model_name = self.get_manifest_node(model_unique_id).name
+        model_path = self.get_manifest_node(model_unique_id).original_file_path
         for folder, pattern in self.patterns.items():
             if is_superset_path(folder, model_path):
                 if re.match(pattern, model_name, re.IGNORECASE) is None:
@@ -1,14 +1,12 @@
-from typing import List
 from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 
 
-class CheckModelParentsAndChilds(ChecksInsight):
+class CheckModelParentsAndChilds(PerNodeCheck, ChecksInsight):
     NAME = "Model has specific number of parents or/and childs"
     ALIAS = "check_model_parents_and_childs"
     DESCRIPTION = "Ensures the model has a specific number (max/min) of parents or/and childs."
@@ -51,14 +49,12 @@ class CheckModelParentsAndChilds(ChecksInsight):
             },
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         """
-        Generate a list of InsightResponse objects for each model in the DBT project,
-        ensures that the model has a specific number (max/min) of parents or/and childs.
+        Ensures that the model has a specific number (max/min) of parents or/and childs.
         The parent and child numbers are defined in the config file.
-        The parent and corresponding child information is present in self.children_map
+        The number of parents and children of every model is read from self.graph
         """
-        insights = []
         self.min_parents = self.get_check_config(self.MIN_PARENTS_STR) or 1
         self.max_parents = self.get_check_config(self.MAX_PARENTS_STR)
         self.min_childs = self.get_check_config(self.MIN_CHILDS_STR) or 0
@@ -68,40 +64,27 @@ class CheckModelParentsAndChilds(ChecksInsight):
             self.logger.info(
                 "max_children and max_parents are required values in the configuration. Please provide the required values. Skipping the insight."
             )
-            return insights
+            return False
+        return True
 
-        for node_id, node in self.nodes.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-
-            if node.resource_type == AltimateResourceType.model:
-                failure_message = self._check_model_parents_and_childs(node_id)
-                if failure_message:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, failure_message),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        failure_message = self._check_model_parents_and_childs(node_id)
+        if failure_message:
+            return self._build_failure_result(node_id, failure_message)
+        return None
 
     def _check_model_parents_and_childs(self, model_unique_id: str) -> Optional[str]:
         """
         Check if the model has a specific number (max/min) of parents or/and childs.
         """
-        children = self.children_map.get(model_unique_id, [])
-        node = self.get_node(model_unique_id)
-        parents = node.depends_on.nodes
+        num_children = self.graph.get_out_degree(model_unique_id)
+        num_parents = self.graph.get_in_degree(model_unique_id)
         message = ""
-        if len(parents) < self.min_parents or len(parents) > self.max_parents:
-            message += f"The model:{model_unique_id} doesn't have the required number of parents.\n Min parents: {self.min_parents}, Max parents: {self.max_parents}. It has f{len(parents)} parents\n"
+        if num_parents < self.min_parents or num_parents > self.max_parents:
+            message += f"The model:{model_unique_id} doesn't have the required number of parents.\n Min parents: {self.min_parents}, Max parents: {self.max_parents}. It has f{num_parents} parents\n"
 
-        if len(children) < self.min_childs or len(children) > self.max_childs:
-            message += f"The model:{model_unique_id} doesn't have the required number of childs.\n Min childs: {self.min_childs}, Max childs: {self.max_childs}. It has f{len(children)} childs\n"
+        if num_children < self.min_childs or num_children > self.max_childs:
+            message += f"The model:{model_unique_id} doesn't have the required number of childs.\n Min childs: {self.min_childs}, Max childs: {self.max_childs}. It has f{num_children} childs\n"
 
         return message
 
@@ -1,15 +1,16 @@
-from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
-class CheckModelParentsDatabase(ChecksInsight):
+class CheckModelParentsDatabase(PerNodeCheck, ChecksInsight):
     NAME = "Check model parents database"
     ALIAS = "check_model_parents_database"
+    VISITED_RESOURCE_TYPE = None
     DESCRIPTION = "Ensures the parent models or sources are from certain database."
     REASON_TO_FLAG = "The model has a different database as parent model or source."
     WHITELIST_STR = "whitelist"
@@ -37,40 +38,26 @@ class CheckModelParentsDatabase(ChecksInsight):
             metadata={"parent_database": parent_database},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         """
-        Generate a list of InsightResponse objects for each model in the DBT project,
-        ensures the parent models or sources are from certain database.
+        Ensures the parent models or sources are from certain database.
         The whitelist and blacklist of databases are defined in the config file.
         """
-        insights = []
-
         self.whitelist = self.get_check_config(self.WHITELIST_STR)
         self.blacklist = self.get_check_config(self.BLACKLIST_STR) or []
+        return True
 
-        for node_id in self.nodes.keys():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            parent_database = self._check_model_parents_database(node_id)
-            if parent_database:
-                insights.append(
-                    DBTModelInsightResponse(
-                        unique_id=node_id,
-                        package_name=self.nodes[node_id].package_name,
-                        path=self.nodes[node_id].original_file_path,
-                        original_file_path=self.nodes[node_id].original_file_path,
-                        insight=self._build_failure_result(node_id, parent_database),
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                    )
-                )
-        return insights
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        parent_database = self._check_model_parents_database(node_id)
+        if parent_database:
+            return self._build_failure_result(node_id, parent_database)
+        return None
 
     def _check_model_parents_database(self, model_unique_id: str) -> bool:
         """
         Check if the parent models or sources are from certain database.
         """
-        model = self.get_node(model_unique_id)
+        model = self.get_manifest_node(model_unique_id)
         if model.resource_type == AltimateResourceType.model:
             for parent in getattr(model.depends_on, "nodes", []):
                 parent_model = self.get_node(parent)
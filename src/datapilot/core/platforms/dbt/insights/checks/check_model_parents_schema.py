@@ -1,15 +1,16 @@
-from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
-class CheckModelParentsSchema(ChecksInsight):
+class CheckModelParentsSchema(PerNodeCheck, ChecksInsight):
     NAME = "Model Parents are from an allowed list of schemas"
     ALIAS = "check_model_parents_schema"
+    VISITED_RESOURCE_TYPE = None
     DESCRIPTION = "Ensures the parent models or sources are from certain schema."
     REASON_TO_FLAG = "The model has a different schema as parent model or source."
 
@@ -38,39 +39,26 @@ class CheckModelParentsSchema(ChecksInsight):
             metadata={"parent_schema": parent_schema},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         """
-        Generate a list of InsightResponse objects for each model in the DBT project,
-        ensures the parent models or sources are from certain schema.
+        Ensures the parent models or sources are from certain schema.
         The whitelist and blacklist of schemas are defined in the config file.
         """
-        insights = []
         self.whitelist = self.get_check_config(self.WHITELIST_STR)
         self.blacklist = self.get_check_config(self.BLACKLIST_STR) or []
+        return True
 
-        for node_id in self.nodes.keys():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            parent_schema = self._check_model_parents_schema(node_id)
-            if parent_schema:
-                insights.append(
-                    DBTModelInsightResponse(
-                        unique_id=node_id,
-                        package_name=self.nodes[node_id].package_name,
-                        path=self.nodes[node_id].original_file_path,
-                        original_file_path=self.nodes[node_id].original_file_path,
-                        insight=self._build_failure_result(node_id, parent_schema),
-                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                    )
-                )
-        return insights
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        parent_schema = self._check_model_parents_schema(node_id)
+        if parent_schema:
+            return self._build_failure_result(node_id, parent_schema)
+        return None
 
     def _check_model_parents_schema(self, model_unique_id: str) -> bool:
         """
         Check if the parent models or sources are from certain schema.
         """
-        model = self.get_node(model_unique_id)
+        model = self.get_manifest_node(model_unique_id)
         if model.resource_type == AltimateResourceType.model:
             for parent in getattr(model.depends_on, "nodes", []):
                 parent_model = self.get_node(parent)
@@ -1,13 +1,13 @@
 from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
-from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 
 
-class CheckModelTags(ChecksInsight):
+class CheckModelTags(PerNodeCheck, ChecksInsight):
     NAME = "Model only has valid tags"
     ALIAS = "check_model_tags"
     DESCRIPTION = "Ensures that the model has only valid tags from the provided list."
@@ -36,31 +36,18 @@ class CheckModelTags(ChecksInsight):
             metadata={"tags": tags},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         """
-        Generate a list of InsightResponse objects for each model in the DBT project,
         Ensures that the model has only valid tags from the provided list.
         The provided tag list is in the configuration file.
         """
-        insights = []
         self.tag_list = self.get_check_config(self.TAGS_LIST_STR)
-        for node_id, node in self.nodes.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.model:
-                if not self.valid_tag(node.config.tags):
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            original_file_path=node.original_file_path,
-                            path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, node.config.tags),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+        return True
+
+    def check_node(self, node_id: str, node: AltimateManifestNode) -> Optional[DBTInsightResult]:
+        if not self.valid_tag(node.config.tags):
+            return self._build_failure_result(node_id, node.config.tags)
+        return None
 
     def valid_tag(self, tags: List[str]) -> bool:
         """
@@ -1,15 +1,18 @@
-from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import SOURCES
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
-class CheckSourceChilds(ChecksInsight):
+class CheckSourceChilds(PerNodeCheck, ChecksInsight):
     NAME = "Source has allowed number of children"
     ALIAS = "check_source_childs"
+    VISITED_ENTITIES = SOURCES
+    VISITED_RESOURCE_TYPE = AltimateResourceType.source
     DESCRIPTION = "Check the source has a specific number (max/min) of childs"
     REASON_TO_FLAG = "The source has a number of childs that is not in the valid range"
     MIN_CHILDS_STR = "min_childs"
@@ -38,32 +41,19 @@ class CheckSourceChilds(ChecksInsight):
             metadata={"source_unique_id": node_id, "min_childs": min_childs, "max_childs": max_childs},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         """
-        Generate a list of InsightResponse objects for each source in the DBT project,
         Check the source has a specific number (max/min) of childs
         The min and max number of childs is in the configuration file.
         """
-        insights = []
         self.min_childs = self.get_check_config(self.MIN_CHILDS_STR)
         self.max_childs = self.get_check_config(self.MAX_CHILDS_STR)
-        for node_id, node in self.sources.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.source:
-                if not self.valid_childs(node_id):
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            original_file_path=node.original_file_path,
-                            path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, min_childs=self.min_childs, max_childs=self.max_childs),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+        return True
+
+    def check_node(self, node_id: str, node: AltimateManifestSourceNode) -> Optional[DBTInsightResult]:
+        if not self.valid_childs(node_id):
+            return self._build_failure_result(node_id, min_childs=self.min_childs, max_childs=self.max_childs)
+        return None
 
     def valid_childs(self, source_unique_id: str) -> bool:
         """
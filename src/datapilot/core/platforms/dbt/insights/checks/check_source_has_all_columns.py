@@ -1,21 +1,25 @@
 from typing import ClassVar
-from typing import List
+from typing import Optional
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import SOURCES
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWrapper
 from datapilot.utils.formatting.utils import numbered_list
 
 
-class CheckSourceHasAllColumns(ChecksInsight):
+class CheckSourceHasAllColumns(PerNodeCheck, ChecksInsight):
     NAME = "Source has all columns"
     ALIAS = "check_source_has_all_columns"
+    VISITED_ENTITIES = SOURCES
+    VISITED_RESOURCE_TYPE = AltimateResourceType.source
+    HEAVY_FIELDS_REQUIRED = ("columns",)
     DESCRIPTION = "Ensures that all columns in the database are also specified in the properties file. (usually schema.yml)."
     REASON_TO_FLAG = "Missing columns in the source can lead to confusion and inconsistency in analysis. "
     FILES_REQUIRED: ClassVar = ["Manifest", "Catalog"]
@@ -41,31 +45,14 @@ class CheckSourceHasAllColumns(ChecksInsight):
             metadata={"source_unique_id": source_unique_id, "columns": columns},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def check_node(self, node_id: str, node: AltimateManifestSourceNode) -> Optional[DBTInsightResult]:
         """
-        Generate the insight response for the check. This method is called by the insight runner to generate the insight
-        response for the check.
         Ensures that the source has all columns in the properties file (usually schema.yml).
         """
-        insights = []
-        for node_id, node in self.sources.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.source:
-                missing_columns = self._check_source_columns(node_id)
-                if missing_columns:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            original_file_path=node.original_file_path,
-                            path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, list(missing_columns)),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+        missing_columns = self._check_source_columns(node_id)
+        if missing_columns:
+            return self._build_failure_result(node_id, list(missing_columns))
+        return None
 
     def _check_source_columns(self, node_id) -> Tuple[int, Set[str]]:
         """
@@ -74,11 +61,10 @@ class CheckSourceHasAllColumns(ChecksInsight):
         Ensuring that the source has all columns helps in maintaining data integrity and consistency.
         """
         missing_columns = set()
-        schema = self.catalog.get_schema()
-        if node_id not in schema:
+        if not self.catalog.has_node(node_id):
             return missing_columns
-        catalog_columns = schema[node_id].keys()
-        for col_name in self.get_node(node_id).columns.items():
+        catalog_columns = self.catalog.get_node_columns(node_id)
+        for col_name in self.get_source(node_id).columns.items():
             if col_name not in catalog_columns:
                 missing_columns.add(col_name)
         return missing_columns
@@ -1,15 +1,19 @@
 from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import SOURCES
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
-class CheckSourceHasFreshness(ChecksInsight):
+class CheckSourceHasFreshness(PerNodeCheck, ChecksInsight):
     NAME = "Source has freshness options"
     ALIAS = "check_source_has_freshness"
+    VISITED_ENTITIES = SOURCES
+    VISITED_RESOURCE_TYPE = AltimateResourceType.source
     DESCRIPTION = "Ensures that the source has freshness options"
     REASON_TO_FLAG = "Missing freshness options for the source can lead to confusion and inconsistency in analysis. "
     FRESHNESS_STR = "freshness"
@@ -32,35 +36,21 @@ class CheckSourceHasFreshness(ChecksInsight):
             metadata={"source_id": source_id, "missing_keys": missing_keys},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
+        self.freshness_keys = self.get_check_config(self.FRESHNESS_STR) or []
+        return True
+
+    def check_node(self, node_id: str, node: AltimateManifestSourceNode) -> Optional[DBTInsightResult]:
         """
-        Generate the insight response for the check. This method is called by the insight runner to generate the insight
-        response for the check.
         Ensures that the source has freshness options
         """
-        self.freshness_keys = self.get_check_config(self.FRESHNESS_STR) or []
-        insights = []
-        for node_id, node in self.sources.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.source:
-                missing_keys = self._check_source_has_freshness(node_id)
-                if missing_keys:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            original_file_path=node.original_file_path,
-                            path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, missing_keys),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+        missing_keys = self._check_source_has_freshness(node_id)
+        if missing_keys:
+            return self._build_failure_result(node_id, missing_keys)
+        return None
 
     def _check_source_has_freshness(self, source_id: str) -> List[str]:
-        source = self.get_node(source_id)
+        source = self.get_source(source_id)
         freshness = source.freshness.dict() if source.freshness else {}
 
         if not freshness:
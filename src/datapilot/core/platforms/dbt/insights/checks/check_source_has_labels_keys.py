@@ -1,19 +1,22 @@
-from typing import List
+from typing import Optional
 from typing import Sequence
 from typing import Set
 from typing import Tuple
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import SOURCES
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 from datapilot.utils.formatting.utils import numbered_list
 
 
-class CheckSourceHasLabelsKeys(ChecksInsight):
+class CheckSourceHasLabelsKeys(PerNodeCheck, ChecksInsight):
     NAME = "Check source has labels keys"
     ALIAS = "check_source_has_labels_keys"
+    VISITED_ENTITIES = SOURCES
+    VISITED_RESOURCE_TYPE = AltimateResourceType.source
     DESCRIPTION = (
         "Checks that the source has the specified labels keys as defined in the properties file. "
         "Ensuring that the source has the required labels keys helps in maintaining metadata consistency and understanding."
@@ -25,29 +28,16 @@ class CheckSourceHasLabelsKeys(ChecksInsight):
     LABEL_KEYS_STR = "labels_keys"
     ALLOW_EXTRA_KEYS_STR = "allow_extra_keys"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
-        insights = []
+    def prepare(self) -> bool:
         self.labels_keys = self.get_check_config(self.LABEL_KEYS_STR)
         self.allow_extra_keys = self.get_check_config(self.ALLOW_EXTRA_KEYS_STR)
+        return True
 
-        for node_id, node in self.sources.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.source:
-                status_code, missing_keys, extra_keys = self._check_labels_keys(node_id)
-                if status_code == 1:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, missing_keys, extra_keys),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+    def check_node(self, node_id: str, node: AltimateManifestSourceNode) -> Optional[DBTInsightResult]:
+        status_code, missing_keys, extra_keys = self._check_labels_keys(node_id)
+        if status_code == 1:
+            return self._build_failure_result(node_id, missing_keys, extra_keys)
+        return None
 
     def _build_failure_result(self, model_unique_id: str, missing_keys: Sequence[str], extra_keys: Sequence[str]) -> DBTInsightResult:
         failure_message = ""
@@ -73,8 +63,8 @@ class CheckSourceHasLabelsKeys(ChecksInsight):
 
     def _check_labels_keys(self, node_id) -> Tuple[int, Set[str]]:
         status_code = 0
-        missing_keys = set(self.labels_keys) - set(self.get_node(node_id).label)
-        config = self.get_node(node_id).config.dict() if self.get_node(node_id).config else {}
+        missing_keys = set(self.labels_keys) - set(self.get_source(node_id).label)
+        config = self.get_source(node_id).config.dict() if self.get_source(node_id).config else {}
         labels = config.get("labels", {})
         label_keys = set(labels.keys())
         extra_keys = set()
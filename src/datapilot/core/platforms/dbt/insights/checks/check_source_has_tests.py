@@ -1,40 +1,33 @@
-from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import SOURCES
+from datapilot.core.platforms.dbt.constants import TESTS
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
-class CheckSourceHasTests(ChecksInsight):
+class CheckSourceHasTests(PerNodeCheck, ChecksInsight):
     NAME = "Source has tests"
     ALIAS = "check_source_has_tests"
+    VISITED_ENTITIES = SOURCES
+    VISITED_RESOURCE_TYPE = AltimateResourceType.source
+    ENTITIES_REQUIRED = (TESTS,)
     DESCRIPTION = "Check if the source has tests"
     REASON_TO_FLAG = "The source table is missing tests. Ensure that the source table has tests."
     TESTS_STR = "tests"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
-        insights = []
-        source_threshold = self.get_check_config(self.TESTS_STR) or 1
-        for node_id, node in self.sources.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.source:
-                source_test_count = self.get_source_test_count(node_id)
-                if source_test_count < source_threshold:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, source_test_count, source_threshold),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+    def prepare(self) -> bool:
+        self.source_threshold = self.get_check_config(self.TESTS_STR) or 1
+        return True
+
+    def check_node(self, node_id: str, node: AltimateManifestSourceNode) -> Optional[DBTInsightResult]:
+        source_test_count = self.get_source_test_count(node_id)
+        if source_test_count < self.source_threshold:
+            return self._build_failure_result(node_id, source_test_count, self.source_threshold)
+        return None
 
     def _build_failure_result(self, source_unique_id: str, source_test_count: int, source_test_count_threshold: int) -> DBTInsightResult:
         failure_message = (
@@ -55,14 +48,9 @@ class CheckSourceHasTests(ChecksInsight):
 
     def get_source_test_count(self, node_id: str) -> int:
         """
-        Getting test count of sources by checking child nodes of sources that have type test.
+        Getting test count of sources from the tests attached to them.
         """
-        count = 0
-        for child_id in self.children_map.get(node_id, []):
-            child = self.get_node(child_id)
-            if child.resource_type == AltimateResourceType.test:
-                count += 1
-        return count
+        return self.test_index.get_test_count(node_id)
 
     @classmethod
     def get_config_schema(cls):
@@ -1,49 +1,42 @@
 from typing import Dict
 from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import SOURCES
+from datapilot.core.platforms.dbt.constants import TESTS
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
-class CheckSourceHasTestsByGroup(ChecksInsight):
+class CheckSourceHasTestsByGroup(PerNodeCheck, ChecksInsight):
     NAME = "Source has tests by group"
     ALIAS = "check_source_has_tests_by_group"
+    VISITED_ENTITIES = SOURCES
+    VISITED_RESOURCE_TYPE = AltimateResourceType.source
+    ENTITIES_REQUIRED = (TESTS,)
     DESCRIPTION = "Check if sources have a number of tests for specific test groups."
     REASON_TO_FLAG = "Sources should have tests with specific groups for proper validation."
     TESTS_LIST_STR = "tests"
     TEST_GROUP_STR = "test_group"
     TEST_COUNT_STR = "min_count"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
-        insights = []
+    def prepare(self) -> bool:
         self.test_list = self.get_check_config(self.TESTS_LIST_STR) or []
         self.test_groups = {
             tuple(test.get(self.TEST_GROUP_STR, [])): test.get(self.TEST_COUNT_STR, 0)
             for test in self.test_list
             if test.get(self.TEST_GROUP_STR)
         }
-        for node_id, node in self.sources.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping source {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.source:
-                missing_test_groups = self._source_has_tests_by_group(node_id)
+        return True
 
-                if missing_test_groups:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, missing_test_groups),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+    def check_node(self, node_id: str, node: AltimateManifestSourceNode) -> Optional[DBTInsightResult]:
+        missing_test_groups = self._source_has_tests_by_group(node_id)
+        if missing_test_groups:
+            return self._build_failure_result(node_id, missing_test_groups)
+        return None
 
     def _build_failure_result(self, source_unique_id: str, missing_test_groups: List[Dict]) -> DBTInsightResult:
         missing_test_group_str = ""
@@ -69,16 +62,10 @@ class CheckSourceHasTestsByGroup(ChecksInsight):
 
     def _source_has_tests_by_group(self, node_id) -> List[Dict]:
         """
-        For model, check all dependencies and if node type is test, check if it has the required groups.
-        Only return true if all child.group in test_groups
+        For source, check the tests attached to it and if it has the required groups.
+        Only return true if all the test groups have their minimum count
         """
-        test_group_count = {}
-        for child_id in self.children_map.get(node_id, []):
-            child = self.get_node(child_id)
-            if child.resource_type == AltimateResourceType.test:
-                for group in self.test_groups:
-                    if child.name in group:
-                        test_group_count[group] = test_group_count.get(group, 0) + 1
+        test_group_count = {group: self.test_index.get_count_by_group(node_id, group) for group in self.test_groups}
         missing_test_groups = []
         for group, count in self.test_groups.items():
             if test_group_count.get(group, 0) < count:
@@ -1,49 +1,43 @@
 from typing import Dict
 from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import SOURCES
+from datapilot.core.platforms.dbt.constants import TESTS
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
-class CheckSourceHasTestsByName(ChecksInsight):
+class CheckSourceHasTestsByName(PerNodeCheck, ChecksInsight):
     NAME = "Source has tests by name"
     ALIAS = "check_source_has_tests_by_name"
+    VISITED_ENTITIES = SOURCES
+    VISITED_RESOURCE_TYPE = AltimateResourceType.source
+    ENTITIES_REQUIRED = (TESTS,)
     DESCRIPTION = "Checks that the source has tests with specific names."
     REASON_TO_FLAG = "Sources should have tests with specific names for proper validation."
     TESTS_LIST_STR = "tests"
     TEST_NAME_STR = "test"
     TEST_COUNT_STR = "min_count"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         self.test_list = self.get_check_config(self.TESTS_LIST_STR) or []
         self.tests = {
             test.get(self.TEST_NAME_STR): test.get(self.TEST_COUNT_STR, 0) for test in self.test_list if test.get(self.TEST_NAME_STR)
         }
         if not self.tests:
             self.logger.warning(f"No tests found in the configuration for {self.ALIAS}. Skipping the insight.")
-            return []
-        insights = []
-        for node_id, node in self.sources.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping source {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.source:
-                missing_tests = self._source_has_tests_by_name(node_id)
-                if missing_tests:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+            return False
+        return True
+
+    def check_node(self, node_id: str, node: AltimateManifestSourceNode) -> Optional[DBTInsightResult]:
+        missing_tests = self._source_has_tests_by_name(node_id)
+        if missing_tests:
+            return self._build_failure_result(node_id, missing_tests)
+        return None
 
     def _build_failure_result(self, source_unique_id: str, missing_tests: List[Dict]) -> DBTInsightResult:
         tests_str = ""
@@ -65,28 +59,19 @@ class CheckSourceHasTestsByName(ChecksInsight):
             metadata={"source_unique_id": source_unique_id},
         )
 
-    def _source_has_tests_by_name(self, node_id) -> bool:
+    def _source_has_tests_by_name(self, node_id) -> List[Dict]:
         """
-        For model, check all dependencies and if node type is test, check if it has the required names.
-        Only return true if all child.name in test_names
+        For source, check the tests attached to it and if it has the required names.
+        Return the test names that do not have their minimum count
         """
-        test_count = {}
-
-        for child_id in self.children_map.get(node_id, []):
-            child = self.get_node(child_id)
-            if child.resource_type == AltimateResourceType.test:
-                test_name = child.name
-                test_count[test_name] = test_count.get(test_name, 0) + 1
+        test_count = self.test_index.get_count_by_name(node_id)
 
         missing_tests = []
         for test_name, min_count in self.tests.items():
             if test_count.get(test_name, 0) < min_count:
                 missing_tests.append({"test_name": test_name, "min_count": min_count, "actual_count": test_count.get(test_name, 0)})
 
-        if missing_tests:
-            return False, missing_tests
-
-        return True, None
+        return missing_tests
 
     @classmethod
     def get_config_schema(cls):
@@ -1,48 +1,41 @@
-from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import SOURCES
+from datapilot.core.platforms.dbt.constants import TESTS
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
-class CheckSourceHasTestsByType(ChecksInsight):
+class CheckSourceHasTestsByType(PerNodeCheck, ChecksInsight):
     NAME = "Source has tests by type"
     ALIAS = "check_source_has_tests_by_type"
+    VISITED_ENTITIES = SOURCES
+    VISITED_RESOURCE_TYPE = AltimateResourceType.source
+    ENTITIES_REQUIRED = (TESTS,)
     DESCRIPTION = "Checks that the source has tests with specific types."
     REASON_TO_FLAG = "Sources should have tests with specific types for proper validation."
     TESTS_LIST_STR = "tests"
     TEST_TYPE_STR = "test"
     TEST_COUNT_STR = "min_count"
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         self.test_list = self.get_check_config(self.TESTS_LIST_STR) or []
         self.tests = {
-            test.get(self.TEST_TYPE_STR): test.get(self.TEST_COUNT_STR, 0) for test in self.test_list if test.get(self.TEST_NAME_STR)
+            test.get(self.TEST_TYPE_STR): test.get(self.TEST_COUNT_STR, 0) for test in self.test_list if test.get(self.TEST_TYPE_STR)
         }
         if not self.tests:
             self.logger.warning(f"No tests found in the configuration for {self.ALIAS}. Skipping the insight.")
-            return []
-        insights = []
-        for node_id, node in self.sources.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping source {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.source:
-                missing_tests = self._source_has_tests_by_type(node_id)
-                if missing_tests:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            path=node.original_file_path,
-                            original_file_path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, missing_tests),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+            return False
+        return True
+
+    def check_node(self, node_id: str, node: AltimateManifestSourceNode) -> Optional[DBTInsightResult]:
+        missing_tests = self._source_has_tests_by_type(node_id)
+        if missing_tests:
+            return self._build_failure_result(node_id, missing_tests)
+        return None
 
     def _build_failure_result(self, source_unique_id: str, missing_tests) -> DBTInsightResult:
         missing_test_type_str = ""
@@ -66,17 +59,13 @@ class CheckSourceHasTestsByType(ChecksInsight):
 
     def _source_has_tests_by_type(self, node_id) -> bool:
         """
-        For model, check all dependencies and if node type is test, check if it has the required types.
-        Only return true if all child.type in test_types
+        For source, check the tests attached to it and if it has the required types.
+        Only return true if all the test types have their minimum count
         """
         test_count = {}
-
-        for child_id in self.children_map.get(node_id, []):
-            child = self.get_node(child_id)
-            if child.resource_type == AltimateResourceType.test:
-                child_tags = child.tags or []
-                test_type = "data" if "data" in child_tags else "schema"
-                test_count[test_type] = test_count.get(test_type, 0) + 1
+        for test in self.test_index.get_tests(node_id):
+            test_type = "data" if "data" in (test.tags or []) else "schema"
+            test_count[test_type] = test_count.get(test_type, 0) + 1
         missing_tests = []
         for test_type in self.tests.keys():
             if test_count.get(test_type, 0) < self.tests.get(test_type, 0):
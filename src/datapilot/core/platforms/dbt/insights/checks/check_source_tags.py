@@ -1,15 +1,19 @@
 from typing import List
+from typing import Optional
 
-from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import SOURCES
 from datapilot.core.platforms.dbt.insights.checks.base import ChecksInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
-from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.insights.visitor import PerNodeCheck
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
 
 
-class CheckSourceTags(ChecksInsight):
+class CheckSourceTags(PerNodeCheck, ChecksInsight):
     NAME = "Source has tags"
     ALIAS = "check_source_tags"
+    VISITED_ENTITIES = SOURCES
+    VISITED_RESOURCE_TYPE = AltimateResourceType.source
     DESCRIPTION = "The source has only valid tags from the provided list."
     REASON_TO_FLAG = "The source has tags that are not in the valid tags list"
     TESTS_STR = "tags"
@@ -36,32 +40,19 @@ class CheckSourceTags(ChecksInsight):
             metadata={"tags": tags, "source_id": node_id},
         )
 
-    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+    def prepare(self) -> bool:
         """
-        Generate a list of InsightResponse objects for each source in the DBT project,
         Ensures that the source has only valid tags from the provided list.
         The provided tag list is in the configuration file.
         """
-        insights = []
         self.tag_list = self.get_check_config(self.TESTS_STR)
-        for node_id, node in self.sources.items():
-            if self.should_skip_model(node_id):
-                self.logger.debug(f"Skipping source {node_id} as it is not enabled for selected models")
-                continue
-            if node.resource_type == AltimateResourceType.source:
-                tag_list = self.valid_tag(node.tags)
-                if tag_list:
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=node_id,
-                            package_name=node.package_name,
-                            original_file_path=node.original_file_path,
-                            path=node.original_file_path,
-                            insight=self._build_failure_result(node_id, tag_list),
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
-                    )
-        return insights
+        return True
+
+    def check_node(self, node_id: str, node: AltimateManifestSourceNode) -> Optional[DBTInsightResult]:
+        tag_list = self.valid_tag(node.tags)
+        if tag_list:
+            return self._build_failure_result(node_id, tag_list)
+        return None
 
     def valid_tag(self, tags: List[str]) -> List[str]:
         """
@@ -3,11 +3,12 @@ from typing import List
 from typing import Optional
 
 from datapilot.core.insights.utils import get_severity
-from datapilot.core.platforms.dbt.constants import GENERIC
+from datapilot.core.platforms.dbt.constants import TESTS
 from datapilot.core.platforms.dbt.insights.dbt_test.base import DBTTestInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
 from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.wrappers.manifest.attachments import ALL_COLUMNS
 
 
 class MissingPrimaryKeyTests(DBTTestInsight):
@@ -17,12 +18,12 @@ class MissingPrimaryKeyTests(DBTTestInsight):
     This class generates insights for each model that lacks proper primary key tests.
     """
 
-    _ALL_TESTS_KEY = "_all_tests"
     NOT_NULL = "not_null"
     UNIQUE = "unique"
     UNIQUE_COMBINATION_OF_COLUMNS = "unique_combination_of_columns"
     NAME = "Missing primary key tests"
     ALIAS = "missing_primary_key_tests"
+    ENTITIES_REQUIRED = (TESTS,)
     DESCRIPTION = "Checks if the model has a primary key test. "
     REASON_TO_FLAG = (
         "dbt tests play a crucial role in asserting data correctness. The absence of primary key tests can increase "
@@ -60,20 +61,19 @@ class MissingPrimaryKeyTests(DBTTestInsight):
         """
         Checks if the given column tests include a primary key test.
 
-        :param column_tests: Dictionary of column tests.
+        :param column_tests: Dictionary of column tests, see TestAttachmentIndex.get_column_tests.
         :return: True if primary key test exists, False otherwise.
         """
         self.logger.debug("Checking for primary key tests")
         if not column_tests:
             return False
 
-        if self.UNIQUE_COMBINATION_OF_COLUMNS in column_tests.get(self._ALL_TESTS_KEY, []):
+        if self.UNIQUE_COMBINATION_OF_COLUMNS in column_tests.get(ALL_COLUMNS, []):
             return True
 
-        column_tests.pop(self._ALL_TESTS_KEY, None)
-
-        for tests in column_tests.values():
-            if self.NOT_NULL in tests and self.UNIQUE in tests:
+        # The column tests are shared by the insights of the run, they are not modified
+        for column, tests in column_tests.items():
+            if column != ALL_COLUMNS and self.NOT_NULL in tests and self.UNIQUE in tests:
                 return True
 
         return False
@@ -85,15 +85,6 @@ class MissingPrimaryKeyTests(DBTTestInsight):
             if self.check_part_of_project(node.package_name) and node.resource_type == AltimateResourceType.model
         ]
 
-    def _get_nodes_with_tests(self, tests) -> Dict[str, Dict[str, List]]:
-        nodes_with_tests = {}
-        for test in tests.values():
-            for node_id in test.depends_on.nodes or []:
-                column = test.test_metadata.kwargs.get("column_name")
-                key = column if column else self._ALL_TESTS_KEY
-                nodes_with_tests.setdefault(node_id, {}).setdefault(key, []).append(test.test_metadata.name)
-        return nodes_with_tests
-
     def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
         """
         Generates insights for each DBT model in the project.
@@ -101,18 +92,14 @@ class MissingPrimaryKeyTests(DBTTestInsight):
         :return: A list of DBTModelInsightResponse objects with insights for each model.
         """
         self.logger.debug("Generating insights for DBT models")
-        tests = self.manifest.get_tests(GENERIC)
-
         nodes_which_need_tests = self._get_nodes_which_need_tests()
 
-        nodes_which_have_test = self._get_nodes_with_tests(tests)
-
         insights = []
         for node_id in nodes_which_need_tests:
             if self.should_skip_model(node_id):
                 self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
                 continue
-            if not self._has_primary_key_test(nodes_which_have_test.get(node_id)):
+            if not self._has_primary_key_test(self.test_index.get_column_tests(node_id)):
                 node = self.get_node(node_id)
                 self.logger.debug(f"Adding insight for model {node_id}")
                 insights.append(
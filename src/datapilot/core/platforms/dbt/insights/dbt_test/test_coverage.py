@@ -1,7 +1,7 @@
 from typing import List
 
 from datapilot.core.insights.utils import get_severity
-from datapilot.core.platforms.dbt.constants import SINGULAR
+from datapilot.core.platforms.dbt.constants import TESTS
 from datapilot.core.platforms.dbt.insights.dbt_test.base import DBTTestInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
 from datapilot.core.platforms.dbt.insights.schema import DBTProjectInsightResponse
@@ -16,6 +16,7 @@ class DBTTestCoverage(DBTTestInsight):
 
     NAME = "Low test coverage in dbt models"
     ALIAS = "dbt_low_test_coverage"
+    ENTITIES_REQUIRED = (TESTS,)
     DESCRIPTION = "Checks if the project test coverage is below the minimum threshold. "
     REASON_TO_FLAG = (
         "dbt models should have a minimum test coverage percentage to ensure the reliability and accuracy "
@@ -32,6 +33,7 @@ class DBTTestCoverage(DBTTestInsight):
     )
     MIN_COVERAGE_PERCENT = 100
     MIN_COVERAGE_PERCENT_STR = "min_test_coverage_percent"
+    INCREMENTAL = False
 
     def _build_failure_result(self, coverage: float, min_coverage=MIN_COVERAGE_PERCENT) -> DBTInsightResult:
         """
@@ -63,12 +65,9 @@ class DBTTestCoverage(DBTTestInsight):
             ]
         )
 
-        models_with_tests = set()
-        for test in self.tests.values():
-            if test.test_type == SINGULAR:
-                return 100
-            if test.package_name == self.project_name:
-                models_with_tests = models_with_tests.union(set(test.depends_on.nodes) if test.depends_on else set())
+        if self.test_index.has_singular_test:
+            return 100
+        models_with_tests = self.test_index.project_tested_ids
 
         return round((len(models_with_tests) / num_models) * 100) if num_models > 0 else 100
 
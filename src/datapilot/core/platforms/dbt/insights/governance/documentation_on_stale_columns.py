@@ -18,6 +18,7 @@ class DBTDocumentationStaleColumns(DBTGovernanceInsight):
 
     NAME = "Documentation of stale columns"
     ALIAS = "documentation_on_stale_columns"
+    HEAVY_FIELDS_REQUIRED = ("columns",)
     DESCRIPTION = (
         "Identify columns that have been documented but are no longer present in the model. "
         "This insight helps in maintaining accurate and up-to-date documentation."
@@ -73,15 +74,13 @@ class DBTDocumentationStaleColumns(DBTGovernanceInsight):
         :return: A list of column names.
         """
         columns = []
-        for column_name, column_node in self.get_node(node_id).columns.items():
+        for column_name, column_node in self.get_manifest_node(node_id).columns.items():
             if column_node.description:
                 columns.append(column_name.lower())
         return columns
 
     def _get_columns_in_model(self, node_id) -> List[str]:
-        if node_id not in self.catalog.get_schema():
-            return []
-        return [k.lower() for k in self.catalog.get_schema()[node_id].keys()]
+        return self.catalog.get_column_names(node_id)
 
     def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
         """
@@ -1,6 +1,7 @@
 from typing import List
 
 from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import EXPOSURES
 from datapilot.core.platforms.dbt.insights.governance.base import DBTGovernanceInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
 from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
@@ -15,6 +16,7 @@ class DBTExposureDependentOnPrivateModels(DBTGovernanceInsight):
 
     NAME = "Exposures dependent on private models"
     ALIAS = "exposures_dependent_on_private_models"
+    ENTITIES_REQUIRED = (EXPOSURES,)
     DESCRIPTION = "Identify exposures that are dependent on private models. "
     REASON_TO_FLAG = (
         "Exposures illustrate how and where data is consumed in downstream tools. These tools should utilize "
@@ -18,6 +18,7 @@ class DBTMissingDocumentation(DBTGovernanceInsight):
 
     NAME = "Missing documentation"
     ALIAS = "missing_documentation"
+    HEAVY_FIELDS_REQUIRED = ("columns",)
     DESCRIPTION = (
         "Detects columns and models in the dbt project that lack documentation. Proper documentation is essential "
         "for understanding data structures and facilitating collaboration and usage of the dbt project."
@@ -86,15 +87,13 @@ class DBTMissingDocumentation(DBTGovernanceInsight):
         :return: A list of column names.
         """
         columns = []
-        for column_name, column_node in self.get_node(node_id).columns.items():
+        for column_name, column_node in self.get_manifest_node(node_id).columns.items():
             if column_node.description:
                 columns.append(column_name.lower())
         return columns
 
     def _get_columns_in_model(self, node_id) -> List[str]:
-        if node_id not in self.catalog.get_schema():
-            return []
-        return [k.lower() for k in self.catalog.get_schema()[node_id].keys()]
+        return self.catalog.get_column_names(node_id)
 
     def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
         """
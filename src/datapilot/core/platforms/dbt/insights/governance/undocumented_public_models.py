@@ -19,6 +19,7 @@ class DBTUndocumentedPublicModels(DBTGovernanceInsight):
 
     NAME = "Undocumented public models"
     ALIAS = "undocumented_public_models"
+    HEAVY_FIELDS_REQUIRED = ("columns",)
     DESCRIPTION = "Identify public models that don't have documentation."
     REASON_TO_FLAG = (
         "Public models are accessible to a wide range of data consumers. To promote understanding and usability, "
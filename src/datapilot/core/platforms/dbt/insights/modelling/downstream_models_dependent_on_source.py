@@ -90,7 +90,7 @@ class DBTDownstreamModelsDependentOnSource(DBTModellingInsight):
                 model_type = classify_model_type(node.name, node.original_file_path, regex_configuration)
                 source_dependencies = [
                     dependent_node_id
-                    for dependent_node_id in node.depends_on.nodes
+                    for dependent_node_id in self.graph.get_parents(node_id)
                     if self.get_node(dependent_node_id).resource_type == AltimateResourceType.source
                 ]
 
@@ -30,6 +30,7 @@ class DBTDuplicateSources(DBTModellingInsight):
         "Consolidate the duplicate source nodes so that each database location has only a single source definition "
         "in your dbt project. This will help maintain clear and accurate data lineage."
     )
+    INCREMENTAL = False
 
     def _build_failure_result(self, source_table: str, source_ids: List[str]) -> DBTInsightResult:
         """
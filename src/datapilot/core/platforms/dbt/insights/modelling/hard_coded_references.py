@@ -17,6 +17,7 @@ class DBTHardCodedReferences(DBTModellingInsight):
 
     NAME = "Hard coded references"
     ALIAS = "hard_coded_references"
+    HEAVY_FIELDS_REQUIRED = ("raw_code",)
     DESCRIPTION = "Models should not have hard-coded references to tables"
     REASON_TO_FLAG = (
         "Hard-coded references in SQL prevent easy identification and tracking of data lineage, "
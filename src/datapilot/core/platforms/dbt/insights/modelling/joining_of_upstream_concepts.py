@@ -32,10 +32,14 @@ class DBTRejoiningOfUpstreamConcepts(DBTModellingInsight):
         "avoid unnecessary complexity or potential loops."
     )
 
-    def _build_failure_result(self, child: str, parent_model: str, children_list: List[str]) -> DBTInsightResult:
-        failure_message = self.FAILURE_MESSAGE.format(child=child, parent_model=parent_model, downstream_child=children_list[0])
+    # Number of children above which the children of a parent are looked up in a set
+    SET_THRESHOLD = 16
 
-        recommendation = self.RECOMMENDATION.format(child=child, parent_model=parent_model, downstream_child=children_list[0])
+    def _build_failure_result(self, child: str, parent_model: str, children_list: List[str], rejoin_targets: List[str]) -> DBTInsightResult:
+        downstream_child = "`, `".join(rejoin_targets)
+        failure_message = self.FAILURE_MESSAGE.format(child=child, parent_model=parent_model, downstream_child=downstream_child)
+
+        recommendation = self.RECOMMENDATION.format(child=child, parent_model=parent_model, downstream_child=downstream_child)
         return DBTInsightResult(
             type=self.TYPE,
             name=self.NAME,
@@ -45,35 +49,50 @@ class DBTRejoiningOfUpstreamConcepts(DBTModellingInsight):
             metadata={
                 "model": parent_model,
                 "children": children_list,
+                "rejoin_targets": rejoin_targets,
             },
         )
 
     def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+        """
+        Only the children with a single child can rejoin their parent. The children of a parent
+        are turned into a set once, when it has a lot of them, so that a hub costs the number of
+        its children rather than its square.
+        """
         insights = []
-        for parent_model, children in self.children_map.items():
-            for child in children:
-                child_child_is_also_parent_child = any(
-                    dwn_stream_child in self.children_map[child] for dwn_stream_child in self.children_map[parent_model]
+        graph = self.graph
+        out_degree, child_offsets, child_targets = graph.out_degree, graph.child_offsets, graph.child_targets
+        for parent_position, parent_model in enumerate(graph.unique_ids):
+            parent_children = child_targets[child_offsets[parent_position] : child_offsets[parent_position + 1]]
+            candidates = [child for child in parent_children if out_degree[child] == 1]
+            if not candidates:
+                continue
+            if len(parent_children) > self.SET_THRESHOLD:
+                parent_children = set(parent_children)
+            for child_position in candidates:
+                downstream_child = child_targets[child_offsets[child_position]]
+                if downstream_child not in parent_children:
+                    continue
+                child = graph.unique_ids[child_position]
+                child_node = self.get_node(child)
+                if self.should_skip_model(child_node.unique_id):
+                    self.logger.debug(f"Skipping model {child_node.unique_id} as it is not enabled for selected models")
+                    continue
+                insight_result = self._build_failure_result(
+                    child=child,
+                    parent_model=parent_model,
+                    children_list=graph.get_children(child),
+                    rejoin_targets=[graph.unique_ids[downstream_child]],
                 )
-                if child_child_is_also_parent_child and len(self.children_map[child]) == 1:
-                    insight_result = self._build_failure_result(
-                        child=child,
-                        parent_model=parent_model,
-                        children_list=list(self.children_map[child]),
-                    )
-                    child_node = self.get_node(child)
-                    if self.should_skip_model(child_node.unique_id):
-                        self.logger.debug(f"Skipping model {child_node.unique_id} as it is not enabled for selected models")
-                        continue
-                    insights.append(
-                        DBTModelInsightResponse(
-                            unique_id=child_node.unique_id,
-                            package_name=child_node.package_name,
-                            path=child_node.path,
-                            original_file_path=child_node.original_file_path,
-                            insight=insight_result,
-                            severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
-                        )
+                insights.append(
+                    DBTModelInsightResponse(
+                        unique_id=child_node.unique_id,
+                        package_name=child_node.package_name,
+                        path=child_node.path,
+                        original_file_path=child_node.original_file_path,
+                        insight=insight_result,
+                        severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
                     )
+                )
 
         return insights
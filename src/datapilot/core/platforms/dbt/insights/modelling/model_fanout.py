@@ -67,7 +67,8 @@ class DBTModelFanout(DBTModellingInsight):
         fanout_threshold = self.get_check_config(self.FANOUT_THRESHOLD_STR) or self.FANOUT_THRESHOLD
         insights = []
         self.logger.debug(f"Checking for models with fanout greater than {fanout_threshold}")
-        for parent, children_set in self.children_map.items():
+        graph = self.graph
+        for position, parent in enumerate(graph.unique_ids):
             if self.should_skip_model(parent):
                 self.logger.debug(f"Skipping model {parent} as it is not enabled for selected models")
                 continue
@@ -77,10 +78,10 @@ class DBTModelFanout(DBTModellingInsight):
                 continue
 
             leaf_children = [
-                child
-                for child in children_set
-                if len(self.children_map[child]) == 0
-                and self.get_node(child).resource_type
+                graph.unique_ids[child]
+                for child in graph.child_positions(position)
+                if not graph.out_degree[child]
+                and self.get_node(graph.unique_ids[child]).resource_type
                 not in [
                     AltimateResourceType.test,
                     AltimateResourceType.analysis,
@@ -64,7 +64,7 @@ class DBTRootModel(DBTModellingInsight):
             if self.should_skip_model(node_id):
                 self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
                 continue
-            if node.resource_type == AltimateResourceType.model and not node.depends_on.nodes:
+            if node.resource_type == AltimateResourceType.model and not self.graph.get_in_degree(node_id):
                 self.logger.debug(f"Found root model {node_id} with no direct parents")
                 insight_result = self._build_failure_result(node.unique_id)
                 insights.append(
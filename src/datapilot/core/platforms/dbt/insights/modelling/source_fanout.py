@@ -55,16 +55,17 @@ class DBTSourceFanout(DBTModellingInsight):
         fanout_threshold = self.get_check_config(self.SOURCE_FANOUT_THRESHOLD_STR) or self.SOURCE_FANOUT_THRESHOLD
         insights = []
 
-        for node_id, children_set in self.children_map.items():
+        graph = self.graph
+        for position, node_id in enumerate(graph.unique_ids):
             if self.should_skip_model(node_id):
                 self.logger.debug(f"Skipping model {node_id} as it is not enabled for selected models")
                 continue
             node = self.get_node(node_id)
             if node.resource_type == AltimateResourceType.source:
-                if len(children_set) > fanout_threshold:
+                if graph.out_degree[position] > fanout_threshold:
                     insight_result = self._build_failure_result(
                         source_unique_id=node_id,
-                        children_count=len(children_set),
+                        children_count=graph.out_degree[position],
                         fanout_threshold=fanout_threshold,
                     )
 
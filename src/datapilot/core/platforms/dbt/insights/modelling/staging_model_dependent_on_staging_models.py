@@ -64,7 +64,7 @@ class DBTStagingModelsDependentOnStagingModels(DBTModellingInsight):
             ):
                 downstream_dependencies = [
                     dependent_node_id
-                    for dependent_node_id in node.depends_on.nodes
+                    for dependent_node_id in self.graph.get_parents(node_id)
                     if classify_model_type(
                         self.get_node(dependent_node_id).name,
                         self.get_node(dependent_node_id).original_file_path,
@@ -1,7 +1,18 @@
 from abc import abstractmethod
+from typing import ClassVar
+from typing import Dict
+from typing import Iterator
+from typing import Optional
 from typing import Tuple
 
+from datapilot.core.insights.schema import Severity
 from datapilot.core.platforms.dbt.insights.base import DBTInsight
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateRunResult
+
+# Status of the nodes that were built, the timings of the others are not comparable
+SUCCESS = "success"
 
 
 class DBTPerformanceInsight(DBTInsight):
@@ -24,3 +35,51 @@ class DBTPerformanceInsight(DBTInsight):
         if not has_manifest:
             return False, "manifest is required for insight to run."
         return True, ""
+
+
+class DBTRunResultsInsight(DBTPerformanceInsight):
+    """
+    Performance insights on the time the models took to run, from the run_results.json of a
+    dbt run or build.
+    """
+
+    DEFAULT_SEVERITY = Severity.WARNING
+    FILES_REQUIRED: ClassVar = ["Manifest", "Run Results"]
+    # The timings change with every run, not with the manifest
+    INCREMENTAL = False
+
+    def __init__(
+        self,
+        run_results: Optional[Dict[str, AltimateRunResult]] = None,
+        baseline_run_results: Optional[Dict[str, AltimateRunResult]] = None,
+        *args,
+        **kwargs,
+    ):
+        self.run_results = run_results or {}
+        self.baseline_run_results = baseline_run_results or {}
+        super().__init__(*args, **kwargs)
+
+    def get_model_run_times(self, selected_only: bool = True) -> Iterator[Tuple[str, AltimateManifestNode, float]]:
+        """
+        The models that were built successfully in the run, with their run time in seconds, see
+        AltimateRunResult.get_run_time.
+
+        :param selected_only: Skip the models that are not selected.
+        """
+        for node_id, result in self.run_results.items():
+            if result.status != SUCCESS or (selected_only and self.should_skip_model(node_id)):
+                continue
+            node = self.nodes.get(node_id)
+            if node is None or node.resource_type != AltimateResourceType.model:
+                continue
+            yield node_id, node, result.get_run_time()
+
+    @classmethod
+    def has_all_required_data(cls, has_manifest: bool, has_run_results: bool = False, **kwargs) -> Tuple[bool, str]:
+        if not has_manifest:
+            return False, "manifest is required for insight to run."
+
+        if not has_run_results:
+            return False, "run results are required for insight to run."
+
+        return True, ""
@@ -16,6 +16,7 @@ class DBTChainViewLinking(DBTPerformanceInsight):
     NAME = "Chain view linking"
     ALIAS = "chain_view_linking"
     CHAIN_LENGTH = 4  # Default chain length, can be adjusted as needed
+    INCREMENTAL = False
     DESCRIPTION = "Checks for long chains of view/ephemeral models in the dbt project. Long chains can lead to slow computation "
     REASON_TO_FLAG = (
         "Long runtime can occur for a model when it is built on top of a long chain of 'non-physically-materialized'"
@@ -1,6 +1,7 @@
 from typing import List
 
 from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import EXPOSURES
 from datapilot.core.platforms.dbt.constants import SOURCE
 from datapilot.core.platforms.dbt.insights.performance.base import DBTPerformanceInsight
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
@@ -16,6 +17,7 @@ class DBTExposureParentMaterialization(DBTPerformanceInsight):
 
     NAME = "Exposure parent materialization check"
     ALIAS = "exposure_parent_bad_materialization"
+    ENTITIES_REQUIRED = (EXPOSURES,)
     DESCRIPTION = "Exposures should depend on transformed data models or metrics, not raw untransformed sources. "
     REASON_TO_FLAG = (
         "Exposures should depend on transformed data models or metrics, not raw untransformed sources. "
@@ -0,0 +1,103 @@
+from typing import List
+
+from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.insights.performance.base import DBTRunResultsInsight
+from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
+from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.utils.formatting.utils import numbered_list
+
+
+class DBTRunTimeDwarfsChildren(DBTRunResultsInsight):
+    """
+    DBTRunTimeDwarfsChildren identifies the models that take much longer to run than all their
+    children together.
+    """
+
+    NAME = "Model run time dwarfs its children"
+    ALIAS = "model_run_time_dwarfs_children"
+    DESCRIPTION = "Identifies models whose run time is many times the run time of all their children together."
+    REASON_TO_FLAG = (
+        "A model that runs much longer than the models built on top of it does most of the work of its branch of "
+        "the DAG, often on more data than its children need. It is where an optimization saves the most time."
+    )
+    FAILURE_MESSAGE = (
+        "Model `{model_unique_id}` ran for {run_time:.1f}s, {ratio:.1f} times the {children_run_time:.1f}s of its "
+        "children together:\n{children}"
+    )
+    RECOMMENDATION = (
+        "Review model `{model_unique_id}`. Consider materializing it as incremental, or moving the filters and the "
+        "aggregations of its children into it so that it processes less data."
+    )
+    RATIO = 10
+    MIN_RUN_TIME = 60
+    RATIO_STR = "ratio"
+    MIN_RUN_TIME_STR = "min_run_time"
+
+    def _build_failure_result(self, model_unique_id: str, run_time: float, children_run_times: dict) -> DBTInsightResult:
+        children_run_time = sum(children_run_times.values())
+        failure_message = self.FAILURE_MESSAGE.format(
+            model_unique_id=model_unique_id,
+            run_time=run_time,
+            ratio=run_time / children_run_time if children_run_time else float("inf"),
+            children_run_time=children_run_time,
+            children=numbered_list([f"{child_id}: {child_run_time:.1f}s" for child_id, child_run_time in children_run_times.items()]),
+        )
+        recommendation = self.RECOMMENDATION.format(model_unique_id=model_unique_id)
+
+        return DBTInsightResult(
+            type=self.TYPE,
+            name=self.NAME,
+            message=failure_message,
+            recommendation=recommendation,
+            reason_to_flag=self.REASON_TO_FLAG,
+            metadata={"model_unique_id": model_unique_id, "run_time": run_time, "children_run_times": children_run_times},
+        )
+
+    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+        ratio = self.get_check_config(self.RATIO_STR) or self.RATIO
+        min_run_time = self.get_check_config(self.MIN_RUN_TIME_STR)
+        min_run_time = self.MIN_RUN_TIME if min_run_time is None else min_run_time
+
+        # The children are looked up among all the models of the run, selected or not
+        run_times = {node_id: run_time for node_id, _, run_time in self.get_model_run_times(selected_only=False)}
+
+        insights = []
+        for node_id, node, run_time in self.get_model_run_times():
+            if run_time < min_run_time:
+                continue
+            children_run_times = {child_id: run_times[child_id] for child_id in self.children_map.get(node_id, []) if child_id in run_times}
+            # Models without built children are left to the slowest models
+            if not children_run_times or run_time < ratio * sum(children_run_times.values()):
+                continue
+            insights.append(
+                DBTModelInsightResponse(
+                    unique_id=node_id,
+                    package_name=node.package_name,
+                    path=node.original_file_path,
+                    original_file_path=node.original_file_path,
+                    insight=self._build_failure_result(node_id, run_time, children_run_times),
+                    severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                )
+            )
+        return insights
+
+    @classmethod
+    def get_config_schema(cls):
+        config_schema = super().get_config_schema()
+        config_schema["config"] = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {
+                cls.RATIO_STR: {
+                    "type": "number",
+                    "description": "How many times the run time of all its children together a model must run to be reported.",
+                    "default": cls.RATIO,
+                },
+                cls.MIN_RUN_TIME_STR: {
+                    "type": "number",
+                    "description": "The run time in seconds below which a model is not reported.",
+                    "default": cls.MIN_RUN_TIME,
+                },
+            },
+        }
+        return config_schema
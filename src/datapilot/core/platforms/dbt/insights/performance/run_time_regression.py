@@ -0,0 +1,115 @@
+from typing import List
+from typing import Tuple
+
+from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.insights.performance.base import SUCCESS
+from datapilot.core.platforms.dbt.insights.performance.base import DBTRunResultsInsight
+from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
+from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+
+
+class DBTRunTimeRegression(DBTRunResultsInsight):
+    """
+    DBTRunTimeRegression identifies the models that ran significantly slower than in a baseline
+    run, e.g. the previous production run.
+    """
+
+    NAME = "Model run time regression"
+    ALIAS = "model_run_time_regression"
+    DESCRIPTION = "Identifies the models whose run time increased significantly compared to a baseline run."
+    REASON_TO_FLAG = (
+        "A model that suddenly runs much slower than before usually points to a change of its SQL, of its "
+        "materialization or of the volume of its data, which slows down and adds cost to every later run."
+    )
+    FAILURE_MESSAGE = (
+        "Model `{model_unique_id}` ran for {run_time:.1f}s, {increase:.0%} slower than the {baseline_run_time:.1f}s "
+        "of the baseline run, above the threshold of {threshold:.0%}."
+    )
+    RECOMMENDATION = (
+        "Review the recent changes to model `{model_unique_id}` and to the data it reads. Compare its query plan "
+        "with the one of the baseline run to find the cause of the regression."
+    )
+    THRESHOLD_PERCENT = 50
+    MIN_RUN_TIME = 10
+    THRESHOLD_PERCENT_STR = "threshold_percent"
+    MIN_RUN_TIME_STR = "min_run_time"
+
+    def _build_failure_result(self, model_unique_id: str, run_time: float, baseline_run_time: float, threshold: float) -> DBTInsightResult:
+        increase = run_time / baseline_run_time - 1 if baseline_run_time else float("inf")
+        failure_message = self.FAILURE_MESSAGE.format(
+            model_unique_id=model_unique_id,
+            run_time=run_time,
+            increase=increase,
+            baseline_run_time=baseline_run_time,
+            threshold=threshold,
+        )
+        recommendation = self.RECOMMENDATION.format(model_unique_id=model_unique_id)
+
+        return DBTInsightResult(
+            type=self.TYPE,
+            name=self.NAME,
+            message=failure_message,
+            recommendation=recommendation,
+            reason_to_flag=self.REASON_TO_FLAG,
+            metadata={"model_unique_id": model_unique_id, "run_time": run_time, "baseline_run_time": baseline_run_time},
+        )
+
+    def _get_regressions(self, threshold: float, min_run_time: float) -> List[Tuple]:
+        regressions = []
+        for node_id, node, run_time in self.get_model_run_times():
+            baseline = self.baseline_run_results.get(node_id)
+            # Models new to the run or not built in the baseline have nothing to compare with
+            if baseline is None or baseline.status != SUCCESS or run_time < min_run_time:
+                continue
+            baseline_run_time = baseline.get_run_time()
+            if run_time > baseline_run_time * (1 + threshold):
+                regressions.append((node_id, node, run_time, baseline_run_time))
+        return regressions
+
+    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+        threshold_percent = self.get_check_config(self.THRESHOLD_PERCENT_STR)
+        threshold = (self.THRESHOLD_PERCENT if threshold_percent is None else threshold_percent) / 100
+        min_run_time = self.get_check_config(self.MIN_RUN_TIME_STR)
+        min_run_time = self.MIN_RUN_TIME if min_run_time is None else min_run_time
+
+        insights = []
+        for node_id, node, run_time, baseline_run_time in self._get_regressions(threshold, min_run_time):
+            insights.append(
+                DBTModelInsightResponse(
+                    unique_id=node_id,
+                    package_name=node.package_name,
+                    path=node.original_file_path,
+                    original_file_path=node.original_file_path,
+                    insight=self._build_failure_result(node_id, run_time, baseline_run_time, threshold),
+                    severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                )
+            )
+        return insights
+
+    @classmethod
+    def has_all_required_data(cls, has_manifest: bool, has_baseline_run_results: bool = False, **kwargs) -> Tuple[bool, str]:
+        run_insight, message = super().has_all_required_data(has_manifest=has_manifest, **kwargs)
+        if run_insight and not has_baseline_run_results:
+            return False, "baseline run results are required for insight to run."
+        return run_insight, message
+
+    @classmethod
+    def get_config_schema(cls):
+        config_schema = super().get_config_schema()
+        config_schema["config"] = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {
+                cls.THRESHOLD_PERCENT_STR: {
+                    "type": "number",
+                    "description": "The increase of the run time over the baseline, in percent, above which a model is reported.",
+                    "default": cls.THRESHOLD_PERCENT,
+                },
+                cls.MIN_RUN_TIME_STR: {
+                    "type": "number",
+                    "description": "The run time in seconds below which a model is not reported.",
+                    "default": cls.MIN_RUN_TIME,
+                },
+            },
+        }
+        return config_schema
@@ -0,0 +1,93 @@
+import heapq
+from typing import List
+
+from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.insights.performance.base import DBTRunResultsInsight
+from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
+from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+
+
+class DBTSlowestModels(DBTRunResultsInsight):
+    """
+    DBTSlowestModels identifies the models that took the longest to run in the warehouse.
+    """
+
+    NAME = "Slowest models"
+    ALIAS = "slowest_models"
+    DESCRIPTION = "Identifies the models that took the longest to run, to prioritize their optimization."
+    REASON_TO_FLAG = (
+        "The slowest models account for most of the time and the cost of a dbt run in the warehouse. "
+        "Optimizing them first gives the largest reduction of the runtime of the project."
+    )
+    FAILURE_MESSAGE = (
+        "Model `{model_unique_id}` ranks #{rank} among the slowest models of the run, it ran for {run_time:.1f}s, "
+        "{share:.0%} of the run time of all the models."
+    )
+    RECOMMENDATION = (
+        "Review the SQL and the materialization of model `{model_unique_id}`. Consider materializing it as incremental, "
+        "filtering or aggregating its data earlier, or clustering or partitioning the tables it reads."
+    )
+    TOP_N = 10
+    MIN_RUN_TIME = 60
+    TOP_N_STR = "top_n"
+    MIN_RUN_TIME_STR = "min_run_time"
+
+    def _build_failure_result(self, model_unique_id: str, rank: int, run_time: float, total_run_time: float) -> DBTInsightResult:
+        share = run_time / total_run_time if total_run_time else 1
+        failure_message = self.FAILURE_MESSAGE.format(model_unique_id=model_unique_id, rank=rank, run_time=run_time, share=share)
+        recommendation = self.RECOMMENDATION.format(model_unique_id=model_unique_id)
+
+        return DBTInsightResult(
+            type=self.TYPE,
+            name=self.NAME,
+            message=failure_message,
+            recommendation=recommendation,
+            reason_to_flag=self.REASON_TO_FLAG,
+            metadata={"model_unique_id": model_unique_id, "rank": rank, "run_time": run_time, "share": share},
+        )
+
+    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+        top_n = self.get_check_config(self.TOP_N_STR) or self.TOP_N
+        min_run_time = self.get_check_config(self.MIN_RUN_TIME_STR)
+        min_run_time = self.MIN_RUN_TIME if min_run_time is None else min_run_time
+
+        run_times = list(self.get_model_run_times())
+        total_run_time = sum(run_time for _, _, run_time in run_times)
+        slowest = heapq.nlargest(top_n, run_times, key=lambda model: model[2])
+
+        insights = []
+        for rank, (node_id, node, run_time) in enumerate(slowest, start=1):
+            if run_time < min_run_time:
+                break
+            insights.append(
+                DBTModelInsightResponse(
+                    unique_id=node_id,
+                    package_name=node.package_name,
+                    path=node.original_file_path,
+                    original_file_path=node.original_file_path,
+                    insight=self._build_failure_result(node_id, rank, run_time, total_run_time),
+                    severity=get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY),
+                )
+            )
+        return insights
+
+    @classmethod
+    def get_config_schema(cls):
+        config_schema = super().get_config_schema()
+        config_schema["config"] = {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {
+                cls.TOP_N_STR: {
+                    "type": "integer",
+                    "description": "The number of slowest models to report.",
+                    "default": cls.TOP_N,
+                },
+                cls.MIN_RUN_TIME_STR: {
+                    "type": "number",
+                    "description": "The run time in seconds below which a model is not reported.",
+                    "default": cls.MIN_RUN_TIME,
+                },
+            },
+        }
+        return config_schema
@@ -2,6 +2,7 @@ from typing import List
 from typing import Optional
 
 from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import TESTS
 from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
 from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
 from datapilot.core.platforms.dbt.insights.structure.base import DBTStructureInsight
@@ -15,6 +16,7 @@ class DBTTestDirectoryStructure(DBTStructureInsight):
 
     NAME = "Bad test directory structure"
     ALIAS = "test_directory_structure"
+    ENTITIES_REQUIRED = (TESTS,)
     DESCRIPTION = "This rule checks if tests are correctly placed in the same directories as their corresponding models."
     REASON_TO_FLAG = (
         "It is important for tests to be placed in the same directory as their corresponding models to maintain "
@@ -1,8 +1,8 @@
-from datapilot.core.platforms.dbt.insights import INSIGHTS
+from datapilot.core.platforms.dbt.insights import get_insights
 
 
 def get_insight_with_configs():
-    return [insight.get_config_schema() for insight in INSIGHTS]
+    return [insight.get_config_schema() for insight in get_insights()]
 
 
 def insights_require_catalog(insights):
@@ -0,0 +1,165 @@
+import time
+from abc import ABC
+from abc import abstractmethod
+from typing import ClassVar
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from datapilot.core.insights.schema import Severity
+from datapilot.core.insights.utils import get_severity
+from datapilot.core.platforms.dbt.constants import NODES
+from datapilot.core.platforms.dbt.insights.schema import DBTInsightResult
+from datapilot.core.platforms.dbt.insights.schema import DBTModelInsightResponse
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestEntity
+from datapilot.utils.profiling import INSIGHT
+from datapilot.utils.profiling import make_span
+
+
+class PerNodeCheck(ABC):
+    """
+    Adapter of the insights that check every model, source or macro on its own. Insights opt in
+    by inheriting it before their insight base class and implementing check_node instead of
+    generate. generate checks every entity, NodeVisitor checks the entities for many insights in
+    a single pass.
+    """
+
+    # Dict of the entities to check, NODES, SOURCES or MACROS, and their resource type, None for all
+    VISITED_ENTITIES: ClassVar[str] = NODES
+    VISITED_RESOURCE_TYPE: ClassVar[Optional[AltimateResourceType]] = AltimateResourceType.model
+
+    def prepare(self) -> bool:
+        """
+        Read the configuration of the check before the entities are checked.
+
+        :return: False to skip the insight, it then has no results.
+        """
+        return True
+
+    @abstractmethod
+    def check_node(self, node_id: str, node: ManifestEntity) -> Optional[DBTInsightResult]:
+        """
+        Check a single entity of the visited type.
+
+        :return: The failure of the entity, None when it passes the check.
+        """
+
+    def start(self) -> bool:
+        # Validated once here rather than in every response
+        self.severity = Severity(get_severity(self.config, self.ALIAS, self.DEFAULT_SEVERITY))
+        return self.prepare()
+
+    def build_response(self, node_id: str, node: ManifestEntity, result: DBTInsightResult) -> DBTModelInsightResponse:
+        # The fields are valid already, validating them would copy the result
+        return DBTModelInsightResponse.construct(
+            unique_id=node_id,
+            package_name=node.package_name,
+            path=node.original_file_path,
+            original_file_path=node.original_file_path,
+            insight=result,
+            severity=self.severity,
+        )
+
+    def generate(self, *args, **kwargs) -> List[DBTModelInsightResponse]:
+        results, _, error = NodeVisitor([self]).generate()[0]
+        if error is not None:
+            raise error
+        return results
+
+
+class _CheckState:
+    """
+    Results of a check during a pass, the time spent in it and the error it raised.
+    """
+
+    def __init__(self, check: PerNodeCheck):
+        self.check = check
+        self.check_node = check.check_node
+        self.results: Optional[List[DBTModelInsightResponse]] = []
+        self.duration = 0.0
+        self.error: Optional[Exception] = None
+
+
+class _CheckGroup:
+    """
+    Checks that visit the same entities: the same type, resource type and selection.
+    """
+
+    def __init__(self, resource_type: Optional[AltimateResourceType], selected_models):
+        self.resource_type = resource_type
+        self.selected_models = selected_models
+        self.states: List[_CheckState] = []
+
+
+class NodeVisitor:
+    """
+    Runs the checks of many PerNodeCheck insights in a single pass over every dict of entities
+    they visit. Every entity is dispatched to all the checks in turn, the filter on its resource
+    type and on the selected models is applied once per group of checks that share them. The
+    results are the same as the ones of the generate of every insight.
+    """
+
+    NAME = "Node checks"
+
+    def __init__(self, checks: List[PerNodeCheck]):
+        self.checks = checks
+
+    def generate(self, *args, **kwargs) -> List[Tuple[Optional[List], Dict, Optional[Exception]]]:
+        """
+        The results of every check, in the order of the checks: the responses of the failing
+        entities, the span of the time spent in the check and the error it raised, if any.
+        A check that raised is not called again, it has no results.
+        """
+        start = time.perf_counter()
+        states = [_CheckState(check) for check in self.checks]
+        groups_by_entities: Dict[str, Dict[Tuple, _CheckGroup]] = {}
+        for state in states:
+            check = state.check
+            check_start = time.perf_counter()
+            try:
+                started = check.start()
+            except Exception as e:
+                state.error = e
+                continue
+            finally:
+                state.duration += time.perf_counter() - check_start
+            if not started:
+                continue
+            # Checks that select nothing check every entity, see DBTInsight.should_skip_model
+            selected_models = check.selected_models or None
+            key = (check.VISITED_RESOURCE_TYPE, id(selected_models))
+            groups = groups_by_entities.setdefault(check.VISITED_ENTITIES, {})
+            groups.setdefault(key, _CheckGroup(check.VISITED_RESOURCE_TYPE, selected_models)).states.append(state)
+
+        perf_counter = time.perf_counter
+        for entity_type, groups in groups_by_entities.items():
+            entities = getattr(next(iter(groups.values())).states[0].check, entity_type)
+            for node_id, node in entities.items():
+                resource_type = node.resource_type
+                for group in groups.values():
+                    if group.resource_type is not None and resource_type != group.resource_type:
+                        continue
+                    if group.selected_models is not None and node_id not in group.selected_models:
+                        continue
+                    for state in group.states:
+                        check_start = perf_counter()
+                        try:
+                            result = state.check_node(node_id, node)
+                            if result is not None:
+                                state.results.append(state.check.build_response(node_id, node, result))
+                        except Exception as e:
+                            state.error = e
+                            # The list being iterated is left as is
+                            group.states = [other for other in group.states if other is not state]
+                        state.duration += perf_counter() - check_start
+
+        outcomes = []
+        for state in states:
+            span = make_span(state.check.NAME, INSIGHT, start, state.duration, fused=True)
+            if state.error is not None:
+                outcomes.append((None, span, state.error))
+            else:
+                outcomes.append((state.results, span, None))
+        return outcomes
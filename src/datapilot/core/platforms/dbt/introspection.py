@@ -0,0 +1,202 @@
+import hashlib
+import json
+import subprocess
+import time
+from abc import ABC
+from abc import abstractmethod
+from pathlib import Path
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from datapilot.schemas.nodes import ModelNode
+from datapilot.schemas.nodes import SourceNode
+from datapilot.utils.cache import DiskCache
+from datapilot.utils.utils import get_dbt_env
+
+# Columns of a relation are queried again once their cached copy is older than this, in seconds
+COLUMN_CACHE_MAX_AGE = 24 * 60 * 60
+
+# (database, schema) of a batch of relations, and (database, schema, identifier) of a relation
+Schema = Tuple[Optional[str], str]
+Relation = Tuple[Optional[str], str, str]
+
+# Adapters whose information_schema has a columns view, queried once per schema. The columns
+# of the other adapters (e.g. spark, or databricks without Unity Catalog) are fetched per relation.
+INFORMATION_SCHEMA_ADAPTERS = ("bigquery", "duckdb", "postgres", "redshift", "snowflake")
+
+# Either one information_schema query per schema, or adapter.get_columns_in_relation for every
+# table, all of them in a single dbt invocation.
+# The result is rendered as JSON: a list of [batch index, table, column, data type].
+COLUMNS_QUERY = """{% set result = [] %}
+{% for batch in batches %}
+{% set batch_index = loop.index0 %}
+{% if per_relation or target.type not in information_schema_adapters %}
+{% for table in batch.tables %}
+{% set relation = adapter.get_relation(database=batch.database or none, schema=batch.schema, identifier=table) %}
+{% if relation %}
+{% for column in adapter.get_columns_in_relation(relation) %}
+{% do result.append([batch_index, table, column.name, column.dtype]) %}
+{% endfor %}
+{% endif %}
+{% endfor %}
+{% else %}
+{% if target.type == "bigquery" %}
+{% set columns_table = "`" ~ batch.database ~ "`." ~ batch.schema ~ ".INFORMATION_SCHEMA.COLUMNS" %}
+{% elif batch.database %}
+{% set columns_table = batch.database ~ ".information_schema.columns" %}
+{% else %}
+{% set columns_table = "information_schema.columns" %}
+{% endif %}
+{% set query %}
+select lower(table_name), column_name, data_type from {{ columns_table }}
+where lower(table_schema) = '{{ batch.schema | lower | replace("'", "''") }}'
+and lower(table_name) in ({% for table in batch.tables %}'{{ table | replace("'", "''") }}'{% if not loop.last %}, {% endif %}{% endfor %})
+order by 1, ordinal_position
+{% endset %}
+{% for row in run_query(query).rows %}
+{% do result.append([batch_index, row[0], row[1], row[2]]) %}
+{% endfor %}
+{% endif %}
+{% endfor %}
+{{ tojson(result) }}"""
+
+
+class ColumnIntrospector(ABC):
+    """
+    Columns of the relations of models and sources, fetched in batches of one schema and cached
+    on disk. A cached entry is reused while the relation and the checksum of its node are the
+    same and it is not older than max_age.
+
+    Subclasses implement fetch_columns for a given warehouse connection.
+    """
+
+    def __init__(self, cache: Optional[DiskCache] = None, cache_key: str = "columns", max_age: float = COLUMN_CACHE_MAX_AGE):
+        self.cache = cache
+        self.cache_key = cache_key
+        self.max_age = max_age
+
+    @abstractmethod
+    def fetch_columns(self, batches: Dict[Schema, List[str]]) -> Dict[Relation, List[Dict]]:
+        """
+        Fetch the columns of the given tables.
+
+        :param batches: Lowercase names of the tables to fetch, by (database, schema).
+        :return: The columns of every table found, as dicts with a column and a dtype, by
+            (database, schema, lowercase table name).
+        """
+
+    @staticmethod
+    def get_relation(node: Union[ModelNode, SourceNode]) -> Relation:
+        identifier = node.table if isinstance(node, SourceNode) else node.alias
+        return node.database, node.table_schema, identifier
+
+    def get_columns(self, nodes: List[Union[ModelNode, SourceNode]]) -> Dict[str, List[Dict]]:
+        """
+        Columns of the relations of the given models and sources, by unique id. Relations that
+        do not exist have no columns.
+        """
+        cached = (self.cache.get(self.cache_key) if self.cache else None) or {}
+        now = time.time()
+        columns = {}
+        batches: Dict[Schema, List[str]] = {}
+        for node in nodes:
+            relation = self.get_relation(node)
+            entry = cached.get(node.unique_id)
+            if entry and entry["relation"] == relation and entry["checksum"] == node.checksum and now - entry["fetched_at"] < self.max_age:
+                columns[node.unique_id] = entry["columns"]
+                continue
+            database, schema, identifier = relation
+            tables = batches.setdefault((database, schema), [])
+            if identifier.lower() not in tables:
+                tables.append(identifier.lower())
+
+        if not batches:
+            return columns
+
+        fetched = self.fetch_columns(batches)
+        for node in nodes:
+            if node.unique_id in columns:
+                continue
+            database, schema, identifier = self.get_relation(node)
+            columns[node.unique_id] = fetched.get((database, schema, identifier.lower()), [])
+            # Missing relations are not cached, they may be built before the next run
+            if columns[node.unique_id]:
+                cached[node.unique_id] = {
+                    "relation": (database, schema, identifier),
+                    "checksum": node.checksum,
+                    "columns": columns[node.unique_id],
+                    "fetched_at": now,
+                }
+
+        if self.cache:
+            self.cache.set(self.cache_key, cached)
+        return columns
+
+
+class DbtColumnIntrospector(ColumnIntrospector):
+    """
+    Fetch the columns with the adapter of a dbt project, through a single dbt compile --inline
+    that runs one information_schema query per schema. The compiled result is read from the
+    JSON logs of dbt.
+
+    Adapters not in INFORMATION_SCHEMA_ADAPTERS, and any adapter whose information_schema query
+    fails, fall back to adapter.get_columns_in_relation, one query per relation.
+    """
+
+    def __init__(self, base_path: str, cache: Optional[DiskCache] = None, max_age: float = COLUMN_CACHE_MAX_AGE):
+        cache_key = "columns-" + hashlib.sha256(str(Path(base_path).resolve()).encode()).hexdigest()
+        super().__init__(cache=cache, cache_key=cache_key, max_age=max_age)
+        self.base_path = base_path
+
+    def compile_inline(self, sql: str) -> str:
+        """
+        Compile a query with dbt compile --inline and return the compiled code.
+        """
+        dbt_compile = subprocess.run(
+            ["dbt", "compile", "--log-format", "json", "--inline", sql],  # noqa
+            capture_output=True,
+            cwd=self.base_path,
+            text=True,
+            env=get_dbt_env(),
+        )
+        errors = []
+        for line in dbt_compile.stdout.splitlines():
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            info = event.get("info", {})
+            if info.get("name") == "CompiledNode":
+                return event["data"]["compiled"]
+            if info.get("level") == "error":
+                errors.append(info.get("msg", ""))
+        raise RuntimeError(f"dbt compile did not return a compiled node: {' '.join(errors) or dbt_compile.stderr}")
+
+    def _compile_columns_query(self, batches_json: str, per_relation: bool) -> str:
+        return self.compile_inline(
+            f"{{% set batches = {batches_json} %}}\n"
+            f"{{% set information_schema_adapters = {json.dumps(list(INFORMATION_SCHEMA_ADAPTERS))} %}}\n"
+            f"{{% set per_relation = {json.dumps(per_relation)} %}}\n"
+            f"{COLUMNS_QUERY}"
+        )
+
+    def fetch_columns(self, batches: Dict[Schema, List[str]]) -> Dict[Relation, List[Dict]]:
+        schemas = list(batches)
+        # Passed as a Jinja literal, which has no null
+        batches_json = json.dumps(
+            [{"database": database or "", "schema": schema, "tables": batches[(database, schema)]} for database, schema in schemas]
+        )
+        try:
+            compiled = self._compile_columns_query(batches_json, per_relation=False)
+        except RuntimeError:
+            # The information_schema of the warehouse may have no columns view or not be readable
+            compiled = self._compile_columns_query(batches_json, per_relation=True)
+
+        columns: Dict[Relation, List[Dict]] = {}
+        for batch_index, table, column, dtype in json.loads(compiled):
+            database, schema = schemas[batch_index]
+            columns.setdefault((database, schema, table), []).append({"column": column, "dtype": dtype})
+        return columns
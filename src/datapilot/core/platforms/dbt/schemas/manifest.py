@@ -1,26 +1,32 @@
 from enum import Enum
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import ClassVar
 from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from dbt_artifacts_parser.parsers.catalog.catalog_v1 import CatalogV1
-from dbt_artifacts_parser.parsers.manifest.manifest_v1 import ManifestV1
-from dbt_artifacts_parser.parsers.manifest.manifest_v2 import ManifestV2
-from dbt_artifacts_parser.parsers.manifest.manifest_v3 import ManifestV3
-from dbt_artifacts_parser.parsers.manifest.manifest_v4 import ManifestV4
-from dbt_artifacts_parser.parsers.manifest.manifest_v5 import ManifestV5
-from dbt_artifacts_parser.parsers.manifest.manifest_v6 import ManifestV6
-from dbt_artifacts_parser.parsers.manifest.manifest_v7 import ManifestV7
-from dbt_artifacts_parser.parsers.manifest.manifest_v8 import ManifestV8
-from dbt_artifacts_parser.parsers.manifest.manifest_v9 import ManifestV9
-from dbt_artifacts_parser.parsers.manifest.manifest_v10 import ManifestV10
-from dbt_artifacts_parser.parsers.manifest.manifest_v11 import ManifestV11
-from dbt_artifacts_parser.parsers.manifest.manifest_v11 import SupportedLanguage
 from pydantic import BaseModel
 from pydantic import Extra
 
+from datapilot.utils.field_store import FieldStore
+from datapilot.utils.field_store import StoreRef
+
+if TYPE_CHECKING:
+    from dbt_artifacts_parser.parsers.manifest.manifest_v10 import ManifestV10
+    from dbt_artifacts_parser.parsers.manifest.manifest_v11 import ManifestV11
+    from dbt_artifacts_parser.parsers.manifest.manifest_v12 import ManifestV12
+    from dbt_artifacts_parser.parsers.run_results.run_results_v1 import RunResultsV1
+    from dbt_artifacts_parser.parsers.run_results.run_results_v2 import RunResultsV2
+    from dbt_artifacts_parser.parsers.run_results.run_results_v3 import RunResultsV3
+    from dbt_artifacts_parser.parsers.run_results.run_results_v4 import RunResultsV4
+    from dbt_artifacts_parser.parsers.run_results.run_results_v5 import RunResultsV5
+    from dbt_artifacts_parser.parsers.run_results.run_results_v6 import RunResultsV6
+
 
 class DBTVersion(BaseModel):
     MAJOR: int
@@ -28,22 +34,122 @@ class DBTVersion(BaseModel):
     PATCH: Optional[int]
 
 
+# Supported manifest versions. Their models are large modules, only the model of the version
+# of the manifest being parsed is imported, see parse_manifest.
 Manifest = Union[
-    ManifestV11,
-    ManifestV10,
-    ManifestV9,
-    ManifestV8,
-    ManifestV7,
-    ManifestV6,
-    ManifestV5,
-    ManifestV4,
-    ManifestV3,
-    ManifestV2,
-    ManifestV1,
+    "ManifestV12",
+    "ManifestV11",
+    "ManifestV10",
 ]
 
 Catalog = CatalogV1
 
+# Supported run results versions, only the model of the version being parsed is imported, see parse_run_results
+RunResults = Union[
+    "RunResultsV6",
+    "RunResultsV5",
+    "RunResultsV4",
+    "RunResultsV3",
+    "RunResultsV2",
+    "RunResultsV1",
+]
+
+
+class AltimateLazyModel(BaseModel):
+    """
+    Model of which the heavy fields, listed in LAZY_FIELDS, can be moved to a FieldStore with
+    offload. They are loaded back from the store on first access and kept until the store
+    releases them. dict, json, copy and == load them all, repr reads them without keeping them.
+    """
+
+    LAZY_FIELDS: ClassVar[Tuple[str, ...]] = ()
+
+    __slots__ = ("_lazy_fields",)
+
+    def _get_lazy_fields(self) -> Dict[str, Tuple[FieldStore, StoreRef]]:
+        try:
+            return object.__getattribute__(self, "_lazy_fields")
+        except AttributeError:
+            return {}
+
+    def offload(self, store: FieldStore, names: Optional[Iterable[str]] = None) -> None:
+        """
+        Move the values of the fields to the store. Empty values are left where they are.
+        """
+        lazy = self._get_lazy_fields()
+        for name in self.LAZY_FIELDS if names is None else names:
+            value = self.__dict__.get(name)
+            if value:
+                lazy[name] = (store, store.put(value))
+                del self.__dict__[name]
+        if lazy:
+            object.__setattr__(self, "_lazy_fields", lazy)
+
+    def drop_fields(self, names: Iterable[str]) -> None:
+        """
+        Empty the values of the fields, for the fields that no insight reads. They are neither
+        kept in memory nor moved to a store.
+        """
+        for name in names:
+            value = self.__dict__.get(name)
+            if value:
+                self.__dict__[name] = type(value)()
+
+    def release_field(self, name: str) -> None:
+        if name in self._get_lazy_fields():
+            self.__dict__.pop(name, None)
+
+    def _load_field(self, name: str) -> Any:
+        store, ref = self._get_lazy_fields()[name]
+        return store.get(ref)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for the attributes that are not in __dict__
+        if name in self._get_lazy_fields():
+            value = self._load_field(name)
+            self.__dict__[name] = value
+            self._get_lazy_fields()[name][0].track(self, name)
+            return value
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def _get_values(self, keep: bool) -> Dict[str, Any]:
+        # The fields in the order of the model, whatever the order they were loaded in
+        lazy = self._get_lazy_fields()
+        values = {}
+        for name in self.__fields__:
+            if name in self.__dict__:
+                values[name] = self.__dict__[name]
+            elif name in lazy:
+                values[name] = getattr(self, name) if keep else self._load_field(name)
+        values.update((name, value) for name, value in self.__dict__.items() if name not in values)
+        return values
+
+    def _iter(self, *args, **kwargs):
+        if self._get_lazy_fields():
+            object.__setattr__(self, "__dict__", self._get_values(keep=True))
+        return super()._iter(*args, **kwargs)
+
+    def __repr_args__(self):
+        if not self._get_lazy_fields():
+            return super().__repr_args__()
+        return [
+            (name, value)
+            for name, value in self._get_values(keep=False).items()
+            if not name.startswith("_") and (name not in self.__fields__ or self.__fields__[name].field_info.repr)
+        ]
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state["_lazy_fields"] = self._get_lazy_fields()
+        return state
+
+    def __setstate__(self, state):
+        state = dict(state)
+        lazy = state.pop("_lazy_fields", None)
+        super().__setstate__(state)
+        if lazy:
+            object.__setattr__(self, "_lazy_fields", lazy)
+
 
 class AltimateDocs(BaseModel):
     class Config:
@@ -140,7 +246,9 @@ class AltimateNodeConfig(BaseModel):
     on_schema_change: Optional[Optional[str]] = "ignore"
 
 
-class AltimateManifestNode(BaseModel):
+class AltimateManifestNode(AltimateLazyModel):
+    LAZY_FIELDS: ClassVar = ("raw_code", "compiled_code", "columns")
+
     database: Optional[str]
     resource_type: AltimateResourceType
     schema_name: str
@@ -275,7 +383,9 @@ class AltimateSeedNode(BaseModel):
     defer_relation: Optional[Optional[AltimateDeferRelation]] = None
 
 
-class AltimateManifestSourceNode(BaseModel):
+class AltimateManifestSourceNode(AltimateLazyModel):
+    LAZY_FIELDS: ClassVar = ("columns",)
+
     database: Optional[str]
     resource_type: AltimateResourceType
     schema_name: str
@@ -402,7 +512,9 @@ class AltimateTestConfig(BaseModel):
     error_if: Optional[str] = "!= 0"
 
 
-class AltimateManifestTestNode(BaseModel):
+class AltimateManifestTestNode(AltimateLazyModel):
+    LAZY_FIELDS: ClassVar = ("raw_code", "compiled_code", "columns")
+
     test_metadata: Optional[AltimateTestMetadata] = None
     test_type: Optional[str] = None
     name: str
@@ -441,10 +553,21 @@ class AltimateMacroArgument(BaseModel):
     description: Optional[Optional[str]] = ""
 
 
-AltimateSupportedLanguage = SupportedLanguage
+class AltimateSupportedLanguage(Enum):
+    python = "python"
+    sql = "sql"
+
+    @classmethod
+    def _missing_(cls, value):
+        # Members of the SupportedLanguage enums of the manifest versions
+        if isinstance(value, Enum):
+            return cls(value.value)
+        return None
 
 
-class AltimateManifestMacroNode(BaseModel):
+class AltimateManifestMacroNode(AltimateLazyModel):
+    LAZY_FIELDS: ClassVar = ("macro_sql",)
+
     name: str
     resource_type: AltimateResourceType
     package_name: str
@@ -460,3 +583,23 @@ class AltimateManifestMacroNode(BaseModel):
     arguments: Optional[List[AltimateMacroArgument]] = None
     created_at: Optional[float] = None
     supported_languages: Optional[Optional[List[AltimateSupportedLanguage]]] = None
+
+
+class AltimateRunResult(BaseModel):
+    """
+    Result of a node in run_results.json. The timing holds the duration in seconds of every
+    phase of the node, compile and execute.
+    """
+
+    unique_id: str
+    status: str
+    execution_time: float
+    thread_id: Optional[str] = None
+    timing: Dict[str, float] = {}
+
+    def get_run_time(self) -> float:
+        """
+        Time spent by the warehouse on the node, the execute phase, or the whole execution
+        time of the node when its phases were not timed.
+        """
+        return self.timing.get("execute", self.execution_time)
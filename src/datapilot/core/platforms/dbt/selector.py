@@ -0,0 +1,210 @@
+import os
+import re
+from functools import lru_cache
+from pathlib import PurePath
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from datapilot.core.platforms.dbt.utils import SelectOption
+from datapilot.core.platforms.dbt.utils import parse_argument
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestEntity
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+from datapilot.core.platforms.dbt.wrappers.manifest.index import merge_entities
+
+TAG_PREFIX = "tag:"
+
+# [@][n+]selector[+n]
+SELECTOR_REGEX = re.compile(r"^(?P<at>@)?(?:(?P<parents_depth>\d*)\+)?(?P<method>.+?)(?:\+(?P<children_depth>\d*))?$")
+
+
+def get_tags(entity: ManifestEntity) -> Set[str]:
+    """
+    Tags of an entity, set on the entity itself or in its config.
+    """
+    tags = set()
+    config = getattr(entity, "config", None)
+    for entity_tags in (getattr(entity, "tags", None), getattr(config, "tags", None)):
+        if isinstance(entity_tags, str):
+            tags.add(entity_tags)
+        elif entity_tags:
+            tags.update(entity_tags)
+    return tags
+
+
+@lru_cache(maxsize=None)
+def _directory_parts(directory: str) -> Tuple[str, ...]:
+    return PurePath(directory).parts
+
+
+class _PathTrie:
+    """
+    Unique ids by the parts of their original file path. A directory selects every path under
+    it, like is_superset_path, without comparing it to every path.
+    """
+
+    __slots__ = ("children", "unique_ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_PathTrie"] = {}
+        self.unique_ids: List[str] = []
+
+    def add(self, path: str, unique_ids: Iterable[str]) -> None:
+        trie = self
+        # Paths are parsed by directory, most files of a project share theirs
+        directory, name = os.path.split(path)
+        parts = _directory_parts(directory) + (() if name in ("", ".") else (name,))
+        for part in parts:
+            child = trie.children.get(part)
+            if child is None:
+                child = trie.children[part] = _PathTrie()
+            trie = child
+        trie.unique_ids.extend(unique_ids)
+
+    def find(self, directory: str) -> Set[str]:
+        trie = self
+        for part in PurePath(directory).parts:
+            trie = trie.children.get(part)
+            if trie is None:
+                return set()
+        found = set()
+        pending = [trie]
+        while pending:
+            trie = pending.pop()
+            found.update(trie.unique_ids)
+            pending.extend(trie.children.values())
+        return found
+
+
+class ModelSelector:
+    """
+    Selection of entities with the syntax of dbt --select. A selector is a name, a path, a
+    directory, path:<path> or tag:<tag>, optionally with graph operators: +selector for the
+    ancestors, selector+ for the descendants, n+selector and selector+n to limit them to n
+    levels, and @selector for the descendants and all their ancestors.
+
+    The lookup tables by name, path and tag are built once, the path trie and tag index only
+    when a selector needs them, so that a selection costs the size of its result.
+    """
+
+    def __init__(
+        self,
+        entities: Dict[str, ManifestEntity],
+        by_name: Optional[Dict[str, List[str]]] = None,
+        by_path: Optional[Dict[str, List[str]]] = None,
+    ):
+        self.entities = entities
+        if by_name is None or by_path is None:
+            by_name, by_path = {}, {}
+            for unique_id, entity in entities.items():
+                by_name.setdefault(entity.name, []).append(unique_id)
+                by_path.setdefault(entity.original_file_path, []).append(unique_id)
+        self.by_name = by_name
+        self.by_path = by_path
+        self._path_trie: Optional[_PathTrie] = None
+        self._by_tag: Optional[Dict[str, List[str]]] = None
+        self._parents: Optional[Dict[str, List[str]]] = None
+        self._children: Optional[Dict[str, List[str]]] = None
+
+    @classmethod
+    def from_index(cls, index: ManifestIndex) -> "ModelSelector":
+        """
+        Selector over the nodes, sources, exposures and tests of an index, reusing its lookup
+        tables by name and path.
+        """
+        return cls(merge_entities(index.nodes, index.sources, index.exposures, index.tests), index.by_name, index.by_path)
+
+    def _in_selection(self, unique_ids: Iterable[str]) -> Set[str]:
+        # The lookup tables of an index also hold the macros and seeds
+        return {unique_id for unique_id in unique_ids if unique_id in self.entities}
+
+    def _get_path_trie(self) -> _PathTrie:
+        if self._path_trie is None:
+            self._path_trie = _PathTrie()
+            for path, unique_ids in self.by_path.items():
+                self._path_trie.add(path, unique_ids)
+        return self._path_trie
+
+    def _get_by_tag(self) -> Dict[str, List[str]]:
+        if self._by_tag is None:
+            self._by_tag = {}
+            for unique_id, entity in self.entities.items():
+                for tag in get_tags(entity):
+                    self._by_tag.setdefault(tag, []).append(unique_id)
+        return self._by_tag
+
+    def _get_neighbours(self):
+        if self._parents is None:
+            self._parents, self._children = {}, {}
+            for unique_id, entity in self.entities.items():
+                depends_on = getattr(entity, "depends_on", None)
+                parents = (depends_on.nodes if depends_on else None) or []
+                self._parents[unique_id] = parents
+                for parent in parents:
+                    self._children.setdefault(parent, []).append(unique_id)
+        return self._parents, self._children
+
+    @staticmethod
+    def _walk(start: Iterable[str], neighbours: Dict[str, List[str]], depth: Optional[int] = None) -> Set[str]:
+        """
+        Everything reachable from the start in at most depth steps, the start excluded.
+        """
+        found: Set[str] = set()
+        level = list(start)
+        while level and (depth is None or depth > 0):
+            next_level = []
+            for unique_id in level:
+                for neighbour in neighbours.get(unique_id, ()):
+                    if neighbour not in found:
+                        found.add(neighbour)
+                        next_level.append(neighbour)
+            level = next_level
+            depth = None if depth is None else depth - 1
+        return found
+
+    def _select_method(self, method: str) -> Set[str]:
+        if method.startswith(TAG_PREFIX):
+            return set(self._get_by_tag().get(method[len(TAG_PREFIX) :], ()))
+        selected_category = parse_argument(method)
+        name = selected_category["name"]
+        if selected_category["type"] == SelectOption.DIRECTORY:
+            return self._in_selection(self._get_path_trie().find(name))
+        return self._in_selection([*self.by_name.get(name, ()), *self.by_path.get(name, ())])
+
+    def select_one(self, selector: str) -> Set[str]:
+        match = SELECTOR_REGEX.match(selector)
+        if match is None:
+            return set()
+        selected = self._select_method(match.group("method"))
+        if not selected:
+            return selected
+
+        parents, children = None, None
+        if match.group("at") or match.group("parents_depth") is not None or match.group("children_depth") is not None:
+            parents, children = self._get_neighbours()
+
+        result = set(selected)
+        if match.group("at"):
+            result.update(self._walk(selected, children))
+            result.update(self._walk(result, parents))
+            return self._in_selection(result)
+        if match.group("parents_depth") is not None:
+            depth = match.group("parents_depth")
+            result.update(self._walk(selected, parents, int(depth) if depth else None))
+        if match.group("children_depth") is not None:
+            depth = match.group("children_depth")
+            result.update(self._walk(selected, children, int(depth) if depth else None))
+        return self._in_selection(result)
+
+    def select(self, selectors: Optional[Iterable[str]]) -> FrozenSet[str]:
+        """
+        Unique ids of the entities selected by any of the selectors.
+        """
+        selected: Set[str] = set()
+        for selector in selectors or []:
+            selected.update(self.select_one(selector))
+        return frozenset(selected)
@@ -1,17 +1,24 @@
+import hashlib
 import re
 from enum import Enum
+from importlib import import_module
+from pathlib import Path
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import Set
 from typing import Tuple
 from typing import Union
 
-from dbt_artifacts_parser.parser import parse_catalog
-from dbt_artifacts_parser.parser import parse_manifest
+from dbt_artifacts_parser.parsers.catalog.catalog_v1 import CatalogV1
 
+from datapilot import __version__
 from datapilot.core.platforms.dbt.constants import BASE
 from datapilot.core.platforms.dbt.constants import FOLDER
 from datapilot.core.platforms.dbt.constants import INTERMEDIATE
+from datapilot.core.platforms.dbt.constants import MANIFEST_SECTIONS
 from datapilot.core.platforms.dbt.constants import MART
 from datapilot.core.platforms.dbt.constants import MODEL
 from datapilot.core.platforms.dbt.constants import OTHER
@@ -24,12 +31,22 @@ from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSource
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
 from datapilot.core.platforms.dbt.schemas.manifest import Catalog
 from datapilot.core.platforms.dbt.schemas.manifest import Manifest
+from datapilot.core.platforms.dbt.schemas.manifest import RunResults
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+from datapilot.core.platforms.dbt.wrappers.manifest.index import merge_entities
+from datapilot.core.platforms.dbt.wrappers.manifest.projection import FULL_PROJECTION
+from datapilot.core.platforms.dbt.wrappers.manifest.projection import ManifestProjection
 from datapilot.exceptions.exceptions import AltimateFileNotFoundError
 from datapilot.exceptions.exceptions import AltimateInvalidJSONError
+from datapilot.exceptions.exceptions import AltimateNotSupportedError
+from datapilot.utils.cache import DiskCache
+from datapilot.utils.cache import file_checksum
+from datapilot.utils.json_loader import AUTO
+from datapilot.utils.json_loader import load_json
+from datapilot.utils.profiling import NO_PROFILER
+from datapilot.utils.profiling import Profiler
 from datapilot.utils.utils import extract_dir_name_from_file_path
 from datapilot.utils.utils import extract_folders_in_path
-from datapilot.utils.utils import is_superset_path
-from datapilot.utils.utils import load_json
 
 MODEL_TYPE_PATTERNS = {
     STAGING: r"^stg_.*",  # Example: models starting with 'stg_'
@@ -54,14 +71,126 @@ class SelectOption(Enum):
     MODEL_PATH = "model_path"
 
 
+# Module and class of the dbt_artifacts_parser model of every supported manifest schema version
+MANIFEST_MODELS = {
+    "https://schemas.getdbt.com/dbt/manifest/v10.json": ("dbt_artifacts_parser.parsers.manifest.manifest_v10", "ManifestV10"),
+    "https://schemas.getdbt.com/dbt/manifest/v11.json": ("dbt_artifacts_parser.parsers.manifest.manifest_v11", "ManifestV11"),
+    "https://schemas.getdbt.com/dbt/manifest/v12.json": ("dbt_artifacts_parser.parsers.manifest.manifest_v12", "ManifestV12"),
+}
+MANIFEST_SCHEMA_PREFIX = "https://schemas.getdbt.com/dbt/manifest/"
+CATALOG_SCHEMA_VERSION = "https://schemas.getdbt.com/dbt/catalog/v1.json"
+# Module and class of the dbt_artifacts_parser model of every supported run results schema version
+RUN_RESULTS_MODELS = {
+    f"https://schemas.getdbt.com/dbt/run-results/v{version}.json": (
+        f"dbt_artifacts_parser.parsers.run_results.run_results_v{version}",
+        f"RunResultsV{version}",
+    )
+    for version in range(1, 7)
+}
+
+# dbt writes the metadata of an artifact first, starting with its schema version, so that it
+# can be read from the head of the file without decoding the file
+ARTIFACT_HEAD_SIZE = 64 * 1024
+HEAD_SCHEMA_VERSION_REGEX = re.compile(rb'^\s*\{\s*"metadata"\s*:\s*\{[^{}]*?"dbt_schema_version"\s*:\s*"([^"\\]*)"')
+
+
+def get_dbt_schema_version(artifact: Dict) -> str:
+    if not isinstance(artifact.get("metadata"), dict) or "dbt_schema_version" not in artifact["metadata"]:
+        raise ValueError("'metadata.dbt_schema_version' doesn't exist.")
+    return artifact["metadata"]["dbt_schema_version"]
+
+
+def read_dbt_schema_version(file_path: str) -> Optional[str]:
+    """
+    Schema version of an artifact read from the head of its file. None when the file does not
+    start with the metadata of the artifact, or cannot be read.
+    """
+    try:
+        with Path(file_path).open("rb") as f:
+            head = f.read(ARTIFACT_HEAD_SIZE)
+    except OSError:
+        return None
+    match = HEAD_SCHEMA_VERSION_REGEX.match(head)
+    return match.group(1).decode("utf-8", errors="replace") if match else None
+
+
+def check_manifest_schema_version(dbt_schema_version: str) -> None:
+    """
+    Raise AltimateNotSupportedError for the manifests of a version DataPilot does not support,
+    and ValueError for other artifacts.
+    """
+    if dbt_schema_version in MANIFEST_MODELS:
+        return
+    if isinstance(dbt_schema_version, str) and dbt_schema_version.startswith(MANIFEST_SCHEMA_PREFIX):
+        raise AltimateNotSupportedError(
+            f"dbt manifest schema version {dbt_schema_version} not supported. Supported versions: {', '.join(MANIFEST_MODELS)}"
+        )
+    raise ValueError("Not a manifest.json")
+
+
+def parse_manifest(manifest: Dict) -> Manifest:
+    """
+    Parse a manifest of a supported version with the model of its version, which is the only
+    one imported.
+    """
+    dbt_schema_version = get_dbt_schema_version(manifest)
+    check_manifest_schema_version(dbt_schema_version)
+    module, name = MANIFEST_MODELS[dbt_schema_version]
+    return getattr(import_module(module), name)(**manifest)
+
+
+def parse_catalog(catalog: Dict) -> Catalog:
+    if get_dbt_schema_version(catalog) != CATALOG_SCHEMA_VERSION:
+        raise ValueError("Not a catalog.json")
+    return CatalogV1(**catalog)
+
+
+def parse_run_results(run_results: Dict) -> RunResults:
+    dbt_schema_version = get_dbt_schema_version(run_results)
+    if dbt_schema_version not in RUN_RESULTS_MODELS:
+        raise ValueError("Not a run_results.json of a supported version")
+    module, name = RUN_RESULTS_MODELS[dbt_schema_version]
+    return getattr(import_module(module), name)(**run_results)
+
+
 def combine_dict(dict1: Dict, dict2: Optional[Dict]) -> Dict:
     dict2 = dict2 or {}
     return {**dict1, **dict2}
 
 
-def load_manifest(manifest_path: str) -> Manifest:
+def _check_manifest_head(manifest_path: str) -> None:
+    # Manifests of an unsupported version fail before they are decoded
+    dbt_schema_version = read_dbt_schema_version(manifest_path)
+    if dbt_schema_version is None:
+        return
+    try:
+        check_manifest_schema_version(dbt_schema_version)
+    except ValueError as e:
+        raise AltimateInvalidManifestError(f"Invalid manifest file: {manifest_path}. Error: {e}") from e
+
+
+def load_manifest(
+    manifest_path: str,
+    backend: Optional[str] = AUTO,
+    use_mmap: bool = False,
+    sections: Optional[Iterable[str]] = None,
+    profiler: Profiler = NO_PROFILER,
+) -> Manifest:
+    """
+    Load and parse a manifest file.
+
+    :param manifest_path: Path of the manifest file.
+    :param backend: JSON decoder to use, see datapilot.utils.json_loader.
+    :param use_mmap: Memory-map the manifest file while decoding it.
+    :param sections: Top-level sections to materialize, e.g. MANIFEST_SECTIONS. All the other
+        sections are left empty, which skips their decoding and validation.
+    :param profiler: Profiler of the decoding and parsing phases.
+    :return: The parsed manifest.
+    """
+    _check_manifest_head(manifest_path)
     try:
-        manifest_dict = load_json(manifest_path)
+        with profiler.phase("decode manifest json"):
+            manifest_dict = load_json(manifest_path, backend=backend, use_mmap=use_mmap, sections=sections)
     except FileNotFoundError as e:
         raise AltimateFileNotFoundError(f"Manifest file not found: {manifest_path}. Error: {e}") from e
     except ValueError as e:
@@ -72,31 +201,157 @@ def load_manifest(manifest_path: str) -> Manifest:
         ) from e
 
     try:
-        manifest: Manifest = parse_manifest(manifest_dict)
+        with profiler.phase("parse manifest"):
+            manifest: Manifest = parse_manifest(manifest_dict)
     except ValueError as e:
         raise AltimateInvalidManifestError(f"Invalid manifest file: {manifest_path}. Error: {e}") from e
 
     return manifest
 
 
-def load_catalog(catalog_path: str) -> Catalog:
+def load_raw_manifest(
+    manifest_path: str,
+    backend: Optional[str] = AUTO,
+    use_mmap: bool = False,
+    sections: Optional[Iterable[str]] = None,
+    profiler: Profiler = NO_PROFILER,
+) -> Dict:
+    """
+    Load a manifest file without parsing it with dbt_artifacts_parser.
+    DBTFactory.get_manifest_wrapper builds a RawManifestWrapper from the returned dict.
+    """
+    _check_manifest_head(manifest_path)
+    try:
+        with profiler.phase("decode manifest json"):
+            manifest_dict = load_json(manifest_path, backend=backend, use_mmap=use_mmap, sections=sections)
+    except FileNotFoundError as e:
+        raise AltimateFileNotFoundError(f"Manifest file not found: {manifest_path}. Error: {e}") from e
+    except ValueError as e:
+        raise AltimateInvalidJSONError(f"Invalid manifest file: {manifest_path}. Error: {e}") from e
+
+    if not isinstance(manifest_dict, dict) or not isinstance(manifest_dict.get("metadata"), dict):
+        raise AltimateInvalidManifestError(
+            f"Invalid manifest file: {manifest_path}. Please ensure that you are providing the path to a manifest file"
+        )
+    return manifest_dict
+
+
+def load_catalog(catalog_path: str, backend: Optional[str] = AUTO, use_mmap: bool = False, profiler: Profiler = NO_PROFILER) -> Catalog:
     try:
-        catalog_dict = load_json(catalog_path)
+        with profiler.phase("decode catalog json"):
+            catalog_dict = load_json(catalog_path, backend=backend, use_mmap=use_mmap)
     except FileNotFoundError as e:
         raise AltimateFileNotFoundError(f"Manifest file not found: {catalog_path}. Error: {e}") from e
     except ValueError as e:
         raise AltimateInvalidJSONError(f"Invalid JSON file: {catalog_path}. Error: {e}") from e
 
     try:
-        catalog: Catalog = parse_catalog(catalog_dict)
+        with profiler.phase("parse catalog"):
+            catalog: Catalog = parse_catalog(catalog_dict)
     except ValueError as e:
         raise AltimateInvalidManifestError(f"Invalid manifest file: {catalog_path}. Error: {e}") from e
 
     return catalog
 
 
-def load_run_results(run_results_path: str) -> Manifest:
-    raise NotImplementedError
+def _artifact_cache_key(kind: str, artifact_path: str, *options) -> Optional[str]:
+    try:
+        checksum = file_checksum(artifact_path)
+    except OSError:
+        # Let the loader report the missing or unreadable file
+        return None
+    # Entries are pickled Altimate models, they are only valid for the version that wrote them
+    parts = [kind, __version__, *(str(option) for option in options), checksum]
+    return hashlib.sha256(":".join(parts).encode()).hexdigest()
+
+
+def load_cached_manifest(
+    manifest_path: str,
+    cache: Optional[DiskCache] = None,
+    skip_validation: bool = False,
+    sections: Optional[Iterable[str]] = MANIFEST_SECTIONS,
+    profiler: Profiler = NO_PROFILER,
+    projection: ManifestProjection = FULL_PROJECTION,
+) -> ManifestIndex:
+    """
+    Load the ManifestIndex of a manifest file, using the on-disk cache when one is given.
+    Entries are keyed by the checksum of the manifest, so a cache hit skips the JSON decoding
+    and the construction of the Altimate models.
+
+    :param manifest_path: Path of the manifest file.
+    :param cache: The cache to read from and write to, None disables caching.
+    :param skip_validation: Build the entities without validating the manifest, see load_raw_manifest.
+    :param sections: Top-level sections of the manifest to load.
+    :param profiler: Profiler of the loading phases.
+    :param projection: Entity types and heavy fields to build. The sections that none of the
+        entity types need are not loaded.
+    :return: The index of the manifest, DBTFactory.get_manifest_wrapper accepts it in place of a manifest.
+    """
+    if sections is not None:
+        sections = [section for section in sections if section in projection.get_sections()]
+    key = _artifact_cache_key("manifest", manifest_path, skip_validation, sections and sorted(sections), projection) if cache else None
+    if key:
+        with profiler.phase("read manifest cache"):
+            index = cache.get(key)
+        if index is not None:
+            return index
+
+    if skip_validation:
+        manifest = load_raw_manifest(manifest_path, sections=sections, profiler=profiler)
+    else:
+        manifest = load_manifest(manifest_path, sections=sections, profiler=profiler)
+    # The children map is built with the index, in the same pass
+    with profiler.phase("index manifest"):
+        index = DBTFactory.get_manifest_wrapper(manifest).get_index(projection)
+
+    if key:
+        with profiler.phase("write manifest cache"):
+            cache.set(key, index)
+    return index
+
+
+def load_cached_catalog(catalog_path: str, cache: Optional[DiskCache] = None, profiler: Profiler = NO_PROFILER) -> Catalog:
+    """
+    Load a catalog file, using the on-disk cache when one is given.
+
+    :param catalog_path: Path of the catalog file.
+    :param cache: The cache to read from and write to, None disables caching.
+    :param profiler: Profiler of the loading phases.
+    :return: The parsed catalog.
+    """
+    key = _artifact_cache_key("catalog", catalog_path) if cache else None
+    if key:
+        with profiler.phase("read catalog cache"):
+            catalog = cache.get(key)
+        if catalog is not None:
+            return catalog
+
+    catalog = load_catalog(catalog_path, profiler=profiler)
+
+    if key:
+        with profiler.phase("write catalog cache"):
+            cache.set(key, catalog)
+    return catalog
+
+
+def load_run_results(
+    run_results_path: str, backend: Optional[str] = AUTO, use_mmap: bool = False, profiler: Profiler = NO_PROFILER
+) -> RunResults:
+    try:
+        with profiler.phase("decode run results json"):
+            run_results_dict = load_json(run_results_path, backend=backend, use_mmap=use_mmap)
+    except FileNotFoundError as e:
+        raise AltimateFileNotFoundError(f"Run results file not found: {run_results_path}. Error: {e}") from e
+    except ValueError as e:
+        raise AltimateInvalidJSONError(f"Invalid JSON file: {run_results_path}. Error: {e}") from e
+
+    try:
+        with profiler.phase("parse run results"):
+            run_results: RunResults = parse_run_results(run_results_dict)
+    except ValueError as e:
+        raise AltimateInvalidManifestError(f"Invalid run results file: {run_results_path}. Error: {e}") from e
+
+    return run_results
 
 
 # TODO: Add tests!
@@ -254,17 +509,40 @@ def get_children_map(nodes: Dict[str, AltimateManifestNode]) -> Dict[str, Altima
     return children_map
 
 
-# TODO: Add tests!
-def get_hard_coded_references(sql_code):
+def get_longest_path_lengths(parents: Dict[str, List[str]]) -> Tuple[Dict[str, int], Set[str]]:
     """
-    Find all hard-coded references in the given SQL code.
+    Number of nodes of the longest path going up from every node of a graph, computed
+    iteratively in topological order. Parents that are not in the graph are ignored.
 
-    :param sql_code: A string containing the SQL code to be analyzed.
-    :return: A set of unique hard-coded references found in the SQL code.
+    :param parents: The parents of every node of the graph.
+    :return: The length of the longest path from every node, and the nodes that are on a cycle
+        or below one, which have no longest path and are left out of the lengths.
     """
-    # Define regex patterns to match different types of hard-coded references
-    from_hard_coded_references = {
-        "from_var_1": r"""(?ix)
+    children: Dict[str, List[str]] = {node_id: [] for node_id in parents}
+    graph_parents = {}
+    for node_id, node_parents in parents.items():
+        graph_parents[node_id] = [parent for parent in node_parents if parent in children]
+        for parent in graph_parents[node_id]:
+            children[parent].append(node_id)
+
+    pending_parents = {node_id: len(node_parents) for node_id, node_parents in graph_parents.items()}
+    queue = [node_id for node_id, count in pending_parents.items() if count == 0]
+    lengths = {}
+    # The queue grows while it is iterated, every node is appended once all its parents are done
+    for node_id in queue:
+        node_parents = graph_parents[node_id]
+        lengths[node_id] = 1 + max(map(lengths.__getitem__, node_parents)) if node_parents else 1
+        for child in children[node_id]:
+            pending_parents[child] -= 1
+            if not pending_parents[child]:
+                queue.append(child)
+
+    return lengths, {node_id for node_id in parents if node_id not in lengths}
+
+
+# Patterns of the hard-coded references, each one starts with a from or join keyword
+HARD_CODED_REFERENCE_PATTERNS = {
+    "from_var_1": r"""(?ix)
 
                     # first matching group
                     # from or join followed by at least 1 whitespace character
@@ -287,7 +565,7 @@ def get_hard_coded_references(sql_code):
                 (\)\s *}})
 
     """,
-        "from_var_2": r"""(?ix)
+    "from_var_2": r"""(?ix)
 
     # first matching group
     # from or join followed by at least 1 whitespace character
@@ -327,7 +605,7 @@ def get_hard_coded_references(sql_code):
         (\)\s *}})
 
     """,
-        "from_table_1": r"""(?ix)
+    "from_table_1": r"""(?ix)
 
     # first matching group
     # from or join followed by at least 1 whitespace character
@@ -363,7 +641,7 @@ def get_hard_coded_references(sql_code):
         ([\]`\"\']?)(?=\s|$)
 
               """,
-        "from_table_2": r"""(?ix)
+    "from_table_2": r"""(?ix)
 
     # first matching group
     # from or join followed by at least 1 whitespace character
@@ -414,7 +692,7 @@ def get_hard_coded_references(sql_code):
         ([\]`\"\']?)(?=\s|$)
 
               """,
-        "from_table_3": r"""(?ix)
+    "from_table_3": r"""(?ix)
 
     # first matching group
     # from or join followed by at least 1 whitespace character
@@ -434,21 +712,46 @@ def get_hard_coded_references(sql_code):
                      ([\]`\"\'])(?=\s|$)
 
                            """,
-    }
+}
 
-    # Set to store all unique hard-coded references
-    hard_coded_references = set()
-    for regex_pattern in from_hard_coded_references.values():
-        # Compile the regex pattern
-        all_regex_matches = re.findall(regex_pattern, sql_code)
+# The patterns matching {{ var(...) }} and the ones matching a table name
+_VAR_REFERENCE_REGEXES = [(name, re.compile(HARD_CODED_REFERENCE_PATTERNS[name])) for name in ("from_var_1", "from_var_2")]
+_TABLE_REFERENCE_REGEXES = [
+    (name, re.compile(HARD_CODED_REFERENCE_PATTERNS[name])) for name in ("from_table_1", "from_table_2", "from_table_3")
+]
+_FROM_OR_JOIN = re.compile(r"(?i)(?:from|join)(?=\s)")
+_NON_WHITESPACE = re.compile(r"\S")
 
-        # Find all matches in the SQL code
-        # Process each match
-        for match in all_regex_matches:
-            # Extract all groups except the first one and join them
-            raw_reference = "".join(match[1:]).strip()  #
 
-            hard_coded_references.add(raw_reference)
+def get_hard_coded_references(sql_code):
+    """
+    Find all hard-coded references in the given SQL code.
+
+    The code is scanned once for from and join keywords. At each of them, the token that
+    follows tells whether it can be a var reference or a table name, and only the patterns of
+    that kind are tried. A pattern is not tried inside its own previous match, so the result
+    is the same as running re.findall with every pattern.
+
+    :param sql_code: A string containing the SQL code to be analyzed.
+    :return: A set of unique hard-coded references found in the SQL code.
+    """
+    # Set to store all unique hard-coded references
+    hard_coded_references = set()
+    matched_until = dict.fromkeys(HARD_CODED_REFERENCE_PATTERNS, 0)
+    for keyword in _FROM_OR_JOIN.finditer(sql_code):
+        start = keyword.start()
+        token = _NON_WHITESPACE.search(sql_code, keyword.end())
+        if token is None:
+            break
+        regexes = _VAR_REFERENCE_REGEXES if sql_code[token.start()] == "{" else _TABLE_REFERENCE_REGEXES
+        for name, regex in regexes:
+            if start < matched_until[name]:
+                continue
+            match = regex.match(sql_code, start)
+            if match:
+                matched_until[name] = match.end()
+                # Extract all groups except the first one and join them
+                hard_coded_references.add("".join(match.groups()[1:]).strip())
     return hard_coded_references
 
 
@@ -480,44 +783,24 @@ def parse_argument(argument: str) -> dict:
     return {"type": SelectOption.MODEL_NAME, "name": argument}
 
 
-def add_models_by_type(selected_category: dict, entities: dict, final_models: List[str]):
-    """
-    Adds models to the final list based on the selected category.
-
-    Parameters:
-    - selected_category (dict): The category selected for adding models.
-    - entities (dict): A dictionary of entities, each associated with a type.
-    - final_models (List[str]): The list to which the models' unique IDs are added.
-    """
-    for entity in entities.values():
-        if selected_category["type"] in (SelectOption.MODEL_NAME, SelectOption.MODEL_PATH):
-            if entity.name == selected_category.get("name") or entity.original_file_path == selected_category.get("name"):
-                final_models.append(entity.unique_id)
-        elif selected_category["type"] == SelectOption.DIRECTORY:
-            if is_superset_path(selected_category["name"], entity.original_file_path):
-                final_models.append(entity.unique_id)
-
-
 def get_models(
     selected_model_list: Optional[List[str]],
     entities: Dict[str, Union[AltimateManifestNode, AltimateManifestExposureNode, AltimateManifestSourceNode, AltimateManifestTestNode]],
-) -> List[str]:
+) -> FrozenSet[str]:
     """
     Retrieves models based on a selected list and entities.
 
     Parameters:
-    - selected_model_list (Optional[List[str]]): The list of selected models.
+    - selected_model_list (Optional[List[str]]): The list of selected models, with the syntax of ModelSelector.
     - entities (Dict): A dictionary containing entity types and their instances.
 
     Returns:
-    - List[str]: A list of unique model IDs based on the selection criteria.
+    - FrozenSet[str]: The unique IDs of the selected entities.
     """
-    final_models = []
-    for selected_model in selected_model_list or []:
-        selected_category = parse_argument(selected_model)
-        for entity_type in entities:
-            add_models_by_type(selected_category, entities[entity_type], final_models)
-    return list(set(final_models))
+    # Imported here, the selector itself uses parse_argument
+    from datapilot.core.platforms.dbt.selector import ModelSelector
+
+    return ModelSelector(merge_entities(*entities.values())).select(selected_model_list)
 
 
 def get_manifest_wrapper(manifest_path: str):
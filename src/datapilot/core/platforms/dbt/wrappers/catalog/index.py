@@ -0,0 +1,28 @@
+from typing import Dict
+from typing import FrozenSet
+from typing import List
+
+
+class CatalogIndex:
+    """
+    The columns of every node and source of a catalog, by unique id. Column names are kept as
+    in the catalog, and also lowercased for case-insensitive lookups. It is built once by
+    BaseCatalogWrapper.get_index.
+    """
+
+    def __init__(self):
+        # unique id -> column name -> column type, in catalog order
+        self.columns: Dict[str, Dict[str, str]] = {}
+        # unique id -> lowercase column name -> column type
+        self.lower_columns: Dict[str, Dict[str, str]] = {}
+        self.column_names: Dict[str, List[str]] = {}
+        self.column_sets: Dict[str, FrozenSet[str]] = {}
+
+    def add(self, unique_id: str, columns: Dict[str, str]) -> None:
+        self.columns[unique_id] = columns
+        lower_columns = {}
+        for name, column_type in columns.items():
+            lower_columns.setdefault(name.lower(), column_type)
+        self.lower_columns[unique_id] = lower_columns
+        self.column_names[unique_id] = [name.lower() for name in columns]
+        self.column_sets[unique_id] = frozenset(lower_columns)
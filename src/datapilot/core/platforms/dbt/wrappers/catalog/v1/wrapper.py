@@ -5,14 +5,11 @@ from datapilot.core.platforms.dbt.wrappers.catalog.wrapper import BaseCatalogWra
 
 class CatalogV1Wrapper(BaseCatalogWrapper):
     def __init__(self, catalog: CatalogV1):
+        super().__init__()
         self.catalog = catalog
 
-    def get_schema(self):
-        nodes_with_schemas = {}
+    def _get_tables(self):
         for node_id, catalog_table_node in self.catalog.nodes.items():
-            nodes_with_schemas[node_id] = {column_name: column_node.type for column_name, column_node in catalog_table_node.columns.items()}
+            yield node_id, {column_name: column_node.type for column_name, column_node in catalog_table_node.columns.items()}
         for source_id, catalog_source_node in self.catalog.sources.items():
-            nodes_with_schemas[source_id] = {
-                column_name: column_node.type for column_name, column_node in catalog_source_node.columns.items()
-            }
-        return nodes_with_schemas
+            yield source_id, {column_name: column_node.type for column_name, column_node in catalog_source_node.columns.items()}
@@ -1,9 +1,60 @@
 from abc import ABC
 from abc import abstractmethod
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from datapilot.core.platforms.dbt.wrappers.catalog.index import CatalogIndex
 
 
 class BaseCatalogWrapper(ABC):
+    def __init__(self):
+        self._index: Optional[CatalogIndex] = None
+
     @abstractmethod
+    def _get_tables(self) -> Iterable[Tuple[str, Dict[str, str]]]:
+        """
+        Unique id and columns (name -> type) of every node and source of the catalog.
+        """
+
+    def get_index(self) -> CatalogIndex:
+        """
+        The column index of the catalog, built on first use and shared by all the insights.
+        """
+        if self._index is None:
+            index = CatalogIndex()
+            for unique_id, columns in self._get_tables():
+                index.add(unique_id, columns)
+            self._index = index
+        return self._index
+
     def get_schema(self) -> Dict[str, Dict[str, str]]:
-        pass
+        return self.get_index().columns
+
+    def has_node(self, unique_id: str) -> bool:
+        return unique_id in self.get_index().columns
+
+    def get_node_columns(self, unique_id: str) -> Dict[str, str]:
+        """
+        Columns of a node or source, name -> type, with the names as in the catalog.
+        Empty if the node is not in the catalog.
+        """
+        return self.get_index().columns.get(unique_id, {})
+
+    def get_column_names(self, unique_id: str) -> List[str]:
+        """
+        Lowercase column names of a node or source, in catalog order.
+        """
+        return self.get_index().column_names.get(unique_id, [])
+
+    def get_column_set(self, unique_id: str) -> FrozenSet[str]:
+        return self.get_index().column_sets.get(unique_id, frozenset())
+
+    def get_column_type(self, unique_id: str, column_name: str) -> Optional[str]:
+        """
+        Type of a column, looked up case-insensitively. None if the column is not in the catalog.
+        """
+        return self.get_index().lower_columns.get(unique_id, {}).get(column_name.lower())
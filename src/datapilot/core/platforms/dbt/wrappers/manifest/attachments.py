@@ -0,0 +1,91 @@
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Set
+
+from datapilot.core.platforms.dbt.constants import GENERIC
+from datapilot.core.platforms.dbt.constants import SINGULAR
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+
+# Key of the generic tests that are not on a column, see TestAttachmentIndex.get_column_tests
+ALL_COLUMNS = "_all_tests"
+
+
+class TestAttachmentIndex:
+    """
+    The tests of every model and source, built in a single pass over the tests. A test is
+    attached to every entity of its depends_on, and is counted once per entity by name and by
+    type. The generic tests are also grouped by the column they test.
+
+    Built once per run and shared by the insights on tests, so that they look the tests of an
+    entity up instead of scanning the tests or the children of the entity.
+    """
+
+    # Not a test class, pytest collects classes whose name starts with Test
+    __test__ = False
+
+    def __init__(self, tests: Iterable[AltimateManifestTestNode], project_name: str):
+        self.tests_by_entity: Dict[str, List[AltimateManifestTestNode]] = {}
+        self.count_by_name: Dict[str, Dict[str, int]] = {}
+        self.count_by_type: Dict[str, Dict[str, int]] = {}
+        self.column_tests: Dict[str, Dict[str, List[str]]] = {}
+        # Entities with a test of the project, and whether there is any singular test
+        self.project_tested_ids: Set[str] = set()
+        self.has_singular_test = False
+        self.num_tests = 0
+
+        for test in tests:
+            self.num_tests += 1
+            test_type = test.test_type
+            in_project = test.package_name == project_name
+            if test_type == SINGULAR:
+                self.has_singular_test = True
+            metadata = test.test_metadata if test_type == GENERIC else None
+            column = (metadata.kwargs.get("column_name") or ALL_COLUMNS) if metadata is not None else None
+            for unique_id in (test.depends_on.nodes if test.depends_on else None) or []:
+                self.tests_by_entity.setdefault(unique_id, []).append(test)
+                by_name = self.count_by_name.setdefault(unique_id, {})
+                by_name[test.name] = by_name.get(test.name, 0) + 1
+                by_type = self.count_by_type.setdefault(unique_id, {})
+                by_type[test_type] = by_type.get(test_type, 0) + 1
+                if metadata is not None:
+                    self.column_tests.setdefault(unique_id, {}).setdefault(column, []).append(metadata.name)
+                if in_project:
+                    self.project_tested_ids.add(unique_id)
+
+    @classmethod
+    def from_index(cls, index: ManifestIndex) -> "TestAttachmentIndex":
+        return cls(index.tests.values(), index.project_name)
+
+    def get_tests(self, unique_id: str) -> List[AltimateManifestTestNode]:
+        return self.tests_by_entity.get(unique_id, [])
+
+    def get_test_count(self, unique_id: str) -> int:
+        return len(self.tests_by_entity.get(unique_id, ()))
+
+    def get_count_by_name(self, unique_id: str) -> Dict[str, int]:
+        """
+        Number of tests of the entity by name of the test node.
+        """
+        return self.count_by_name.get(unique_id, {})
+
+    def get_count_by_type(self, unique_id: str) -> Dict[str, int]:
+        """
+        Number of tests of the entity by test type, GENERIC or SINGULAR.
+        """
+        return self.count_by_type.get(unique_id, {})
+
+    def get_count_by_group(self, unique_id: str, group: Iterable[str]) -> int:
+        """
+        Number of tests of the entity whose name is one of the group.
+        """
+        count_by_name = self.get_count_by_name(unique_id)
+        return sum(count_by_name.get(name, 0) for name in set(group))
+
+    def get_column_tests(self, unique_id: str) -> Dict[str, List[str]]:
+        """
+        Names of the generic tests of the entity, e.g. unique or not_null, by the column they
+        test, ALL_COLUMNS for the ones on the whole entity.
+        """
+        return self.column_tests.get(unique_id, {})
@@ -0,0 +1,24 @@
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+from datapilot.core.platforms.dbt.wrappers.manifest.projection import FULL_PROJECTION
+from datapilot.core.platforms.dbt.wrappers.manifest.projection import ManifestProjection
+from datapilot.core.platforms.dbt.wrappers.manifest.wrapper import BaseManifestIndexWrapper
+from datapilot.exceptions.exceptions import AltimateNotSupportedError
+
+
+class CachedManifestWrapper(BaseManifestIndexWrapper):
+    """
+    Manifest wrapper serving the entities of a ManifestIndex that was built earlier, e.g. loaded
+    from the on-disk cache. The original manifest is not available, so the index cannot be
+    built again.
+    """
+
+    def __init__(self, index: ManifestIndex):
+        self._index = index
+
+    def get_package(self) -> str:
+        return self._index.project_name
+
+    def get_index(self, projection: ManifestProjection = FULL_PROJECTION) -> ManifestIndex:
+        if not self._index.projection.covers(projection):
+            raise AltimateNotSupportedError(f"The cached index was built with {self._index.projection}, it cannot serve {projection}")
+        return self._index
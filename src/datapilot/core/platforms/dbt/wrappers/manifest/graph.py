@@ -0,0 +1,152 @@
+from array import array
+from itertools import chain
+from operator import sub
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+
+# Typecode of the integer arrays, a signed int of at least 4 bytes
+ARRAY_TYPECODE = "i"
+
+
+def _csr(adjacency: Iterable[Iterable[int]]) -> Tuple[array, array, array]:
+    """
+    Offsets and targets of adjacency lists in compressed sparse row form, the neighbours of
+    vertex v being targets[offsets[v]:offsets[v + 1]], and the degree of every vertex.
+    """
+    offsets = array(ARRAY_TYPECODE, [0])
+    targets = array(ARRAY_TYPECODE)
+    for neighbours in adjacency:
+        targets.extend(neighbours)
+        offsets.append(len(targets))
+    return offsets, targets, array(ARRAY_TYPECODE, map(sub, offsets[1:], offsets[:-1]))
+
+
+class ManifestGraph:
+    """
+    Compact DAG of the nodes of a manifest and their parents. Unique ids are mapped to dense
+    integers and the parents and children of every vertex are stored as integer arrays in
+    compressed sparse row form, with the in and out degrees, a topological order and the depth
+    of every vertex computed once.
+
+    Vertices are the keys of the children map, in the same order, followed by the other nodes
+    and the extra ids, e.g. the sources and seeds without children. Parents follow the order of depends_on and children the order of
+    the children map, so that insights running on the graph give the same results as on the
+    entities.
+    """
+
+    def __init__(
+        self,
+        nodes: Dict[str, AltimateManifestNode],
+        children_map: Dict[str, Iterable[str]],
+        extra_ids: Iterable[str] = (),
+    ):
+        self.unique_ids: List[str] = list(children_map)
+        self.positions: Dict[str, int] = {unique_id: position for position, unique_id in enumerate(self.unique_ids)}
+        for unique_id in chain(nodes, extra_ids):
+            if unique_id not in self.positions:
+                self.positions[unique_id] = len(self.unique_ids)
+                self.unique_ids.append(unique_id)
+
+        positions = self.positions
+        # Built straight into the arrays, without a list per vertex.
+        # dict.fromkeys drops duplicated parents and keeps the order of depends_on.
+        self.parent_offsets, self.parent_targets, self.in_degree = _csr(
+            map(positions.__getitem__, dict.fromkeys(nodes[unique_id].depends_on.nodes or ()) if unique_id in nodes else ())
+            for unique_id in self.unique_ids
+        )
+        self.child_offsets, self.child_targets, self.out_degree = _csr(
+            map(positions.__getitem__, children_map.get(unique_id, ())) for unique_id in self.unique_ids
+        )
+        self.topological_order, self.depth = self._sort()
+
+    @classmethod
+    def from_index(cls, index: ManifestIndex) -> "ManifestGraph":
+        return cls(index.nodes, index.children_map, extra_ids=[*index.sources, *index.seeds])
+
+    def _sort(self) -> Tuple[array, array]:
+        """
+        Topological order of the vertices with Kahn's algorithm, and the depth of every vertex:
+        the number of edges of the longest path from a vertex without parents. Vertices on a
+        cycle or below one are left out of the order and have a depth of -1.
+        """
+        pending = array(ARRAY_TYPECODE, self.in_degree)
+        depth = array(ARRAY_TYPECODE, [-1]) * len(self.unique_ids)
+        order = array(ARRAY_TYPECODE, (vertex for vertex, count in enumerate(pending) if count == 0))
+        for vertex in order:
+            depth[vertex] = 0
+        child_offsets, child_targets = self.child_offsets, self.child_targets
+        # The order grows while it is iterated, every vertex is appended once all its parents are done
+        for vertex in order:
+            child_depth = depth[vertex] + 1
+            for child in child_targets[child_offsets[vertex] : child_offsets[vertex + 1]]:
+                if depth[child] < child_depth:
+                    depth[child] = child_depth
+                pending[child] -= 1
+                if not pending[child]:
+                    order.append(child)
+        if len(order) < len(self.unique_ids):
+            for vertex in range(len(self.unique_ids)):
+                if pending[vertex]:
+                    depth[vertex] = -1
+        return order, depth
+
+    def __len__(self) -> int:
+        return len(self.unique_ids)
+
+    def __contains__(self, unique_id: str) -> bool:
+        return unique_id in self.positions
+
+    def parent_positions(self, vertex: int) -> array:
+        return self.parent_targets[self.parent_offsets[vertex] : self.parent_offsets[vertex + 1]]
+
+    def child_positions(self, vertex: int) -> array:
+        return self.child_targets[self.child_offsets[vertex] : self.child_offsets[vertex + 1]]
+
+    def get_parents(self, unique_id: str) -> List[str]:
+        """
+        Unique ids of the direct parents of an entity, in the order of its depends_on.
+        """
+        position = self.positions.get(unique_id)
+        if position is None:
+            return []
+        return [self.unique_ids[parent] for parent in self.parent_positions(position)]
+
+    def get_children(self, unique_id: str) -> List[str]:
+        """
+        Unique ids of the direct children of an entity.
+        """
+        position = self.positions.get(unique_id)
+        if position is None:
+            return []
+        return [self.unique_ids[child] for child in self.child_positions(position)]
+
+    def get_in_degree(self, unique_id: str) -> int:
+        position = self.positions.get(unique_id)
+        return 0 if position is None else self.in_degree[position]
+
+    def get_out_degree(self, unique_id: str) -> int:
+        position = self.positions.get(unique_id)
+        return 0 if position is None else self.out_degree[position]
+
+    def get_depth(self, unique_id: str) -> Optional[int]:
+        """
+        Number of edges of the longest path from a root to an entity, None when the entity is
+        not in the graph or is on a cycle or below one.
+        """
+        position = self.positions.get(unique_id)
+        if position is None or self.depth[position] < 0:
+            return None
+        return self.depth[position]
+
+    def get_cyclic(self) -> Set[str]:
+        """
+        Unique ids of the entities on a cycle or below one.
+        """
+        return {self.unique_ids[vertex] for vertex, depth in enumerate(self.depth) if depth < 0}
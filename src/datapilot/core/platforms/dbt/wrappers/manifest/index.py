@@ -0,0 +1,123 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Union
+
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestExposureNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestMacroNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateSeedNode
+from datapilot.core.platforms.dbt.wrappers.manifest.projection import FULL_PROJECTION
+from datapilot.core.platforms.dbt.wrappers.manifest.projection import ManifestProjection
+from datapilot.utils.field_store import FieldStore
+
+ManifestEntity = Union[
+    AltimateManifestNode,
+    AltimateManifestSourceNode,
+    AltimateManifestExposureNode,
+    AltimateManifestTestNode,
+    AltimateManifestMacroNode,
+    AltimateSeedNode,
+]
+
+
+def merge_entities(*entities_by_type: Optional[Dict[str, ManifestEntity]]) -> Dict[str, ManifestEntity]:
+    """
+    A single lookup table of entities by unique id. When the same unique id is in several of
+    the given dicts, the entity of the first one wins.
+    """
+    entities: Dict[str, ManifestEntity] = {}
+    for entities_of_type in reversed(entities_by_type):
+        entities.update(entities_of_type or {})
+    return entities
+
+
+class ManifestIndex:
+    """
+    The entities of a manifest grouped by type, the children map and secondary lookup
+    tables. It is filled in a single pass over the manifest by BaseManifestWrapper.get_index.
+
+    With a store, the heavy fields of the entities (code, columns, macro SQL) are moved to it
+    as they are added, and loaded back on first access, see AltimateLazyModel. The heavy fields
+    that are not in the projection are emptied instead.
+    """
+
+    def __init__(self, project_name: str, store: Optional[FieldStore] = None, projection: ManifestProjection = FULL_PROJECTION):
+        self.project_name = project_name
+        self.store = store
+        self.projection = projection
+        self.nodes: Dict[str, AltimateManifestNode] = {}
+        self.sources: Dict[str, AltimateManifestSourceNode] = {}
+        self.macros: Dict[str, AltimateManifestMacroNode] = {}
+        self.exposures: Dict[str, AltimateManifestExposureNode] = {}
+        self.seeds: Dict[str, AltimateSeedNode] = {}
+        self.tests: Dict[str, AltimateManifestTestNode] = {}
+        self.tests_by_type: Dict[str, Dict[str, AltimateManifestTestNode]] = {}
+        self.children_map: Dict[str, Set[str]] = {}
+
+        # Secondary indexes: key -> unique ids of the entities above, in manifest order
+        self.by_resource_type: Dict[str, List[str]] = {}
+        self.by_package: Dict[str, List[str]] = {}
+        self.by_path: Dict[str, List[str]] = {}
+        self.by_name: Dict[str, List[str]] = {}
+
+    def get_entities(self) -> Dict[str, ManifestEntity]:
+        """
+        Every entity of the manifest by unique id, see merge_entities.
+        """
+        return merge_entities(self.nodes, self.sources, self.exposures, self.tests, self.macros, self.seeds)
+
+    def _add_to_indexes(self, entity: ManifestEntity) -> None:
+        unique_id = entity.unique_id
+        self.by_resource_type.setdefault(entity.resource_type.value, []).append(unique_id)
+        self.by_package.setdefault(entity.package_name, []).append(unique_id)
+        self.by_path.setdefault(entity.original_file_path, []).append(unique_id)
+        self.by_name.setdefault(entity.name, []).append(unique_id)
+
+    def _offload(self, entity: ManifestEntity) -> None:
+        entity.drop_fields(self.projection.get_dropped_fields(entity.LAZY_FIELDS))
+        if self.store is not None:
+            entity.offload(self.store)
+
+    def release(self) -> None:
+        """
+        Drop the heavy fields loaded since the last release, they are read again from the store
+        on their next access.
+        """
+        if self.store is not None:
+            self.store.release()
+
+    def add_node(self, node: AltimateManifestNode) -> None:
+        self._offload(node)
+        self.nodes[node.unique_id] = node
+        self._add_to_indexes(node)
+        self.children_map.setdefault(node.unique_id, set())
+        for parent in node.depends_on.nodes or []:
+            self.children_map.setdefault(parent, set()).add(node.unique_id)
+
+    def add_test(self, test: AltimateManifestTestNode) -> None:
+        self._offload(test)
+        self.tests[test.unique_id] = test
+        self.tests_by_type.setdefault(test.test_type, {})[test.unique_id] = test
+        self._add_to_indexes(test)
+
+    def add_seed(self, seed: AltimateSeedNode) -> None:
+        self.seeds[seed.unique_id] = seed
+        self._add_to_indexes(seed)
+
+    def add_source(self, source: AltimateManifestSourceNode) -> None:
+        self._offload(source)
+        self.sources[source.unique_id] = source
+        self._add_to_indexes(source)
+
+    def add_macro(self, macro: AltimateManifestMacroNode) -> None:
+        self._offload(macro)
+        self.macros[macro.unique_id] = macro
+        self._add_to_indexes(macro)
+
+    def add_exposure(self, exposure: AltimateManifestExposureNode) -> None:
+        self.exposures[exposure.unique_id] = exposure
+        self._add_to_indexes(exposure)
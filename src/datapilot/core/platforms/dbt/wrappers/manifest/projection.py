@@ -0,0 +1,92 @@
+from typing import FrozenSet
+from typing import Iterable
+from typing import Tuple
+from typing import Type
+
+from datapilot.core.platforms.dbt.constants import DAG_ENTITY_TYPES
+from datapilot.core.platforms.dbt.constants import ENTITY_TYPES
+from datapilot.core.platforms.dbt.constants import EXPOSURES
+from datapilot.core.platforms.dbt.constants import MACROS
+from datapilot.core.platforms.dbt.constants import NODES
+from datapilot.core.platforms.dbt.constants import SOURCES
+from datapilot.core.platforms.dbt.constants import TESTS
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestMacroNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
+
+# The heavy fields of all the entities, see AltimateLazyModel.LAZY_FIELDS
+HEAVY_FIELDS: Tuple[str, ...] = tuple(
+    dict.fromkeys([*AltimateManifestNode.LAZY_FIELDS, *AltimateManifestSourceNode.LAZY_FIELDS, *AltimateManifestMacroNode.LAZY_FIELDS])
+)
+
+# Top-level section of the manifest that holds the entities of every type
+SECTION_OF_ENTITY_TYPE = {
+    NODES: "nodes",
+    SOURCES: "sources",
+    TESTS: "nodes",
+    MACROS: "macros",
+    EXPOSURES: "exposures",
+}
+
+
+class ManifestProjection:
+    """
+    The entity types and the heavy fields of the manifest that the insights of a run read.
+    BaseManifestWrapper.get_index only builds the entities of these types, ManifestIndex empties
+    the heavy fields that are not in it, and the loader skips the sections no entity type needs.
+
+    The entities of DAG_ENTITY_TYPES are always built, the graph, the selector and the
+    incremental runs rely on them.
+    """
+
+    def __init__(self, entity_types: Iterable[str] = ENTITY_TYPES, fields: Iterable[str] = HEAVY_FIELDS):
+        self.entity_types: FrozenSet[str] = frozenset(DAG_ENTITY_TYPES).union(entity_types)
+        self.fields: FrozenSet[str] = frozenset(fields)
+
+    @classmethod
+    def of_insights(cls, insights: Iterable[Type]) -> "ManifestProjection":
+        """
+        The union of the entity types and the heavy fields the given insight classes declare,
+        see DBTInsight.ENTITIES_REQUIRED and DBTInsight.HEAVY_FIELDS_REQUIRED. Classes that
+        declare nothing read everything.
+        """
+        entity_types, fields = set(), set()
+        for insight in insights:
+            entity_types.update(getattr(insight, "ENTITIES_REQUIRED", ENTITY_TYPES))
+            fields.update(getattr(insight, "HEAVY_FIELDS_REQUIRED", HEAVY_FIELDS))
+        return cls(entity_types, fields)
+
+    def includes(self, entity_type: str) -> bool:
+        return entity_type in self.entity_types
+
+    def covers(self, other: "ManifestProjection") -> bool:
+        """
+        Whether an index built with this projection has everything other needs.
+        """
+        return self.entity_types >= other.entity_types and self.fields >= other.fields
+
+    def union(self, other: "ManifestProjection") -> "ManifestProjection":
+        return ManifestProjection(self.entity_types | other.entity_types, self.fields | other.fields)
+
+    def get_sections(self) -> Tuple[str, ...]:
+        """
+        Top-level sections of the manifest to load, see load_manifest.
+        """
+        sections = {SECTION_OF_ENTITY_TYPE[entity_type] for entity_type in self.entity_types if entity_type in SECTION_OF_ENTITY_TYPE}
+        return ("metadata", *sorted(sections))
+
+    def get_dropped_fields(self, lazy_fields: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(name for name in lazy_fields if name not in self.fields)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ManifestProjection) and (self.entity_types, self.fields) == (other.entity_types, other.fields)
+
+    def __hash__(self) -> int:
+        return hash((self.entity_types, self.fields))
+
+    def __repr__(self) -> str:
+        return f"ManifestProjection(entity_types={sorted(self.entity_types)}, fields={sorted(self.fields)})"
+
+
+# Every entity with all its fields
+FULL_PROJECTION = ManifestProjection()
@@ -0,0 +1,317 @@
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Type
+
+from pydantic import BaseModel
+from pydantic import Extra
+
+from datapilot.core.platforms.dbt.constants import GENERIC
+from datapilot.core.platforms.dbt.constants import SEED
+from datapilot.core.platforms.dbt.constants import SINGULAR
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDBTContract
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDependsOn
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDocs
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateExposureType
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateExternalPartition
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateExternalTable
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateFileHash
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateFreshnessThreshold
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateHook
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateMacroArgument
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestColumnInfo
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestExposureNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestMacroNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateMaturityEnum
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateNodeConfig
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateOwner
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateQuoting
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateRefArgs
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateSeedConfig
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateSeedNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateSourceConfig
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateSupportedLanguage
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateTestConfig
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateTestMetadata
+from datapilot.core.platforms.dbt.wrappers.manifest.wrapper import BaseManifestWrapper
+
+# Keys of the manifest JSON that dbt_artifacts_parser exposes under a different attribute name
+FIELD_ALIASES = {
+    "schema": "schema_",
+    "post-hook": "post_hook",
+    "pre-hook": "pre_hook",
+}
+
+
+def _construct(model: Type[BaseModel], values: Dict[str, Any]) -> BaseModel:
+    """
+    Build a model without running pydantic validation. Keys that the model does not
+    declare are dropped, unless the model allows extra fields.
+    """
+    if model.__config__.extra != Extra.allow:
+        values = {key: value for key, value in values.items() if key in model.__fields__}
+    return model.construct(**values)
+
+
+def _unalias(values: Dict[str, Any]) -> Dict[str, Any]:
+    return {FIELD_ALIASES.get(key, key): value for key, value in values.items()}
+
+
+def _column(column: Dict) -> AltimateManifestColumnInfo:
+    return AltimateManifestColumnInfo.construct(
+        name=column["name"],
+        description=column.get("description", ""),
+        meta=column.get("meta", {}),
+        data_type=column.get("data_type"),
+        quote=column.get("quote"),
+        tags=column.get("tags", []),
+    )
+
+
+def _columns(columns: Optional[Dict]) -> Dict[str, AltimateManifestColumnInfo]:
+    return {name: _column(column) for name, column in (columns or {}).items()}
+
+
+def _file_hash(checksum: Optional[Dict]) -> AltimateFileHash:
+    checksum = checksum or {}
+    return AltimateFileHash.construct(name=checksum.get("name"), checksum=checksum.get("checksum"))
+
+
+def _depends_on(depends_on: Optional[Dict]) -> AltimateDependsOn:
+    depends_on = depends_on or {}
+    return AltimateDependsOn.construct(nodes=depends_on.get("nodes", []), macros=depends_on.get("macros", []))
+
+
+def _hooks(hooks):
+    if hooks is None:
+        return None
+    return [_construct(AltimateHook, hook) for hook in hooks]
+
+
+def _config(model: Type[BaseModel], config: Optional[Dict]) -> Optional[BaseModel]:
+    if config is None:
+        return None
+    values = _unalias(config)
+    if "post_hook" in model.__fields__:
+        values["post_hook"] = _hooks(values.get("post_hook"))
+        values["pre_hook"] = _hooks(values.get("pre_hook"))
+    return _construct(model, values)
+
+
+def _refs(refs):
+    if not refs:
+        return None
+    return [_construct(AltimateRefArgs, ref) for ref in refs if isinstance(ref, dict)]
+
+
+class RawManifestWrapper(BaseManifestWrapper):
+    """
+    Manifest wrapper that builds the Altimate schemas straight from the manifest JSON.
+
+    The manifest is neither validated by dbt_artifacts_parser nor by the Altimate models,
+    which makes it a lot cheaper to build on large projects. It expects a manifest produced
+    by a supported dbt version, see DBTFactory.get_manifest_wrapper.
+    """
+
+    def __init__(self, manifest: Dict):
+        super().__init__(manifest)
+
+    def _get_section(self, section: str) -> Iterable[Dict]:
+        return self.manifest[section].values()
+
+    def _get_resource_type(self, node: Dict) -> str:
+        return node["resource_type"]
+
+    def _get_package_name(self, node: Dict) -> str:
+        return node["package_name"]
+
+    def _get_node(self, node: Dict) -> AltimateManifestNode:
+        is_seed = node["resource_type"] == SEED
+        contract = node.get("contract") if not is_seed else None
+        return AltimateManifestNode.construct(
+            database=node.get("database"),
+            schema_name=node["schema"],
+            name=node["name"],
+            resource_type=AltimateResourceType(node["resource_type"]),
+            package_name=node["package_name"],
+            path=node["path"],
+            description=node.get("description", ""),
+            original_file_path=node["original_file_path"],
+            unique_id=node["unique_id"],
+            fqn=node["fqn"],
+            alias=node["alias"],
+            raw_code="" if is_seed else node.get("raw_code", ""),
+            language="" if is_seed else node.get("language"),
+            config=_config(AltimateNodeConfig, node.get("config")),
+            checksum=_file_hash(node.get("checksum")),
+            columns=_columns(node.get("columns")),
+            relation_name=node.get("relation_name"),
+            sources=[] if is_seed else node.get("sources", []),
+            metrics=[] if is_seed else node.get("metrics", []),
+            depends_on=AltimateDependsOn.construct(nodes=None, macros=None) if is_seed else _depends_on(node.get("depends_on")),
+            compiled_path=None if is_seed else node.get("compiled_path"),
+            compiled=None if is_seed else node.get("compiled", False),
+            compiled_code=None,
+            contract=_construct(AltimateDBTContract, contract) if contract else None,
+            meta=node.get("meta", {}),
+            patch_path=node.get("patch_path"),
+        )
+
+    def _get_source(self, source: Dict) -> AltimateManifestSourceNode:
+        external = source.get("external")
+        if external:
+            external = _construct(AltimateExternalTable, external)
+            if external.partitions:
+                external.partitions = [_construct(AltimateExternalPartition, partition) for partition in external.partitions]
+        return AltimateManifestSourceNode.construct(
+            database=source.get("database"),
+            resource_type=AltimateResourceType(source["resource_type"]),
+            schema_name=source["schema"],
+            name=source["name"],
+            package_name=source["package_name"],
+            path=source["path"],
+            original_file_path=source["original_file_path"],
+            unique_id=source["unique_id"],
+            fqn=source["fqn"],
+            source_name=source["source_name"],
+            source_description=source["source_description"],
+            loader=source["loader"],
+            identifier=source["identifier"],
+            quoting=_construct(AltimateQuoting, _unalias(source["quoting"])) if source.get("quoting") else None,
+            loaded_at_field=source.get("loaded_at_field"),
+            freshness=_construct(AltimateFreshnessThreshold, source["freshness"]) if source.get("freshness") else None,
+            external=external,
+            description=source.get("description", ""),
+            columns=_columns(source.get("columns")),
+            meta=source.get("meta", {}),
+            relation_name=source.get("relation_name"),
+            source_meta=source.get("source_meta", {}),
+            tags=source.get("tags", []),
+            config=_config(AltimateSourceConfig, source.get("config")),
+            patch_path=source.get("patch_path"),
+            unrendered_config=source.get("unrendered_config", {}),
+            created_at=source.get("created_at"),
+        )
+
+    def _get_macro(self, macro: Dict) -> AltimateManifestMacroNode:
+        depends_on = macro.get("depends_on")
+        supported_languages = macro.get("supported_languages")
+        return AltimateManifestMacroNode.construct(
+            name=macro["name"],
+            resource_type=AltimateResourceType(macro["resource_type"]),
+            package_name=macro["package_name"],
+            path=macro["path"],
+            original_file_path=macro["original_file_path"],
+            unique_id=macro["unique_id"],
+            macro_sql=macro["macro_sql"],
+            depends_on=AltimateDependsOn.construct(nodes=None, macros=depends_on.get("macros", [])) if depends_on else None,
+            description=macro.get("description", ""),
+            meta=macro.get("meta", {}),
+            docs=_construct(AltimateDocs, macro["docs"]) if macro.get("docs") else None,
+            patch_path=macro.get("patch_path"),
+            arguments=[_construct(AltimateMacroArgument, arg) for arg in macro["arguments"]] if macro.get("arguments") else None,
+            created_at=macro.get("created_at"),
+            supported_languages=(
+                [AltimateSupportedLanguage(language) for language in supported_languages] if supported_languages is not None else None
+            ),
+        )
+
+    def _get_exposure(self, exposure: Dict) -> AltimateManifestExposureNode:
+        depends_on = exposure.get("depends_on")
+        return AltimateManifestExposureNode.construct(
+            name=exposure["name"],
+            resource_type=AltimateResourceType(exposure["resource_type"]),
+            package_name=exposure["package_name"],
+            path=exposure["path"],
+            original_file_path=exposure["original_file_path"],
+            unique_id=exposure["unique_id"],
+            fqn=exposure["fqn"],
+            type=AltimateExposureType(exposure["type"]) if exposure.get("type") else None,
+            owner=_construct(AltimateOwner, exposure["owner"]) if exposure.get("owner") else None,
+            description=exposure.get("description", ""),
+            label=exposure.get("label"),
+            maturity=AltimateMaturityEnum(exposure["maturity"]) if exposure.get("maturity") else None,
+            meta=exposure.get("meta", {}),
+            tags=exposure.get("tags", []),
+            config=_config(AltimateSourceConfig, exposure.get("config")),
+            unrendered_config=exposure.get("unrendered_config", {}),
+            url=exposure.get("url"),
+            depends_on=_depends_on(depends_on) if depends_on else None,
+            refs=_refs(exposure.get("refs")),
+            sources=exposure.get("sources", []),
+            metrics=exposure.get("metrics", []),
+            created_at=exposure.get("created_at"),
+        )
+
+    def _get_test_type(self, test: Dict) -> str:
+        # Generic tests are the only test nodes that carry test_metadata
+        return GENERIC if "test_metadata" in test else SINGULAR
+
+    def _get_tests(self, test: Dict) -> AltimateManifestTestNode:
+        test_type = self._get_test_type(test)
+        test_metadata = test.get("test_metadata") if test_type == GENERIC else None
+        depends_on = test.get("depends_on")
+        return AltimateManifestTestNode.construct(
+            test_metadata=_construct(AltimateTestMetadata, test_metadata) if test_metadata else None,
+            test_type=test_type,
+            name=test["name"],
+            resource_type=AltimateResourceType(test["resource_type"]),
+            package_name=test["package_name"],
+            path=test["path"],
+            original_file_path=test["original_file_path"],
+            unique_id=test["unique_id"],
+            fqn=test["fqn"],
+            alias=test["alias"],
+            checksum=_file_hash(test["checksum"]) if test.get("checksum") else None,
+            config=_config(AltimateTestConfig, test.get("config")),
+            description=test.get("description", ""),
+            tags=test.get("tags", []),
+            columns=_columns(test["columns"]) if test.get("columns") else None,
+            meta=test.get("meta", {}),
+            group=test.get("group"),
+            raw_code=test.get("raw_code", ""),
+            language=test.get("language"),
+            refs=_refs(test.get("refs")),
+            sources=test.get("sources", []),
+            metrics=test.get("metrics", []),
+            depends_on=_depends_on(depends_on) if depends_on else None,
+            compiled_path=test.get("compiled_path"),
+            compiled=test.get("compiled", False),
+            compiled_code=test.get("compiled_code"),
+        )
+
+    def _get_seed(self, seed: Dict) -> AltimateSeedNode:
+        return AltimateSeedNode.construct(
+            database=seed.get("database"),
+            schema_name=seed["schema"],
+            name=seed["name"],
+            resource_type=AltimateResourceType(seed["resource_type"]),
+            package_name=seed["package_name"],
+            path=seed["path"],
+            original_file_path=seed["original_file_path"],
+            unique_id=seed["unique_id"],
+            fqn=seed["fqn"],
+            alias=seed["alias"],
+            checksum=_file_hash(seed["checksum"]) if seed.get("checksum") else None,
+            config=_config(AltimateSeedConfig, seed.get("config")),
+            description=seed.get("description", ""),
+            tags=seed.get("tags", []),
+            columns=_columns(seed["columns"]) if seed.get("columns") else None,
+            meta=seed.get("meta", {}),
+            group=seed.get("group"),
+            docs=seed.get("docs"),
+            patch_path=seed.get("patch_path"),
+            build_path=seed.get("build_path"),
+            deferred=seed.get("deferred", False),
+            unrendered_config=seed.get("unrendered_config", {}),
+            created_at=seed.get("created_at"),
+            config_call_dict=seed.get("config_call_dict"),
+        )
+
+    def get_package(self) -> str:
+        return self.manifest["metadata"].get("project_name")
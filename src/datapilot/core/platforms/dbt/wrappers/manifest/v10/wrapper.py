@@ -1,14 +1,8 @@
-from typing import Dict
-from typing import Set
-
-from dbt_artifacts_parser.parsers.manifest.manifest_v10 import GenericTestNode
 from dbt_artifacts_parser.parsers.manifest.manifest_v10 import ManifestV10
-from dbt_artifacts_parser.parsers.manifest.manifest_v10 import SingularTestNode
 
 from datapilot.core.platforms.dbt.constants import GENERIC
 from datapilot.core.platforms.dbt.constants import OTHER_TEST_NODE
 from datapilot.core.platforms.dbt.constants import SEED
-from datapilot.core.platforms.dbt.constants import SINGULAR
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateDBTContract
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateDependsOn
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateExposureType
@@ -45,7 +39,7 @@ from datapilot.core.platforms.dbt.wrappers.manifest.wrapper import BaseManifestW
 
 class ManifestV10Wrapper(BaseManifestWrapper):
     def __init__(self, manifest: ManifestV10):
-        self.manifest = manifest
+        super().__init__(manifest)
 
     def _get_node(self, node: ManifestNode) -> AltimateManifestNode:
         (
@@ -213,15 +207,17 @@ class ManifestV10Wrapper(BaseManifestWrapper):
             created_at=exposure.created_at,
         )
 
+    def _get_test_type(self, test: TestNode) -> str:
+        for test_type, node_types in TEST_TYPE_TO_NODE_MAP.items():
+            if isinstance(test, tuple(node_types)):
+                return test_type
+        return OTHER_TEST_NODE
+
     def _get_tests(self, test: TestNode) -> AltimateManifestTestNode:
+        test_type = self._get_test_type(test)
         test_metadata = None
-        if isinstance(test, GenericTestNode):
-            test_type = GENERIC
+        if test_type == GENERIC:
             test_metadata = AltimateTestMetadata(**test.test_metadata.dict()) if test.test_metadata else None
-        elif isinstance(test, SingularTestNode):
-            test_type = SINGULAR
-        else:
-            test_type = OTHER_TEST_NODE
         return AltimateManifestTestNode(
             test_metadata=test_metadata,
             test_type=test_type,
@@ -319,79 +315,5 @@ class ManifestV10Wrapper(BaseManifestWrapper):
             config_call_dict=seed.config_call_dict,
         )
 
-    def get_nodes(
-        self,
-    ) -> Dict[str, AltimateManifestNode]:
-        nodes = {}
-        for node in self.manifest.nodes.values():
-            if (
-                node.resource_type.value
-                in [
-                    AltimateResourceType.seed.value,
-                    AltimateResourceType.test.value,
-                ]
-                or node.package_name != self.get_package()
-            ):
-                continue
-            nodes[node.unique_id] = self._get_node(node)
-        return nodes
-
     def get_package(self) -> str:
         return self.manifest.metadata.project_name
-
-    def get_sources(self) -> Dict[str, AltimateManifestSourceNode]:
-        sources = {}
-        for source in self.manifest.sources.values():
-            sources[source.unique_id] = self._get_source(source)
-        return sources
-
-    def get_macros(self) -> Dict[str, AltimateManifestMacroNode]:
-        macros = {}
-        for macro in self.manifest.macros.values():
-            if macro.resource_type.value == AltimateResourceType.macro.value and macro.package_name == self.get_package():
-                macros[macro.unique_id] = self._get_macro(macro)
-        return macros
-
-    def get_exposures(self) -> Dict[str, AltimateManifestExposureNode]:
-        exposures = {}
-        for exposure in self.manifest.exposures.values():
-            exposures[exposure.unique_id] = self._get_exposure(exposure)
-        return exposures
-
-    def get_tests(self, type=None) -> Dict[str, AltimateManifestTestNode]:
-        tests = {}
-        # Initialize types_union with TestNode
-        types = [GenericTestNode, SingularTestNode]
-
-        # Add other types to the union if provided
-        if type:
-            types = TEST_TYPE_TO_NODE_MAP.get(type)
-
-        for node in self.manifest.nodes.values():
-            # Check if the node is a test and of the correct type
-            if node.resource_type.value == AltimateResourceType.test.value:
-                if any(isinstance(node, t) for t in types):
-                    tests[node.unique_id] = self._get_tests(node)
-        return tests
-
-    def get_seeds(self) -> Dict[str, AltimateSeedNode]:
-        seeds = {}
-        for seed in self.manifest.nodes.values():
-            if seed.resource_type.value == AltimateResourceType.seed.value:
-                seeds[seed.unique_id] = self._get_seed(seed)
-        return seeds
-
-    def parent_to_child_map(self, nodes: Dict[str, AltimateManifestNode]) -> Dict[str, Set[str]]:
-        """
-        Current manifest contains information about parents
-        THis gives an information of node to childre
-        :param nodes: A dictionary of nodes in a manifest.
-        :return: A dictionary of all the children of a node.
-        """
-        children_map = {}
-        for node_id, node in nodes.items():
-            if node_id not in children_map:
-                children_map[node_id] = set()
-            for parent in node.depends_on.nodes or []:
-                children_map.setdefault(parent, set()).add(node_id)
-        return children_map
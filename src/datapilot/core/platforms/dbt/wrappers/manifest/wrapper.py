@@ -1,35 +1,177 @@
 from abc import ABC
 from abc import abstractmethod
+from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import Optional
 from typing import Set
 
+from datapilot.core.platforms.dbt.constants import EXPOSURES
+from datapilot.core.platforms.dbt.constants import GENERIC
+from datapilot.core.platforms.dbt.constants import MACRO
+from datapilot.core.platforms.dbt.constants import MACROS
+from datapilot.core.platforms.dbt.constants import SEED
+from datapilot.core.platforms.dbt.constants import SINGULAR
+from datapilot.core.platforms.dbt.constants import TEST
+from datapilot.core.platforms.dbt.constants import TESTS
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestExposureNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestMacroNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestSourceNode
 from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateSeedNode
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+from datapilot.core.platforms.dbt.wrappers.manifest.projection import FULL_PROJECTION
+from datapilot.core.platforms.dbt.wrappers.manifest.projection import ManifestProjection
+from datapilot.utils.field_store import FieldStore
 
+# Below this number of nodes in the manifest, the heavy fields stay in the models. Moving them to
+# a FieldStore takes more time than the memory it saves is worth.
+OFFLOAD_MIN_NODES = 10_000
+
+
+class BaseManifestIndexWrapper(ABC):
+    """
+    Serves the entities of the manifest from a ManifestIndex.
+    """
+
+    @abstractmethod
+    def get_package(self) -> str:
+        pass
 
-class BaseManifestWrapper(ABC):
     @abstractmethod
+    def get_index(self, projection: ManifestProjection = FULL_PROJECTION) -> ManifestIndex:
+        """
+        The index of the manifest, with at least the entities and fields of the projection.
+        """
+
     def get_nodes(self) -> Dict[str, AltimateManifestNode]:
+        return self.get_index().nodes
+
+    def get_sources(self) -> Dict[str, AltimateManifestSourceNode]:
+        return self.get_index().sources
+
+    def get_macros(self) -> Dict[str, AltimateManifestMacroNode]:
+        return self.get_index().macros
+
+    def get_exposures(self) -> Dict[str, AltimateManifestExposureNode]:
+        return self.get_index().exposures
+
+    def get_seeds(self) -> Dict[str, AltimateSeedNode]:
+        return self.get_index().seeds
+
+    def get_tests(self, type=None) -> Dict[str, AltimateManifestTestNode]:
+        if type:
+            return self.get_index().tests_by_type.get(type, {})
+        return self.get_index().tests
+
+    def parent_to_child_map(self, nodes: Dict[str, AltimateManifestNode]) -> Dict[str, Set[str]]:
+        """
+        Current manifest contains information about parents
+        THis gives an information of node to childre
+        :param nodes: A dictionary of nodes in a manifest.
+        :return: A dictionary of all the children of a node.
+        """
+        if nodes is self.get_index().nodes:
+            return self.get_index().children_map
+        children_map = {}
+        for node_id, node in nodes.items():
+            if node_id not in children_map:
+                children_map[node_id] = set()
+            for parent in node.depends_on.nodes or []:
+                children_map.setdefault(parent, set()).add(node_id)
+        return children_map
+
+
+class BaseManifestWrapper(BaseManifestIndexWrapper):
+    """
+    Builds the ManifestIndex from a parsed or raw manifest. Subclasses convert the entities of
+    their version of the manifest.
+    """
+
+    def __init__(self, manifest: Any):
+        self.manifest = manifest
+        self._index: Optional[ManifestIndex] = None
+
+    @abstractmethod
+    def _get_node(self, node: Any) -> AltimateManifestNode:
         pass
 
     @abstractmethod
-    def get_package(self) -> str:
+    def _get_source(self, source: Any) -> AltimateManifestSourceNode:
         pass
 
     @abstractmethod
-    def get_sources(self) -> Dict[str, AltimateManifestSourceNode]:
+    def _get_macro(self, macro: Any) -> AltimateManifestMacroNode:
         pass
 
     @abstractmethod
-    def get_exposures(self) -> Dict[str, AltimateManifestExposureNode]:
+    def _get_exposure(self, exposure: Any) -> AltimateManifestExposureNode:
         pass
 
     @abstractmethod
-    def parent_to_child_map(self, nodes: Dict[str, AltimateManifestNode]) -> Dict[str, Set[str]]:
+    def _get_tests(self, test: Any) -> AltimateManifestTestNode:
         pass
 
     @abstractmethod
-    def get_tests(self, types=None) -> Dict[str, AltimateManifestTestNode]:
+    def _get_seed(self, seed: Any) -> AltimateSeedNode:
         pass
+
+    @abstractmethod
+    def _get_test_type(self, test: Any) -> str:
+        pass
+
+    def _get_section(self, section: str) -> Iterable[Any]:
+        return getattr(self.manifest, section).values()
+
+    def _get_resource_type(self, node: Any) -> str:
+        resource_type = node.resource_type
+        return getattr(resource_type, "value", resource_type)
+
+    def _get_package_name(self, node: Any) -> str:
+        return node.package_name
+
+    def get_index(self, projection: ManifestProjection = FULL_PROJECTION) -> ManifestIndex:
+        """
+        Build the ManifestIndex with a single pass over the manifest. The index is built
+        once and shared by all the getters of the wrapper. It is built again, with both
+        projections, when a later call needs entities or fields the first projection left out.
+
+        :param projection: Entity types and heavy fields to build.
+        """
+        if self._index is None:
+            self._index = self._build_index(projection)
+        elif not self._index.projection.covers(projection):
+            self._index = self._build_index(self._index.projection.union(projection))
+        return self._index
+
+    def _build_index(self, projection: ManifestProjection) -> ManifestIndex:
+        project_name = self.get_package()
+        nodes = self._get_section("nodes")
+        # On large projects, the heavy fields are kept out of memory until an insight reads them
+        store = FieldStore() if len(nodes) >= OFFLOAD_MIN_NODES else None
+        index = ManifestIndex(project_name, store, projection)
+
+        for node in nodes:
+            resource_type = self._get_resource_type(node)
+            if resource_type == TEST:
+                if projection.includes(TESTS) and self._get_test_type(node) in (GENERIC, SINGULAR):
+                    index.add_test(self._get_tests(node))
+            elif resource_type == SEED:
+                index.add_seed(self._get_seed(node))
+            elif self._get_package_name(node) == project_name:
+                index.add_node(self._get_node(node))
+
+        for source in self._get_section("sources"):
+            index.add_source(self._get_source(source))
+
+        if projection.includes(MACROS):
+            for macro in self._get_section("macros"):
+                if self._get_resource_type(macro) == MACRO and self._get_package_name(macro) == project_name:
+                    index.add_macro(self._get_macro(macro))
+
+        if projection.includes(EXPOSURES):
+            for exposure in self._get_section("exposures"):
+                index.add_exposure(self._get_exposure(exposure))
+
+        return index
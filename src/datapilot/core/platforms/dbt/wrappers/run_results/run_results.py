@@ -1,39 +1,87 @@
-from abc import ABC
-from abc import abstractmethod
+from datetime import datetime
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from typing import Union
 
-from dbt_artifacts_parser.parsers.run_results.run_results_v1 import RunResultsV1
-from dbt_artifacts_parser.parsers.run_results.run_results_v2 import RunResultsV2
-from dbt_artifacts_parser.parsers.run_results.run_results_v3 import RunResultsV3
-from dbt_artifacts_parser.parsers.run_results.run_results_v4 import RunResultsV4
-from dbt_artifacts_parser.parsers.run_results.run_results_v5 import RunResultsV5
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateRunResult
+from datapilot.core.platforms.dbt.schemas.manifest import RunResults
 
 
-class BaseRunResultsWrapper(ABC):
-    @abstractmethod
-    def get_run_results(self):
-        pass
+def _parse_timestamp(timestamp: Union[datetime, str, None]) -> Optional[datetime]:
+    # Parsed by the models of the older versions, ISO strings with a Z suffix in the newer ones
+    if timestamp is None or isinstance(timestamp, datetime):
+        return timestamp
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
 
 
-class RunResultsV1Wrapper(BaseRunResultsWrapper):
-    def __init__(self, run_results: RunResultsV1):
+def get_run_result(result) -> AltimateRunResult:
+    """
+    The AltimateRunResult of a result of run_results.json, of any version.
+    """
+    timing = {}
+    for timing_info in result.timing or []:
+        started_at = _parse_timestamp(timing_info.started_at)
+        completed_at = _parse_timestamp(timing_info.completed_at)
+        if started_at is not None and completed_at is not None:
+            timing[timing_info.name] = (completed_at - started_at).total_seconds()
+    status = result.status
+    return AltimateRunResult(
+        unique_id=result.unique_id,
+        status=getattr(status, "value", status),
+        execution_time=result.execution_time,
+        thread_id=result.thread_id,
+        timing=timing,
+    )
+
+
+class BaseRunResultsWrapper:
+    """
+    The results of a run_results.json. The results of every version are read the same way, see
+    get_run_result.
+    """
+
+    def __init__(self, run_results: RunResults):
         self.run_results = run_results
+        self._results: Optional[Dict[str, AltimateRunResult]] = None
+
+    def _get_results(self) -> Iterable[AltimateRunResult]:
+        """
+        The result of every node of the run.
+        """
+        return map(get_run_result, self.run_results.results)
+
+    def get_run_results(self) -> Dict[str, AltimateRunResult]:
+        """
+        The results of the run by unique id, built on first use and shared by all the insights.
+        """
+        if self._results is None:
+            self._results = {result.unique_id: result for result in self._get_results()}
+        return self._results
+
+
+class RunResultsV1Wrapper(BaseRunResultsWrapper):
+    pass
 
 
 class RunResultsV2Wrapper(BaseRunResultsWrapper):
-    def __init__(self, run_results: RunResultsV2):
-        self.run_results = run_results
+    pass
 
 
 class RunResultsV3Wrapper(BaseRunResultsWrapper):
-    def __init__(self, run_results: RunResultsV3):
-        self.run_results = run_results
+    pass
 
 
 class RunResultsV4Wrapper(BaseRunResultsWrapper):
-    def __init__(self, run_results: RunResultsV4):
-        self.run_results = run_results
+    pass
 
 
 class RunResultsV5Wrapper(BaseRunResultsWrapper):
-    def __init__(self, run_results: RunResultsV5):
-        self.run_results = run_results
+    pass
+
+
+class RunResultsV6Wrapper(BaseRunResultsWrapper):
+    pass
@@ -0,0 +1,201 @@
+import json
+from abc import ABC
+from abc import abstractmethod
+from typing import IO
+from typing import Any
+from typing import Callable
+from typing import ClassVar
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Type
+
+from datapilot import __version__
+from datapilot.core.insights.schema import Severity
+from datapilot.core.platforms.dbt.constants import MODEL
+from datapilot.core.platforms.dbt.insights.schema import DBTInsightResponse
+
+# Formats of the report of project-health
+TEXT = "text"
+JSON = "json"
+JSONL = "jsonl"
+SARIF = "sarif"
+REPORT_FORMATS = [TEXT, JSON, JSONL, SARIF]
+
+TOOL_NAME = "datapilot"
+TOOL_URI = "https://github.com/AltimateAI/datapilot-cli"
+
+SARIF_VERSION = "2.1.0"
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+SARIF_LEVELS = {
+    Severity.ERROR: "error",
+    Severity.WARNING: "warning",
+    Severity.INFO: "note",
+}
+
+
+def _get_dumps() -> Callable[[Any], bytes]:
+    try:
+        import orjson
+    except ImportError:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+        return lambda value: encoder.encode(value).encode()
+    return lambda value: orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Encodes a value to compact UTF-8 JSON, with orjson when it is installed
+dumps = _get_dumps()
+
+
+def get_findings(insight_class: Type, responses: List[DBTInsightResponse]) -> Iterator[Dict]:
+    """
+    A flat finding per result of an insight. Project insights have a finding per result they
+    hold, like the rows of the project table of the text report.
+    """
+    for response in responses:
+        results = [response.insight] if response.insight_level == MODEL else response.insights
+        for result in results:
+            yield {
+                "insight": insight_class.NAME,
+                "alias": insight_class.ALIAS,
+                "level": response.insight_level,
+                "severity": response.severity.value,
+                "package_name": response.package_name,
+                "unique_id": getattr(response, "unique_id", None),
+                "path": getattr(response, "original_file_path", None),
+                "name": result.name,
+                "type": result.type,
+                "message": result.message,
+                "recommendation": result.recommendation,
+                "reason_to_flag": result.reason_to_flag,
+                "metadata": result.metadata,
+            }
+
+
+class ReportWriter(ABC):
+    """
+    Writes the findings of a run to a binary stream as soon as every insight is done, so that
+    the report of a large project is never held in memory nor laid out as tables.
+
+    The writer is opened before the insights run, written the results of every insight and
+    closed after the last one.
+    """
+
+    FORMAT: ClassVar[str]
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+        self.count = 0
+
+    def open(self) -> None:  # noqa: B027
+        """
+        Write what comes before the first finding, nothing by default.
+        """
+
+    def write(self, insight_class: Type, responses: List[DBTInsightResponse]) -> None:
+        for finding in get_findings(insight_class, responses):
+            self.write_finding(finding)
+            self.count += 1
+
+    @abstractmethod
+    def write_finding(self, finding: Dict) -> None:
+        """
+        Write a single finding, see get_findings.
+        """
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class JSONLinesWriter(ReportWriter):
+    """
+    A finding per line.
+    """
+
+    FORMAT = JSONL
+
+    def write_finding(self, finding: Dict) -> None:
+        self.stream.write(dumps(finding) + b"\n")
+
+
+class JSONWriter(ReportWriter):
+    """
+    A single JSON document with the list of the findings and their count.
+    """
+
+    FORMAT = JSON
+
+    def open(self) -> None:
+        self.stream.write(b'{"tool":' + dumps({"name": TOOL_NAME, "version": __version__}) + b',"findings":[')
+
+    def write_finding(self, finding: Dict) -> None:
+        if self.count:
+            self.stream.write(b",")
+        self.stream.write(dumps(finding))
+
+    def close(self) -> None:
+        self.stream.write(b'],"count":' + dumps(self.count) + b"}\n")
+        super().close()
+
+
+class SARIFWriter(ReportWriter):
+    """
+    A SARIF 2.1.0 log with a run of DataPilot, that code scanning tools read. Every insight that
+    ran is a rule, and every finding a result of its rule. The results are written first and the
+    rules once all the insights ran, the order of the keys of a JSON object does not matter.
+    """
+
+    FORMAT = SARIF
+
+    def __init__(self, stream: IO[bytes]):
+        super().__init__(stream)
+        self.rules: Dict[str, Dict] = {}
+
+    def open(self) -> None:
+        self.stream.write(b'{"version":' + dumps(SARIF_VERSION) + b',"$schema":' + dumps(SARIF_SCHEMA) + b',"runs":[{"results":[')
+
+    def write(self, insight_class: Type, responses: List[DBTInsightResponse]) -> None:
+        if insight_class.ALIAS not in self.rules:
+            self.rules[insight_class.ALIAS] = {
+                "id": insight_class.ALIAS,
+                "name": insight_class.__name__,
+                "shortDescription": {"text": insight_class.NAME},
+                "fullDescription": {"text": insight_class.DESCRIPTION},
+                "properties": {"type": insight_class.TYPE},
+            }
+        super().write(insight_class, responses)
+
+    def write_finding(self, finding: Dict) -> None:
+        result = {
+            "ruleId": finding["alias"],
+            "level": SARIF_LEVELS.get(Severity(finding["severity"]), "none"),
+            "message": {"text": finding["message"]},
+            "properties": {
+                "package_name": finding["package_name"],
+                "recommendation": finding["recommendation"],
+                "reason_to_flag": finding["reason_to_flag"],
+                "metadata": finding["metadata"],
+            },
+        }
+        if finding["unique_id"]:
+            location = {"logicalLocations": [{"fullyQualifiedName": finding["unique_id"]}]}
+            if finding["path"]:
+                location["physicalLocation"] = {"artifactLocation": {"uri": finding["path"]}}
+            result["locations"] = [location]
+        if self.count:
+            self.stream.write(b",")
+        self.stream.write(dumps(result))
+
+    def close(self) -> None:
+        driver = {"name": TOOL_NAME, "version": __version__, "informationUri": TOOL_URI, "rules": list(self.rules.values())}
+        self.stream.write(b'],"tool":' + dumps({"driver": driver}) + b"}]}\n")
+        super().close()
+
+
+WRITERS: Dict[str, Type[ReportWriter]] = {writer.FORMAT: writer for writer in (JSONWriter, JSONLinesWriter, SARIFWriter)}
+
+
+def get_report_writer(report_format: str, stream: IO[bytes]) -> ReportWriter:
+    if report_format not in WRITERS:
+        raise ValueError(f"Unknown report format: {report_format}. Expected one of {', '.join(WRITERS)}")
+    return WRITERS[report_format](stream)
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -8,6 +10,7 @@ class ModelNode(BaseModel):
     database: str
     alias: str
     table_schema: str
+    checksum: Optional[str] = None
 
 
 class SourceNode(BaseModel):
@@ -17,3 +20,4 @@ class SourceNode(BaseModel):
     table: str = ""
     database: str
     table_schema: str
+    checksum: Optional[str] = None
@@ -0,0 +1,114 @@
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any
+from typing import Optional
+from typing import Union
+
+logger = logging.getLogger("datapilot.cache")
+
+DEFAULT_MAX_CACHE_SIZE = 512 * 1024 * 1024
+CACHE_FILE_SUFFIX = ".pickle"
+
+
+def default_cache_dir() -> Path:
+    """
+    Directory of the on-disk cache, $XDG_CACHE_HOME/datapilot or ~/.cache/datapilot.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "datapilot"
+
+
+def file_checksum(file_path: Union[str, Path], chunk_size: int = 1024 * 1024) -> str:
+    """
+    SHA-256 of the content of a file, read in chunks.
+
+    :param file_path: Path of the file.
+    :param chunk_size: Number of bytes read at once.
+    :return: The hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with Path(file_path).open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DiskCache:
+    """
+    Content-addressed cache of pickled python objects stored as one file per key.
+
+    Reading an entry refreshes its modification time. When the total size of the cache goes
+    above max_size, the least recently used entries are removed first.
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None, max_size: int = DEFAULT_MAX_CACHE_SIZE):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.max_size = max_size
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._path(key)
+        try:
+            with path.open("rb") as f:
+                value = pickle.load(f)  # noqa: S301
+        except FileNotFoundError:
+            return default
+        except Exception as e:
+            # Truncated or written by an incompatible version, drop it
+            logger.debug(f"Discarding unreadable cache entry {path}: {e}")
+            path.unlink(missing_ok=True)
+            return default
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so that concurrent readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            Path(tmp_path).replace(self._path(key))
+            tmp_path = None
+        # Unpicklable values raise any of these, depending on the value and the python version
+        except (OSError, pickle.PicklingError, RecursionError, TypeError, AttributeError) as e:
+            logger.debug(f"Unable to write cache entry {key}: {e}")
+            return
+        finally:
+            # Left behind when the entry could not be written
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits in max_size.
+        """
+        entries = []
+        for path in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,93 @@
+import mmap
+import pickle
+import tempfile
+import threading
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+# Position of a value in a store: its offset and its length in bytes
+StoreRef = Tuple[int, int]
+
+
+class FieldStore:
+    """
+    Values kept out of the memory of the process: pickled into an unnamed temporary file that is
+    memory-mapped to read them back. The operating system pages them in on access and can drop
+    them afterwards, they are not part of the python heap.
+
+    Models record the values they loaded with track, release drops them from the models again,
+    see AltimateLazyModel. Stores can be pickled, with their content, e.g. in the DiskCache.
+    """
+
+    def __init__(self):
+        self._file = tempfile.TemporaryFile()
+        self._size = 0
+        self._map = None
+        self._lock = threading.Lock()
+        self._loaded: List[Tuple[Any, str]] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def put(self, value: Any) -> StoreRef:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            offset = self._size
+            self._file.seek(offset)
+            self._file.write(data)
+            self._size += len(data)
+        return offset, len(data)
+
+    def get(self, ref: StoreRef) -> Any:
+        offset, length = ref
+        with self._lock:
+            if self._map is None or len(self._map) < offset + length:
+                # Values were added since the file was mapped
+                self._file.flush()
+                if self._map is not None:
+                    self._map.close()
+                self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+            data = self._map[offset : offset + length]
+        return pickle.loads(data)  # noqa: S301
+
+    def track(self, model: Any, name: str) -> None:
+        """
+        Record that a model loaded the value of one of its fields from the store.
+        """
+        self._loaded.append((model, name))
+
+    def release(self) -> None:
+        """
+        Drop the values loaded by the models since the last release. They are loaded again from
+        the store on their next access.
+        """
+        loaded, self._loaded = self._loaded, []
+        for model, name in loaded:
+            model.release_field(name)
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __del__(self):
+        # The temporary file is deleted once closed
+        if hasattr(self, "_file"):
+            self.close()
+
+    def _read(self) -> bytes:
+        with self._lock:
+            self._file.flush()
+            self._file.seek(0)
+            return self._file.read(self._size)
+
+    def __getstate__(self) -> Dict:
+        return {"data": self._read()}
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__init__()
+        self._file.write(state["data"])
+        self._size = len(state["data"])
@@ -0,0 +1,188 @@
+import json
+import logging
+import mmap
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+logger = logging.getLogger("datapilot.json_loader")
+
+AUTO = "auto"
+STDLIB = "stdlib"
+ORJSON = "orjson"
+UJSON = "ujson"
+SIMDJSON = "simdjson"
+
+# Order in which the "auto" backend picks an installed decoder.
+BACKEND_PREFERENCE = (ORJSON, SIMDJSON, UJSON, STDLIB)
+
+JSONLoads = Callable[[Union[bytes, memoryview]], Any]
+
+JSON_BACKENDS: Dict[str, JSONLoads] = {}
+
+
+def register_json_backend(name: str, loads: JSONLoads) -> None:
+    """
+    Register a JSON decoder that can be selected by name in load_json.
+
+    :param name: The name of the backend.
+    :param loads: A callable that decodes bytes (or a memoryview) into python objects.
+    """
+    JSON_BACKENDS[name] = loads
+
+
+def _stdlib_loads(data: Union[bytes, memoryview]) -> Any:
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def _register_installed_backends() -> None:
+    register_json_backend(STDLIB, _stdlib_loads)
+
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        register_json_backend(ORJSON, orjson.loads)
+
+    try:
+        import ujson
+    except ImportError:
+        pass
+    else:
+        register_json_backend(UJSON, lambda data: ujson.loads(data.tobytes() if isinstance(data, memoryview) else data))
+
+    try:
+        import simdjson
+    except ImportError:
+        pass
+    else:
+        register_json_backend(SIMDJSON, lambda data: simdjson.loads(data.tobytes() if isinstance(data, memoryview) else data))
+
+
+_register_installed_backends()
+
+
+def available_json_backends() -> Tuple[str, ...]:
+    return tuple(JSON_BACKENDS)
+
+
+def get_json_backend(name: Optional[str] = AUTO) -> Tuple[str, JSONLoads]:
+    """
+    Resolve a backend name to its decoder. "auto" picks the fastest installed decoder.
+
+    :param name: The name of the backend or "auto".
+    :return: A tuple of the resolved backend name and its decoder.
+    """
+    if not name or name == AUTO:
+        for candidate in BACKEND_PREFERENCE:
+            if candidate in JSON_BACKENDS:
+                return candidate, JSON_BACKENDS[candidate]
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"JSON backend {name} is not available. Available backends: {', '.join(JSON_BACKENDS)}")
+    return name, JSON_BACKENDS[name]
+
+
+@contextmanager
+def _read_file(file_path: str, use_mmap: bool) -> Iterator[Union[bytes, memoryview]]:
+    with Path(file_path).open("rb") as f:
+        if not use_mmap:
+            yield f.read()
+            return
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be memory-mapped
+            yield b""
+            return
+        view = memoryview(mapped)
+        try:
+            yield view
+        finally:
+            view.release()
+            mapped.close()
+
+
+def _stream_sections(file_path: str, sections: Iterable[str]) -> Dict:
+    """
+    Decode only the requested top-level keys of a JSON object. Every other top-level
+    key is kept with an empty dict as value so that the shape of the document is preserved.
+    """
+    import ijson
+
+    sections = set(sections)
+    result = {}
+    key, builder = None, None
+    with Path(file_path).open("rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "":
+                if builder is not None:
+                    result[key] = builder.value
+                    key, builder = None, None
+                if event == "map_key":
+                    if value in sections:
+                        key, builder = value, ijson.ObjectBuilder()
+                    else:
+                        result[value] = {}
+            elif builder is not None:
+                builder.event(event, value)
+    return result
+
+
+def _prune_sections(data: Dict, sections: Iterable[str]) -> Dict:
+    sections = set(sections)
+    return {key: (value if key in sections else {}) for key, value in data.items()}
+
+
+def load_json(
+    file_path: str,
+    backend: Optional[str] = AUTO,
+    use_mmap: bool = False,
+    sections: Optional[Iterable[str]] = None,
+) -> Dict:
+    """
+    Load a JSON file using a pluggable decoder.
+
+    :param file_path: Path of the JSON file.
+    :param backend: Name of the decoder to use, "auto" picks the fastest installed one.
+    :param use_mmap: Memory-map the file instead of reading it into a bytes object.
+    :param sections: Top-level keys to materialize. Other top-level keys are replaced by
+        empty dicts. The file is streamed with ijson when it is installed.
+    :return: The decoded JSON document.
+    """
+    path = Path(file_path)
+    if path.is_dir():
+        raise ValueError(f"Please provide a A valid manifest file path. {file_path} is a directory")
+    if not path.exists():
+        raise FileNotFoundError(f"No such file: {file_path}")
+
+    if sections is not None:
+        try:
+            import ijson
+        except ImportError:
+            logger.debug("ijson is not installed, decoding the full file before dropping unused sections")
+        else:
+            try:
+                return _stream_sections(file_path, sections)
+            except ijson.JSONError as e:
+                raise ValueError(f"Invalid JSON file: {file_path}") from e
+
+    _, loads = get_json_backend(backend)
+    with _read_file(file_path, use_mmap) as data:
+        try:
+            decoded = loads(data)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON file: {file_path}") from e
+
+    if sections is not None and isinstance(decoded, dict):
+        return _prune_sections(decoded, sections)
+    return decoded
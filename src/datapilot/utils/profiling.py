@@ -0,0 +1,223 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Union
+
+from datapilot.utils.formatting.utils import tabulate_data
+
+# Categories of the spans
+PHASE = "phase"
+INSIGHT = "insight"
+
+# Output formats of a profile
+TABLE = "table"
+JSON = "json"
+TRACE = "trace"
+PROFILE_FORMATS = [TABLE, JSON, TRACE]
+
+# Absolute peaks of the spans being measured in a thread, the innermost last
+_memory = threading.local()
+
+
+def _start_peak() -> Optional[int]:
+    if not tracemalloc.is_tracing() or not hasattr(tracemalloc, "reset_peak"):
+        # tracemalloc.reset_peak is only available from Python 3.9
+        return None
+    current, peak = tracemalloc.get_traced_memory()
+    peaks = _memory.__dict__.setdefault("peaks", [])
+    if peaks:
+        peaks[-1] = max(peaks[-1], peak)
+    tracemalloc.reset_peak()
+    peaks.append(current)
+    return current
+
+
+def _stop_peak(start: int) -> int:
+    peaks = _memory.peaks
+    peak = max(peaks.pop(), tracemalloc.get_traced_memory()[1])
+    # The peak of a nested span counts for the spans around it
+    if peaks:
+        peaks[-1] = max(peaks[-1], peak)
+    return peak - start
+
+
+@contextmanager
+def measure(name: str, category: str = PHASE) -> Iterator[Dict]:
+    """
+    Measure the block and yield its span: its name and category, its start and duration in
+    seconds on the perf_counter clock, the process and thread it ran in, and the peak memory
+    allocated above what was allocated at its start when tracemalloc is tracing. Values added
+    to the args of the span are reported with it.
+
+    The span is complete once the block exits, it is not recorded anywhere, see Profiler.phase.
+    """
+    span = {"name": name, "category": category, "pid": os.getpid(), "tid": threading.get_ident(), "args": {}}
+    memory_start = _start_peak()
+    span["start"] = time.perf_counter()
+    try:
+        yield span
+    finally:
+        span["duration"] = time.perf_counter() - span["start"]
+        span["peak_memory"] = None if memory_start is None else _stop_peak(memory_start)
+
+
+def make_span(name: str, category: str, start: float, duration: float, **args) -> Dict:
+    """
+    A span of a block that was not measured on its own, e.g. the share of an insight in a pass
+    shared by several insights. It has no peak memory.
+    """
+    return {
+        "name": name,
+        "category": category,
+        "pid": os.getpid(),
+        "tid": threading.get_ident(),
+        "args": args,
+        "start": start,
+        "duration": duration,
+        "peak_memory": None,
+    }
+
+
+class Profiler:
+    """
+    Spans of the phases of a run, from the loading of the artifacts to the formatting of the
+    report, and of every insight. With trace_memory, tracemalloc runs while the profiler is
+    started and every span has the peak memory allocated during it. Insights run in threads
+    share the peak of the process, so their peaks overlap.
+
+    The spans are reported as a table, as JSON, or as a Chrome trace, which chrome://tracing,
+    Perfetto and speedscope open. A disabled profiler records nothing, so the code it measures
+    does not need to check whether profiling was asked for.
+    """
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = False):
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self.spans: List[Dict] = []
+        self.origin = time.perf_counter()
+        self._started_tracing = False
+
+    def start(self) -> "Profiler":
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        return self
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @contextmanager
+    def phase(self, name: str, category: str = PHASE) -> Iterator[Dict]:
+        """
+        Measure the block and record its span.
+        """
+        if not self.enabled:
+            yield {"args": {}}
+            return
+        with measure(name, category) as span:
+            try:
+                yield span
+            finally:
+                self.spans.append(span)
+
+    def add(self, span: Dict) -> None:
+        """
+        Record a span measured elsewhere, e.g. in a worker process.
+        """
+        if self.enabled:
+            self.spans.append(span)
+
+    @property
+    def timings(self) -> Dict[str, float]:
+        """
+        Total duration of every phase in seconds, in the order the phases started.
+        """
+        timings: Dict[str, float] = {}
+        for span in self.spans:
+            if span["category"] == PHASE:
+                timings[span["name"]] = timings.get(span["name"], 0.0) + span["duration"]
+        return timings
+
+    def get_rows(self) -> List[Dict]:
+        """
+        A row per phase in the order they ran, then a row per insight, the slowest first.
+        """
+        phases = [span for span in self.spans if span["category"] == PHASE]
+        others = sorted((span for span in self.spans if span["category"] != PHASE), key=lambda span: -span["duration"])
+        rows = []
+        for span in phases + others:
+            peak_memory = span.get("peak_memory")
+            rows.append(
+                {
+                    "name": span["name"],
+                    "category": span["category"],
+                    "seconds": round(span["duration"], 3),
+                    "peak memory (MB)": "" if peak_memory is None else round(peak_memory / 2**20, 1),
+                    "findings": span["args"].get("findings", ""),
+                }
+            )
+        return rows
+
+    def to_table(self) -> str:
+        return tabulate_data(self.get_rows(), headers="keys")
+
+    def to_json(self) -> Dict:
+        return {
+            "total_seconds": time.perf_counter() - self.origin,
+            "spans": [{**span, "start": span["start"] - self.origin} for span in self.spans],
+        }
+
+    def to_chrome_trace(self) -> Dict:
+        """
+        Spans as complete events of the Chrome trace event format, in microseconds.
+        """
+        events = []
+        for span in self.spans:
+            args = dict(span["args"])
+            if span.get("peak_memory") is not None:
+                args["peak_memory"] = span["peak_memory"]
+            events.append(
+                {
+                    "name": span["name"],
+                    "cat": span["category"],
+                    "ph": "X",
+                    "ts": (span["start"] - self.origin) * 1e6,
+                    "dur": span["duration"] * 1e6,
+                    "pid": span["pid"],
+                    "tid": span["tid"],
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def format(self, profile_format: str) -> str:
+        if profile_format == TABLE:
+            return self.to_table()
+        if profile_format == JSON:
+            return json.dumps(self.to_json(), indent=2)
+        if profile_format == TRACE:
+            return json.dumps(self.to_chrome_trace())
+        raise ValueError(f"Unknown profile format: {profile_format}. Expected one of {', '.join(PROFILE_FORMATS)}")
+
+    def write(self, profile_format: str, path: Union[str, Path]) -> None:
+        Path(path).write_text(self.format(profile_format))
+
+
+# Default of the functions that take an optional profiler
+NO_PROFILER = Profiler(enabled=False)
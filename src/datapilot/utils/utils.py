@@ -1,4 +1,3 @@
-import json
 import os
 import re
 import subprocess
@@ -6,27 +5,29 @@ import tempfile
 import uuid
 from pathlib import Path
 from typing import Dict
+from typing import Iterable
 from typing import List
+from typing import Optional
 from typing import Union
 
-from dbt_artifacts_parser.parser import parse_catalog
-from dbt_artifacts_parser.parser import parse_manifest
-
 from datapilot.config.config import load_config
 from datapilot.schemas.nodes import ModelNode
 from datapilot.schemas.nodes import SourceNode
-
-
-def load_json(file_path: str) -> Dict:
-    try:
-        with Path(file_path).open() as f:
-            return json.load(f)
-    except FileNotFoundError:
-        raise
-    except json.decoder.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON file: {file_path}") from e
-    except IsADirectoryError as e:
-        raise ValueError(f"Please provide a A valid manifest file path. {file_path} is a directory") from e
+from datapilot.utils.cache import DiskCache
+from datapilot.utils.profiling import NO_PROFILER
+from datapilot.utils.profiling import Profiler
+
+# Paths read by dbt parse, as configured in dbt_project.yml, with their default values
+DBT_PROJECT_PATHS = {
+    "model-paths": ["models"],
+    "seed-paths": ["seeds"],
+    "snapshot-paths": ["snapshots"],
+    "macro-paths": ["macros"],
+    "analysis-paths": ["analyses"],
+    "test-paths": ["tests"],
+    "docs-paths": [],
+    "packages-install-path": "dbt_packages",
+}
 
 
 def extract_dir_name_from_file_path(path: str) -> str:
@@ -125,39 +126,52 @@ def get_column_type(dtype: str) -> str:
         return "TEXT"
 
 
-def get_manifest_model_nodes(manifest: Dict, models: List) -> List[ModelNode]:
-    nodes = []
-    for node in manifest["nodes"].values():
-        if node["name"] in models:
-            if node["resource_type"] == "model" and node["config"]["materialized"] in ["table", "view"]:
-                nodes.append(
+def get_manifest_model_nodes(nodes: Dict, models: List) -> List[ModelNode]:
+    """
+    Models of the manifest with one of the given names that are materialized as a table or a view.
+
+    :param nodes: The nodes of the manifest index, by unique id.
+    :param models: Names of the models.
+    """
+    model_nodes = []
+    for node in nodes.values():
+        if node.name in models:
+            if node.resource_type.value == "model" and node.config and node.config.materialized in ["table", "view"]:
+                model_nodes.append(
                     ModelNode(
-                        unique_id=node["unique_id"],
-                        name=node["name"],
-                        resource_type=node["resource_type"],
-                        database=node["database"],
-                        alias=node["alias"],
-                        table_schema=node["schema"],
+                        unique_id=node.unique_id,
+                        name=node.name,
+                        resource_type=node.resource_type.value,
+                        database=node.database,
+                        alias=node.alias,
+                        table_schema=node.schema_name,
+                        checksum=node.checksum.checksum if node.checksum else None,
                     )
                 )
-    return nodes
+    return model_nodes
+
 
+def get_manifest_source_nodes(sources: Dict, source_names: List) -> List[SourceNode]:
+    """
+    Sources of the manifest that belong to one of the given source names.
 
-def get_manifest_source_nodes(manifest: Dict, sources: List) -> List[SourceNode]:
-    nodes = []
-    for node in manifest["sources"].values():
-        if node["source_name"] in sources:
-            nodes.append(
+    :param sources: The sources of the manifest index, by unique id.
+    :param source_names: Names of the sources, as in the sources block of the yaml files.
+    """
+    source_nodes = []
+    for source in sources.values():
+        if source.source_name in source_names:
+            source_nodes.append(
                 SourceNode(
-                    unique_id=node["unique_id"],
-                    name=node["source_name"],
-                    resource_type=node["resource_type"],
-                    table=node["identifier"],
-                    database=node["database"],
-                    table_schema=node["schema"],
+                    unique_id=source.unique_id,
+                    name=source.source_name,
+                    resource_type=source.resource_type.value,
+                    table=source.identifier,
+                    database=source.database,
+                    table_schema=source.schema_name,
                 )
             )
-    return nodes
+    return source_nodes
 
 
 def get_model_tables(models: List[ModelNode]) -> List[str]:
@@ -180,11 +194,8 @@ def get_table_name(node: Union[ModelNode, SourceNode], node_type: str) -> str:
     return f"{node.database}.{node.table_schema}.{node.name}"
 
 
-def fill_catalog(table_columns_map: Dict, manifest: Dict, catalog: Dict, nodes: List[Union[ModelNode, SourceNode]], node_type: str) -> Dict:
-    if not nodes:
-        catalog[node_type] = {}
-        return catalog
-
+def fill_catalog(table_columns_map: Dict, catalog: Dict, nodes: List[Union[ModelNode, SourceNode]], node_type: str) -> Dict:
+    catalog[node_type] = {}
     for node in nodes:
         columns = {}
         for column in table_columns_map[node.unique_id]:
@@ -196,20 +207,18 @@ def fill_catalog(table_columns_map: Dict, manifest: Dict, catalog: Dict, nodes:
                 "comment": None,
             }
 
-        catalog[node_type] = {
-            node.unique_id: {
-                "metadata": {
-                    "type": "BASE TABLE",
-                    "schema": manifest[node_type][node.unique_id]["schema"],
-                    "name": node.alias if node_type == "nodes" else node.name,
-                    "database": manifest[node_type][node.unique_id]["database"],
-                    "comment": None,
-                    "owner": None,
-                },
-                "columns": columns,
-                "stats": {},
-                "unique_id": node.unique_id,
-            }
+        catalog[node_type][node.unique_id] = {
+            "metadata": {
+                "type": "BASE TABLE",
+                "schema": node.table_schema,
+                "name": node.alias if node_type == "nodes" else node.name,
+                "database": node.database,
+                "comment": None,
+                "owner": None,
+            },
+            "columns": columns,
+            "stats": {},
+            "unique_id": node.unique_id,
         }
 
     return catalog
@@ -221,92 +230,159 @@ def run_macro(macro: str, base_path: str) -> str:
         capture_output=True,
         cwd=base_path,
         text=True,
+        env=get_dbt_env(),
     )
     return dbt_compile.stdout
 
 
-def generate_partial_manifest_catalog(changed_files, base_path: str = "./"):
-    try:
-        # print(f"Running generate_partial_manifest_catalog for {changed_files}")
-        yaml_files = [
-            f for f in changed_files if Path(f).suffix in [".yml", ".yaml"] and Path(f).name not in ["dbt_project.yml", "profiles.yml"]
-        ]
-        model_stem = [Path(f).stem for f in changed_files if Path(f).suffix in [".sql"]]
-        # print(f"yaml_files: {yaml_files}")
-        # print(f"model_stem: {model_stem}")
-        model_set = set()
-        source_set = set()
-
-        for file in yaml_files:
-            parsed_file = load_config(file)
-            if "models" in parsed_file:
-                for model in parsed_file["models"]:
-                    model_set.add(model.get("name", ""))
-            if "sources" in parsed_file:
-                for source in parsed_file["sources"]:
-                    source_set.add(source.get("name", ""))
-
-        for model in model_stem:
-            model_set.add(model)
-
-        models = list(model_set)
-        source_list = list(source_set)
-
-        # print(f"models: {models}")
-        # print(f"sources: {source_list}")
-        subprocess.run(["dbt", "parse"], cwd=base_path, stdout=subprocess.PIPE)  # noqa
+def get_dbt_env() -> Dict[str, str]:
+    """
+    Environment of the dbt subprocesses. Partial parsing is turned on unless the user configured
+    it explicitly, so that dbt only re-parses the files that changed since its last parse.
+    """
+    env = dict(os.environ)
+    env.setdefault("DBT_PARTIAL_PARSE", "true")
+    return env
 
-        manifest_file = Path(Path(base_path) / "target/manifest.json")
-        with manifest_file.open() as f:
-            manifest = json.load(f)
 
-        nodes = get_manifest_model_nodes(manifest, models)
-        sources = get_manifest_source_nodes(manifest, source_list)
+def get_project_paths(base_path: str) -> List[Path]:
+    """
+    Files and directories that dbt reads when parsing the project in base_path.
+    """
+    base_path = Path(base_path)
+    project_file = base_path / "dbt_project.yml"
+    try:
+        project = load_config(project_file) or {}
+    except OSError:
+        project = {}
 
-        nodes_data = [{"name": node.name, "resource_type": node.resource_type, "unique_id": node.unique_id, "table": ""} for node in nodes]
+    paths = [project_file, base_path / "packages.yml", base_path / "dependencies.yml", base_path / "selectors.yml"]
+    for key, default in DBT_PROJECT_PATHS.items():
+        value = project.get(key, default)
+        for path in [value] if isinstance(value, str) else value:
+            paths.append(base_path / path)
+    return paths
 
-        sources_data = [
-            {"name": source.name, "resource_type": source.resource_type, "unique_id": source.unique_id, "table": source.table}
-            for source in sources
-        ]
 
-        nodes_str = ",\n".join(json.dumps(data) for data in nodes_data + sources_data)
+def get_latest_mtime(paths: Iterable[Path]) -> float:
+    """
+    Latest modification time of the given files and of everything below the given directories.
+    Directories count too, as removing or renaming a file only changes the mtime of its directory.
+    """
+    latest = 0.0
+    stack = list(paths)
+    while stack:
+        path = stack.pop()
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        latest = max(latest, stat.st_mtime)
+        if path.is_dir():
+            stack.extend(path.iterdir())
+    return latest
+
+
+def is_manifest_fresh(manifest_file: Path, changed_files: List[str], base_path: str = "./") -> bool:
+    """
+    Check if a manifest was generated after the last change to the dbt project, in which case it
+    can be used as is instead of running dbt parse again.
 
-        query = (
-            "{% set result = {} %}{% set nodes = ["
-            + nodes_str
-            + '] %}{% for n in nodes %}{% if n["resource_type"] == "source" %}{% set columns = adapter.get_columns_in_relation(source(n["name"], n["table"])) %}{% else %}{% set columns = adapter.get_columns_in_relation(ref(n["name"])) %}{% endif %}{% set new_columns = [] %}{% for column in columns %}{% do new_columns.append({"column": column.name, "dtype": column.dtype}) %}{% endfor %}{% do result.update({n["unique_id"]:new_columns}) %}{% endfor %}{{ tojson(result) }}'
-        )
+    :param manifest_file: Path of the manifest, usually target/manifest.json.
+    :param changed_files: Files changed in the commit. A missing file means it was deleted.
+    :param base_path: Base path of the dbt project.
+    """
+    try:
+        manifest_mtime = manifest_file.stat().st_mtime
+    except OSError:
+        return False
+    changed_paths = [Path(f) for f in changed_files]
+    if not all(path.exists() for path in changed_paths):
+        return False
+    return get_latest_mtime(changed_paths + get_project_paths(base_path)) <= manifest_mtime
 
-        dbt_compile_output = run_macro(query, base_path)
 
-        # print(dbt_compile_output)
+def generate_partial_manifest_catalog(
+    changed_files,
+    base_path: str = "./",
+    cache: Optional[DiskCache] = None,
+    reuse_manifest: bool = True,
+    profiler: Optional[Profiler] = None,
+    projection=None,
+):
+    """
+    Build the manifest and a catalog of the models and sources changed in a commit.
+
+    :param changed_files: Files changed in the commit.
+    :param base_path: Base path of the dbt project.
+    :param cache: Cache of the parsed manifest and of the columns of the relations, None disables it.
+    :param reuse_manifest: Use target/manifest.json without running dbt parse when it is newer than the project files.
+    :param profiler: Profiler of every phase, see Profiler.timings.
+    :param projection: Entity types and heavy fields of the manifest to build, see ManifestProjection. All of them by default.
+    :return: The unique ids of the changed models and sources, the manifest index and the catalog.
+    """
+    # Imported here as these modules depend on this one
+    from datapilot.core.platforms.dbt.introspection import DbtColumnIntrospector
+    from datapilot.core.platforms.dbt.utils import load_cached_manifest
+    from datapilot.core.platforms.dbt.utils import parse_catalog
+    from datapilot.core.platforms.dbt.wrappers.manifest.projection import FULL_PROJECTION
 
-        compiled_inline_node = dbt_compile_output.split("Compiled inline node is:")[1].strip().replace("'", "").strip()
+    profiler = profiler or NO_PROFILER
+    try:
+        with profiler.phase("find changed models"):
+            yaml_files = [
+                f for f in changed_files if Path(f).suffix in [".yml", ".yaml"] and Path(f).name not in ["dbt_project.yml", "profiles.yml"]
+            ]
+            model_stem = [Path(f).stem for f in changed_files if Path(f).suffix in [".sql"]]
+            model_set = set()
+            source_set = set()
+
+            for file in yaml_files:
+                parsed_file = load_config(file)
+                if "models" in parsed_file:
+                    for model in parsed_file["models"]:
+                        model_set.add(model.get("name", ""))
+                if "sources" in parsed_file:
+                    for source in parsed_file["sources"]:
+                        source_set.add(source.get("name", ""))
+
+            for model in model_stem:
+                model_set.add(model)
+
+            models = list(model_set)
+            source_list = list(source_set)
 
-        table_columns_map = json.loads(compiled_inline_node)
+        manifest_file = Path(Path(base_path) / "target/manifest.json")
+        with profiler.phase("check manifest"):
+            manifest_fresh = reuse_manifest and is_manifest_fresh(manifest_file, changed_files, base_path)
+        if not manifest_fresh:
+            with profiler.phase("dbt parse"):
+                subprocess.run(["dbt", "parse"], cwd=base_path, stdout=subprocess.PIPE, env=get_dbt_env())  # noqa
 
-        # we need to get all columns  from compiled_dict which is a list of dictionaries
-        # and each item in the list is a dictionary with keys table, name, type
-        # we need to create a map of all the columns for each table
-        # and then create a catalog for each table
+        with profiler.phase("load manifest"):
+            index = load_cached_manifest(str(manifest_file), cache=cache, profiler=profiler, projection=projection or FULL_PROJECTION)
 
-        catalog = {
-            "metadata": {
-                "dbt_schema_version": "https://schemas.getdbt.com/dbt/catalog/v1.json",
-                "dbt_version": "1.7.2",
-                "generated_at": "2024-03-04T11:13:52.284167Z",
-                "invocation_id": "e2970ef7-c397-404b-ac5d-63a71a45b628",
-                "env": {},
-            },
-            "errors": None,
-        }
+        with profiler.phase("column metadata"):
+            nodes = get_manifest_model_nodes(index.nodes, models)
+            sources = get_manifest_source_nodes(index.sources, source_list)
+            table_columns_map = DbtColumnIntrospector(base_path, cache=cache).get_columns(nodes + sources)
+
+            catalog = {
+                "metadata": {
+                    "dbt_schema_version": "https://schemas.getdbt.com/dbt/catalog/v1.json",
+                    "dbt_version": "1.7.2",
+                    "generated_at": "2024-03-04T11:13:52.284167Z",
+                    "invocation_id": "e2970ef7-c397-404b-ac5d-63a71a45b628",
+                    "env": {},
+                },
+                "errors": None,
+            }
 
-        catalog = fill_catalog(table_columns_map, manifest, catalog, nodes, "nodes")
-        catalog = fill_catalog(table_columns_map, manifest, catalog, sources, "sources")
+            catalog = fill_catalog(table_columns_map, catalog, nodes, "nodes")
+            catalog = fill_catalog(table_columns_map, catalog, sources, "sources")
 
         selected_models = [node.unique_id for node in nodes + sources]
-        return selected_models, parse_manifest(manifest), parse_catalog(catalog)
+        return selected_models, index, parse_catalog(catalog)
     except Exception as e:
         raise Exception("Unable to generate partial manifest and catalog") from e
 
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache_dir(tmp_path, monkeypatch):
+    # Keep the on-disk cache of the CLI out of the home directory of whoever runs the tests
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
@@ -1,7 +1,13 @@
 # test_app.py
+import json
+
+import pytest
 from click.testing import CliRunner
 
+from datapilot.core.platforms.dbt import executor
 from datapilot.core.platforms.dbt.cli.cli import project_health
+from datapilot.core.platforms.dbt.insights.modelling.model_fanout import DBTModelFanout
+from datapilot.core.platforms.dbt.insights.modelling.root_model import DBTRootModel
 
 
 def test_project_health_with_required_and_optional_args():
@@ -101,3 +107,122 @@ def test_project_health_with_required_and_optional_args_v12():
     # Add more assertions here to validate the behavior of your command,
     # for example, checking that the output contains expected text.
     assert "-----------" in result.output
+
+
+def test_project_health_skip_validation():
+    runner = CliRunner()
+    manifest_path = "tests/data/manifest_v12.json"
+    catalog_path = "tests/data/catalog_v12.json"
+    config_path = "tests/data/config.yml"
+
+    args = ["--manifest-path", manifest_path, "--catalog-path", catalog_path, "--config-path", config_path]
+    validated = runner.invoke(project_health, args)
+    result = runner.invoke(project_health, [*args, "--skip-validation"])
+
+    assert result.exit_code == 0
+    assert result.output == validated.output
+
+
+@pytest.mark.parametrize("fork", [True, False])
+def test_project_health_jobs(monkeypatch, fork):
+    if not fork:
+        # Fall back to the thread pool, as on platforms without fork
+        monkeypatch.setattr(executor.multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    runner = CliRunner()
+    args = ["--manifest-path", "tests/data/manifest_v12.json", "--catalog-path", "tests/data/catalog_v12.json"]
+    sequential = runner.invoke(project_health, args)
+    result = runner.invoke(project_health, [*args, "--jobs", "4"])
+
+    assert result.exit_code == 0
+    assert result.output == sequential.output
+
+
+def test_project_health_cache(tmp_path):
+    runner = CliRunner()
+    args = ["--manifest-path", "tests/data/manifest_v11.json", "--catalog-path", "tests/data/catalog_v1.json"]
+    uncached = runner.invoke(project_health, [*args, "--no-cache", "--cache-dir", str(tmp_path)])
+    assert not list(tmp_path.iterdir())
+
+    cold = runner.invoke(project_health, [*args, "--cache-dir", str(tmp_path)])
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+    warm = runner.invoke(project_health, [*args, "--cache-dir", str(tmp_path)])
+
+    assert warm.exit_code == 0
+    assert cold.output == warm.output == uncached.output
+
+
+def test_project_health_incremental(tmp_path):
+    runner = CliRunner()
+    args = ["--manifest-path", "tests/data/manifest_v11.json", "--cache-dir", str(tmp_path)]
+    full = runner.invoke(project_health, args)
+    first = runner.invoke(project_health, [*args, "--incremental"])
+    second = runner.invoke(project_health, [*args, "--incremental"])
+
+    assert second.exit_code == 0
+    assert full.output == first.output == second.output
+
+    result = runner.invoke(project_health, [*args, "--incremental", "--no-cache"])
+    assert result.exit_code != 0
+
+
+def test_project_health_run_results():
+    runner = CliRunner()
+    args = ["--manifest-path", "tests/data/manifest_v12.json", "--run-results-path", "tests/data/run_results_v6.json"]
+    result = runner.invoke(project_health, [*args, "--baseline-run-results-path", "tests/data/run_results_v5.json"])
+
+    assert result.exit_code == 0
+    assert "Slowest models" in result.output
+    assert "Model run time regression" in result.output
+    assert "Model run time dwarfs its children" in result.output
+
+    result = runner.invoke(project_health, ["--manifest-path", "tests/data/manifest_v12.json", "--baseline-run-results-path", "x.json"])
+    assert result.exit_code != 0
+
+
+@pytest.mark.parametrize("jobs", ["1", "4"])
+def test_project_health_profile(tmp_path, jobs):
+    runner = CliRunner()
+    args = ["--manifest-path", "tests/data/manifest_v11.json", "--no-cache", "--jobs", jobs]
+    profile_path = tmp_path / "profile.json"
+    result = runner.invoke(project_health, [*args, "--profile", "json", "--profile-output", str(profile_path), "--profile-memory"])
+
+    assert result.exit_code == 0
+    assert result.output == runner.invoke(project_health, args).output
+    spans = json.loads(profile_path.read_text())["spans"]
+    phases = [span["name"] for span in spans if span["category"] == "phase"]
+    assert phases[:3] == ["decode manifest json", "parse manifest", "index manifest"]
+    assert phases[-1] == "format report"
+    insights = [span for span in spans if span["category"] == "insight"]
+    assert {span["name"] for span in insights} >= {DBTModelFanout.NAME, DBTRootModel.NAME}
+    assert all(span["duration"] >= 0 and span["peak_memory"] >= 0 and "findings" in span["args"] for span in insights)
+
+    result = runner.invoke(project_health, [*args, "--profile", "trace", "--profile-output", str(profile_path)])
+    events = json.loads(profile_path.read_text())["traceEvents"]
+    assert len(events) == len(spans)
+    assert all(event["ph"] == "X" for event in events)
+
+
+@pytest.mark.parametrize("jobs", ["1", "4"])
+def test_project_health_format(tmp_path, jobs):
+    runner = CliRunner()
+    args = ["--manifest-path", "tests/data/manifest_v11.json", "--catalog-path", "tests/data/catalog_v1.json", "--no-cache", "--jobs", jobs]
+    text = runner.invoke(project_health, args).output
+
+    result = runner.invoke(project_health, [*args, "--format", "json", "--output", str(tmp_path / "report.json")])
+    assert result.exit_code == 0
+    assert result.output == ""
+    report = json.loads((tmp_path / "report.json").read_text())
+    assert report["count"] == len(report["findings"]) > 0
+    model_ids = {finding["unique_id"] for finding in report["findings"] if finding["level"] == "model"}
+    assert model_ids == {line[len("Model: ") :] for line in text.splitlines() if line.startswith("Model: ")}
+
+    result = runner.invoke(project_health, [*args, "--format", "jsonl"])
+    assert [json.loads(line) for line in result.output.splitlines()] == report["findings"]
+
+    result = runner.invoke(project_health, [*args, "--format", "sarif"])
+    sarif = json.loads(result.output)
+    assert sarif["version"] == "2.1.0"
+    results = sarif["runs"][0]["results"]
+    assert [result["ruleId"] for result in results] == [finding["alias"] for finding in report["findings"]]
+    rules = {rule["id"] for rule in sarif["runs"][0]["tool"]["driver"]["rules"]}
+    assert {result["ruleId"] for result in results} <= rules
@@ -0,0 +1,48 @@
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.insights.checks.check_model_parents_and_childs import CheckModelParentsAndChilds
+from datapilot.core.platforms.dbt.utils import load_raw_manifest
+from datapilot.utils.cache import DiskCache
+
+
+def _report(generator):
+    report = generator.run()
+    return {unique_id: sorted(insight.json() for insight in insights) for unique_id, insights in report["model"].items()}
+
+
+def test_incremental_run_matches_full_run(tmp_path):
+    cache = DiskCache(tmp_path)
+    manifest = load_raw_manifest("tests/data/manifest_v11.json")
+    DBTInsightGenerator(manifest=manifest, incremental_cache=cache).run()
+
+    model_id = next(unique_id for unique_id, node in manifest["nodes"].items() if node["depends_on"]["nodes"])
+    manifest["nodes"][model_id]["description"] = ""
+    manifest["nodes"][model_id]["depends_on"]["nodes"] = []
+    generator = DBTInsightGenerator(manifest=manifest, incremental_cache=cache)
+
+    assert model_id in generator.incremental_run.dirty
+    assert len(generator.incremental_run.dirty) < len(generator.incremental_run.fingerprints)
+    assert _report(generator) == _report(DBTInsightGenerator(manifest=manifest))
+
+
+def _results(generator):
+    results = []
+    generator.run(on_results=lambda insight_class, insights: results.append((insight_class.NAME, [insight.json() for insight in insights])))
+    return results
+
+
+def test_incremental_run_matches_full_run_order(tmp_path):
+    cache = DiskCache(tmp_path)
+    manifest = load_raw_manifest("tests/data/manifest_v12.json")
+    # Enables the checks that are skipped without their configuration
+    config = {"insights": {"check_model_parents_and_childs": {"max_parents": 1, "max_children": 1}}}
+    full_results = _results(DBTInsightGenerator(manifest=manifest, config=config))
+    assert dict(full_results)[CheckModelParentsAndChilds.NAME]
+
+    assert _results(DBTInsightGenerator(manifest=manifest, config=config, incremental_cache=cache)) == full_results
+    assert _results(DBTInsightGenerator(manifest=manifest, config=config, incremental_cache=cache)) == full_results
+
+    manifest["nodes"]["model.jaffle_shop.stg_orders"]["description"] = "Orders, one row per order."
+    generator = DBTInsightGenerator(manifest=manifest, config=config, incremental_cache=cache)
+    assert "model.jaffle_shop.stg_orders" in generator.incremental_run.dirty
+    assert len(generator.incremental_run.dirty) < len(generator.incremental_run.fingerprints)
+    assert _results(generator) == _results(DBTInsightGenerator(manifest=manifest, config=config))
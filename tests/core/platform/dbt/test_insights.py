@@ -0,0 +1,160 @@
+import pytest
+
+from datapilot.core.platforms.dbt.constants import GENERIC
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.insights.checks.check_model_has_tests_by_name import CheckModelHasTestsByName
+from datapilot.core.platforms.dbt.insights.checks.check_model_parents_and_childs import CheckModelParentsAndChilds
+from datapilot.core.platforms.dbt.insights.checks.check_model_tags import CheckModelTags
+from datapilot.core.platforms.dbt.insights.checks.check_source_has_loader import CheckSourceHasLoader
+from datapilot.core.platforms.dbt.insights.modelling.joining_of_upstream_concepts import DBTRejoiningOfUpstreamConcepts
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDependsOn
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestTestNode
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateResourceType
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_raw_manifest
+from datapilot.core.platforms.dbt.utils import load_run_results
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+from datapilot.utils.profiling import Profiler
+
+
+def _index(parents):
+    index = ManifestIndex("test")
+    for unique_id, node_parents in parents.items():
+        index.add_node(
+            AltimateManifestNode.construct(
+                unique_id=unique_id,
+                name=unique_id,
+                resource_type=AltimateResourceType.model,
+                package_name="test",
+                path=f"{unique_id}.sql",
+                original_file_path=f"models/{unique_id}.sql",
+                depends_on=AltimateDependsOn.construct(nodes=node_parents),
+            )
+        )
+    return index
+
+
+def _insight(insight_class, index, **kwargs):
+    return insight_class(
+        manifest_wrapper=None,
+        nodes=index.nodes,
+        sources=index.sources,
+        exposures=index.exposures,
+        tests=index.tests,
+        seeds=index.seeds,
+        macros=index.macros,
+        children_map=index.children_map,
+        project_name=index.project_name,
+        **kwargs,
+    )
+
+
+def test_rejoining_of_upstream_concepts():
+    # hub has more children than SET_THRESHOLD, a and b rejoin it in c, d has two children
+    parents = {"hub": []}
+    parents.update({f"leaf_{i}": ["hub"] for i in range(DBTRejoiningOfUpstreamConcepts.SET_THRESHOLD)})
+    parents.update({"a": ["hub"], "b": ["hub", "small"], "c": ["hub", "a", "b"], "d": ["hub"], "e": ["d"], "f": ["d", "hub"]})
+    parents.update({"small": [], "g": ["small"], "h": ["small", "g"]})
+
+    insights = _insight(DBTRejoiningOfUpstreamConcepts, _index(parents)).generate()
+
+    assert sorted((insight.unique_id, insight.insight.metadata["model"]) for insight in insights) == [
+        ("a", "hub"),
+        ("b", "hub"),
+        ("g", "small"),
+    ]
+    assert all(insight.insight.metadata["rejoin_targets"] == insight.insight.metadata["children"] for insight in insights)
+    assert all("downstream child: `c`" in insight.insight.message for insight in insights if insight.unique_id in ("a", "b"))
+
+
+def test_model_has_tests_by_name():
+    index = _index({"a": [], "b": ["a"]})
+    for model in ("a", "a", "b"):
+        unique_id = f"test.test.unique_{model}.{len(index.tests)}"
+        index.add_test(
+            AltimateManifestTestNode.construct(
+                unique_id=unique_id,
+                name=f"unique_{model}",
+                resource_type=AltimateResourceType.test,
+                package_name="test",
+                test_type=GENERIC,
+                path=f"{unique_id}.sql",
+                original_file_path=f"tests/{unique_id}.sql",
+                depends_on=AltimateDependsOn.construct(nodes=[model]),
+            )
+        )
+
+    def failures(min_count):
+        config = {"insights": {CheckModelHasTestsByName.ALIAS: {"tests": [{"test": "unique_a", "min_count": min_count}]}}}
+        return [insight.unique_id for insight in _insight(CheckModelHasTestsByName, index, config=config).generate()]
+
+    assert failures(2) == ["b"]
+    assert failures(3) == ["a", "b"]
+
+
+def test_model_parents_and_childs_selection():
+    index = _index({"a": [], "b": ["a"], "c": ["a", "b"]})
+    config = {"insights": {CheckModelParentsAndChilds.ALIAS: {"max_parents": 1, "max_children": 1}}}
+
+    def failures(**kwargs):
+        return [insight.unique_id for insight in _insight(CheckModelParentsAndChilds, index, config=config, **kwargs).generate()]
+
+    # a has no parent and two children, c has two parents
+    assert failures() == ["a", "c"]
+    assert failures(selected_models=frozenset(["b", "c"])) == ["c"]
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_fused_checks_match_per_insight(jobs):
+    manifest = load_raw_manifest("tests/data/manifest_v11.json")
+    catalog = load_catalog("tests/data/catalog_v1.json")
+    config = {
+        "insights": {
+            CheckModelTags.ALIAS: {"tag_list": ["a"]},
+            "check_model_has_labels_keys": {"labels_keys": ["owner"]},
+            "check_source_has_freshness": {"freshness": ["warn_after"]},
+        }
+    }
+
+    def report(generator):
+        reports = generator.run()
+        return sorted(insight.json() for insights in [reports["project"], *reports["model"].values()] for insight in insights)
+
+    profiler = Profiler()
+    fused = DBTInsightGenerator(manifest=manifest, catalog=catalog, config=config, jobs=jobs, profiler=profiler)
+    per_insight = DBTInsightGenerator(manifest=manifest, catalog=catalog, config=config, jobs=jobs, fuse_checks=False)
+    assert report(fused) == report(per_insight)
+
+    assert "Node checks" in profiler.timings
+    spans = {span["name"]: span for span in profiler.spans if span["category"] == "insight"}
+    assert spans[CheckModelTags.NAME]["args"]["fused"]
+    assert spans[CheckSourceHasLoader.NAME]["args"]["findings"] > 0
+
+
+def test_run_results_insights():
+    manifest = load_raw_manifest("tests/data/manifest_v12.json")
+    run_results = load_run_results("tests/data/run_results_v6.json")
+    baseline_run_results = load_run_results("tests/data/run_results_v5.json")
+    config = {"insights": {"slowest_models": {"top_n": 3, "min_run_time": 60}}}
+
+    def findings(generator):
+        reports = generator.run()
+        found = {}
+        for unique_id, insights in reports["model"].items():
+            for insight in insights:
+                if insight.insight.type == "Performance":
+                    found.setdefault(insight.insight.name, []).append(unique_id)
+        return found
+
+    found = findings(
+        DBTInsightGenerator(manifest=manifest, run_results=run_results, baseline_run_results=baseline_run_results, config=config)
+    )
+    # The model that failed is not among the slowest, whatever its execution time
+    assert sorted(found["Slowest models"]) == ["model.jaffle_shop.customers", "model.jaffle_shop.orders", "model.jaffle_shop.stg_orders"]
+    assert found["Model run time regression"] == ["model.jaffle_shop.stg_orders"]
+    assert found["Model run time dwarfs its children"] == ["model.jaffle_shop.customers"]
+
+    # Without a baseline there is nothing to compare with, and without run results nothing to rank
+    assert "Model run time regression" not in findings(DBTInsightGenerator(manifest=manifest, run_results=run_results, config=config))
+    assert not findings(DBTInsightGenerator(manifest=manifest, config=config))
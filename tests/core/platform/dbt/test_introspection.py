@@ -0,0 +1,115 @@
+import json
+import sqlite3
+import subprocess
+
+from datapilot.core.platforms.dbt import introspection
+from datapilot.core.platforms.dbt.introspection import ColumnIntrospector
+from datapilot.core.platforms.dbt.introspection import DbtColumnIntrospector
+from datapilot.schemas.nodes import ModelNode
+from datapilot.schemas.nodes import SourceNode
+from datapilot.utils.cache import DiskCache
+
+
+class SQLiteColumnIntrospector(ColumnIntrospector):
+    """
+    Stand-in for a warehouse, with one attached sqlite database per schema.
+    """
+
+    def __init__(self, connection, **kwargs):
+        super().__init__(**kwargs)
+        self.connection = connection
+        self.queries = []
+
+    def fetch_columns(self, batches):
+        columns = {}
+        for (database, schema), tables in batches.items():
+            self.queries.append(schema)
+            rows = self.connection.execute(
+                f"select lower(m.name), p.name, p.type from {schema}.sqlite_master m join pragma_table_info(m.name, '{schema}') p "  # noqa: S608
+                f"where lower(m.name) in ({', '.join('?' for _ in tables)}) order by 1, p.cid",
+                tables,
+            )
+            for table, column, dtype in rows:
+                columns.setdefault((database, schema, table), []).append({"column": column, "dtype": dtype})
+        return columns
+
+
+def test_columns_are_batched_per_schema_and_cached(tmp_path):
+    connection = sqlite3.connect(":memory:")
+    connection.execute("attach ':memory:' as staging")
+    connection.execute("create table main.customers (customer_id integer, name text)")
+    connection.execute("create table main.orders (order_id integer)")
+    connection.execute("create table staging.raw_customers (id integer)")
+    nodes = [
+        ModelNode(
+            unique_id="model.customers",
+            name="customers",
+            resource_type="model",
+            database="db",
+            alias="Customers",
+            table_schema="main",
+            checksum="1",
+        ),
+        ModelNode(
+            unique_id="model.orders", name="orders", resource_type="model", database="db", alias="orders", table_schema="main", checksum="2"
+        ),
+        ModelNode(unique_id="model.missing", name="missing", resource_type="model", database="db", alias="missing", table_schema="main"),
+        SourceNode(
+            unique_id="source.raw.customers",
+            name="raw",
+            resource_type="source",
+            table="raw_customers",
+            database="db",
+            table_schema="staging",
+        ),
+    ]
+    cache = DiskCache(tmp_path)
+
+    introspector = SQLiteColumnIntrospector(connection, cache=cache)
+    columns = introspector.get_columns(nodes)
+    assert sorted(introspector.queries) == ["main", "staging"]
+    assert columns["model.customers"] == [{"column": "customer_id", "dtype": "INTEGER"}, {"column": "name", "dtype": "TEXT"}]
+    assert columns["source.raw.customers"] == [{"column": "id", "dtype": "INTEGER"}]
+    assert columns["model.missing"] == []
+
+    introspector = SQLiteColumnIntrospector(connection, cache=cache)
+    nodes[1] = nodes[1].copy(update={"checksum": "3"})
+    assert introspector.get_columns(nodes) == columns
+    # Only the schemas of the changed model and of the missing relation are queried again
+    assert introspector.queries == ["main"]
+
+
+def test_dbt_introspector_reads_compiled_node_from_json_logs(monkeypatch):
+    logs = [
+        {"info": {"name": "MainReportVersion", "level": "info", "msg": "Running with dbt=1.7.4"}},
+        {"info": {"name": "CompiledNode", "level": "info"}, "data": {"compiled": json.dumps([[0, "customers", "customer_id", "integer"]])}},
+    ]
+    calls = []
+
+    def run(args, **kwargs):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout="\n".join(json.dumps(log) for log in logs), stderr="")
+
+    monkeypatch.setattr(introspection.subprocess, "run", run)
+    batches = {("db", "main"): ["customers", "orders"], ("db", "staging"): ["raw_customers"]}
+    columns = DbtColumnIntrospector("./").fetch_columns(batches)
+
+    assert len(calls) == 1
+    assert columns == {("db", "main", "customers"): [{"column": "customer_id", "dtype": "integer"}]}
+
+
+def test_dbt_introspector_falls_back_to_columns_in_relation(monkeypatch):
+    error = {"info": {"name": "GenericExceptionOnRun", "level": "error", "msg": "Table or view not found: information_schema.columns"}}
+    compiled = {"info": {"name": "CompiledNode", "level": "info"}, "data": {"compiled": json.dumps([[0, "customers", "id", "int"]])}}
+    calls = []
+
+    def run(args, **kwargs):
+        calls.append(args[-1])
+        log = error if len(calls) == 1 else compiled
+        return subprocess.CompletedProcess(args, 0, stdout=json.dumps(log), stderr="")
+
+    monkeypatch.setattr(introspection.subprocess, "run", run)
+    columns = DbtColumnIntrospector("./").fetch_columns({(None, "main"): ["customers"]})
+
+    assert ["{% set per_relation = true %}" in sql for sql in calls] == [False, True]
+    assert columns == {(None, "main", "customers"): [{"column": "id", "dtype": "int"}]}
@@ -1,3 +1,4 @@
+import json
 from pathlib import Path
 
 import pytest
@@ -7,11 +8,18 @@ from datapilot.core.platforms.dbt.constants import INTERMEDIATE
 from datapilot.core.platforms.dbt.constants import MART
 from datapilot.core.platforms.dbt.constants import OTHER
 from datapilot.core.platforms.dbt.constants import STAGING
+from datapilot.core.platforms.dbt.exceptions import AltimateInvalidManifestError
 from datapilot.core.platforms.dbt.utils import MODEL_TYPE_PATTERNS
 from datapilot.core.platforms.dbt.utils import _check_model_naming_convention
 from datapilot.core.platforms.dbt.utils import classify_model_type_by_folder
 from datapilot.core.platforms.dbt.utils import classify_model_type_by_name
 from datapilot.core.platforms.dbt.utils import get_hard_coded_references
+from datapilot.core.platforms.dbt.utils import get_longest_path_lengths
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.core.platforms.dbt.utils import load_raw_manifest
+from datapilot.core.platforms.dbt.utils import load_run_results
+from datapilot.core.platforms.dbt.utils import read_dbt_schema_version
+from datapilot.exceptions.exceptions import AltimateNotSupportedError
 
 
 @pytest.mark.parametrize(
@@ -51,6 +59,14 @@ def test_get_hard_coded_references(sql_code, expected):
     assert get_hard_coded_references(sql_code) == expected
 
 
+def test_get_hard_coded_references_golden_corpus():
+    # References found by the previous implementation, one re.findall per pattern
+    with Path("tests/data/hard_coded_references.json").open() as f:
+        corpus = json.load(f)
+    for case in corpus:
+        assert get_hard_coded_references(case["sql"]) == set(case["references"]), case["sql"]
+
+
 # Define the test cases
 # Each test case includes: model_path, model_folder_pattern (optional), expected_output
 
@@ -137,3 +153,48 @@ def test_classify_model_type_by_name(model_name, model_name_pattern, expected):
 def test_check_model_naming_convention(model_name, expected_model_type, patterns, expected):
     result = _check_model_naming_convention(model_name, expected_model_type, patterns)
     assert result == expected
+
+
+def test_get_longest_path_lengths():
+    parents = {
+        "a": [],
+        "b": ["a", "source.x"],
+        "c": ["a", "b"],
+        "d": ["c", "f"],
+        "e": ["f"],
+        "f": ["e"],
+    }
+    lengths, cyclic = get_longest_path_lengths(parents)
+
+    assert lengths == {"a": 1, "b": 2, "c": 3}
+    assert cyclic == {"d", "e", "f"}
+
+
+def test_read_dbt_schema_version(tmp_path):
+    assert read_dbt_schema_version("tests/data/manifest_v12.json") == "https://schemas.getdbt.com/dbt/manifest/v12.json"
+    assert read_dbt_schema_version("tests/data/catalog_v1.json") == "https://schemas.getdbt.com/dbt/catalog/v1.json"
+    # Not at the start of the file, left to the decoded manifest
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps({"nodes": {}, "metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v12.json"}}))
+    assert read_dbt_schema_version(str(path)) is None
+    assert read_dbt_schema_version(str(tmp_path / "missing.json")) is None
+
+
+@pytest.mark.parametrize("load", [load_manifest, load_raw_manifest])
+def test_load_unsupported_manifest(tmp_path, load):
+    # The rest of the file is not even decoded
+    path = tmp_path / "manifest.json"
+    path.write_text('{"metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/manifest/v9.json"}, "nodes": {')
+    with pytest.raises(AltimateNotSupportedError):
+        load(str(path))
+
+    with pytest.raises(AltimateInvalidManifestError):
+        load("tests/data/catalog_v1.json")
+
+
+def test_load_run_results():
+    run_results = load_run_results("tests/data/run_results_v6.json")
+    assert run_results.metadata.dbt_schema_version == "https://schemas.getdbt.com/dbt/run-results/v6.json"
+
+    with pytest.raises(AltimateInvalidManifestError):
+        load_run_results("tests/data/catalog_v1.json")
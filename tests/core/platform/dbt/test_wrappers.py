@@ -0,0 +1,299 @@
+import json
+import pickle
+from pathlib import Path
+
+import pytest
+
+from datapilot.core.platforms.dbt.constants import GENERIC
+from datapilot.core.platforms.dbt.constants import MACROS
+from datapilot.core.platforms.dbt.constants import SINGULAR
+from datapilot.core.platforms.dbt.executor import DBTInsightGenerator
+from datapilot.core.platforms.dbt.executor import get_projection
+from datapilot.core.platforms.dbt.factory import DBTFactory
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateDependsOn
+from datapilot.core.platforms.dbt.schemas.manifest import AltimateManifestNode
+from datapilot.core.platforms.dbt.utils import load_catalog
+from datapilot.core.platforms.dbt.utils import load_manifest
+from datapilot.core.platforms.dbt.utils import load_raw_manifest
+from datapilot.core.platforms.dbt.utils import load_run_results
+from datapilot.core.platforms.dbt.utils import parse_run_results
+from datapilot.core.platforms.dbt.wrappers.manifest import wrapper as manifest_wrapper
+from datapilot.core.platforms.dbt.wrappers.manifest.attachments import ALL_COLUMNS
+from datapilot.core.platforms.dbt.wrappers.manifest.attachments import TestAttachmentIndex
+from datapilot.core.platforms.dbt.wrappers.manifest.graph import ManifestGraph
+from datapilot.core.platforms.dbt.wrappers.manifest.index import ManifestIndex
+from datapilot.core.platforms.dbt.wrappers.manifest.projection import ManifestProjection
+from datapilot.core.platforms.dbt.wrappers.manifest.raw.wrapper import RawManifestWrapper
+from datapilot.exceptions.exceptions import AltimateNotSupportedError
+from datapilot.utils.field_store import FieldStore
+
+MANIFESTS = [
+    "tests/data/manifest_v10.json",
+    "tests/data/manifest_v11.json",
+    "tests/data/manifest_v12.json",
+]
+
+
+def _as_json(entities):
+    return {unique_id: json.loads(entity.json()) for unique_id, entity in entities.items()}
+
+
+@pytest.mark.parametrize("manifest_path", MANIFESTS)
+@pytest.mark.parametrize("getter", ["get_nodes", "get_sources", "get_macros", "get_exposures", "get_tests"])
+def test_raw_wrapper_matches_parsed_wrapper(manifest_path, getter):
+    parsed_wrapper = DBTFactory.get_manifest_wrapper(load_manifest(manifest_path))
+    raw_wrapper = DBTFactory.get_manifest_wrapper(load_raw_manifest(manifest_path))
+
+    assert isinstance(raw_wrapper, RawManifestWrapper)
+    assert raw_wrapper.get_package() == parsed_wrapper.get_package()
+    assert _as_json(getattr(raw_wrapper, getter)()) == _as_json(getattr(parsed_wrapper, getter)())
+
+
+def test_raw_wrapper_rejects_unsupported_version():
+    manifest = load_raw_manifest("tests/data/manifest_v12.json")
+    manifest["metadata"]["dbt_schema_version"] = "https://schemas.getdbt.com/dbt/manifest/v9.json"
+    with pytest.raises(AltimateNotSupportedError):
+        DBTFactory.get_manifest_wrapper(manifest)
+
+
+@pytest.mark.parametrize("manifest_path", MANIFESTS)
+def test_manifest_index(manifest_path):
+    wrapper = DBTFactory.get_manifest_wrapper(load_manifest(manifest_path))
+    index = wrapper.get_index()
+
+    assert wrapper.get_index() is index
+    assert wrapper.get_nodes() is index.nodes
+    assert wrapper.parent_to_child_map(index.nodes) is index.children_map
+    assert wrapper.parent_to_child_map(dict(index.nodes)) == index.children_map
+    assert set(wrapper.get_tests(GENERIC)) | set(wrapper.get_tests(SINGULAR)) == set(index.tests)
+    for unique_id, node in index.nodes.items():
+        assert unique_id in index.by_name[node.name]
+        assert unique_id in index.by_path[node.original_file_path]
+        assert unique_id in index.by_resource_type[node.resource_type.value]
+    entities = index.get_entities()
+    for entities_of_type in (index.nodes, index.sources, index.exposures, index.tests, index.macros, index.seeds):
+        assert all(entities[unique_id] is entity for unique_id, entity in entities_of_type.items())
+
+
+@pytest.mark.parametrize("manifest_path", MANIFESTS)
+def test_test_attachment_index(manifest_path):
+    index = DBTFactory.get_manifest_wrapper(load_manifest(manifest_path)).get_index()
+    test_index = TestAttachmentIndex.from_index(index)
+
+    assert test_index.num_tests == len(index.tests)
+    for unique_id in [*index.nodes, *index.sources]:
+        tests = [test for test in index.tests.values() if unique_id in (test.depends_on.nodes or [])]
+        assert test_index.get_tests(unique_id) == tests
+        assert test_index.get_test_count(unique_id) == len(tests)
+        assert sum(test_index.get_count_by_name(unique_id).values()) == len(tests)
+        assert test_index.get_count_by_type(unique_id).get(GENERIC, 0) == sum(test.test_type == GENERIC for test in tests)
+        names = {test.name for test in tests}
+        assert test_index.get_count_by_group(unique_id, [*names, *names, "missing"]) == len(tests)
+        column_tests = test_index.get_column_tests(unique_id)
+        for test in tests:
+            if test.test_type == GENERIC:
+                column = test.test_metadata.kwargs.get("column_name") or ALL_COLUMNS
+                assert test.test_metadata.name in column_tests[column]
+        if any(test.package_name == index.project_name for test in tests):
+            assert unique_id in test_index.project_tested_ids
+    assert test_index.has_singular_test == any(test.test_type == SINGULAR for test in index.tests.values())
+
+
+def test_manifest_index_lazy_fields(monkeypatch):
+    assert DBTFactory.get_manifest_wrapper(load_manifest("tests/data/manifest_v12.json")).get_index().store is None
+    monkeypatch.setattr(manifest_wrapper, "OFFLOAD_MIN_NODES", 0)
+    wrapper = DBTFactory.get_manifest_wrapper(load_manifest("tests/data/manifest_v12.json"))
+    index = wrapper.get_index()
+    assert index.store is not None
+    # The same nodes, without a store
+    eager = ManifestIndex(index.project_name)
+    for node in wrapper._get_section("nodes"):
+        if node.unique_id in index.nodes:
+            eager.add_node(wrapper._get_node(node))
+
+    node = next(node for node in index.nodes.values() if node.raw_code)
+    index.release()
+    assert "raw_code" not in node.__dict__
+    assert repr(index.nodes) == repr(eager.nodes)
+    assert "raw_code" not in node.__dict__
+    assert node.raw_code == eager.nodes[node.unique_id].raw_code
+    assert "raw_code" in node.__dict__
+    index.release()
+    assert "raw_code" not in node.__dict__
+    assert _as_json(pickle.loads(pickle.dumps(index)).nodes) == _as_json(eager.nodes) == _as_json(index.nodes)  # noqa: S301
+
+
+def test_lazy_model_pydantic_behaviours():
+    # AltimateLazyModel overrides internals of pydantic v1, these are the behaviours it keeps
+    index = DBTFactory.get_manifest_wrapper(load_manifest("tests/data/manifest_v12.json")).get_index()
+    eager = next(node for node in index.nodes.values() if node.raw_code and node.columns)
+    lazy = eager.copy(deep=True)
+    lazy.offload(FieldStore())
+    assert eager.raw_code
+    assert "raw_code" not in lazy.__dict__
+
+    assert repr(lazy) == repr(eager)
+    assert "raw_code" not in lazy.__dict__
+    assert lazy.dict() == eager.dict()
+    assert lazy.json() == eager.json()
+    assert lazy.copy().dict() == lazy.copy(deep=True).dict() == eager.dict()
+    assert lazy == eager
+    assert pickle.loads(pickle.dumps(lazy)).dict() == eager.dict()  # noqa: S301
+
+
+def test_manifest_projection():
+    config = {"disabled_insights": ["hard_coded_references", "check_macro_args_have_desc", "check_macro_has_desc", "dbt_low_test_coverage"]}
+    projection = get_projection(config)
+    assert not projection.includes(MACROS)
+    assert "raw_code" not in projection.fields
+    assert "macros" not in projection.get_sections()
+
+    manifest = load_raw_manifest("tests/data/manifest_v12.json")
+    full = DBTFactory.get_manifest_wrapper(manifest).get_index()
+    index = DBTFactory.get_manifest_wrapper(manifest).get_index(projection)
+    assert full.macros
+    assert not index.macros
+    assert index.tests.keys() == full.tests.keys()
+    assert index.nodes.keys() == full.nodes.keys()
+    assert any(node.raw_code for node in full.nodes.values())
+    assert not any(node.raw_code for node in index.nodes.values())
+
+    projection = ManifestProjection.of_insights([])
+    index = DBTFactory.get_manifest_wrapper(manifest).get_index(projection)
+    assert not index.tests
+    assert not index.macros
+    assert not index.exposures
+
+
+def test_manifest_index_is_rebuilt_for_a_wider_projection():
+    manifest = load_raw_manifest("tests/data/manifest_v12.json")
+    full = DBTFactory.get_manifest_wrapper(manifest).get_index()
+    wrapper = DBTFactory.get_manifest_wrapper(manifest)
+    index = wrapper.get_index(ManifestProjection.of_insights([]))
+    assert not index.tests
+
+    # A narrower projection reuses the index, the getters need every entity
+    assert wrapper.get_index(ManifestProjection.of_insights([])) is index
+    assert wrapper.get_tests().keys() == full.tests.keys()
+    assert wrapper.get_macros().keys() == full.macros.keys()
+
+    cached_wrapper = DBTFactory.get_manifest_wrapper(index)
+    assert cached_wrapper.get_index(ManifestProjection.of_insights([])) is index
+    with pytest.raises(AltimateNotSupportedError):
+        cached_wrapper.get_tests()
+
+
+def test_projected_run_matches_full_run():
+    manifest = load_raw_manifest("tests/data/manifest_v12.json")
+    config = {"disabled_insights": ["hard_coded_references", "check_macro_args_have_desc", "check_macro_has_desc", "missing_documentation"]}
+
+    def report(generator):
+        reports = generator.run()
+        return sorted(insight.json() for insights in [reports["project"], *reports["model"].values()] for insight in insights)
+
+    full_index = DBTFactory.get_manifest_wrapper(manifest).get_index()
+    projected = DBTInsightGenerator(manifest=manifest, config=config)
+    assert len(projected.macros) < len(full_index.macros)
+    assert report(projected) == report(DBTInsightGenerator(manifest=full_index, config=config))
+
+
+@pytest.mark.parametrize("manifest_path", MANIFESTS)
+def test_manifest_graph(manifest_path):
+    index = DBTFactory.get_manifest_wrapper(load_manifest(manifest_path)).get_index()
+    graph = ManifestGraph.from_index(index)
+
+    assert set(graph.unique_ids) == set(index.children_map) | set(index.sources) | set(index.seeds)
+    for unique_id in graph.unique_ids:
+        assert graph.get_children(unique_id) == list(index.children_map.get(unique_id, []))
+        node = index.nodes.get(unique_id)
+        assert graph.get_parents(unique_id) == (list(dict.fromkeys(node.depends_on.nodes)) if node else [])
+        assert graph.get_in_degree(unique_id) == len(graph.get_parents(unique_id))
+        assert graph.get_out_degree(unique_id) == len(graph.get_children(unique_id))
+        parent_depths = [graph.get_depth(parent) for parent in graph.get_parents(unique_id)]
+        assert graph.get_depth(unique_id) == 1 + max(parent_depths, default=-1)
+
+    order = {vertex: position for position, vertex in enumerate(graph.topological_order)}
+    assert len(order) == len(graph)
+    for vertex in range(len(graph)):
+        assert all(order[parent] < order[vertex] for parent in graph.parent_positions(vertex))
+
+
+def test_manifest_graph_with_cycle():
+    parents = {"a": [], "b": ["a", "d"], "c": ["b"], "d": ["c"], "e": ["d"], "f": ["a"]}
+    nodes = {
+        unique_id: AltimateManifestNode.construct(unique_id=unique_id, depends_on=AltimateDependsOn.construct(nodes=node_parents))
+        for unique_id, node_parents in parents.items()
+    }
+    children_map = {unique_id: set() for unique_id in parents}
+    for unique_id, node_parents in parents.items():
+        for parent in node_parents:
+            children_map[parent].add(unique_id)
+    graph = ManifestGraph(nodes, children_map)
+
+    assert graph.get_cyclic() == {"b", "c", "d", "e"}
+    assert [graph.unique_ids[vertex] for vertex in graph.topological_order] == ["a", "f"]
+    assert graph.get_depth("f") == 1
+    assert graph.get_depth("e") is None
+    assert graph.get_parents("missing") == []
+
+
+def test_catalog_index():
+    wrapper = DBTFactory.get_catalog_wrapper(load_catalog("tests/data/catalog_v12.json"))
+    schema = wrapper.get_schema()
+
+    assert wrapper.get_schema() is schema
+    for unique_id, columns in schema.items():
+        assert wrapper.get_column_names(unique_id) == [name.lower() for name in columns]
+        assert wrapper.get_column_set(unique_id) == {name.lower() for name in columns}
+        for name, column_type in columns.items():
+            assert wrapper.get_column_type(unique_id, name.upper()) == column_type
+    assert not wrapper.has_node("model.missing")
+    assert wrapper.get_node_columns("model.missing") == {}
+    assert wrapper.get_column_names("model.missing") == []
+
+
+@pytest.mark.parametrize("run_results_path", ["tests/data/run_results_v5.json", "tests/data/run_results_v6.json"])
+def test_run_results_wrapper(run_results_path):
+    raw_results = json.loads(Path(run_results_path).read_text())["results"]
+    run_results = DBTFactory.get_run_results_wrapper(load_run_results(run_results_path)).get_run_results()
+
+    assert list(run_results) == [result["unique_id"] for result in raw_results]
+    for raw_result in raw_results:
+        result = run_results[raw_result["unique_id"]]
+        assert result.status == raw_result["status"]
+        assert result.execution_time == raw_result["execution_time"]
+        assert set(result.timing) == {"compile", "execute"}
+        # The execution time also covers the work of dbt between the phases
+        assert result.get_run_time() == result.timing["execute"] < result.execution_time
+
+
+def test_run_results_wrapper_datetime_timing():
+    # The models of the older versions parse the timestamps of the phases
+    run_results = parse_run_results(
+        {
+            "metadata": {"dbt_schema_version": "https://schemas.getdbt.com/dbt/run-results/v1.json", "dbt_version": "0.19.0"},
+            "results": [
+                {
+                    "status": "success",
+                    "timing": [{"name": "execute", "started_at": "2021-02-10T04:42:33Z", "completed_at": "2021-02-10T04:42:45.5Z"}],
+                    "thread_id": "Thread-1",
+                    "execution_time": 13.0,
+                    "adapter_response": {},
+                    "unique_id": "model.a.b",
+                },
+                {
+                    "status": "skipped",
+                    "timing": [],
+                    "thread_id": "Thread-1",
+                    "execution_time": 0.0,
+                    "adapter_response": {},
+                    "unique_id": "model.a.c",
+                },
+            ],
+            "elapsed_time": 13.0,
+        }
+    )
+    results = DBTFactory.get_run_results_wrapper(run_results).get_run_results()
+    assert results["model.a.b"].get_run_time() == 12.5
+    assert results["model.a.c"].status == "skipped"
+    assert results["model.a.c"].get_run_time() == 0.0
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+
+from datapilot.core.platforms.dbt.insights import INSIGHT_REGISTRY
+from datapilot.core.platforms.dbt.insights import load_insight
+
+# Import time of the CLI allowed in seconds, it took about 3s when every insight and every
+# manifest version of dbt_artifacts_parser was imported with it
+IMPORT_TIME_BUDGET = 1.5
+
+
+def _import_times(statement):
+    command = [sys.executable, "-X", "importtime", "-c", statement]
+    stderr = subprocess.run(command, capture_output=True, text=True, check=True).stderr  # noqa: S603
+    times = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "cumulative" not in line:
+            _, cumulative, name = line[len("import time:") :].split("|")
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def test_cli_import_time():
+    times = _import_times("import datapilot.cli.main")
+
+    assert not [name for name in times if name.startswith("dbt_artifacts_parser.parsers.manifest.")]
+    assert not {f"datapilot.core.platforms.dbt.insights.{module}" for module, _ in INSIGHT_REGISTRY.values()} & set(times)
+    assert times["datapilot.cli.main"] < IMPORT_TIME_BUDGET
+
+
+def test_insight_registry():
+    for alias in INSIGHT_REGISTRY:
+        assert load_insight(alias).ALIAS == alias
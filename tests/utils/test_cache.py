@@ -0,0 +1,42 @@
+import os
+
+from datapilot.utils.cache import DiskCache
+
+
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskCache(tmp_path)
+    value = {"nodes": {"model.a": {"depends_on": ["model.b"]}}, "children": {"model.b": {"model.a"}}}
+
+    assert cache.get("key") is None
+    cache.set("key", value)
+    assert cache.get("key") == value
+
+
+def test_disk_cache_discards_corrupt_entries(tmp_path):
+    cache = DiskCache(tmp_path)
+    (tmp_path / "key.pickle").write_bytes(b"not a pickle")
+
+    assert cache.get("key", "default") == "default"
+    assert not (tmp_path / "key.pickle").exists()
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    cache = DiskCache(tmp_path, max_size=2500)
+    for position, key in enumerate(["first", "second"]):
+        cache.set(key, b"x" * 1000)
+        os.utime(tmp_path / f"{key}.pickle", (position, position))
+
+    # Reading "first" makes "second" the least recently used entry
+    assert cache.get("first") is not None
+    cache.set("third", b"x" * 1000)
+
+    assert sorted(path.stem for path in tmp_path.glob("*.pickle")) == ["first", "third"]
+
+
+def test_disk_cache_skips_unpicklable_values(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.set("key", {"generator": (n for n in range(3))})
+    cache.set("lambda", lambda: None)
+
+    assert cache.get("key") is None
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,66 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from datapilot.core.platforms.dbt.constants import MANIFEST_SECTIONS
+from datapilot.utils.json_loader import _prune_sections
+from datapilot.utils.json_loader import _stream_sections
+from datapilot.utils.json_loader import available_json_backends
+from datapilot.utils.json_loader import get_json_backend
+from datapilot.utils.json_loader import load_json
+
+MANIFEST_PATH = "tests/data/manifest_v12.json"
+MANIFESTS = ["tests/data/manifest_v10.json", "tests/data/manifest_v11.json", "tests/data/manifest_v12.json"]
+
+
+@pytest.mark.parametrize("backend", available_json_backends())
+@pytest.mark.parametrize("use_mmap", [False, True])
+def test_load_json_backends(backend, use_mmap):
+    with Path(MANIFEST_PATH).open() as f:
+        expected = json.load(f)
+    assert load_json(MANIFEST_PATH, backend=backend, use_mmap=use_mmap) == expected
+
+
+def test_load_json_sections():
+    with Path(MANIFEST_PATH).open() as f:
+        expected = json.load(f)
+    manifest = load_json(MANIFEST_PATH, sections=MANIFEST_SECTIONS)
+
+    assert manifest.keys() == expected.keys()
+    for key, value in manifest.items():
+        assert value == (expected[key] if key in MANIFEST_SECTIONS else {})
+
+
+@pytest.mark.parametrize("manifest_path", MANIFESTS)
+def test_stream_sections(manifest_path):
+    pytest.importorskip("ijson")
+    with Path(manifest_path).open() as f:
+        expected = json.load(f)
+
+    assert _stream_sections(manifest_path, MANIFEST_SECTIONS) == _prune_sections(expected, MANIFEST_SECTIONS)
+    assert _stream_sections(manifest_path, expected.keys()) == expected
+    assert _stream_sections(manifest_path, ["metadata"]) == {key: (expected[key] if key == "metadata" else {}) for key in expected}
+
+
+def test_load_json_sections_without_ijson(monkeypatch):
+    # The full file is decoded, then pruned
+    monkeypatch.setitem(sys.modules, "ijson", None)
+    with Path(MANIFEST_PATH).open() as f:
+        expected = json.load(f)
+    assert load_json(MANIFEST_PATH, sections=MANIFEST_SECTIONS) == _prune_sections(expected, MANIFEST_SECTIONS)
+
+
+def test_load_json_invalid_file(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text("{not json")
+    with pytest.raises(ValueError, match="Invalid JSON file"):
+        load_json(str(path))
+    with pytest.raises(ValueError, match="Invalid JSON file"):
+        load_json(str(path), sections=MANIFEST_SECTIONS)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="not available"):
+        get_json_backend("does-not-exist")
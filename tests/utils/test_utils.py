@@ -1,10 +1,20 @@
+import json
+import os
+import shutil
 from pathlib import Path
 
 import pytest
 
+from datapilot.core.platforms.dbt.introspection import DbtColumnIntrospector
+from datapilot.core.platforms.dbt.selector import ModelSelector
 from datapilot.core.platforms.dbt.utils import get_manifest_wrapper
 from datapilot.core.platforms.dbt.utils import get_models
+from datapilot.utils import utils
+from datapilot.utils.cache import DiskCache
+from datapilot.utils.profiling import Profiler
 from datapilot.utils.utils import extract_folders_in_path
+from datapilot.utils.utils import generate_partial_manifest_catalog
+from datapilot.utils.utils import is_manifest_fresh
 from datapilot.utils.utils import is_superset_path
 
 test_cases = [
@@ -33,6 +43,31 @@ test_cases = [
         ["path:models/staging/stg_customers.sql"],
         ["model.jaffle_shop_package.stg_customers"],
     ),
+    (["stg_customers+1"], ["model.jaffle_shop_package.stg_customers", "model.jaffle_shop_package.customers"]),
+    (
+        ["+customers"],
+        [
+            "model.jaffle_shop_package.customers",
+            "model.jaffle_shop_package.stg_customers",
+            "model.jaffle_shop_package.stg_orders",
+            "model.jaffle_shop_package.stg_payments",
+            "source.jaffle_shop_package.jaffle_shop.customers",
+        ],
+    ),
+    (
+        ["@stg_orders", "path:models/staging/stg_payments.sql"],
+        [
+            "model.jaffle_shop_package.customers",
+            "model.jaffle_shop_package.customers_downstream",
+            "model.jaffle_shop_package.direct_join_to_source",
+            "model.jaffle_shop_package.joining_of_upstream_contexts",
+            "model.jaffle_shop_package.orders",
+            "model.jaffle_shop_package.stg_customers",
+            "model.jaffle_shop_package.stg_orders",
+            "model.jaffle_shop_package.stg_payments",
+            "source.jaffle_shop_package.jaffle_shop.customers",
+        ],
+    ),
 ]
 
 
@@ -54,6 +89,19 @@ def test_model_selections(selected_model_list, expected):
     assert sorted(selected_models) == sorted(expected)
 
 
+def test_model_selections_by_tag():
+    index = get_manifest_wrapper("tests/data/manifest_v11.json").get_index()
+    index.nodes["model.jaffle_shop_package.orders"].config.tags = ["finance"]
+    index.sources["source.jaffle_shop_package.jaffle_shop.customers"].tags = ["finance", "raw"]
+    selector = ModelSelector.from_index(index)
+
+    assert selector.select(["tag:finance"]) == {"model.jaffle_shop_package.orders", "source.jaffle_shop_package.jaffle_shop.customers"}
+    source_id = "source.jaffle_shop_package.jaffle_shop.customers"
+    selected = {unique_id for unique_id in selector.select(["tag:raw+1"]) if not unique_id.startswith("test.")}
+    assert selected == {source_id, *index.children_map[source_id]}
+    assert selector.select(["tag:missing", "missing+"]) == frozenset()
+
+
 @pytest.mark.parametrize(
     ("superset_path", "path", "expected"),
     [
@@ -68,3 +116,43 @@ def test_model_selections(selected_model_list, expected):
 )
 def test_is_superset_path(superset_path, path, expected):
     assert is_superset_path(superset_path, path) == expected
+
+
+def test_generate_partial_manifest_catalog_reuses_manifest_and_columns(tmp_path, monkeypatch):
+    model_file = tmp_path / "models" / "customers.sql"
+    model_file.parent.mkdir()
+    model_file.write_text("select 1 as customer_id")
+    (tmp_path / "dbt_project.yml").write_text("name: jaffle_shop_package\n")
+    manifest_file = tmp_path / "target" / "manifest.json"
+    manifest_file.parent.mkdir()
+    shutil.copy("tests/data/manifest_v11.json", manifest_file)
+    os.utime(manifest_file, (model_file.stat().st_mtime + 10,) * 2)
+
+    compiled = []
+
+    def compile_inline(self, sql):
+        compiled.append(sql)
+        return json.dumps([[0, "customers", "customer_id", "integer"]])
+
+    def run(*args, **kwargs):
+        raise AssertionError("dbt parse should not run on a fresh manifest")
+
+    monkeypatch.setattr(DbtColumnIntrospector, "compile_inline", compile_inline)
+    monkeypatch.setattr(utils.subprocess, "run", run)
+    changed_files = [str(model_file)]
+    assert is_manifest_fresh(manifest_file, changed_files, str(tmp_path))
+
+    cache = DiskCache(tmp_path / "cache")
+    for _ in range(2):
+        profiler = Profiler()
+        selected_models, _, catalog = generate_partial_manifest_catalog(
+            changed_files, base_path=str(tmp_path), cache=cache, profiler=profiler
+        )
+        assert selected_models == ["model.jaffle_shop_package.customers"]
+        assert list(catalog.nodes["model.jaffle_shop_package.customers"].columns) == ["customer_id"]
+        assert {"check manifest", "load manifest", "column metadata"} <= set(profiler.timings)
+    assert len(compiled) == 1
+
+    os.utime(model_file, (manifest_file.stat().st_mtime + 10,) * 2)
+    assert not is_manifest_fresh(manifest_file, changed_files, str(tmp_path))
+    assert not is_manifest_fresh(manifest_file, [str(tmp_path / "models" / "deleted.sql")], str(tmp_path))